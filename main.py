@@ -9,6 +9,7 @@ import sys
 import argparse
 from pathlib import Path
 
+from src.autosave import AUTOSAVE_FILENAME, DEFAULT_AUTOSAVE_MOVES
 from src.game import GameEngine
 
 
@@ -36,9 +37,106 @@ def main() -> None:
         action="store_true", 
         help="Show detailed loading and parsing information"
     )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=1,
+        help="Parse .mud files in N worker processes (default: 1)"
+    )
+    parser.add_argument(
+        "--rebuild-world-cache",
+        action="store_true",
+        help="Rebuild the precompiled world image next to the .mud files and exit"
+    )
+    parser.add_argument(
+        "--no-world-cache",
+        action="store_true",
+        help="Always parse the .mud files instead of using the precompiled world image"
+    )
+    parser.add_argument(
+        "--script",
+        type=Path,
+        help="Run the commands in FILE (one per line) without a terminal and report timings"
+    )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        metavar="DIR",
+        help="Run every *.txt script in DIR across a process pool and report throughput"
+    )
+    parser.add_argument(
+        "--transcript-dir",
+        type=Path,
+        default=Path("transcripts"),
+        help="Where --script/--batch write transcripts and summary.json (default: transcripts)"
+    )
+    parser.add_argument(
+        "--batch-workers",
+        type=int,
+        default=None,
+        help="Worker processes for --batch (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed the game's random streams so a run can be reproduced"
+    )
+    parser.add_argument(
+        "--autosave",
+        type=int,
+        nargs="?",
+        const=DEFAULT_AUTOSAVE_MOVES,
+        default=0,
+        metavar="MOVES",
+        help=f"Save to saves/{AUTOSAVE_FILENAME} in the background every MOVES moves "
+             f"(default when given: {DEFAULT_AUTOSAVE_MOVES})"
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Host concurrent games over a line protocol instead of playing in the terminal"
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address --serve listens on (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=4000,
+        help="TCP port for --serve (default: 4000)"
+    )
+    parser.add_argument(
+        "--unix-socket",
+        type=Path,
+        metavar="PATH",
+        help="Serve on a Unix socket at PATH instead of TCP"
+    )
+    parser.add_argument(
+        "--command-timeout",
+        type=float,
+        default=5.0,
+        help="Seconds a served command may run before the player is told to wait (default: 5)"
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=300.0,
+        help="Seconds before an idle served game is saved to disk and unloaded (default: 300)"
+    )
     
     args = parser.parse_args()
     
+    if args.script or args.batch:
+        run_scripts(args)
+        return
+    
+    if args.serve:
+        serve_games(args)
+        return
+    
     # Only show loading messages in debug mode
     if args.debug:
         print("Welcome to Zork!")
@@ -64,10 +162,88 @@ def main() -> None:
         demo_disambiguation()
         return
     
-    game = GameEngine(use_mud_files=not args.test, mud_directory=args.mud_dir, debug_mode=args.debug)
+    if args.rebuild_world_cache:
+        rebuild_world_cache(args.mud_dir, args.debug, args.parse_workers)
+        return
+    
+    game = GameEngine(use_mud_files=not args.test, mud_directory=args.mud_dir, debug_mode=args.debug,
+                      use_world_cache=not args.no_world_cache, parse_workers=args.parse_workers,
+                      seed=args.seed, autosave_every=args.autosave)
     game.run()
 
 
+def run_scripts(args: argparse.Namespace) -> None:
+    """Run --script FILE or --batch DIR headlessly and print the timing summary."""
+    from src.batch import EngineOptions, ScriptRunner, format_summary, run_batch
+    
+    options = EngineOptions(use_mud_files=not args.test, mud_directory=str(args.mud_dir),
+                            use_world_cache=not args.no_world_cache, debug_mode=args.debug,
+                            seed=args.seed)
+    
+    if args.script:
+        if not args.script.is_file():
+            print(f"Script not found: {args.script}")
+            sys.exit(1)
+        result = ScriptRunner(options).run(args.script, args.transcript_dir)
+        print(f"Script: {args.script} (engine built in {result.setup_time:.2f}s)")
+        for line in format_summary(result.commands, result.elapsed, result.latencies):
+            print(line)
+        if result.stopped_early:
+            print("The game ended before the end of the script.")
+        for error in result.errors:
+            print(f"Error: {error}")
+        print(f"Transcript: {result.transcript}")
+        return
+    
+    if not args.batch.is_dir():
+        print(f"Batch directory not found: {args.batch}")
+        sys.exit(1)
+    batch = run_batch(args.batch, options, args.transcript_dir, workers=args.batch_workers)
+    if not batch.scripts:
+        print(f"No *.txt scripts in {args.batch}")
+        sys.exit(1)
+    print(f"Batch: {len(batch.scripts)} scripts on {batch.workers} worker(s)")
+    for result in batch.scripts:
+        status = " (ended early)" if result.stopped_early else ""
+        errors = f", {len(result.errors)} errors" if result.errors else ""
+        print(f"  {Path(result.script).name:<30} {result.commands:>6} commands "
+              f"{result.commands_per_second:>10,.0f}/sec{errors}{status}")
+    for line in format_summary(batch.commands, batch.wall_time, batch.latencies()):
+        print(line)
+    print(f"Transcripts and summary.json: {args.transcript_dir}")
+
+
+def serve_games(args: argparse.Namespace) -> None:
+    """Run the multi-session game server (--serve)."""
+    from src.batch import EngineOptions
+    from src.server import ServerOptions, run_server
+    
+    engine = EngineOptions(use_mud_files=not args.test, mud_directory=str(args.mud_dir),
+                           use_world_cache=not args.no_world_cache, debug_mode=args.debug, seed=args.seed)
+    run_server(ServerOptions(host=args.host, port=args.port,
+                             unix_path=str(args.unix_socket) if args.unix_socket else None,
+                             command_timeout=args.command_timeout, idle_timeout=args.idle_timeout,
+                             engine=engine))
+
+
+def rebuild_world_cache(mud_dir: Path, debug: bool = False, parse_workers: int = 1) -> None:
+    """Parse the .mud files from scratch and write a fresh world image."""
+    import time
+    from src.world.world_image import WorldImageCache
+    
+    start = time.perf_counter()
+    game = GameEngine(use_mud_files=True, mud_directory=mud_dir, debug_mode=debug, rebuild_world_cache=True,
+                      parse_workers=parse_workers)
+    elapsed = time.perf_counter() - start
+    
+    image_path = WorldImageCache(mud_dir).image_path
+    if image_path.exists():
+        print(f"World image rebuilt: {image_path} ({len(game.world)} rooms, {elapsed:.2f}s)")
+    else:
+        print(f"Could not build a world image from {mud_dir}")
+        sys.exit(1)
+
+
 def demo_disambiguation() -> None:
     """Run a quick demonstration of the disambiguation system."""
     from src.game import GameEngine
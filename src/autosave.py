@@ -0,0 +1,174 @@
+"""
+Autosave - Saves written on a background thread.
+
+save_game() collects, serializes and writes inside the command turn, so
+the player (or, in the server, the worker the session runs on) waits for
+the disk. An Autosaver splits a save in two:
+
+    game thread     a snapshot: copies of the rooms, objects and NPCs
+                    touched since the last autosave, plus the small
+                    sections (player, score, RNG, ...). Only the first
+                    autosave of a file, or the first after loading a
+                    game, copies everything.
+    worker thread   applies the snapshot to its own copy of the full
+                    state, serializes it and writes the file: a delta
+                    appended to the save, or a new checkpoint written to
+                    a temporary file that then replaces the save.
+
+At most one snapshot waits for the worker. A snapshot taken while the one
+before is still waiting is merged into it, so a burst of saves costs one
+write. The existing save is never left half-written: checkpoints replace
+it with os.replace, and a delta torn by a crash is ignored when loading
+(see savefile).
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .savefile import (
+    ChangeSet, SaveChain, SaveHeader, append_delta, apply_delta, changed_sections, write_checkpoint
+)
+
+logger = logging.getLogger(__name__)
+
+AUTOSAVE_FILENAME = "autosave.json"
+DEFAULT_AUTOSAVE_MOVES = 10  # Moves between autosaves
+
+
+@dataclass
+class SaveSnapshot:
+    """What one save hands to the worker (owned by the worker once submitted)."""
+    header: SaveHeader
+    entries: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # Keyed section -> changed entries
+    sections: Dict[str, Any] = field(default_factory=dict)  # Every unkeyed section
+    state: Optional[Dict[str, Any]] = None  # The full state, when the worker has none yet
+
+    def merge(self, newer: "SaveSnapshot") -> "SaveSnapshot":
+        """Fold a newer snapshot into this unwritten one; returns the combined snapshot."""
+        if newer.state is not None:
+            return newer
+        if self.state is not None:
+            newer.apply_to(self.state)
+        else:
+            for key, entries in newer.entries.items():
+                self.entries.setdefault(key, {}).update(entries)
+            self.sections = newer.sections
+        self.header = newer.header
+        return self
+
+    def apply_to(self, state: Dict[str, Any]) -> None:
+        """Bring a full state up to date with this snapshot."""
+        apply_delta(state, self.entries)
+        state.update(self.sections)
+        state["timestamp"] = self.header.timestamp
+
+
+class Autosaver:
+    """
+    Background writer for one save file.
+
+    Args:
+        path: Save file to write
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        # Game thread
+        self.pending = ChangeSet()  # Changed since the last snapshot
+        self.has_base = False  # A full snapshot was handed to the worker
+        self.last_moves = 0  # Move count at the last snapshot
+        # Shared, under _condition
+        self._condition = threading.Condition()
+        self._waiting: Optional[SaveSnapshot] = None
+        self._writing = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self.written = 0
+        self.coalesced = 0
+        self.failed = 0
+        # Worker thread
+        self._state: Optional[Dict[str, Any]] = None  # Full state as of the last snapshot
+        self._chain: Optional[SaveChain] = None
+
+    def rebase(self) -> None:
+        """Forget what the worker knows (the game was replaced, e.g. by loading); the next snapshot is full."""
+        self.has_base = False
+        self.pending.clear()
+
+    def submit(self, snapshot: SaveSnapshot) -> None:
+        """Queue a snapshot for writing, merging it into one still waiting."""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("autosaver is closed")
+            if self._waiting is not None:
+                self._waiting = self._waiting.merge(snapshot)
+                self.coalesced += 1
+            else:
+                self._waiting = snapshot
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"autosave-{self.path.name}", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted snapshot is written. Returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._waiting is None and not self._writing, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Write what is waiting and stop the worker. Returns False if it didn't finish in time."""
+        finished = self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return finished
+
+    @property
+    def busy(self) -> bool:
+        """True while a snapshot waits or is being written."""
+        with self._condition:
+            return self._waiting is not None or self._writing
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._waiting is not None or self._closed)
+                if self._waiting is None:
+                    return
+                snapshot, self._waiting = self._waiting, None
+                self._writing = True
+            try:
+                self._write(snapshot)
+                written, failed = 1, 0
+            except Exception as e:
+                logger.warning(f"Autosave to {self.path} failed: {type(e).__name__}: {e}")
+                self._chain = None  # Next time, write a whole checkpoint from the state
+                written, failed = 0, 1
+            with self._condition:
+                self.written += written
+                self.failed += failed
+                self._writing = False
+                self._condition.notify_all()
+
+    def _write(self, snapshot: SaveSnapshot) -> None:
+        """Apply a snapshot to the worker's state and write it (worker thread)."""
+        if snapshot.state is not None:
+            self._state = snapshot.state
+            self._state["timestamp"] = snapshot.header.timestamp
+            self._chain = None
+        elif self._state is None:
+            raise RuntimeError("partial snapshot without a full one before it")
+        else:
+            snapshot.apply_to(self._state)
+        chain = self._chain
+        if chain is not None and chain.can_append(self.path):
+            sections, prints = changed_sections(chain.fingerprints, snapshot.sections)
+            delta = {"timestamp": snapshot.header.timestamp, **snapshot.entries, **sections}
+            append_delta(chain, snapshot.header, delta, prints)
+        else:
+            self._chain = write_checkpoint(self.path, snapshot.header, self._state)
@@ -0,0 +1,294 @@
+"""
+Script Runner - Headless command scripts and the throughput benchmark.
+
+A script is a text file with one input line per line (blank lines and
+lines starting with "#" are skipped). The runner builds a GameEngine with
+no terminal I/O, feeds each line through _process_input, the same
+pipeline the terminal and the server use (so "take lamp. n" chains), and
+records how long every line took. Lines the game reads
+on its own (such as the quit confirmation) are taken from the script too.
+
+Each script gets a transcript ("> command" followed by the game's reply),
+and the timings add up to commands per second plus p50/p99 latency per
+verb. A directory of scripts runs across a process pool, one fresh engine
+per script, which makes the whole thing a whole-game throughput benchmark.
+"""
+
+import json
+import logging
+import math
+import os
+import time
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .game import GameEngine
+from .hooks import HookStage, TurnContext
+from .output import FileTranscriptSink, OutputChannel
+from .sessions import WorldBase
+
+logger = logging.getLogger(__name__)
+
+COMMENT_PREFIX = "#"
+TRANSCRIPT_SUFFIX = ".transcript"
+SUMMARY_FILE = "summary.json"
+
+
+@dataclass
+class EngineOptions:
+    """How to build the engine for each script (picklable for worker processes)."""
+    use_mud_files: bool = True
+    mud_directory: Optional[str] = None
+    use_world_cache: bool = True
+    debug_mode: bool = False
+    seed: Optional[int] = None  # Same seed for every script, so runs are reproducible
+
+
+@dataclass
+class ScriptResult:
+    """Outcome and timings of one script."""
+    script: str
+    commands: int = 0  # Script lines executed (a chained line counts once)
+    elapsed: float = 0.0  # Seconds spent inside _process_input
+    setup_time: float = 0.0  # Seconds spent building the engine
+    latencies: Dict[str, List[float]] = field(default_factory=dict)  # verb -> seconds per command
+    errors: List[str] = field(default_factory=list)  # Commands that raised
+    stopped_early: bool = False  # The game ended (quit/death) before the script did
+    transcript: Optional[str] = None
+
+    @property
+    def commands_per_second(self) -> float:
+        return self.commands / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class BatchResult:
+    """Results of a directory of scripts."""
+    scripts: List[ScriptResult] = field(default_factory=list)
+    wall_time: float = 0.0  # Seconds from the first script starting to the last finishing
+    workers: int = 1
+
+    @property
+    def commands(self) -> int:
+        return sum(result.commands for result in self.scripts)
+
+    @property
+    def commands_per_second(self) -> float:
+        """Whole-batch throughput, counting every worker."""
+        return self.commands / self.wall_time if self.wall_time else 0.0
+
+    def latencies(self) -> Dict[str, List[float]]:
+        """Per-verb latencies merged across scripts."""
+        merged: Dict[str, List[float]] = {}
+        for result in self.scripts:
+            for verb, samples in result.latencies.items():
+                merged.setdefault(verb, []).extend(samples)
+        return merged
+
+
+def load_script(path: Path) -> List[str]:
+    """Commands in a script file, without blank lines and comments."""
+    commands = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith(COMMENT_PREFIX):
+                commands.append(line)
+    return commands
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of samples (0.0 when empty)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(len(ordered) * pct / 100))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class ScriptRunner:
+    """Runs command scripts against headless engines."""
+
+    def __init__(self, options: Optional[EngineOptions] = None) -> None:
+        self.options = options or EngineOptions()
+
+    def build_engine(self, output: OutputChannel, world_base: Optional[WorldBase] = None) -> GameEngine:
+        """Build an engine that writes only to output (forked from world_base if given)."""
+        options = self.options
+        mud_directory = Path(options.mud_directory) if options.mud_directory else None
+        return GameEngine(use_mud_files=options.use_mud_files, mud_directory=mud_directory,
+                          debug_mode=options.debug_mode, use_world_cache=options.use_world_cache,
+                          output=output, seed=options.seed, world_base=world_base)
+    
+    def build_world_base(self) -> WorldBase:
+        """Build a world once for many engines to fork from."""
+        return WorldBase.from_engine(self.build_engine(OutputChannel.memory()))
+
+    def run(self, script: Path, transcript_dir: Optional[Path] = None) -> ScriptResult:
+        """
+        Run one script on a fresh engine.
+
+        Args:
+            script: Script file
+            transcript_dir: Write <script name>.transcript here (None = no transcript)
+
+        Returns:
+            ScriptResult with per-verb timings
+        """
+        script = Path(script)
+        result = ScriptResult(script=str(script))
+        commands = load_script(script)
+
+        output = OutputChannel.memory()
+        transcript = None
+        if transcript_dir is not None:
+            transcript_dir = Path(transcript_dir)
+            transcript_dir.mkdir(parents=True, exist_ok=True)
+            transcript = FileTranscriptSink(transcript_dir / (script.stem + TRANSCRIPT_SUFFIX), mode="w")
+            output.add_sink(transcript)
+            result.transcript = str(transcript.path)
+
+        start = time.perf_counter()
+        game = self.build_engine(output)
+        result.setup_time = time.perf_counter() - start
+
+        pending = iter(commands)
+
+        def read_input(prompt: str) -> str:
+            # The game asks for a line mid-command (e.g. quit confirmation): take the next script line
+            line = next(pending, "")
+            output.write(f"{prompt}{line}")
+            return line
+
+        game.read_input = read_input
+        turns: List[TurnContext] = []  # Turns run by the current script line
+        game.hooks.register(HookStage.END_OF_TURN, lambda engine, context: turns.append(context),
+                            name="script_runner")
+        try:
+            output.begin_turn()
+            game._show_welcome()
+            game._look_around()
+            output.end_turn()
+
+            for line in pending:
+                if not game.running:
+                    result.stopped_early = True
+                    break
+                answering = game.player.awaiting_disambiguation
+                turns.clear()
+                output.write(f"\n> {line}")
+                start = time.perf_counter()
+                try:
+                    game._process_input(line)
+                except Exception as e:
+                    result.errors.append(f"{line}: {type(e).__name__}: {e}")
+                    logger.warning(f"{script.name}: '{line}' raised {type(e).__name__}: {e}")
+                latency = time.perf_counter() - start
+                result.elapsed += latency
+                result.commands += 1
+                verb = self._classify(turns, answering)
+                result.latencies.setdefault(verb, []).append(latency)
+        finally:
+            output.close()
+        return result
+
+    @staticmethod
+    def _classify(turns: List[TurnContext], answering: bool) -> str:
+        """
+        Verb a line was timed under: the first command's, for a chain.
+
+        Taken from the turns the line ran rather than by parsing the line
+        beforehand, which would warm the parse cache and leave parsing out of
+        the timing.
+        """
+        if answering:
+            return "(disambiguation)"
+        command = turns[0].command if turns else None
+        return command.verb if command else "(unparsed)"
+
+
+def _run_script_job(script: Path, options: EngineOptions, transcript_dir: Optional[Path]) -> ScriptResult:
+    """Worker: run one script in a pool process."""
+    return ScriptRunner(options).run(script, transcript_dir)
+
+
+def find_scripts(directory: Path, pattern: str = "*.txt") -> List[Path]:
+    """Script files in directory, in name order."""
+    return sorted(path for path in Path(directory).glob(pattern) if path.is_file())
+
+
+def run_batch(directory: Path, options: Optional[EngineOptions] = None, transcript_dir: Optional[Path] = None,
+              workers: Optional[int] = None, pattern: str = "*.txt") -> BatchResult:
+    """
+    Run every script in a directory, each on its own engine.
+
+    Args:
+        directory: Directory of scripts
+        options: Engine settings shared by every script
+        transcript_dir: Where transcripts and summary.json go (None = nowhere)
+        workers: Worker processes (default: one per CPU; 1 runs in this process)
+        pattern: Glob selecting script files
+
+    Returns:
+        BatchResult in script name order
+    """
+    options = options or EngineOptions()
+    scripts = find_scripts(directory, pattern)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(scripts) or 1))
+    batch = BatchResult(workers=workers)
+
+    start = time.perf_counter()
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                batch.scripts = list(pool.map(_run_script_job, scripts, repeat(options), repeat(transcript_dir)))
+        except (BrokenExecutor, OSError, NotImplementedError) as e:
+            # Process pools are unavailable on some platforms/sandboxes, or their workers get killed
+            logger.warning(f"Process pool unavailable ({type(e).__name__}), running scripts serially")
+            batch.workers = 1
+    if batch.workers == 1:
+        runner = ScriptRunner(options)
+        batch.scripts = [runner.run(script, transcript_dir) for script in scripts]
+    batch.wall_time = time.perf_counter() - start
+
+    if transcript_dir is not None:
+        write_summary(batch, Path(transcript_dir) / SUMMARY_FILE)
+    return batch
+
+
+def verb_table(latencies: Dict[str, List[float]]) -> List[Tuple[str, int, float, float]]:
+    """(verb, count, p50 ms, p99 ms), busiest verb first."""
+    rows = [(verb, len(samples), percentile(samples, 50) * 1000, percentile(samples, 99) * 1000)
+            for verb, samples in latencies.items()]
+    rows.sort(key=lambda row: (-row[1], row[0]))
+    return rows
+
+
+def format_summary(commands: int, elapsed: float, latencies: Dict[str, List[float]]) -> List[str]:
+    """Human-readable throughput line plus the per-verb latency table."""
+    rate = commands / elapsed if elapsed else 0.0
+    lines = [f"{commands} commands in {elapsed:.3f}s ({rate:,.0f} commands/sec)",
+             f"  {'verb':<18}{'count':>7}{'p50 ms':>10}{'p99 ms':>10}"]
+    for verb, count, p50, p99 in verb_table(latencies):
+        lines.append(f"  {verb:<18}{count:>7}{p50:>10.3f}{p99:>10.3f}")
+    return lines
+
+
+def write_summary(batch: BatchResult, path: Path) -> None:
+    """Write batch totals, per-verb percentiles and per-script results as JSON."""
+    summary = {
+        "scripts": len(batch.scripts),
+        "workers": batch.workers,
+        "commands": batch.commands,
+        "wall_time": batch.wall_time,
+        "commands_per_second": batch.commands_per_second,
+        "verbs": {verb: {"count": count, "p50_ms": p50, "p99_ms": p99}
+                  for verb, count, p50, p99 in verb_table(batch.latencies())},
+        "results": [{key: value for key, value in asdict(result).items() if key != "latencies"}
+                    for result in batch.scripts],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
@@ -0,0 +1,56 @@
+"""
+Change Tracker - What the game changed, for UNDO and for saves.
+
+Rooms, objects, the player and the NPC manager report each change they
+make to the engine's ChangeTracker:
+
+    record()          how to reverse it, passed on to the UndoJournal
+    room_changed()    which room, object or NPC it touched, so the next
+    object_changed()  save only has to write those (see take())
+    npc_changed()
+
+The engine owns the tracker and attaches it to the world, the object
+manager, the player and the NPC manager once the world is built, so a
+precompiled world image never holds one. The inventory isn't tracked:
+it is saved with the player every time.
+"""
+
+from typing import Any, Callable, Optional
+
+from .savefile import ChangeSet
+
+
+class ChangeTracker:
+    """Passes undo records to the journal and remembers what changed since the last save."""
+
+    def __init__(self, journal: Optional[Any] = None) -> None:
+        self.journal = journal  # UndoJournal of the engine
+        self.changes = ChangeSet()  # Rooms, objects and NPCs changed since the last save
+
+    @property
+    def recording(self) -> bool:
+        """True while a turn is being journaled."""
+        return self.journal is not None and self.journal.current is not None
+
+    def record(self, undo: Callable[..., Any], *args: Any) -> None:
+        """Pass the journal how to reverse a change (ignored when nothing is recording)."""
+        if self.journal is not None:
+            self.journal.record(undo, *args)
+
+    def room_changed(self, room_id: str) -> None:
+        self.changes.rooms.add(room_id)
+
+    def object_changed(self, object_id: str) -> None:
+        self.changes.objects.add(object_id)
+
+    def npc_changed(self, npc_id: str) -> None:
+        self.changes.npcs.add(npc_id)
+
+    def take(self) -> ChangeSet:
+        """What changed since the last take() or clear(), tracking anew from here."""
+        changes, self.changes = self.changes, ChangeSet()
+        return changes
+
+    def clear(self) -> None:
+        """Forget what changed (after it was saved or a save was loaded)."""
+        self.changes = ChangeSet()
@@ -25,6 +25,19 @@ class InteractionType(Enum):
     COOL_WITH = "cool_with"  # Cool object using another object
 
 
+# Interaction types each command verb may perform (verbs not listed accept any type)
+VERB_INTERACTION_TYPES: Dict[str, Tuple[InteractionType, ...]] = {
+    "combine": (InteractionType.COMBINE,),
+    "heat": (InteractionType.HEAT_WITH,),
+    "cool": (InteractionType.COOL_WITH,),
+    "light": (InteractionType.LIGHT_WITH,),
+    "break": (InteractionType.BREAK_WITH,),
+    "pour": (InteractionType.POUR_ON,),
+    "use": (InteractionType.APPLY_TOOL,),
+    "apply": (InteractionType.APPLY_TOOL,),
+}
+
+
 @dataclass
 class InteractionRule:
     """Defines how two objects can interact."""
@@ -54,10 +67,21 @@ class ObjectState:
 
 
 class ObjectCombinationManager:
-    """Manages object combinations, transformations, and tool usage."""
+    """
+    Manages object combinations, transformations, and tool usage.
+    
+    Rules are indexed by (primary_object, secondary_object) for lookups and
+    by every object they mention for hints, so neither grows with the
+    number of authored rules. Add and remove rules through
+    add_interaction_rule/remove_interaction_rule to keep the indexes current.
+    """
     
     def __init__(self):
         self.interaction_rules: Dict[str, InteractionRule] = {}
+        self._rules_by_pair: Dict[Tuple[str, Optional[str]], List[InteractionRule]] = {}
+        self._rules_by_object: Dict[str, Dict[str, InteractionRule]] = {}  # object_id -> rule_id -> rule
+        self._rule_order: Dict[str, int] = {}  # rule_id -> position, first-added rules win ties
+        self._added = 0  # Rules ever added; positions only grow, so removing a rule never frees one
         self.object_states: Dict[str, ObjectState] = {}
         self.interaction_history: List[str] = []
         
@@ -155,22 +179,55 @@ class ObjectCombinationManager:
         ))
     
     def add_interaction_rule(self, rule: InteractionRule) -> None:
-        """Add a new interaction rule."""
+        """Add a new interaction rule (replacing any rule with the same ID)."""
+        if rule.id in self.interaction_rules:
+            self.remove_interaction_rule(rule.id)
         self.interaction_rules[rule.id] = rule
+        self._added += 1
+        self._rule_order[rule.id] = self._added
+        self._rules_by_pair.setdefault((rule.primary_object, rule.secondary_object), []).append(rule)
+        for object_id in (rule.primary_object, rule.secondary_object):
+            if object_id:
+                self._rules_by_object.setdefault(object_id, {})[rule.id] = rule
         logger.info(f"Added interaction rule: {rule.id}")
     
+    def remove_interaction_rule(self, rule_id: str) -> Optional[InteractionRule]:
+        """Remove a rule by ID. Returns the removed rule, if any."""
+        rule = self.interaction_rules.pop(rule_id, None)
+        if rule is None:
+            return None
+        del self._rule_order[rule_id]
+        pair = (rule.primary_object, rule.secondary_object)
+        bucket = self._rules_by_pair.get(pair, [])
+        bucket[:] = [r for r in bucket if r.id != rule_id]
+        if not bucket:
+            self._rules_by_pair.pop(pair, None)
+        for object_id in (rule.primary_object, rule.secondary_object):
+            rules = self._rules_by_object.get(object_id)
+            if rules is not None:
+                rules.pop(rule_id, None)
+                if not rules:
+                    del self._rules_by_object[object_id]
+        return rule
+    
+    def _candidate_rules(self, primary_id: str, secondary_id: Optional[str]) -> List[InteractionRule]:
+        """Rules whose objects match, in the order they were added."""
+        # A rule without a secondary object matches whatever secondary was given
+        general = self._rules_by_pair.get((primary_id, None), [])
+        if secondary_id is None:
+            return general
+        specific = self._rules_by_pair.get((primary_id, secondary_id), [])
+        if not general or not specific:
+            return specific or general
+        return sorted(specific + general, key=lambda rule: self._rule_order[rule.id])
+    
     def can_interact(self, primary_id: str, secondary_id: Optional[str] = None, 
                     command_verb: str = "", room_id: Optional[str] = None) -> Optional[InteractionRule]:
         """Check if objects can interact and return the applicable rule."""
+        # Interaction types the command verb allows (None = any)
+        allowed_types = VERB_INTERACTION_TYPES.get(command_verb.lower()) if command_verb else None
         
-        for rule in self.interaction_rules.values():
-            # Check if objects match
-            if rule.primary_object != primary_id:
-                continue
-                
-            if rule.secondary_object and rule.secondary_object != secondary_id:
-                continue
-            
+        for rule in self._candidate_rules(primary_id, secondary_id):
             # Check room requirement
             if rule.required_room and rule.required_room != room_id:
                 continue
@@ -184,22 +241,9 @@ class ObjectCombinationManager:
                     logger.warning(f"Condition check failed for rule {rule.id}: {e}")
                     continue
             
-            # Check if interaction type matches command verb (optional)
-            if command_verb:
-                verb_mapping = {
-                    "combine": [InteractionType.COMBINE],
-                    "heat": [InteractionType.HEAT_WITH],
-                    "cool": [InteractionType.COOL_WITH],
-                    "light": [InteractionType.LIGHT_WITH],
-                    "break": [InteractionType.BREAK_WITH],
-                    "pour": [InteractionType.POUR_ON],
-                    "use": [InteractionType.APPLY_TOOL],
-                    "apply": [InteractionType.APPLY_TOOL]
-                }
-                
-                if command_verb.lower() in verb_mapping:
-                    if rule.interaction_type not in verb_mapping[command_verb.lower()]:
-                        continue
+            # Check if interaction type matches command verb
+            if allowed_types is not None and rule.interaction_type not in allowed_types:
+                continue
             
             return rule
         
@@ -258,11 +302,7 @@ class ObjectCombinationManager:
     
     def get_available_interactions(self, object_id: str) -> List[InteractionRule]:
         """Get all possible interactions for an object."""
-        interactions = []
-        for rule in self.interaction_rules.values():
-            if rule.primary_object == object_id or rule.secondary_object == object_id:
-                interactions.append(rule)
-        return interactions
+        return list(self._rules_by_object.get(object_id, {}).values())
     
     def get_interaction_hints(self, object_id: str) -> List[str]:
         """Get hints about what interactions are possible with an object."""
@@ -315,16 +355,18 @@ def integrate_combinations_into_game(game_engine):
     """Integrate object combination system into the main game engine."""
     game_engine.combination_manager = ObjectCombinationManager()
     
-    # Add enhanced command handlers to GameEngine
-    # These would be added to the _route_command method
-    enhanced_handlers = {
-        "heat": "_handle_heat",
-        "cool": "_handle_cool", 
-        "combine": "_handle_combine",
-        "break": "_handle_break_with",
-        "pour": "_handle_pour_on",
-        "apply": "_handle_apply_tool",
-        "use": "_handle_use_tool"
-    }
+    # Register combination verbs with the engine's verb registry
+    engine_class = type(game_engine)
+    combination_verbs = [
+        (("heat",), "_handle_heat", "heat <object>", "Object Combinations"),
+        (("cool",), "_handle_cool", "cool <object>", "Object Combinations"),
+        (("combine",), "_handle_combine", "combine <object> with <object>", "Object Combinations"),
+        (("break",), "_handle_break_with", "break <object> with <tool>", "Tool Usage"),
+        (("pour",), "_handle_pour_on", "pour <object> on <object>", "Tool Usage"),
+        (("use", "apply"), "_handle_use_tool", "use <tool> on <object>", "Tool Usage"),
+    ]
+    for verbs, handler_name, usage, category in combination_verbs:
+        game_engine.verbs.register(*verbs, handler=getattr(engine_class, handler_name),
+                                   usage=usage, category=category)
     
     return game_engine.combination_manager
\ No newline at end of file
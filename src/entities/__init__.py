@@ -5,6 +5,7 @@ from .objects import GameObject
 from .npc import NPC, DialogueNode, DialogueResponse
 from .npc_manager import NPCManager
 from .object_manager import ObjectManager
+from .containment import ContainmentIndex
 from .object_loader import ZorkObjectLoader
 from .combat import (
     CombatManager, 
@@ -26,6 +27,7 @@ __all__ = [
     # Managers
     'NPCManager',
     'ObjectManager',
+    'ContainmentIndex',
     'ZorkObjectLoader',
     
     # Combat system
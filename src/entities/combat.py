@@ -51,8 +51,8 @@ class CombatStats:
         self.current_health = min(self.max_health, self.current_health + amount)
         return self.current_health - old_health
     
-    def get_attack_damage(self) -> int:
-        """Calculate attack damage including weapon bonuses."""
+    def get_attack_damage(self, rng=None) -> int:
+        """Calculate attack damage including weapon bonuses (rng: random source, default the random module)."""
         base_damage = self.attack_power
         
         # Add weapon damage if equipped
@@ -61,7 +61,7 @@ class CombatStats:
         
         # Add some randomness (±20%)
         variation = int(base_damage * 0.2)
-        damage = base_damage + random.randint(-variation, variation)
+        damage = base_damage + (rng or random).randint(-variation, variation)
         
         return max(1, damage)  # Minimum 1 damage
 
@@ -81,7 +81,8 @@ class CombatAction:
 class CombatManager:
     """Manages combat encounters between player and NPCs."""
     
-    def __init__(self):
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random  # Source of combat rolls (a random.Random or the module)
         self.active_combats: Dict[str, Dict] = {}  # room_id -> combat_state
         self.combat_history: List[CombatAction] = []
         self.max_history_size = 50
@@ -127,25 +128,26 @@ class CombatManager:
         """Calculate the result of an attack."""
         # Check if attack hits
         hit_chance = attacker_stats.accuracy - (defender_stats.dodge_chance // 2)
-        hit_roll = random.randint(1, 100)
+        rng = self.rng
+        hit_roll = rng.randint(1, 100)
         
         # Miss check
         if hit_roll > hit_chance:
             return CombatResult.MISS, 0
         
         # Dodge check
-        if random.randint(1, 100) <= defender_stats.dodge_chance:
+        if rng.randint(1, 100) <= defender_stats.dodge_chance:
             return CombatResult.DODGE, 0
         
         # Block check
-        if random.randint(1, 100) <= defender_stats.block_chance:
+        if rng.randint(1, 100) <= defender_stats.block_chance:
             return CombatResult.BLOCK, 0
         
         # Calculate damage
-        damage = attacker_stats.get_attack_damage()
+        damage = attacker_stats.get_attack_damage(rng)
         
         # Critical hit check
-        if random.randint(1, 100) <= attacker_stats.critical_chance:
+        if rng.randint(1, 100) <= attacker_stats.critical_chance:
             damage = int(damage * 1.5)
             return CombatResult.CRITICAL, damage
         
@@ -193,7 +195,7 @@ class CombatManager:
         
         # TODO: Modify based on entity stats, room conditions, etc.
         
-        success = random.randint(1, 100) <= flee_chance
+        success = self.rng.randint(1, 100) <= flee_chance
         
         if success:
             # Remove from combat participants
@@ -0,0 +1,83 @@
+"""ContainmentIndex - Reverse map from each object to whatever holds it."""
+
+from typing import Dict, List, Optional, Tuple
+
+# Location types (match the values returned by find_object_location)
+LOCATION_ROOM = "room"
+LOCATION_INVENTORY = "inventory"
+LOCATION_CONTAINER = "container"
+
+# (location_type, holder_id); holder_id is None for the player's inventory
+Parent = Tuple[str, Optional[str]]
+
+
+class ContainmentIndex:
+    """
+    Maps object ID -> (location_type, holder_id).
+
+    Rooms, the player and containers report every add/remove here, so an
+    object's location is a dictionary lookup and its full path to a room
+    or the inventory costs one lookup per level of nesting.
+    
+    The index also keeps a world mutation version: every placement change,
+    object attribute write and room flag change bumps it, so caches derived
+    from world state can tell when they are stale.
+    """
+
+    # Guards against cycles from malformed container data
+    MAX_DEPTH = 32
+
+    def __init__(self) -> None:
+        self.parents: Dict[str, Parent] = {}
+        self.version = 0
+
+    def touch(self) -> None:
+        """Record a world mutation that doesn't move anything (a room's flags, an object's attributes)."""
+        self.version += 1
+
+    def place(self, item_id: str, location_type: str, holder_id: Optional[str] = None) -> None:
+        """Record that item_id is now held by the given room, inventory or container."""
+        self.parents[item_id] = (location_type, holder_id)
+        self.version += 1
+
+    def release(self, item_id: str, location_type: str, holder_id: Optional[str] = None) -> None:
+        """Forget item_id's parent if it is still the given holder."""
+        if self.parents.get(item_id) == (location_type, holder_id):
+            del self.parents[item_id]
+        self.version += 1
+
+    def get_parent(self, item_id: str) -> Optional[Parent]:
+        """Get the immediate holder of an object, if known."""
+        return self.parents.get(item_id)
+
+    def get_chain(self, item_id: str) -> List[Parent]:
+        """Get holders from the immediate parent up to the room or inventory."""
+        chain = []
+        parent = self.parents.get(item_id)
+        while parent is not None and len(chain) < self.MAX_DEPTH:
+            chain.append(parent)
+            if parent[0] != LOCATION_CONTAINER:
+                break
+            parent = self.parents.get(parent[1])
+        return chain
+
+    def clear(self) -> None:
+        """Forget all locations."""
+        self.parents.clear()
+        self.version += 1
+
+    def rebuild(self, world, player, object_manager) -> None:
+        """Rebuild the index from room items, the inventory and container contents."""
+        self.clear()
+        for room in world.rooms.values():
+            for item_id in room.items:
+                self.place(item_id, LOCATION_ROOM, room.id)
+        for item_id in player.inventory:
+            self.place(item_id, LOCATION_INVENTORY)
+        for obj in object_manager.objects.values():
+            for item_id in obj.get_contents():
+                self.place(item_id, LOCATION_CONTAINER, obj.id)
+
+    def __len__(self) -> int:
+        """Return number of objects with a known location."""
+        return len(self.parents)
@@ -1,6 +1,6 @@
 """NPC Manager - Central registry for all NPCs and conversation handling."""
 
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from .npc import NPC, DialogueNode, DialogueResponse
 
 
@@ -11,6 +11,13 @@ class NPCManager:
         self.npcs: Dict[str, NPC] = {}
         self.dialogue_states: Dict[str, str] = {}  # npc_id -> current_node_id
         self.active_conversations: Dict[str, str] = {}  # player_id -> npc_id (for future multiplayer support)
+        self.tracker: Optional[Any] = None  # ChangeTracker of the engine (set by the engine)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # The tracker belongs to the engine; don't pickle it into world images
+        state = self.__dict__.copy()
+        state["tracker"] = None
+        return state
     
     def add_npc(self, npc: NPC) -> None:
         """Add an NPC to the registry."""
@@ -40,10 +47,22 @@ class NPCManager:
         """Move an NPC to a new room. Returns True if successful."""
         npc = self.get_npc(npc_id)
         if npc and npc.is_moveable():
-            npc.location = new_room
+            self.place_npc(npc, new_room)
             return True
         return False
     
+    def place_npc(self, npc: NPC, room_id: str) -> None:
+        """Put an NPC in a room, moveable or not (scripted moves and UNDO)."""
+        self.record(self.place_npc, npc, npc.location)
+        npc.location = room_id
+        if self.tracker is not None:
+            self.tracker.npc_changed(npc.id)
+    
+    def record(self, undo: Callable[..., Any], *args: Any) -> None:
+        """Pass the tracker how to reverse an NPC change (ignored without a tracker)."""
+        if self.tracker is not None:
+            self.tracker.record(undo, *args)
+    
     def start_conversation_with_npc(self, npc: NPC, player_id: str = "default") -> Tuple[bool, str]:
         """
         Start a conversation with an NPC.
@@ -1,30 +1,129 @@
 """ObjectManager - Central registry for all game objects."""
 
-from typing import Dict, Optional, List, Tuple
+from typing import Any, Dict, FrozenSet, Iterator, Optional, List, Set, Tuple
 from .objects import GameObject
+from .containment import ContainmentIndex, LOCATION_ROOM, LOCATION_INVENTORY, LOCATION_CONTAINER
+
+
+_NO_MATCHES: FrozenSet[str] = frozenset()
 
 
 class ObjectManager:
     """Manages all game objects and their locations."""
     
+    # Shortest partial name that matches (mirrors GameObject.matches)
+    MIN_SUBSTRING_MATCH = 5
+    
     def __init__(self) -> None:
         self.objects: Dict[str, GameObject] = {}
+        self._name_index: Dict[str, Set[str]] = {}  # Match key -> object IDs
+        self._index_keys: Dict[str, Set[str]] = {}  # Object ID -> its match keys
+        self._positions: Dict[str, int] = {}  # Object ID -> registration order
+        self._bulk_action_ids: Set[str] = set()
+        self.containment = ContainmentIndex()  # Object ID -> room, inventory or container holding it
+        self.tracker: Optional[Any] = None  # ChangeTracker of the engine (set by the engine)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # The tracker belongs to the engine; don't pickle it into world images
+        state = self.__dict__.copy()
+        state["tracker"] = None
+        return state
+    
+    def attach_tracker(self, tracker: Any) -> None:
+        """Report every object's changes (current and future) to a ChangeTracker."""
+        self.tracker = tracker
+        for obj in self.objects.values():
+            obj.tracker = tracker
     
     def add_object(self, obj: GameObject) -> None:
         """Add an object to the registry."""
+        if obj.id in self.objects:
+            self._unindex_object(obj.id)
+        else:
+            self._positions[obj.id] = len(self._positions)
         self.objects[obj.id] = obj
+        self._index_object(obj)
+        
+        # Track container contents from now on
+        obj.containment = self.containment
+        obj.tracker = self.tracker
+        for item_id in obj.get_contents():
+            self.containment.place(item_id, LOCATION_CONTAINER, obj.id)
+    
+    def reindex_object(self, obj: GameObject) -> None:
+        """Refresh index entries after an object's name, aliases or bulk flag change."""
+        if obj.id in self.objects:
+            self._unindex_object(obj.id)
+            self._index_object(obj)
+    
+    def _match_keys(self, obj: GameObject) -> Set[str]:
+        """Every noun for which obj.matches() is true."""
+        name_lower = obj.name.lower()
+        keys = {alias.lower() for alias in obj.aliases}
+        keys.add(name_lower)
+        keys.update(name_lower.split())
+        
+        # All substrings long enough to match partially
+        length = len(name_lower)
+        for start in range(length - self.MIN_SUBSTRING_MATCH + 1):
+            for end in range(start + self.MIN_SUBSTRING_MATCH, length + 1):
+                keys.add(name_lower[start:end])
+        return keys
+    
+    def _index_object(self, obj: GameObject) -> None:
+        """Add obj to the name index and bulk-action set."""
+        keys = self._match_keys(obj)
+        self._index_keys[obj.id] = keys
+        for key in keys:
+            self._name_index.setdefault(key, set()).add(obj.id)
+        if obj.is_bulk_action():
+            self._bulk_action_ids.add(obj.id)
+    
+    def _unindex_object(self, object_id: str) -> None:
+        """Remove an object ID from the name index and bulk-action set."""
+        for key in self._index_keys.pop(object_id, ()):
+            ids = self._name_index.get(key)
+            if ids is not None:
+                ids.discard(object_id)
+                if not ids:
+                    del self._name_index[key]
+        self._bulk_action_ids.discard(object_id)
     
     def get_object(self, object_id: str) -> Optional[GameObject]:
         """Get an object by its ID."""
         return self.objects.get(object_id)
     
+    def peek_object(self, object_id: str) -> Optional[GameObject]:
+        """Get an object only to read it (a session doesn't copy it)."""
+        return self.objects.get(object_id)
+    
+    def _ids_named(self, key: str) -> Optional[Set[str]]:
+        """Indexed IDs for a lowercase match key."""
+        return self._name_index.get(key)
+    
+    def _position(self, object_id: str) -> int:
+        """Registration order of an object."""
+        return self._positions[object_id]
+    
+    def _bulk_ids(self) -> Set[str]:
+        """IDs of the bulk action objects."""
+        return self._bulk_action_ids
+    
+    def find_object_ids_by_name(self, name: str) -> FrozenSet[str]:
+        """Return IDs of all objects whose matches(name) is true."""
+        ids = self._ids_named(name.lower().strip())
+        return frozenset(ids) if ids else _NO_MATCHES
+    
     def find_objects_by_name(self, name: str) -> List[GameObject]:
         """Find all objects that match the given name."""
-        matches = []
-        for obj in self.objects.values():
-            if obj.matches(name):
-                matches.append(obj)
-        return matches
+        ids = self._ids_named(name.lower().strip())
+        if not ids:
+            return []
+        return [self.objects[obj_id] for obj_id in sorted(ids, key=self._position)]
+    
+    def get_bulk_action_objects(self) -> List[GameObject]:
+        """Get bulk action objects (ALL, VALUABLES, ...) in registration order."""
+        return [self.objects[obj_id] for obj_id in sorted(self._bulk_ids(), key=self._position)]
     
     def get_objects_in_room(self, room_items: List[str]) -> List[GameObject]:
         """Get GameObject instances for object IDs in a room."""
@@ -45,10 +144,57 @@ class ObjectManager:
         return objects
     
     def find_object_location(self, obj: GameObject, world, player) -> Tuple[str, Optional[str]]:
-        """Find where an object is located. Returns (location_type, container_id)."""
-        from ..world.world import World
-        from ..entities.player import Player
+        """
+        Find where an object is located relative to the player.
+        
+        Returns ("room", None) for the current room, ("inventory", None),
+        ("container", container_id) for a container in the room or inventory,
+        or ("unknown", None) when the object is out of reach.
+        """
+        parent = self._verified_parent(obj.id, world, player)
+        if parent is None:
+            # Not tracked (e.g. lists edited directly); fall back to scanning
+            return self._scan_object_location(obj, world, player)
+        
+        location_type, holder_id = parent
+        if location_type == LOCATION_ROOM:
+            return ("room", None) if holder_id == player.current_room else ("unknown", None)
+        if location_type == LOCATION_INVENTORY:
+            return ("inventory", None)
         
+        # Only containers directly in the room or inventory count as reachable
+        container_parent = self._verified_parent(holder_id, world, player)
+        if container_parent is None:
+            return self._scan_object_location(obj, world, player)
+        if container_parent in ((LOCATION_ROOM, player.current_room), (LOCATION_INVENTORY, None)):
+            return ("container", holder_id)
+        return ("unknown", None)
+    
+    def get_location_chain(self, object_id: str, world, player) -> List[Tuple[str, Optional[str]]]:
+        """Get (location_type, holder_id) pairs from an object's parent up to its room or the inventory."""
+        if self._verified_parent(object_id, world, player) is None:
+            return []
+        return self.containment.get_chain(object_id)
+    
+    def _verified_parent(self, object_id: str, world, player) -> Optional[Tuple[str, Optional[str]]]:
+        """Get an object's indexed parent, confirming the holder really lists it."""
+        parent = self.containment.get_parent(object_id)
+        if parent is None:
+            return None
+        
+        location_type, holder_id = parent
+        if location_type == LOCATION_ROOM:
+            room = world.peek_room(holder_id)
+            held = room is not None and object_id in room.items
+        elif location_type == LOCATION_INVENTORY:
+            held = object_id in player.inventory
+        else:
+            container = self.get_object(holder_id)
+            held = container is not None and object_id in container.get_contents()
+        return parent if held else None
+    
+    def _scan_object_location(self, obj: GameObject, world, player) -> Tuple[str, Optional[str]]:
+        """Find an object's location by scanning the room, inventory and their containers."""
         current_room = world.get_room(player.current_room)
         
         # Check if in current room
@@ -78,6 +224,10 @@ class ObjectManager:
         """Get all objects in the registry."""
         return self.objects.copy()
     
+    def iter_objects(self) -> Iterator[GameObject]:
+        """Every object, for reading only (a session's manager doesn't copy them for this)."""
+        return iter(self.objects.values())
+    
     def __len__(self) -> int:
         """Return number of objects in registry."""
         return len(self.objects)
\ No newline at end of file
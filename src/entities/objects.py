@@ -1,30 +1,236 @@
 """GameObject class - Represents items and objects in the game."""
 
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field
+from collections.abc import MutableMapping
+from typing import Dict, Any, Iterator, Optional, List
+
+# Boolean attributes packed into GameObject._flags
+FLAG_TAKEABLE = 1 << 0
+FLAG_CONTAINER = 1 << 1
+FLAG_OPENABLE = 1 << 2
+FLAG_OPEN = 1 << 3
+FLAG_LOCKED = 1 << 4
+FLAG_LIGHT_SOURCE = 1 << 5
+FLAG_LIT = 1 << 6
+FLAG_TREASURE = 1 << 7
+FLAG_BULK_ACTION = 1 << 8
+FLAG_DOOR = 1 << 9
+
+_FLAG_BITS: Dict[str, int] = {
+    "takeable": FLAG_TAKEABLE,
+    "container": FLAG_CONTAINER,
+    "openable": FLAG_OPENABLE,
+    "open": FLAG_OPEN,
+    "locked": FLAG_LOCKED,
+    "light_source": FLAG_LIGHT_SOURCE,
+    "lit": FLAG_LIT,
+    "treasure": FLAG_TREASURE,
+    "bulk_action": FLAG_BULK_ACTION,
+    "door": FLAG_DOOR,
+}
+
+# Integer attributes kept in their own slots (None = not set)
+_TYPED_SLOTS: Dict[str, str] = {
+    "weight": "_weight",
+    "capacity": "_capacity",
+    "light_turns": "_light_turns",
+    "treasure_value": "_treasure_value",
+}
+
+_MISSING = object()
+
+
+class _AttributeView(MutableMapping):
+    """Dict-like view over a GameObject's packed attributes."""
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj: "GameObject") -> None:
+        self._obj = obj
+
+    def __getitem__(self, name: str) -> Any:
+        value = self._obj.get_attribute(name, _MISSING)
+        if value is _MISSING:
+            raise KeyError(name)
+        return value
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        self._obj.set_attribute(name, value)
+
+    def __delitem__(self, name: str) -> None:
+        if not self._obj.remove_attribute(name):
+            raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._obj._attribute_names())
+
+    def __len__(self) -> int:
+        return len(self._obj._attribute_names())
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
 
 
-@dataclass
 class GameObject:
-    """Represents an item or object in the game world."""
-    
-    id: str
-    name: str  # What players see and type
-    description: str  # Full description when examined
-    attributes: Dict[str, Any] = field(default_factory=dict)
-    aliases: List[str] = field(default_factory=list)  # Alternative names for this object
-    
+    """
+    Represents an item or object in the game world.
+
+    Objects are numerous and their predicates (is_takeable, is_open, ...)
+    run on every scope walk, so attributes are packed: the common boolean
+    flags live in a bitfield, the common integer attributes in typed slots,
+    and everything else in a small overflow dict. get_attribute(),
+    set_attribute() and the ``attributes`` mapping behave exactly as the
+    plain dict did, including values of unexpected types.
+    """
+
+    __slots__ = ("id", "name", "description", "aliases", "containment", "tracker",
+                 "_flags", "_flags_present", "_weight", "_capacity",
+                 "_light_turns", "_treasure_value", "_extra")
+
+    def __init__(self, id: str, name: str, description: str,
+                 attributes: Optional[Dict[str, Any]] = None,
+                 aliases: Optional[List[str]] = None,
+                 containment: Optional[Any] = None) -> None:
+        self.id = id
+        self.name = name  # What players see and type
+        self.description = description  # Full description when examined
+        self.aliases = aliases if aliases is not None else []  # Alternative names for this object
+        self.containment = containment  # ContainmentIndex
+        self.tracker: Optional[Any] = None  # ChangeTracker of the engine
+        self._flags = 0  # Values of the packed boolean attributes
+        self._flags_present = 0  # Which packed boolean attributes are set at all
+        self._weight: Optional[int] = None
+        self._capacity: Optional[int] = None
+        self._light_turns: Optional[int] = None
+        self._treasure_value: Optional[int] = None
+        self._extra: Optional[Dict[str, Any]] = None  # Remaining attributes
+        if attributes:
+            for attr_name, value in attributes.items():
+                self._store(attr_name, value)
+
+    @property
+    def attributes(self) -> MutableMapping:
+        """All attributes as a mutable mapping."""
+        return _AttributeView(self)
+
+    @attributes.setter
+    def attributes(self, values: Dict[str, Any]) -> None:
+        if self.tracker is not None and self.tracker.recording:
+            self.tracker.record(setattr, self, "attributes", dict(self.attributes.items()))
+        self._clear_attributes()
+        for attr_name, value in values.items():
+            self._store(attr_name, value)
+        self._touch()
+
+    def _store(self, name: str, value: Any) -> None:
+        """Put a value in its packed location, dropping any other copy of it."""
+        bit = _FLAG_BITS.get(name)
+        slot = _TYPED_SLOTS.get(name)
+        if bit is not None and type(value) is bool:
+            self._flags_present |= bit
+            if value:
+                self._flags |= bit
+            else:
+                self._flags &= ~bit
+        elif slot is not None and type(value) is int:
+            setattr(self, slot, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[name] = value
+            if bit is not None:
+                self._flags_present &= ~bit
+                self._flags &= ~bit
+            elif slot is not None:
+                setattr(self, slot, None)
+            return
+        if self._extra and name in self._extra:
+            del self._extra[name]
+
+    def _clear_attributes(self) -> None:
+        """Drop every attribute."""
+        self._flags = 0
+        self._flags_present = 0
+        self._weight = self._capacity = self._light_turns = self._treasure_value = None
+        self._extra = None
+
+    def _attribute_names(self) -> List[str]:
+        """Names of all set attributes."""
+        names = [name for name, bit in _FLAG_BITS.items() if self._flags_present & bit]
+        names.extend(name for name, slot in _TYPED_SLOTS.items() if getattr(self, slot) is not None)
+        if self._extra:
+            names.extend(self._extra)
+        return names
+
     def get_attribute(self, name: str, default: Any = None) -> Any:
         """Get an attribute value with optional default."""
-        return self.attributes.get(name, default)
+        bit = _FLAG_BITS.get(name)
+        if bit is not None:
+            if self._flags_present & bit:
+                return self._flags & bit != 0
+        else:
+            slot = _TYPED_SLOTS.get(name)
+            if slot is not None:
+                value = getattr(self, slot)
+                if value is not None:
+                    return value
+        if self._extra:
+            return self._extra.get(name, default)
+        return default
     
     def set_attribute(self, name: str, value: Any) -> None:
         """Set an attribute value."""
-        self.attributes[name] = value
+        tracker = self.tracker
+        if tracker is not None and tracker.recording:
+            tracker.record(self._restore_attribute, name, self.get_attribute(name, _MISSING))
+        self._store(name, value)
+        self._touch()
+
+    def _touch(self) -> None:
+        """Tell the containment index and the tracker that an attribute changed."""
+        if self.containment is not None:
+            self.containment.touch()
+        if self.tracker is not None:
+            self.tracker.object_changed(self.id)
+
+    def _restore_attribute(self, name: str, value: Any) -> None:
+        """Put back an attribute's earlier value (_MISSING: it wasn't set)."""
+        if value is _MISSING:
+            self.remove_attribute(name)
+        else:
+            self.set_attribute(name, value)
+
+    def remove_attribute(self, name: str) -> bool:
+        """Remove an attribute. Returns True if it was set."""
+        tracker = self.tracker
+        if tracker is not None and tracker.recording:
+            old_value = self.get_attribute(name, _MISSING)
+            if old_value is not _MISSING:
+                tracker.record(self.set_attribute, name, old_value)
+        bit = _FLAG_BITS.get(name)
+        slot = _TYPED_SLOTS.get(name)
+        if bit is not None and self._flags_present & bit:
+            self._flags_present &= ~bit
+            self._flags &= ~bit
+        elif slot is not None and getattr(self, slot) is not None:
+            setattr(self, slot, None)
+        elif self._extra and name in self._extra:
+            del self._extra[name]
+        else:
+            return False
+        self._touch()
+        return True
+
+    def _extra_flag(self, name: str) -> Any:
+        """Value of a flag attribute that isn't packed (unset or not a bool)."""
+        if self._extra:
+            return self._extra.get(name, False)
+        return False
     
     def is_takeable(self) -> bool:
         """Check if this object can be picked up."""
-        return self.get_attribute("takeable", False)
+        if self._flags_present & FLAG_TAKEABLE:
+            return self._flags & FLAG_TAKEABLE != 0
+        return self._extra_flag("takeable")
     
     def is_portable(self) -> bool:
         """Check if this object can be carried around."""
@@ -36,19 +242,27 @@ class GameObject:
     
     def is_container(self) -> bool:
         """Check if this object can contain other objects."""
-        return self.get_attribute("container", False)
+        if self._flags_present & FLAG_CONTAINER:
+            return self._flags & FLAG_CONTAINER != 0
+        return self._extra_flag("container")
     
     def is_openable(self) -> bool:
         """Check if this object can be opened/closed."""
-        return self.get_attribute("openable", False)
+        if self._flags_present & FLAG_OPENABLE:
+            return self._flags & FLAG_OPENABLE != 0
+        return self._extra_flag("openable")
     
     def is_open(self) -> bool:
         """Check if this openable object is currently open."""
-        return self.get_attribute("open", False)
+        if self._flags_present & FLAG_OPEN:
+            return self._flags & FLAG_OPEN != 0
+        return self._extra_flag("open")
 
     def is_locked(self) -> bool:
         """Check if this container is locked."""
-        return self.get_attribute("locked", False)
+        if self._flags_present & FLAG_LOCKED:
+            return self._flags & FLAG_LOCKED != 0
+        return self._extra_flag("locked")
         
     def can_open(self) -> bool:
         """Check if this container can currently be opened."""
@@ -71,7 +285,9 @@ class GameObject:
         
     def is_bulk_action(self) -> bool:
         """Check if this is a bulk action object (ALL, EVERYTHING, etc.)."""
-        return self.get_attribute("bulk_action", False)
+        if self._flags_present & FLAG_BULK_ACTION:
+            return self._flags & FLAG_BULK_ACTION != 0
+        return self._extra_flag("bulk_action")
         
     def get_bulk_type(self) -> str:
         """Get the type of bulk action (all, valuables, possessions)."""
@@ -83,11 +299,17 @@ class GameObject:
     
     def is_light_source(self) -> bool:
         """Check if this object provides light."""
-        return self.get_attribute("light_source", False)
+        if self._flags_present & FLAG_LIGHT_SOURCE:
+            return self._flags & FLAG_LIGHT_SOURCE != 0
+        return self._extra_flag("light_source")
     
     def is_lit(self) -> bool:
         """Check if this light source is currently providing light."""
-        return self.is_light_source() and self.get_attribute("lit", False)
+        if not self.is_light_source():
+            return False
+        if self._flags_present & FLAG_LIT:
+            return self._flags & FLAG_LIT != 0
+        return self._extra_flag("lit")
     
     def light_turns_remaining(self) -> int:
         """Get remaining turns of light (0 = infinite, -1 = no light)."""
@@ -112,7 +334,20 @@ class GameObject:
         if item_id not in contents:
             contents.append(item_id)
             self.set_attribute("contents", contents)
+            if self.tracker is not None:
+                self.tracker.record(self.remove_from_container, item_id)
+        if self.containment is not None:
+            self.containment.place(item_id, "container", self.id)
         return True
+
+    def insert_into_container(self, index: int, item_id: str) -> None:
+        """Put an item back at a position in the contents (used by UNDO; ignores capacity)."""
+        contents = self.get_attribute("contents", [])
+        if item_id not in contents:
+            contents.insert(index, item_id)
+            self.set_attribute("contents", contents)
+        if self.containment is not None:
+            self.containment.place(item_id, "container", self.id)
     
     def remove_from_container(self, item_id: str) -> bool:
         """Remove an item from this container. Returns True if item was present."""
@@ -121,11 +356,16 @@ class GameObject:
         
         contents = self.get_attribute("contents", [])
         try:
-            contents.remove(item_id)
-            self.set_attribute("contents", contents)
-            return True
+            index = contents.index(item_id)
         except ValueError:
             return False
+        del contents[index]
+        self.set_attribute("contents", contents)
+        if self.tracker is not None:
+            self.tracker.record(self.insert_into_container, index, item_id)
+        if self.containment is not None:
+            self.containment.release(item_id, "container", self.id)
+        return True
     
     def get_contents(self) -> List[str]:
         """Get the list of items in this container."""
@@ -133,6 +373,32 @@ class GameObject:
             return []
         return self.get_attribute("contents", [])
     
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.id, self.name, self.description, self.aliases) ==
+                (other.id, other.name, other.description, other.aliases)
+                and dict(self.attributes.items()) == dict(other.attributes.items()))
+
+    __hash__ = None  # Mutable, like the dataclass it replaced
+
+    def __repr__(self) -> str:
+        return (f"GameObject(id={self.id!r}, name={self.name!r}, description={self.description!r}, "
+                f"attributes={self.attributes!r}, aliases={self.aliases!r})")
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = {slot: getattr(self, slot) for slot in self.__slots__}
+        state["tracker"] = None  # Belongs to the engine; not pickled into world images
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for slot in self.__slots__:
+            setattr(self, slot, state.get(slot))
+        if self._flags is None:
+            self._flags = 0
+        if self._flags_present is None:
+            self._flags_present = 0
+    
     def __str__(self) -> str:
         """String representation for display."""
         return self.name
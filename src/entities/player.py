@@ -14,6 +14,8 @@ class Player:
         self.score: int = 0
         self.max_inventory_size: int = 10
         self.brief_mode: bool = False  # Whether to show brief room descriptions
+        self.containment = None  # ContainmentIndex shared with rooms and containers
+        self.tracker = None  # ChangeTracker of the engine (undo records; the inventory is always saved)
         
         # Combat system
         self.combat_stats = CombatStats(
@@ -43,15 +45,31 @@ class Player:
             return False
         if item_id not in self.inventory:
             self.inventory.append(item_id)
+            if self.tracker is not None:
+                self.tracker.record(self.remove_from_inventory, item_id)
+        if self.containment is not None:
+            self.containment.place(item_id, "inventory")
         return True
     
+    def insert_into_inventory(self, index: int, item_id: str) -> None:
+        """Put an item back at a position in the inventory (used by UNDO; ignores the size limit)."""
+        if item_id not in self.inventory:
+            self.inventory.insert(index, item_id)
+        if self.containment is not None:
+            self.containment.place(item_id, "inventory")
+    
     def remove_from_inventory(self, item_id: str) -> bool:
         """Remove an item from inventory. Returns True if item was present."""
         try:
-            self.inventory.remove(item_id)
-            return True
+            index = self.inventory.index(item_id)
         except ValueError:
             return False
+        del self.inventory[index]
+        if self.tracker is not None:
+            self.tracker.record(self.insert_into_inventory, index, item_id)
+        if self.containment is not None:
+            self.containment.release(item_id, "inventory")
+        return True
     
     def has_item(self, item_id: str) -> bool:
         """Check if player has a specific item."""
@@ -13,22 +13,21 @@ This implementation provides the foundation for all other canonical NPCs.
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass
 import random
-import time
 
 from src.entities.npc import NPC, DialogueNode, DialogueResponse
 from src.entities.combat import CombatStats
+from src.hooks import HookStage
 
 
 class ThiefBehavior:
     """Manages Thief-specific behaviors and mechanics."""
     
-    def __init__(self, thief_npc: NPC):
+    def __init__(self, thief_npc: NPC, rng=None):
         self.thief = thief_npc
+        self.rng = rng if rng is not None else random  # Source of theft/movement/flee decisions
         self.stolen_objects: List[str] = []  # Objects stolen from player
-        self.last_theft_time = 0
-        self.theft_cooldown = 30  # Seconds between theft attempts
-        self.movement_timer = 0
-        self.movement_interval = 45  # Seconds between room movements
+        self.theft_cooldown = 5  # Turns before stealing again after a successful theft
+        self.movement_interval = 3  # Turns between chances to wander
         
         # Thief preferences for what to steal (treasures preferred)
         self.theft_preferences = {
@@ -39,15 +38,15 @@ class ThiefBehavior:
             "other": 1       # Low priority for other items
         }
     
-    def can_attempt_theft(self) -> bool:
-        """Check if Thief can attempt to steal something."""
-        current_time = time.time()
-        return (current_time - self.last_theft_time) > self.theft_cooldown
+    def __getstate__(self) -> Dict[str, Any]:
+        # The random source belongs to the running engine, not to world images
+        state = self.__dict__.copy()
+        state.pop("rng", None)
+        return state
     
-    def can_move(self) -> bool:
-        """Check if Thief can move to a different room."""
-        current_time = time.time()  
-        return (current_time - self.movement_timer) > self.movement_interval
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.rng = random
     
     def get_theft_targets(self, player_inventory: List[str], object_manager) -> List[str]:
         """Get list of objects Thief wants to steal, ordered by preference."""
@@ -87,7 +86,7 @@ class ThiefBehavior:
     
     def attempt_theft(self, player_inventory: List[str], object_manager) -> Optional[str]:
         """Attempt to steal an object. Returns stolen object ID or None."""
-        if not self.can_attempt_theft() or not player_inventory:
+        if not player_inventory:
             return None
             
         targets = self.get_theft_targets(player_inventory, object_manager)
@@ -95,10 +94,9 @@ class ThiefBehavior:
             return None
         
         # Thief has 60% chance to successfully steal the preferred item
-        if random.random() < 0.6:
+        if self.rng.random() < 0.6:
             stolen_item = targets[0]  # Take highest priority item
             self.stolen_objects.append(stolen_item)
-            self.last_theft_time = time.time()
             return stolen_item
             
         return None
@@ -111,13 +109,11 @@ class ThiefBehavior:
     
     def get_movement_destinations(self, current_room, world) -> List[str]:
         """Get list of rooms Thief can move to."""
-        room = world.get_room(current_room)
-        if not room or not room.exits:
+        # Valid exits only; the compiled world graph skips exits to missing rooms
+        destinations = [room_id for _, room_id in world.get_graph().neighbors(current_room)]
+        if not destinations:
             return []
         
-        # Thief prefers rooms with treasures or player presence
-        destinations = list(room.exits.values())
-        
         # Filter out dangerous rooms Thief would avoid
         safe_destinations = []
         for room_id in destinations:
@@ -135,13 +131,13 @@ class ThiefBehavior:
         if health_ratio < 0.3:
             return True
         elif health_ratio < 0.6:
-            return random.random() < 0.2
+            return self.rng.random() < 0.2
             
         return False
 
 
-def create_canonical_thief(npc_manager, starting_room: str = "WHOUS") -> NPC:
-    """Create the canonical Thief NPC with authentic Zork behaviors."""
+def create_canonical_thief(npc_manager, starting_room: str = "WHOUS", rng=None) -> NPC:
+    """Create the canonical Thief NPC with authentic Zork behaviors (rng: random source for its decisions)."""
     
     # Create dialogue nodes for Thief interactions
     encounter_node = DialogueNode(
@@ -220,38 +216,55 @@ def create_canonical_thief(npc_manager, starting_room: str = "WHOUS") -> NPC:
     )
     
     # Initialize Thief behavior system
-    thief.thief_behavior = ThiefBehavior(thief)
+    thief.thief_behavior = ThiefBehavior(thief, rng)
     
     return thief
 
 
 def integrate_thief_behaviors(game_engine):
-    """Integrate Thief behaviors into the game engine."""
-    
-    original_process_command = game_engine._process_command
-    
-    def enhanced_process_command(user_input: str) -> None:
-        """Enhanced command processing with Thief behavior integration."""
-        
-        # Check for Thief theft attempts before processing player command
-        thief = game_engine.npc_manager.get_npc("THIEF")
-        if thief and thief.location == game_engine.player.current_room:
-            _handle_thief_behaviors(game_engine, thief)
-        
-        # Process the original command
-        original_process_command(user_input)
-        
-        # Check for Thief movement after player action  
-        if thief and thief.get_attribute("moveable", False):
-            _handle_thief_movement(game_engine, thief)
+    """Schedule the Thief's theft attempts and wandering on the game clock."""
+    scheduler = game_engine.scheduler
+    scheduler.register_action("thief_steal", _thief_steal_event)
+    scheduler.register_action("thief_wander", _thief_wander_event)
     
-    game_engine._process_command = enhanced_process_command
+    thief = game_engine.npc_manager.get_npc("THIEF")
+    if thief and hasattr(thief, 'thief_behavior'):
+        scheduler.schedule(thief.id, "thief_steal", delay=1, interval=1)
+        if thief.get_attribute("moveable", False):
+            interval = thief.thief_behavior.movement_interval
+            scheduler.schedule(thief.id, "thief_wander", delay=interval, interval=interval)
+
+
+def _scheduled_thief(game_engine, event) -> Optional[NPC]:
+    """The live Thief an event belongs to; stops the event if it is gone or dead."""
+    thief = game_engine.npc_manager.get_npc(event.npc_id)
+    if not thief or not hasattr(thief, 'thief_behavior') or not thief.combat_stats.is_alive():
+        event.cancelled = True
+        return None
+    return thief
+
 
+def _thief_steal_event(game_engine, event) -> Optional[int]:
+    """Scheduled: try to steal when sharing a room with the player; lie low after a theft."""
+    thief = _scheduled_thief(game_engine, event)
+    if thief and thief.location == game_engine.player.current_room:
+        if _handle_thief_behaviors(game_engine, thief):
+            return thief.thief_behavior.theft_cooldown
+    return None
 
-def _handle_thief_behaviors(game_engine, thief: NPC):
-    """Handle Thief theft attempts when in same room as player."""
+
+def _thief_wander_event(game_engine, event) -> Optional[int]:
+    """Scheduled: maybe move to a neighboring room."""
+    thief = _scheduled_thief(game_engine, event)
+    if thief:
+        _handle_thief_movement(game_engine, thief)
+    return None
+
+
+def _handle_thief_behaviors(game_engine, thief: NPC) -> Optional[str]:
+    """Handle Thief theft attempts when in same room as player. Returns the stolen object ID."""
     if not hasattr(thief, 'thief_behavior'):
-        return
+        return None
         
     behavior = thief.thief_behavior
     
@@ -264,13 +277,16 @@ def _handle_thief_behaviors(game_engine, thief: NPC):
     if stolen_item:
         # Remove from player inventory
         game_engine.player.remove_from_inventory(stolen_item)
+        game_engine.npc_manager.record(behavior.stolen_objects.remove, stolen_item)
         
         # Get object name for message
         obj = game_engine.object_manager.get_object(stolen_item)
         item_name = obj.name if obj else "something"
         
-        print(f"\\nThe thief quickly snatches your {item_name} and grins wickedly!")
-        print("\"Thank you for the donation!\" the thief laughs.")
+        game_engine.output.write(f"\\nThe thief quickly snatches your {item_name} and grins wickedly!")
+        game_engine.output.write("\"Thank you for the donation!\" the thief laughs.")
+    
+    return stolen_item
 
 
 def _handle_thief_movement(game_engine, thief: NPC):
@@ -280,9 +296,6 @@ def _handle_thief_movement(game_engine, thief: NPC):
         
     behavior = thief.thief_behavior
     
-    if not behavior.can_move():
-        return
-        
     # Get possible destinations
     destinations = behavior.get_movement_destinations(
         thief.location,
@@ -292,33 +305,31 @@ def _handle_thief_movement(game_engine, thief: NPC):
     if not destinations:
         return
         
-    # 30% chance to move each turn
-    if random.random() < 0.3:
-        new_room = random.choice(destinations)
+    # 30% chance to move each time the wander event comes due
+    if behavior.rng.random() < 0.3:
+        new_room = behavior.rng.choice(destinations)
         
         # Notify player if Thief was in their room
         if thief.location == game_engine.player.current_room:
-            print("\\nThe thief slips away into the shadows.")
+            game_engine.output.write("\\nThe thief slips away into the shadows.")
             
         # Move Thief
         old_location = thief.location
         game_engine.npc_manager.move_npc(thief.id, new_room)
         thief.location = new_room
-        behavior.movement_timer = time.time()
         
         # Notify player if Thief enters their room
         if new_room == game_engine.player.current_room:
-            print(f"\\n{thief.description}")
+            game_engine.output.write(f"\\n{thief.description}")
 
 
 def handle_thief_combat_integration(game_engine, thief: NPC):
     """Handle special Thief combat behaviors."""
     
-    # Override standard NPC death handling to drop loot
-    original_handle_attack = game_engine._handle_attack
-    
-    def enhanced_handle_attack(command):
-        result = original_handle_attack(command)
+    # After an attack, drop the loot if it killed the Thief
+    def drop_loot_after_attack(game_engine, context):
+        if context.command.verb != "attack":
+            return
         
         # Check if Thief was defeated
         if (hasattr(thief, 'thief_behavior') and 
@@ -329,14 +340,12 @@ def handle_thief_combat_integration(game_engine, thief: NPC):
             
             if loot:
                 current_room = game_engine.world.get_room(game_engine.player.current_room)
-                print("\\nThe thief's possessions scatter as he falls:")
+                game_engine.output.write("\\nThe thief's possessions scatter as he falls:")
                 
                 for item_id in loot:
                     obj = game_engine.object_manager.get_object(item_id)
                     if obj and current_room:
                         current_room.add_item(item_id)
-                        print(f"  A {obj.name} clatters to the ground.")
-        
-        return result
+                        game_engine.output.write(f"  A {obj.name} clatters to the ground.")
     
-    game_engine._handle_attack = enhanced_handle_attack
\ No newline at end of file
+    game_engine.hooks.register(HookStage.POST_DISPATCH, drop_loot_after_attack, name="thief_loot")
\ No newline at end of file
@@ -1,15 +1,19 @@
 """Main game engine - Coordinates all game systems."""
 
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 import sys
+import copy
 import json
 import datetime
 import re
 import logging
+import time
 from pathlib import Path
 from .world.world import World
 from .world.room import Room
+from .world.room_flags import RoomFlag, encode_flags, to_mask
 from .world.room_loader import ZorkRoomLoader
+from .world.world_image import WorldImage, WorldImageCache
 from .entities.player import Player
 from .entities.objects import GameObject
 from .entities.object_manager import ObjectManager
@@ -21,19 +25,82 @@ from .responses import ZorkResponses
 from .puzzles import integrate_puzzles_into_game
 from .score import ScoreManager
 from .combinations import integrate_combinations_into_game
+from .scope import ScopeCache
+from .sessions import WorldBase
+from .output import OutputChannel
+from .rng import GameRandom
+from .scheduler import TurnScheduler
+from .hooks import HookPipeline, HookStage, TurnContext
+from .journal import UndoJournal
+from .changes import ChangeTracker
+from .savefile import (
+    ChangeSet, SaveChain, SaveHeader, append_delta, changed_sections, new_header, read_header, read_save,
+    sections_of, write_checkpoint
+)
+from .autosave import AUTOSAVE_FILENAME, DEFAULT_AUTOSAVE_MOVES, Autosaver, SaveSnapshot
+from .verbs import (
+    VerbRegistry, verb_handler, DIRECTIONS, ARGS_NONE, ARGS_COMMAND_INPUT
+)
+
+# Room flags that carry a per-turn chance of death
+DANGER_FLAGS = int(RoomFlag.DANGEROUS | RoomFlag.DEADLY)
+
+# Atmospheric text shown for room flags, in display order. SACRED is the
+# MDL RSACREDBIT (rooms the thief stays out of, such as the house and the
+# forest), which never showed any text of its own, so it has none here.
+ATMOSPHERE_FLAGS = (
+    (int(RoomFlag.NOISY), "Your footsteps echo loudly here."),
+    (int(RoomFlag.OUTDOOR), "A gentle breeze stirs the air."),
+    (int(RoomFlag.COLD), "The air is frigid here."),
+)
+
+# Turns of light left when a burning light source starts to dim
+LIGHT_DIM_WARNING = 10
+
+# Verbs that stand for an earlier command rather than being one
+REPEAT_VERBS = ("again", "oops", "undo")
+
+# Save format version written by _collect_game_state
+SAVE_VERSION = "1.3.0"
 
 
 class GameEngine:
     """Main game engine that coordinates all game systems."""
     
-    def __init__(self, use_mud_files: bool = False, mud_directory: Optional[Path] = None, debug_mode: bool = False) -> None:
+    def __init__(self, use_mud_files: bool = False, mud_directory: Optional[Path] = None, debug_mode: bool = False,
+                 use_world_cache: bool = True, rebuild_world_cache: bool = False, parse_workers: int = 1,
+                 output: Optional[OutputChannel] = None, seed: Optional[int] = None,
+                 world_base: Optional[WorldBase] = None, autosave_every: int = 0) -> None:
+        self.output = output if output is not None else OutputChannel()  # All player-facing text
+        self.rng = GameRandom(seed)  # Per-engine random streams (combat, npc, world, flavor)
+        self.read_input: Callable[[str], str] = input  # Source of player input lines (prompt -> line)
         self.world = World()
         self.player = Player()
-        self.parser = CommandParser()
-        self.responses = ZorkResponses()
+        self.parser = world_base.parser if world_base is not None and world_base.parser else CommandParser()
+        self.responses = ZorkResponses(rng=self.rng.flavor)
         self.object_manager = ObjectManager()  # Central object registry
         self.npc_manager = NPCManager()  # Central NPC registry
-        self.combat_manager = CombatManager()  # Combat and fighting system
+        self.combat_manager = CombatManager(rng=self.rng.combat)  # Combat and fighting system
+        self.verbs = VerbRegistry.from_class(type(self))  # Verb -> handler dispatch table
+        self.journal = UndoJournal()  # Inverse operations of recent turns, for UNDO
+        self.tracker = ChangeTracker(self.journal)  # Undo records and what changed since the last save
+        self.saves_dir = Path("saves")  # Where SAVE and RESTORE keep their files
+        self._save_chain: Optional[SaveChain] = None  # Save file the next save can append a delta to
+        self.autosaver: Optional[Autosaver] = None  # Background writer for save_game(background=True)
+        self.autosave_every = 0  # Moves between autosaves (see enable_autosave)
+        self.autosave_filename = AUTOSAVE_FILENAME
+        self._attach_containment()
+        self.scope_cache = ScopeCache(self)  # Reachable objects, light and bulk candidates per world version
+        self.scheduler = TurnScheduler()  # NPC and timed-object events on the move clock
+        self.scheduler.register_action("burn_out", GameEngine._light_burns_out)
+        self.scheduler.register_action("dim", GameEngine._light_dims)
+        self.hooks = HookPipeline()  # Pre/post parse and dispatch, end-of-turn extension points
+        self.hooks.register(HookStage.END_OF_TURN, GameEngine._advance_clock, name="scheduler")
+        if autosave_every > 0:
+            self.enable_autosave(autosave_every)
+        self.turn_context: Optional[TurnContext] = None  # Turn being (or last) processed
+        self.last_command: Optional[Command] = None  # Repeated by AGAIN, corrected by OOPS
+        self.last_input = ""
         
         # Initialize with some test NPCs
         self._create_initial_npcs()
@@ -42,9 +109,15 @@ class GameEngine:
         self.puzzle_manager = None  # Will be initialized after world creation
         self.score_manager = ScoreManager()
         self.combination_manager = None  # Will be initialized after world creation
-        
-        # Initialize world from .mud files or create a basic test world
-        if use_mud_files:
+        self.use_world_cache = use_world_cache  # Reuse precompiled world image when sources are unchanged
+        self.rebuild_world_cache = rebuild_world_cache  # Ignore any existing image and write a fresh one
+        self.world_loaded_from_cache = False
+        self.parse_workers = parse_workers  # Worker processes for parsing .mud files on a cold load
+        
+        # Initialize world from a shared base, from .mud files, or create a basic test world
+        if world_base is not None:
+            self._fork_world(world_base)
+        elif use_mud_files:
             self._load_world_from_mud_files(mud_directory)
         else:
             self._create_initial_world()
@@ -54,159 +127,195 @@ class GameEngine:
         
         # Initialize object combination system after world creation  
         self.combination_manager = integrate_combinations_into_game(self)
+        
+        # The world and managers report how to reverse their changes to the undo journal
+        self._attach_tracker()
+        self.score_manager.journal = self.journal
+        self.puzzle_manager.journal = self.journal
     
     def run(self) -> None:
         """Main game loop."""
         # Add completion message for loading process
         if not self.debug_mode:
-            print("Everything is ready. The grue is hungry...\n")
+            self.output.write("Everything is ready. The grue is hungry...\n")
         else:
-            print("\n" + "="*50)
-            print("DEBUG MODE ENABLED")
-            print("="*50)
-            print("Extra commands available:")
-            print("  debug npc - Test NPC system")
-            print("  debug combat - Test combat system")
-            print("  debug menu - Show debug menu")
-            print("="*50)
+            self.output.write("\n" + "="*50)
+            self.output.write("DEBUG MODE ENABLED")
+            self.output.write("="*50)
+            self.output.write("Extra commands available:")
+            self.output.write("  debug npc - Test NPC system")
+            self.output.write("  debug combat - Test combat system")
+            self.output.write("  debug menu - Show debug menu")
+            self.output.write("="*50)
         self._show_welcome()
         self._look_around()
         
         while self.running:
             try:
-                user_input = input("> ").strip()
+                user_input = self.read_input("> ").strip()
                 if user_input:
-                    self._process_command(user_input)
+                    self._process_input(user_input)
             except (EOFError, KeyboardInterrupt):
-                print("\nGoodbye!")
+                self.output.write("\nGoodbye!")
                 break
+        self.finish_saves()
+    
+    def _process_input(self, user_input: str) -> str:
+        """
+        Process a line that may chain several commands ("take lamp. n, then open window").
+        
+        Each command is its own turn. The chain stops at the first command that
+        fails, asks a disambiguation question, or ends the game.
+        
+        Returns:
+            The output text of the turns that ran
+        """
+        if self.player.awaiting_disambiguation:
+            return self._process_command(user_input)
+        
+        texts = []
+        for segment in self.parser.split_commands(user_input) or [user_input]:
+            texts.append(self._process_command(segment))
+            if self.turn_context.failed or self.player.awaiting_disambiguation or not self.running:
+                break
+        return "\n".join(texts)
+    
+    def _process_command(self, user_input: str) -> str:
+        """
+        Process a single user command as one turn.
+        
+        Everything the turn writes is buffered and sent to the output sinks
+        once, when the turn ends.
+        
+        Returns:
+            The turn's output text
+        """
+        self.output.begin_turn()
+        self.journal.begin_turn(user_input, self._turn_snapshot())
+        try:
+            context = self.turn_context = TurnContext(user_input)
+            self._execute_command(context)
+            self.hooks.run(HookStage.END_OF_TURN, self, context)
+        finally:
+            self.journal.end_turn()
+            text = self.output.end_turn()
+        return text
     
-    def _process_command(self, user_input: str) -> None:
-        """Process a single user command."""
+    def _turn_snapshot(self) -> Dict[str, Any]:
+        """Engine values UNDO restores as a whole (they change by assignment, so aren't journaled)."""
+        return {"room": self.player.current_room, "schedule": self.scheduler.get_state()}
+    
+    def _execute_command(self, context: TurnContext) -> None:
+        """Parse and dispatch a command, running the turn hooks around each step."""
+        hooks = self.hooks
+        clock = time.perf_counter
+        
+        hooks.run(HookStage.PRE_PARSE, self, context)
+        if context.handled:
+            return
         
         # Check if we're awaiting disambiguation
         if self.player.awaiting_disambiguation:
-            self._handle_disambiguation_response(user_input)
+            self._handle_disambiguation_response(context.user_input)
             return
         
-        command = self.parser.parse(user_input)
+        start = clock()
+        context.command = self.parser.parse(context.user_input)
+        hooks.record_step("parse", clock() - start)
+        self._resolve_repeat(context)
         
-        if not command:
-            print("Beg pardon?")
+        hooks.run(HookStage.POST_PARSE, self, context)
+        if context.handled:
+            return
+        
+        if not context.command:
+            self._fail("Beg pardon?")
+            return
+        
+        hooks.run(HookStage.PRE_DISPATCH, self, context)
+        if context.handled:
             return
         
         # Route command to appropriate handler
-        self._route_command(command, user_input)
+        start = clock()
+        self._route_command(context.command, context.user_input)
+        hooks.record_step("dispatch", clock() - start)
+        
+        hooks.run(HookStage.POST_DISPATCH, self, context)
     
-    def _route_command(self, command, user_input: str) -> None:
-        """Route a command to its appropriate handler (extracted from _process_command)."""
-        verb = command.verb
+    def _resolve_repeat(self, context: TurnContext) -> None:
+        """
+        Replace AGAIN with the previous command and OOPS <word> with the previous
+        command using that noun, then remember the turn's command for next time.
         
-        # Commands that don't consume moves
-        non_move_commands = ["inventory", "score", "help", "brief", "verbose"]
+        With nothing to repeat the verb is left as is, and its handler says so.
+        """
+        command = context.command
+        if command is None:
+            return
+        previous = self.last_command
+        if command.verb == "again" and previous is not None:
+            context.command, context.user_input = previous, self.last_input
+        elif command.verb == "oops" and command.noun and previous is not None and previous.noun:
+            context.command = Command(previous.verb, command.noun, previous.preposition, previous.noun2)
+            context.user_input = str(context.command)
+        if context.command.verb not in REPEAT_VERBS:
+            self.last_command, self.last_input = context.command, context.user_input
+    
+    def _fail(self, message: str) -> None:
+        """Write why a command did nothing and mark the turn failed (stops a command chain)."""
+        self.output.write(message)
+        if self.turn_context is not None:
+            self.turn_context.failed = True
+    
+    def _advance_clock(self, context: TurnContext) -> None:
+        """End-of-turn hook: run NPC and timed events that came due on the move clock."""
+        self.scheduler.advance(self.score_manager.moves, self)
+    
+    def _route_command(self, command, user_input: Optional[str] = None, count_move: bool = True) -> None:
+        """Dispatch a parsed command through the verb registry."""
+        if user_input is None:
+            user_input = str(command)
+        
+        self.scope_cache.current_verb = command.verb
+        descriptor = self.verbs.get(command.verb)
+        if descriptor is not None and descriptor.debug_only and not self.debug_mode:
+            descriptor = None
         
         # Increment move counter for most commands (except info/display commands)
-        if verb not in non_move_commands:
+        if count_move and (descriptor is None or descriptor.consumes_move):
             self.score_manager.increment_moves()
         
-        if verb in ["north", "south", "east", "west", "northeast", "northwest", 
-                   "southeast", "southwest", "up", "down", "in", "out", "enter", "exit"]:
-            self._handle_movement(verb)
-        elif verb == "go" and command.noun:
-            # Handle "go north", "go east", etc.
-            direction = command.noun
-            if direction in ["north", "south", "east", "west", "northeast", "northwest",
-                           "southeast", "southwest", "up", "down", "in", "out", "enter", "exit"]:
-                self._handle_movement(direction)
-            else:
-                print(f"I don't know how to go {direction}.")
-        elif verb == "climb":
-            # Handle climb command
-            self._handle_climb(command)
-        elif verb == "look":
-            self._handle_look(command)
-        elif verb == "examine":
-            self._handle_examine(command)
-        elif verb == "inventory":
-            self._handle_inventory()
-        elif verb == "take":
-            self._handle_take(command)
-        elif verb == "drop":
-            self._handle_drop(command)
-        elif verb == "open":
-            self._handle_open(command)
-        elif verb == "close":
-            self._handle_close(command)
-        elif verb == "read":
-            self._handle_read(command)
-        elif verb == "put":
-            self._handle_put(command)
-        elif verb == "get":
-            self._handle_get(command)
-        elif verb == "q" or verb == "quit":
-            self._handle_quit()
-        elif verb == "help":
-            self._handle_help()
-        elif verb == "brief":
-            self._handle_brief()
-        elif verb == "verbose":
-            self._handle_verbose()
-        elif verb == "light":
-            self._handle_light(command)
-        elif verb == "extinguish":
-            self._handle_extinguish(command)
-        elif verb == "unlock":
-            self._handle_unlock(command)
-        elif verb == "lock":
-            self._handle_lock(command)
-        elif verb == "score":
-            self._handle_score()
-        elif verb == "heat":
-            self._handle_heat(command)
-        elif verb == "cool":
-            self._handle_cool(command) 
-        elif verb == "combine":
-            self._handle_combine(command)
-        elif verb == "break":
-            self._handle_break_with(command)
-        elif verb == "pour":
-            self._handle_pour_on(command)
-        elif verb == "apply" or verb == "use":
-            self._handle_use_tool(command)
-        elif verb == "climb":
-            self._handle_climb(command)
-        elif verb == "save":
-            self._handle_save(command)
-        elif verb == "restore" or verb == "load":
-            self._handle_restore(command)
-        elif verb == "talk":
-            self._handle_talk(command)
-        elif verb == "ask":
-            self._handle_ask(command)
-        elif verb == "greet":
-            self._handle_greet(command)
-        elif verb == "say":
-            self._handle_say(command, user_input)
-        elif verb == "attack":
-            self._handle_attack(command)
-        elif verb == "defend":
-            self._handle_defend(command)
-        elif verb == "flee":
-            self._handle_flee(command)
-        elif verb == "debug" and self.debug_mode:
-            self._handle_debug_command(command)
-        else:
+        if descriptor is not None:
+            descriptor.invoke(self, command, user_input)
+        elif self.responses.is_special_command(command.verb):
             # Check for special Easter egg commands first
-            if self.responses.is_special_command(verb):
-                print(self.responses.get_special_command_response(verb))
-            else:
-                print(self.responses.get_unknown_command_response(user_input))
+            self.output.write(self.responses.get_special_command_response(command.verb))
+        else:
+            self._fail(self.responses.get_unknown_command_response(user_input))
+    
+    @verb_handler(*DIRECTIONS, usage="north, south, east, west, up, down (or n, s, e, w, u, d)",
+                  category="Movement")
+    def _handle_direction(self, command: Command) -> None:
+        """Handle a bare direction verb such as "north"."""
+        self._handle_movement(command.verb)
+    
+    @verb_handler("go", arguments=ARGS_COMMAND_INPUT, usage="go <direction>", category="Movement")
+    def _handle_go(self, command: Command, user_input: str) -> None:
+        """Handle "go north", "go east", etc."""
+        direction = command.noun
+        if not direction:
+            self._fail(self.responses.get_unknown_command_response(user_input))
+        elif direction in DIRECTIONS:
+            self._handle_movement(direction)
+        else:
+            self._fail(f"I don't know how to go {direction}.")
     
     def _handle_movement(self, direction: str) -> None:
         """Handle player movement."""
         current_room = self.world.get_room(self.player.current_room)
         if not current_room:
-            print("Error: You are in an unknown location!")
+            self._fail("Error: You are in an unknown location!")
             return
         
         target_room_id = current_room.get_exit(direction)
@@ -220,17 +329,18 @@ class GameEngine:
                 # Check for dangers after moving
                 death_message = self._check_danger()
                 if death_message:
-                    print()
-                    print(death_message)
-                    print("\n*** You have died ***")
-                    print("Would you like to restart, restore a saved game, or quit?")
+                    self.output.write()
+                    self.output.write(death_message)
+                    self.output.write("\n*** You have died ***")
+                    self.output.write("Would you like to restart, restore a saved game, or quit?")
                     # For now, just end the game
                     self.running = False
             else:
-                print("Error: That exit leads nowhere!")
+                self._fail("Error: That exit leads nowhere!")
         else:
-            print(self.responses.get_cant_go_response())
+            self._fail(self.responses.get_cant_go_response())
     
+    @verb_handler("look", category="Actions")
     def _handle_look(self, command: Command) -> None:
         """Handle look command."""
         if command.noun:
@@ -240,21 +350,24 @@ class GameEngine:
             # Looking around the room - always show full description
             self._look_around(force_verbose=True)
     
+    @verb_handler("inventory", arguments=ARGS_NONE, consumes_move=False, usage="inventory (or i)",
+                  category="Actions")
     def _handle_inventory(self) -> None:
         """Handle inventory command."""
         if not self.player.inventory:
-            print("You are empty-handed.")
+            self.output.write("You are empty-handed.")
         else:
-            print("You are carrying:")
+            self.output.write("You are carrying:")
             for item_id in self.player.inventory:
                 obj = self.object_manager.get_object(item_id)
                 if obj:
-                    print(f"  {obj.name}")
+                    self.output.write(f"  {obj.name}")
     
+    @verb_handler("take", usage="take <object>", category="Actions")
     def _handle_take(self, command: Command) -> None:
         """Handle take command."""
         if not command.noun:
-            print("Take what?")
+            self._fail("Take what?")
             return
         
         # Find the object
@@ -264,7 +377,7 @@ class GameEngine:
                 self.player.pending_command = command
                 self._show_disambiguation_prompt()
             else:
-                print(self.responses.get_dont_see_object_response(command.noun))
+                self._fail(self.responses.get_dont_see_object_response(command.noun))
             return
         
         # Check if this is a bulk action object (ALL, EVERYTHING, etc.)
@@ -273,18 +386,18 @@ class GameEngine:
             return
         
         if not target_obj.is_takeable():
-            print(f"You cannot take that.")
+            self._fail(f"You cannot take that.")
             return
         
         if self.player.is_inventory_full():
-            print("Your load is too heavy.")
+            self._fail("Your load is too heavy.")
             return
         
         # Find where the object is located
         location_type, container_id = self._find_object_location(target_obj)
         
         if location_type == "inventory":
-            print("You already have that.")
+            self._fail("You already have that.")
             return
         elif location_type == "room":
             # Take from room
@@ -292,40 +405,40 @@ class GameEngine:
             if current_room:
                 current_room.remove_item(target_obj.id)
                 self.player.add_to_inventory(target_obj.id)
-                print(f"Taken: {target_obj.name}")
+                self.output.write(f"Taken: {target_obj.name}")
                 
                 # Award treasure score (OFVAL) if this is a treasure
                 points_awarded = self.score_manager.find_treasure(target_obj.id)
                 if points_awarded > 0:
-                    print(f"(You have found a treasure worth {points_awarded} points!)")
+                    self.output.write(f"(You have found a treasure worth {points_awarded} points!)")
         elif location_type == "container":
             # Take from container
             container = self.object_manager.get_object(container_id) if container_id else None
             if container and container.is_open():
                 container.remove_from_container(target_obj.id)
                 self.player.add_to_inventory(target_obj.id)
-                print(f"Taken: {target_obj.name}")
+                self.output.write(f"Taken: {target_obj.name}")
                 
                 # Award treasure score (OFVAL) if this is a treasure  
                 points_awarded = self.score_manager.find_treasure(target_obj.id)
                 if points_awarded > 0:
-                    print(f"(You have found a treasure worth {points_awarded} points!)")
+                    self.output.write(f"(You have found a treasure worth {points_awarded} points!)")
             elif container and not container.is_open():
-                print(f"The {container.name} is closed.")
+                self._fail(f"The {container.name} is closed.")
             else:
-                print(self.responses.get_cant_do_that_response())
+                self._fail(self.responses.get_cant_do_that_response())
         else:
-            print(f"I cannot reach that.")
+            self._fail(f"I cannot reach that.")
     
     def _handle_drop(self, command: Command) -> None:
         """Handle drop command with bulk action support."""
         if not command.noun:
-            print("Drop what?")
+            self._fail("Drop what?")
             return
         
         target_obj = self._find_object(command.noun, check_inventory_only=True)
         if not target_obj:
-            print(f"You don't have a {command.noun}.")
+            self._fail(f"You don't have a {command.noun}.")
             return
             
         # Check if this is a bulk action object
@@ -338,12 +451,13 @@ class GameEngine:
         current_room = self.world.get_room(self.player.current_room)
         if current_room:
             current_room.add_item(target_obj.id)
-        print(f"Dropped: {target_obj.name}")
+        self.output.write(f"Dropped: {target_obj.name}")
     
+    @verb_handler("drop", usage="drop <object>", category="Actions")
     def _handle_drop(self, command: Command) -> None:
         """Handle drop command."""
         if not command.noun:
-            print("Drop what?")
+            self._fail("Drop what?")
             return
         
         # Find object - this will handle disambiguation if needed
@@ -356,24 +470,25 @@ class GameEngine:
             return
         
         if not target_obj:
-            print(self.responses.get_dont_see_object_response(command.noun))
+            self._fail(self.responses.get_dont_see_object_response(command.noun))
             return
         
         # Check if object is in inventory
         if target_obj.id not in self.player.inventory:
-            print(self.responses.get_inventory_response("dont_have"))
+            self._fail(self.responses.get_inventory_response("dont_have"))
             return
         
         current_room = self.world.get_room(self.player.current_room)
         if current_room:
             self.player.remove_from_inventory(target_obj.id)
             current_room.add_item(target_obj.id)
-            print(f"Dropped: {target_obj.name}")
+            self.output.write(f"Dropped: {target_obj.name}")
     
+    @verb_handler("examine", usage="examine <object>", category="Actions")
     def _handle_examine(self, command: Command) -> None:
         """Handle examine command for detailed object inspection."""
         if not command.noun:
-            print("Examine what?")
+            self._fail("Examine what?")
             return
         
         target_obj = self._find_object(command.noun)
@@ -382,7 +497,7 @@ class GameEngine:
                 self.player.pending_command = command
                 self._show_disambiguation_prompt()
             else:
-                print(self.responses.get_dont_see_object_response(command.noun))
+                self._fail(self.responses.get_dont_see_object_response(command.noun))
             return
         
         # Determine object location for context-appropriate description
@@ -409,29 +524,30 @@ class GameEngine:
                 if contents:
                     description += " There appears to be something inside."
         
-        print(description)
+        self.output.write(description)
         
         # Show container contents if it's an open container
         if target_obj.is_container() and target_obj.is_open():
             contents = target_obj.get_contents()
             if contents:
-                print("It contains:")
+                self.output.write("It contains:")
                 for item_id in contents:
                     item = self.object_manager.get_object(item_id)
                     if item:
-                        print(f"  {item.name}")
+                        self.output.write(f"  {item.name}")
             else:
-                print("It is empty.")
+                self.output.write("It is empty.")
     
+    @verb_handler("climb", usage="climb <object>", category="Movement")
     def _handle_climb(self, command: Command) -> None:
         """Handle climb command - context-dependent movement."""
         if not command.noun:
-            print("Climb what?")
+            self._fail("Climb what?")
             return
         
         current_room = self.world.get_room(self.player.current_room)
         if not current_room:
-            print("Error: You are in an unknown location!")
+            self._fail("Error: You are in an unknown location!")
             return
         
         # Normalize potential climb targets
@@ -443,25 +559,25 @@ class GameEngine:
             room_desc = current_room.description.lower()
             if "tree" in room_desc and "up" in current_room.exits:
                 # This room has a tree and an up exit - climb the tree!
-                print("You climb up the tree.")
+                self.output.write("You climb up the tree.")
                 self._handle_movement("up")
                 return
             else:
-                print("There's nothing here you can climb.")
+                self._fail("There's nothing here you can climb.")
                 return
         
         # Check for ladder climbing
         elif climb_target in ["ladder", "stairs", "steps", "staircase", "stairway"]:
             if "up" in current_room.exits:
-                print(f"You climb up the {climb_target}.")
+                self.output.write(f"You climb up the {climb_target}.")
                 self._handle_movement("up") 
                 return
             elif "down" in current_room.exits:
-                print(f"You climb down the {climb_target}.")
+                self.output.write(f"You climb down the {climb_target}.")
                 self._handle_movement("down")
                 return
             else:
-                print(f"There's no {climb_target} here to climb.")
+                self._fail(f"There's no {climb_target} here to climb.")
                 return
         
         # Check for rope climbing (if rope is present)
@@ -476,51 +592,52 @@ class GameEngine:
             
             if rope_obj:
                 if "up" in current_room.exits:
-                    print("You climb up the rope.")
+                    self.output.write("You climb up the rope.")
                     self._handle_movement("up")
                     return
                 elif "down" in current_room.exits:
-                    print("You climb down the rope.")
+                    self.output.write("You climb down the rope.")
                     self._handle_movement("down") 
                     return
                 else:
-                    print("The rope doesn't lead anywhere useful.")
+                    self._fail("The rope doesn't lead anywhere useful.")
                     return
             else:
-                print("I don't see any rope here to climb.")
+                self._fail("I don't see any rope here to climb.")
                 return
         
         # Generic climbing - check if there's an "up" direction 
         elif "up" in current_room.exits:
-            print(f"You can't climb the {climb_target}.")
+            self._fail(f"You can't climb the {climb_target}.")
             return
         else:
-            print("There's nothing here you can climb.")
+            self._fail("There's nothing here you can climb.")
     
+    @verb_handler("open", usage="open <object>", category="Object Interaction")
     def _handle_open(self, command: Command) -> None:
         """Handle open command with enhanced container support."""
         if not command.noun:
-            print(self.responses.get_cant_do_that_response())
+            self._fail(self.responses.get_cant_do_that_response())
             return
         
         target_obj = self._find_object(command.noun)
         if not target_obj:
-            print(self.responses.get_dont_see_object_response(command.noun))
+            self._fail(self.responses.get_dont_see_object_response(command.noun))
             return
         
         # Check if object can be opened
         if not target_obj.is_openable():
-            print(self.responses.get_action_response("cant_open", target_obj.name))
+            self._fail(self.responses.get_action_response("cant_open", target_obj.name))
             return
             
         # Check if already open
         if target_obj.is_open():
-            print(self.responses.get_action_response("already_open", target_obj.name))
+            self._fail(self.responses.get_action_response("already_open", target_obj.name))
             return
             
         # Check if locked
         if target_obj.is_locked():
-            print(f"The {target_obj.name} is locked.")
+            self._fail(f"The {target_obj.name} is locked.")
             return
         
         # Open the object
@@ -528,43 +645,44 @@ class GameEngine:
         
         # Custom messages for different object types
         if target_obj.id == "WINDOW":
-            print(f"You open the {target_obj.name} wider. Fresh air flows in.")
+            self.output.write(f"You open the {target_obj.name} wider. Fresh air flows in.")
         elif target_obj.id == "MAILBOX":
-            print(f"You open the {target_obj.name}.")
+            self.output.write(f"You open the {target_obj.name}.")
         else:
-            print(f"Opened.")
+            self.output.write(f"Opened.")
         
         # Show contents if it's a container
         if target_obj.is_container():
             contents = target_obj.get_contents()
             if contents:
-                print("Inside you find:")
+                self.output.write("Inside you find:")
                 for item_id in contents:
                     item = self.object_manager.get_object(item_id)
                     if item:
-                        print(f"  {item.name}")
+                        self.output.write(f"  {item.name}")
             else:
-                print("It is empty.")
+                self.output.write("It is empty.")
     
+    @verb_handler("close", usage="close <object>", category="Object Interaction")
     def _handle_close(self, command: Command) -> None:
         """Handle close command with enhanced container support."""
         if not command.noun:
-            print(self.responses.get_cant_do_that_response())
+            self._fail(self.responses.get_cant_do_that_response())
             return
         
         target_obj = self._find_object(command.noun)
         if not target_obj:
-            print(self.responses.get_dont_see_object_response(command.noun))
+            self._fail(self.responses.get_dont_see_object_response(command.noun))
             return
         
         # Check if object can be closed
         if not target_obj.is_openable():
-            print(self.responses.get_action_response("cant_close", target_obj.name))
+            self._fail(self.responses.get_action_response("cant_close", target_obj.name))
             return
         
         # Check if already closed
         if not target_obj.is_open():
-            print(self.responses.get_action_response("already_closed", target_obj.name))
+            self._fail(self.responses.get_action_response("already_closed", target_obj.name))
             return
         
         # Close the object
@@ -572,76 +690,78 @@ class GameEngine:
         
         # Custom messages for different object types
         if target_obj.id == "WINDOW":
-            print(f"You close the {target_obj.name} tightly, shutting out the fresh air.")
+            self.output.write(f"You close the {target_obj.name} tightly, shutting out the fresh air.")
         elif target_obj.id == "MAILBOX":
-            print(f"You close the {target_obj.name}.")
+            self.output.write(f"You close the {target_obj.name}.")
         else:
-            print(f"Closed.")
+            self.output.write(f"Closed.")
     
+    @verb_handler("read", usage="read <object>", category="Object Interaction")
     def _handle_read(self, command: Command) -> None:
         """Handle read command."""
         if not command.noun:
-            print("Read what?")
+            self._fail("Read what?")
             return
         
         target_obj = self._find_object(command.noun)
         if not target_obj:
-            print(f"I don't see a {command.noun} here.")
+            self._fail(f"I don't see a {command.noun} here.")
             return
         
         # Check if object has readable content
         readable_text = target_obj.get_attribute("readable_text", None)
         if readable_text:
-            print(readable_text)
+            self.output.write(readable_text)
         elif target_obj.get_attribute("readable", False):
-            print(f"The {target_obj.name} has no text on it.")
+            self._fail(f"The {target_obj.name} has no text on it.")
         else:
-            print(f"How can I read a {target_obj.name}?")
+            self._fail(f"How can I read a {target_obj.name}?")
 
+    @verb_handler("put", usage="put <object> in <container>", category="Container Operations")
     def _handle_put(self, command: Command) -> None:
         """Handle put command (put X in Y) with enhanced container support."""
         if not command.noun:
-            print("Put what?")
+            self._fail("Put what?")
             return
         
         if not command.preposition or command.preposition != "in":
-            print("Put it in what?")
+            self._fail("Put it in what?")
             return
         
         if not command.noun2:
-            print("Put it in what?")
+            self._fail("Put it in what?")
             return
         
         # Find the item to put
         item_obj = self._find_object(command.noun)
         if not item_obj:
-            print(self.responses.get_dont_see_object_response(command.noun))
+            self._fail(self.responses.get_dont_see_object_response(command.noun))
             return
         
         # Find the container
         container_obj = self._find_object(command.noun2)
         if not container_obj:
-            print(self.responses.get_dont_see_object_response(command.noun2))
+            self._fail(self.responses.get_dont_see_object_response(command.noun2))
             return
         
         # Check if target is a container
         if not container_obj.is_container():
-            print(self.responses.get_action_response("not_container", container_obj.name))
+            self._fail(self.responses.get_action_response("not_container", container_obj.name))
             return
         
         # Check if container is openable and open
         if container_obj.is_openable() and not container_obj.is_open():
-            print(f"The {container_obj.name} is closed.")
+            self._fail(f"The {container_obj.name} is closed.")
             return
             
         # Check if container is at capacity
         if container_obj.is_at_capacity():
-            print(f"The {container_obj.name} is full.")
+            self._fail(f"The {container_obj.name} is full.")
             return
         
         # Make sure the item isn't the container itself
         if item_obj.id == container_obj.id:
-            print("That would be quite a contortion!")
+            self._fail("That would be quite a contortion!")
             return
         
         # Find where the item currently is
@@ -651,28 +771,29 @@ class GameEngine:
             # Remove from inventory and add to container
             self.player.remove_from_inventory(item_obj.id)
             container_obj.add_to_container(item_obj.id)
-            print(f"You put the {item_obj.name} in the {container_obj.name}.")
+            self.output.write(f"You put the {item_obj.name} in the {container_obj.name}.")
         elif location_type == "room":
             # Remove from room and add to container
             current_room = self.world.get_room(self.player.current_room)
             if current_room:
                 current_room.remove_item(item_obj.id)
                 container_obj.add_to_container(item_obj.id)
-                print(f"You put the {item_obj.name} in the {container_obj.name}.")
+                self.output.write(f"You put the {item_obj.name} in the {container_obj.name}.")
         elif location_type == "container":
             # Move from one container to another
             current_container = self.object_manager.get_object(current_container_id) if current_container_id else None
             if current_container:
                 current_container.remove_from_container(item_obj.id)
                 container_obj.add_to_container(item_obj.id)
-                print(f"You put the {item_obj.name} in the {container_obj.name}.")
+                self.output.write(f"You put the {item_obj.name} in the {container_obj.name}.")
         else:
-            print(f"You can't reach the {item_obj.name}.")
+            self._fail(f"You can't reach the {item_obj.name}.")
 
+    @verb_handler("get", usage="get <object> from <container>", category="Container Operations")
     def _handle_get(self, command: Command) -> None:
         """Handle get command (get X from Y or just get X) with enhanced container support."""
         if not command.noun:
-            print("Get what?")
+            self._fail("Get what?")
             return
         
         # Check for "get X from Y" syntax
@@ -680,21 +801,21 @@ class GameEngine:
             # Find the container
             container_obj = self._find_object(command.noun2)
             if not container_obj:
-                print(self.responses.get_dont_see_object_response(command.noun2))
+                self._fail(self.responses.get_dont_see_object_response(command.noun2))
                 return
             
             if not container_obj.is_container():
-                print(self.responses.get_action_response("not_container", container_obj.name))
+                self._fail(self.responses.get_action_response("not_container", container_obj.name))
                 return
             
             # Check if container is openable and open
             if container_obj.is_openable() and not container_obj.is_open():
-                print(f"The {container_obj.name} is closed.")
+                self._fail(f"The {container_obj.name} is closed.")
                 return
                 
             # Check if container is empty
             if not container_obj.get_contents():
-                print(self.responses.get_action_response("nothing_inside", container_obj.name))
+                self._fail(self.responses.get_action_response("nothing_inside", container_obj.name))
                 return
             
             # Find the item in the container - use disambiguation
@@ -706,7 +827,7 @@ class GameEngine:
                     container_items.append(obj)
             
             if not container_items:
-                print(f"I don't see a {command.noun} in the {container_obj.name}.")
+                self._fail(f"I don't see a {command.noun} in the {container_obj.name}.")
                 return
             elif len(container_items) == 1:
                 item_obj = container_items[0]
@@ -715,16 +836,16 @@ class GameEngine:
                 self.player.awaiting_disambiguation = True
                 self.player.disambiguation_options = container_items
                 self.player.pending_command = command
-                print(f"Which {command.noun} do you mean:")
+                self.output.write(f"Which {command.noun} do you mean:")
                 for i, obj in enumerate(container_items, 1):
                     location_desc = f"in the {container_obj.name}"
-                    print(f"  {i}. The {obj.name} ({location_desc})")
+                    self.output.write(f"  {i}. The {obj.name} ({location_desc})")
                 return
             
             # Remove from container and add to inventory
             container_obj.remove_from_container(item_obj.id)
             self.player.add_to_inventory(item_obj.id)
-            print(f"You take the {item_obj.name} from the {container_obj.name}.")
+            self.output.write(f"You take the {item_obj.name} from the {container_obj.name}.")
         else:
             # Regular get command (equivalent to take)
             self._handle_take(command)
@@ -746,86 +867,81 @@ class GameEngine:
     
     def _find_object_location(self, obj: 'GameObject') -> Tuple[str, Optional[str]]:
         """Find where an object is located. Returns (location_type, container_id)."""
-        current_room = self.world.get_room(self.player.current_room)
-        
-        # Check if in current room
-        if current_room and obj.id in current_room.items:
-            return ("room", None)
-        
-        # Check if in inventory
-        if obj.id in self.player.inventory:
-            return ("inventory", None)
-        
-        # Check if in containers in current room
-        if current_room:
-            for item_id in current_room.items:
-                container = self.object_manager.get_object(item_id)
-                if container and container.is_container() and obj.id in container.get_contents():
-                    return ("container", container.id)
-        
-        # Check if in containers in inventory
+        return self.object_manager.find_object_location(obj, self.world, self.player)
+    
+    def _attach_containment(self) -> None:
+        """Share the object manager's containment index with the world and player."""
+        containment = self.object_manager.containment
+        self.world.attach_containment(containment)
+        self.player.containment = containment
         for item_id in self.player.inventory:
-            container = self.object_manager.get_object(item_id)
-            if container and container.is_container() and obj.id in container.get_contents():
-                return ("container", container.id)
-        
-        return ("unknown", None)
+            containment.place(item_id, "inventory")
     
+    def _attach_tracker(self) -> None:
+        """Have the world, objects, player and NPCs report their changes to the engine's tracker."""
+        self.world.attach_tracker(self.tracker)
+        self.object_manager.attach_tracker(self.tracker)
+        self.player.tracker = self.tracker
+        self.npc_manager.tracker = self.tracker
+    
+    @verb_handler("quit", "q", arguments=ARGS_NONE, usage="quit (or q)")
     def _handle_quit(self) -> None:
         """Handle quit command."""
-        print("Are you sure you want to quit? (y/n)")
-        response = input("> ").strip().lower()
+        self.output.write("Are you sure you want to quit? (y/n)")
+        self.output.flush()  # The question must be on screen before waiting for the answer
+        response = self.read_input("> ").strip().lower()
         if response.startswith('y'):
-            print("Thanks for playing!")
+            self.output.write("Thanks for playing!")
             self.running = False
     
+    @verb_handler("help", arguments=ARGS_NONE, consumes_move=False)
     def _handle_help(self) -> None:
-        """Handle help command."""
-        help_text = """
-Available commands:
-  Movement: north, south, east, west, up, down (or n, s, e, w, u, d)
-  Actions: look, examine <object>, take <object>, drop <object>, inventory (or i)
-  Object Interaction: open <object>, close <object>, read <object>
-  Container Operations: put <object> in <container>, get <object> from <container>
-  Light Sources: light <object>, extinguish <object>
-  Object Combinations: heat <object>, cool <object>, combine <object> <object>
-  Tool Usage: break <object> with <tool>, use <tool> on <object>, apply <tool>
-  Game Management: save [filename], restore [filename], score
-  Display: brief (short room descriptions), verbose (full room descriptions)
-  Other: help, quit (or q)
-
-Shortcuts are available for most commands.
-Use 'restore' without a filename to see available saves.
-"""
-        print(help_text)
-    
+        """Handle help command, listing the verbs in the registry."""
+        help_lines = self.verbs.help_lines(include_debug=self.debug_mode)
+        self.output.write()
+        self.output.write("Available commands:")
+        self.output.write("\n".join(help_lines))
+        self.output.write()
+        self.output.write("Shortcuts are available for most commands.")
+        self.output.write("Use 'restore' without a filename to see available saves.")
+        self.output.write()
+    
+    @verb_handler("brief", arguments=ARGS_NONE, consumes_move=False,
+                  usage="brief (short room descriptions)", category="Display")
     def _handle_brief(self) -> None:
         """Handle brief command - enable brief room descriptions."""
         self.player.brief_mode = True
-        print("Brief descriptions enabled. Visited rooms will show short descriptions.")
+        self.output.write("Brief descriptions enabled. Visited rooms will show short descriptions.")
     
+    @verb_handler("verbose", arguments=ARGS_NONE, consumes_move=False,
+                  usage="verbose (full room descriptions)", category="Display")
     def _handle_verbose(self) -> None:
         """Handle verbose command - enable full room descriptions."""
         self.player.brief_mode = False
-        print("Verbose descriptions enabled. All rooms will show full descriptions.")
+        self.output.write("Verbose descriptions enabled. All rooms will show full descriptions.")
     
+    @verb_handler("light", usage="light <object>", category="Light Sources")
     def _handle_light(self, command: Command) -> None:
         """Handle lighting objects like torches."""
         if not command.noun:
-            print("Light what?")
+            self._fail("Light what?")
             return
         
         obj = self._find_object(command.noun)
         if not obj:
-            print(f"I don't see a {command.noun} here.")
+            self._fail(f"I don't see a {command.noun} here.")
             return
         
         if not obj.is_light_source():
-            print(f"You can't light the {obj.name}.")
+            self._fail(f"You can't light the {obj.name}.")
             return
         
         if obj.is_lit():
-            print(f"The {obj.name} is already lit.")
+            self._fail(f"The {obj.name} is already lit.")
+            return
+        
+        if obj.get_attribute("burned_out", False):
+            self._fail(f"The {obj.name} has burned out and won't light.")
             return
         
         # Check if player has matches or other lighting source
@@ -840,39 +956,81 @@ Use 'restore' without a filename to see available saves.
                     break
         
         if not has_matches:
-            print("You have no way to light it.")
+            self._fail("You have no way to light it.")
             return
         
         # Light the object
         obj.set_attribute("lit", True)
-        print(f"The {obj.name} is now lit.")
+        self.output.write(f"The {obj.name} is now lit.")
+        self._schedule_burn_down(obj)
     
+    @verb_handler("extinguish", usage="extinguish <object>", category="Light Sources")
     def _handle_extinguish(self, command: Command) -> None:
         """Handle extinguishing light sources."""
         if not command.noun:
-            print("Extinguish what?")
+            self._fail("Extinguish what?")
             return
         
         obj = self._find_object(command.noun)
         if not obj:
-            print(f"I don't see a {command.noun} here.")
+            self._fail(f"I don't see a {command.noun} here.")
             return
         
         if not obj.is_light_source():
-            print(f"The {obj.name} is not a light source.")
+            self._fail(f"The {obj.name} is not a light source.")
             return
         
         if not obj.is_lit():
-            print(f"The {obj.name} is not lit.")
+            self._fail(f"The {obj.name} is not lit.")
             return
         
         obj.set_attribute("lit", False)
-        print(f"The {obj.name} is extinguished.")
+        self._stop_burn_down(obj)
+        self.output.write(f"The {obj.name} is extinguished.")
+    
+    def _schedule_burn_down(self, obj: GameObject) -> None:
+        """Queue the dimming warning and burn-out of a light source that was just lit."""
+        turns = obj.get_attribute("light_turns", 0)
+        if turns <= 0:
+            return  # Burns forever
+        self.scheduler.schedule(obj.id, "burn_out", delay=turns)
+        if turns > LIGHT_DIM_WARNING:
+            self.scheduler.schedule(obj.id, "dim", delay=turns - LIGHT_DIM_WARNING)
+    
+    def _stop_burn_down(self, obj: GameObject) -> None:
+        """Keep the unused turns of a light source that was put out."""
+        turns_left = self.scheduler.turns_until(obj.id, "burn_out")
+        if turns_left is not None:
+            obj.set_attribute("light_turns", max(1, turns_left))
+        self.scheduler.cancel(obj.id, "burn_out")
+        self.scheduler.cancel(obj.id, "dim")
+    
+    def _can_see_object(self, obj: GameObject) -> bool:
+        """Check if an object is carried or in the current room."""
+        current_room = self.world.get_room(self.player.current_room)
+        return obj.id in self.player.inventory or (current_room is not None and obj.id in current_room.items)
+    
+    def _light_dims(self, event) -> None:
+        """Scheduled: a burning light source is running low."""
+        obj = self.object_manager.get_object(event.npc_id)
+        if obj and obj.is_lit() and self._can_see_object(obj):
+            self.output.write(f"The {obj.name} is getting dim.")
+    
+    def _light_burns_out(self, event) -> None:
+        """Scheduled: a burning light source has used up its turns."""
+        obj = self.object_manager.get_object(event.npc_id)
+        if not obj or not obj.is_lit():
+            return
+        obj.set_attribute("lit", False)
+        obj.set_attribute("burned_out", True)
+        if self._can_see_object(obj):
+            self.output.write(f"The {obj.name} has burned out.")
 
+    @verb_handler("unlock", usage="unlock <object> with <key>", category="Locks")
     def _handle_unlock(self, command: Command) -> None:
         """Handle unlock command for doors, containers, etc."""
         if not command.noun:
-            print("Unlock what?")
+            self._fail("Unlock what?")
             return
         
         # Check if we're unlocking a grate (special puzzle object)
@@ -882,78 +1040,80 @@ Use 'restore' without a filename to see available saves.
                 # Check if player has keys
                 if "KEYS" in self.player.inventory:
                     # This will be handled by the puzzle system
-                    print("You unlock the grate with the rusty keys.")
+                    self.output.write("You unlock the grate with the rusty keys.")
                     # Add the downward exit
                     current_room.exits["down"] = "CAVE"
                     return
                 else:
-                    print("You don't have anything to unlock it with.")
+                    self._fail("You don't have anything to unlock it with.")
                     return
             else:
-                print("I don't see a grate here.")
+                self._fail("I don't see a grate here.")
                 return
         
         # Find the object to unlock
         obj = self._find_object(command.noun)
         if not obj:
-            print(f"I don't see a {command.noun} here.")
+            self._fail(f"I don't see a {command.noun} here.")
             return
         
         # Check if object can be unlocked
         if not obj.is_openable():
-            print(f"You can't unlock the {obj.name}.")
+            self._fail(f"You can't unlock the {obj.name}.")
             return
             
         if not obj.is_locked():
-            print(f"The {obj.name} isn't locked.")
+            self._fail(f"The {obj.name} isn't locked.")
             return
         
         # Simple unlock (would need key checking in full implementation)
         obj.set_attribute("locked", False)
-        print(f"You unlock the {obj.name}.")
+        self.output.write(f"You unlock the {obj.name}.")
         
+    @verb_handler("lock", usage="lock <object> with <key>", category="Locks")
     def _handle_lock(self, command: Command) -> None:
         """Handle lock command for doors, containers, etc."""
         if not command.noun:
-            print("Lock what?")
+            self._fail("Lock what?")
             return
         
         obj = self._find_object(command.noun)
         if not obj:
-            print(f"I don't see a {command.noun} here.")
+            self._fail(f"I don't see a {command.noun} here.")
             return
         
         # Check if object can be locked
         if not obj.is_openable():
-            print(f"You can't lock the {obj.name}.")
+            self._fail(f"You can't lock the {obj.name}.")
             return
             
         if obj.is_locked():
-            print(f"The {obj.name} is already locked.")
+            self._fail(f"The {obj.name} is already locked.")
             return
             
         if obj.is_open():
-            print(f"You can't lock the {obj.name} while it's open.")
+            self._fail(f"You can't lock the {obj.name} while it's open.")
             return
         
         # Simple lock (would need key checking in full implementation)
         obj.set_attribute("locked", True)
-        print(f"You lock the {obj.name}.")
+        self.output.write(f"You lock the {obj.name}.")
     
+    @verb_handler("score", arguments=ARGS_NONE, consumes_move=False, category="Game Management")
     def _handle_score(self) -> None:
         """Handle score command - display current score and ranking."""
         # Display canonical score report (moves already tracked in _route_command)
-        print(self.score_manager.get_score_report())
+        self.output.write(self.score_manager.get_score_report())
     
     def _handle_heat(self, command: Command) -> None:
         """Handle heat command for object transformations."""
         if not command.noun:
-            print("Heat what?")
+            self._fail("Heat what?")
             return
             
         primary_obj = self._find_object(command.noun)
         if not primary_obj:
-            print(f"I don't see a {command.noun} here.")
+            self._fail(f"I don't see a {command.noun} here.")
             return
             
         # Look for heat source in inventory or room
@@ -965,7 +1125,7 @@ Use 'restore' without a filename to see available saves.
                 break
         
         if not heat_source:
-            print("You need a heat source.")
+            self._fail("You need a heat source.")
             return
             
         # Attempt interaction
@@ -973,37 +1133,40 @@ Use 'restore' without a filename to see available saves.
             primary_obj.id, heat_source.id, "heat", self.player.current_room, self.object_manager
         )
         
-        print(message)
+        if not success:
+            self._fail(message)
+            return
+        self.output.write(message)
         
-        if success and result_obj:
+        if result_obj:
             # Handle object transformation
             self._handle_object_transformation(primary_obj.id, result_obj)
     
     def _handle_cool(self, command: Command) -> None:
         """Handle cool command for object transformations.""" 
         if not command.noun:
-            print("Cool what?")
+            self._fail("Cool what?")
             return
             
         primary_obj = self._find_object(command.noun)
         if not primary_obj:
-            print(f"I don't see a {command.noun} here.")
+            self._fail(f"I don't see a {command.noun} here.")
             return
             
         # For cooling, we might need water or cold conditions
-        print("You need something cold to cool it with.")
+        self._fail("You need something cold to cool it with.")
     
     def _handle_combine(self, command: Command) -> None:
         """Handle combine command for object combinations."""
         if not command.noun or not command.noun2:
-            print("Combine what with what?")
+            self._fail("Combine what with what?")
             return
             
         obj1 = self._find_object(command.noun)
         obj2 = self._find_object(command.noun2)
         
         if not obj1 or not obj2:
-            print("I can't find those objects.")
+            self._fail("I can't find those objects.")
             return
             
         # Attempt combination
@@ -1011,22 +1174,25 @@ Use 'restore' without a filename to see available saves.
             obj1.id, obj2.id, "combine", self.player.current_room, self.object_manager
         )
         
-        print(message)
+        if not success:
+            self._fail(message)
+            return
+        self.output.write(message)
         
-        if success and result_obj:
+        if result_obj:
             self._handle_object_combination(obj1.id, obj2.id, result_obj)
     
     def _handle_break_with(self, command: Command) -> None:
         """Handle break X with Y command."""
         if not command.noun or not command.noun2:
-            print("Break what with what?") 
+            self._fail("Break what with what?") 
             return
             
         target_obj = self._find_object(command.noun)
         tool_obj = self._find_object(command.noun2)
         
         if not target_obj or not tool_obj:
-            print("I can't find those objects.")
+            self._fail("I can't find those objects.")
             return
             
         # Attempt breaking
@@ -1034,22 +1200,25 @@ Use 'restore' without a filename to see available saves.
             target_obj.id, tool_obj.id, "break", self.player.current_room, self.object_manager
         )
         
-        print(message)
+        if not success:
+            self._fail(message)
+            return
+        self.output.write(message)
         
-        if success and result_obj:
+        if result_obj:
             self._handle_object_transformation(target_obj.id, result_obj)
     
     def _handle_pour_on(self, command: Command) -> None:
         """Handle pour X on Y command."""
         if not command.noun or not command.noun2:
-            print("Pour what on what?")
+            self._fail("Pour what on what?")
             return
             
         liquid_obj = self._find_object(command.noun)
         target_obj = self._find_object(command.noun2)
         
         if not liquid_obj or not target_obj:
-            print("I can't find those objects.")
+            self._fail("I can't find those objects.")
             return
             
         # Attempt pouring
@@ -1057,19 +1226,22 @@ Use 'restore' without a filename to see available saves.
             target_obj.id, liquid_obj.id, "pour", self.player.current_room, self.object_manager
         )
         
-        print(message)
+        if not success:
+            self._fail(message)
+            return
+        self.output.write(message)
     
     def _handle_use_tool(self, command: Command) -> None:
         """Handle use/apply X on Y command."""
         if not command.noun or not command.noun2:
-            print("Use what on what?")
+            self._fail("Use what on what?")
             return
             
         tool_obj = self._find_object(command.noun)  
         target_obj = self._find_object(command.noun2)
         
         if not tool_obj or not target_obj:
-            print("I can't find those objects.")
+            self._fail("I can't find those objects.")
             return
             
         # Attempt tool usage
@@ -1077,7 +1249,10 @@ Use 'restore' without a filename to see available saves.
             target_obj.id, tool_obj.id, "use", self.player.current_room, self.object_manager
         )
         
-        print(message)
+        if not success:
+            self._fail(message)
+            return
+        self.output.write(message)
     
     def _handle_object_transformation(self, original_id: str, new_id: str) -> None:
         """Handle when an object transforms into another object."""
@@ -1149,49 +1324,18 @@ Use 'restore' without a filename to see available saves.
     
     def _find_all_objects(self, noun: str, check_inventory_only: bool = False) -> List['GameObject']:
         """Find all objects matching the given noun in accessible locations."""
-        matches = []
+        # Objects anywhere in the game that match the noun; scope is checked against this set
+        matching_ids = self.object_manager.find_object_ids_by_name(noun)
+        if not matching_ids:
+            return []
         
         # Always check bulk action objects first (they're globally available)
-        for obj_id, obj in self.object_manager.objects.items():
-            if obj.is_bulk_action() and obj.matches(noun):
-                matches.append(obj)
+        matches = [obj for obj in self.object_manager.get_bulk_action_objects() if obj.id in matching_ids]
         
-        if check_inventory_only:
-            # Only check inventory (for drop command)
-            for item_id in self.player.inventory:
-                obj = self.object_manager.get_object(item_id)
-                if obj and obj.matches(noun) and not obj.is_bulk_action():
-                    matches.append(obj)
-        else:
-            # Check accessible locations
-            current_room = self.world.get_room(self.player.current_room)
-            
-            # Check current room
-            if current_room:
-                for item_id in current_room.items:
-                    obj = self.object_manager.get_object(item_id)
-                    if obj and obj.matches(noun) and not obj.is_bulk_action():
-                        matches.append(obj)
-                        
-                    # Also check inside open containers in the room
-                    if obj and obj.is_container() and obj.is_open():
-                        for contained_id in obj.get_contents():
-                            contained_obj = self.object_manager.get_object(contained_id)
-                            if contained_obj and contained_obj.matches(noun):
-                                matches.append(contained_obj)
-            
-            # Check inventory  
-            for item_id in self.player.inventory:
-                obj = self.object_manager.get_object(item_id)
-                if obj and obj.matches(noun) and not obj.is_bulk_action():
-                    matches.append(obj)
-                
-                # Also check inside open containers in inventory
-                if obj and obj.is_container() and obj.is_open():
-                    for contained_id in obj.get_contents():
-                        contained_obj = self.object_manager.get_object(contained_id)
-                        if contained_obj and contained_obj.matches(noun):
-                            matches.append(contained_obj)
+        # Then the room, inventory and open containers (or only the inventory, for drop)
+        scope = self.scope_cache.get()
+        candidates = scope.inventory if check_inventory_only else scope.reachable
+        matches.extend(obj for obj in candidates if obj.id in matching_ids)
         
         return matches
     
@@ -1202,7 +1346,7 @@ Use 'restore' without a filename to see available saves.
         # Check for cancel/quit disambiguation
         if user_input in ['cancel', 'quit', 'nevermind', 'none']:
             self._clear_disambiguation()
-            print("Cancelled.")
+            self.output.write("Cancelled.")
             return
         
         # Try to parse as a number (1, 2, 3, etc.)
@@ -1213,7 +1357,7 @@ Use 'restore' without a filename to see available saves.
                 self._execute_disambiguated_command(chosen_obj)
                 return
             else:
-                print(f"Please choose a number between 1 and {len(self.player.disambiguation_options)}.")
+                self.output.write(f"Please choose a number between 1 and {len(self.player.disambiguation_options)}.")
                 return
         except ValueError:
             pass
@@ -1228,7 +1372,7 @@ Use 'restore' without a filename to see available saves.
                 return
         
         # No match found
-        print("I don't understand. Please choose a number or be more specific.")
+        self.output.write("I don't understand. Please choose a number or be more specific.")
         self._show_disambiguation_prompt()
     
     def _execute_disambiguated_command(self, chosen_obj: 'GameObject') -> None:
@@ -1246,12 +1390,12 @@ Use 'restore' without a filename to see available saves.
             if container_obj and container_obj.is_container():
                 # Check if player can carry it
                 if self.player.is_inventory_full():
-                    print("Your load is too heavy.")
+                    self.output.write("Your load is too heavy.")
                 else:
                     # Remove from container and add to inventory
                     container_obj.remove_from_container(chosen_obj.id)
                     self.player.add_to_inventory(chosen_obj.id)
-                    print(f"You take the {chosen_obj.name} from the {container_obj.name}.")
+                    self.output.write(f"You take the {chosen_obj.name} from the {container_obj.name}.")
             self._clear_disambiguation()
             return
         
@@ -1271,8 +1415,8 @@ Use 'restore' without a filename to see available saves.
             # Clear disambiguation state first
             self._clear_disambiguation()
             
-            # Re-execute the original command with the chosen object
-            self._route_command(command)
+            # Re-execute the original command with the chosen object (the move was already counted)
+            self._route_command(command, count_move=False)
         finally:
             # Restore original method
             self._find_object = original_find_object
@@ -1285,11 +1429,11 @@ Use 'restore' without a filename to see available saves.
     
     def _show_disambiguation_prompt(self) -> None:
         """Show the disambiguation options to the player."""
-        print("Which one do you mean?")
+        self.output.write("Which one do you mean?")
         for i, obj in enumerate(self.player.disambiguation_options, 1):
             location_desc = self._get_object_location_description(obj)
-            print(f"  {i}. the {obj.name} ({location_desc})")
-        print("(Enter a number, or type 'cancel' to abort)")
+            self.output.write(f"  {i}. the {obj.name} ({location_desc})")
+        self.output.write("(Enter a number, or type 'cancel' to abort)")
     
     def _get_object_location_description(self, obj: 'GameObject') -> str:
         """Get a description of where an object is located."""
@@ -1308,21 +1452,8 @@ Use 'restore' without a filename to see available saves.
     
     def _has_light_source(self) -> bool:
         """Check if player has any active light source."""
-        # Check inventory for lit light sources
-        for item_id in self.player.inventory:
-            obj = self.object_manager.get_object(item_id)
-            if obj and obj.is_lit():
-                return True
-        
-        # Check current room for lit light sources
-        current_room = self.world.get_room(self.player.current_room)
-        if current_room:
-            for item_id in current_room.items:
-                obj = self.object_manager.get_object(item_id)
-                if obj and obj.is_lit():
-                    return True
-        
-        return False
+        # Lit light sources in the inventory or current room
+        return self.scope_cache.get().has_light
     
     def _check_darkness(self) -> bool:
         """Check if current room is dark and player has no light. Returns True if too dark to see."""
@@ -1340,14 +1471,12 @@ Use 'restore' without a filename to see available saves.
         
         # Check for grue in dark rooms
         if current_room.has_flag("dark") and self._check_darkness():
-            import random
-            if random.random() < 0.1:  # 10% chance per turn in darkness
+            if self.rng.world.random() < 0.1:  # 10% chance per turn in darkness
                 return "You are likely to be eaten by a grue."
         
         # Check for explicitly dangerous/deadly rooms
-        if current_room.has_flag("dangerous") or current_room.has_flag("deadly"):
-            import random
-            if random.random() < 0.05:  # 5% chance per turn in dangerous areas
+        if current_room.flags & DANGER_FLAGS:
+            if self.rng.world.random() < 0.05:  # 5% chance per turn in dangerous areas
                 return "You have died from the treacherous conditions here."
         
         return None
@@ -1358,19 +1487,8 @@ Use 'restore' without a filename to see available saves.
         if not current_room:
             return None
         
-        atmospheric_text = []
-        
-        if current_room.has_flag("noisy"):
-            atmospheric_text.append("Your footsteps echo loudly here.")
-        
-        if current_room.has_flag("sacred"):
-            atmospheric_text.append("An aura of ancient power fills this place.")
-        
-        if current_room.has_flag("outdoor"):
-            atmospheric_text.append("A gentle breeze stirs the air.")
-        
-        if current_room.has_flag("cold"):
-            atmospheric_text.append("The air is frigid here.")
+        flags = current_room.flags
+        atmospheric_text = [text for bit, text in ATMOSPHERE_FLAGS if flags & bit]
         
         return " ".join(atmospheric_text) if atmospheric_text else None
     
@@ -1378,25 +1496,25 @@ Use 'restore' without a filename to see available saves.
         """Show the current room description."""
         current_room = self.world.get_room(self.player.current_room)
         if not current_room:
-            print("You are in a void.")
+            self.output.write("You are in a void.")
             return
         
         # Check for darkness first
         if self._check_darkness():
-            print("It is pitch black. You are likely to be eaten by a grue.")
+            self.output.write("It is pitch black. You are likely to be eaten by a grue.")
             current_room.visited = True  # Still mark as visited
             return
         
         # Determine how to show the description
         if force_verbose:
             # "look" command - always show full description without room name
-            print(current_room.get_description(force_verbose=True, include_name=False))
+            self.output.write(current_room.get_description(force_verbose=True, include_name=False))
         elif not current_room.visited:
             # First visit - always show full description regardless of brief mode, without room name
-            print(current_room.get_description(force_verbose=True, include_name=False))
+            self.output.write(current_room.get_description(force_verbose=True, include_name=False))
         else:
             # Subsequent visit - respect brief mode setting, without room name
-            print(current_room.get_description(force_brief=self.player.brief_mode, include_name=False))
+            self.output.write(current_room.get_description(force_brief=self.player.brief_mode, include_name=False))
         
         # Mark room as visited after showing description
         current_room.visited = True
@@ -1410,25 +1528,25 @@ Use 'restore' without a filename to see available saves.
         
         if items_here:
             if len(items_here) == 1:
-                print(f"There is a {items_here[0]} here.")
+                self.output.write(f"There is a {items_here[0]} here.")
             else:
-                print(f"There are {', '.join(items_here)} here.")
+                self.output.write(f"There are {', '.join(items_here)} here.")
         
         # Show NPCs in room
         npcs_here = self.npc_manager.get_npcs_in_room(current_room.id)
         if npcs_here:
             for npc in npcs_here:
-                print(npc.description)
+                self.output.write(npc.description)
         
         # Show available exits
         if current_room.exits:
             exit_list = list(current_room.exits.keys())
-            print(f"Obvious exits: {', '.join(exit_list)}")
+            self.output.write(f"Obvious exits: {', '.join(exit_list)}")
         
         # Show atmospheric descriptions based on room flags
         atmospheric = self._get_atmospheric_description()
         if atmospheric:
-            print(atmospheric)
+            self.output.write(atmospheric)
     
     def _show_welcome(self) -> None:
         """Show the welcome message."""
@@ -1447,7 +1565,7 @@ ZORK is a registered trademark of Infocom, Inc.
 Revision 88 / Serial number 840726
 
 """
-        print(welcome_text)
+        self.output.write(welcome_text)
     
     def _load_world_from_mud_files(self, mud_directory: Optional[Path] = None) -> None:
         """Load world from original Zork .mud files."""
@@ -1456,57 +1574,99 @@ Revision 88 / Serial number 840726
         
         if not mud_directory.exists():
             if self.debug_mode:
-                print(f"Warning: {mud_directory} not found. Creating simple test world instead.")
+                self.output.write(f"Warning: {mud_directory} not found. Creating simple test world instead.")
             else:
-                print("Hmm, the original scrolls seem to be missing. Conjuring a basic world...")
+                self.output.write("Hmm, the original scrolls seem to be missing. Conjuring a basic world...")
             self._create_initial_world()
             return
         
         if self.debug_mode:
-            print(f"Loading Zork world from {mud_directory}...")
+            self.output.write(f"Loading Zork world from {mud_directory}...")
         else:
-            print("The Implementers are consulting the ancient scrolls...")
+            self.output.write("The Implementers are consulting the ancient scrolls...")
+        
+        # Use the precompiled world image when the sources haven't changed
+        world_cache = None
+        if self.use_world_cache or self.rebuild_world_cache:
+            world_cache = WorldImageCache(mud_directory, debug_mode=self.debug_mode)
+            if not self.rebuild_world_cache and self._load_world_image(world_cache):
+                return
         
         # Load rooms from .mud files
-        room_loader = ZorkRoomLoader(self.world, debug_mode=self.debug_mode)
+        room_loader = ZorkRoomLoader(self.world, debug_mode=self.debug_mode, parse_workers=self.parse_workers)
         room_count = room_loader.load_from_mud_files(mud_directory)
         
         if room_count == 0:
             if self.debug_mode:
-                print("Failed to load rooms from .mud files. Creating simple test world instead.")
+                self.output.write("Failed to load rooms from .mud files. Creating simple test world instead.")
             else:
-                print("The scrolls are written in an ancient tongue. Improvising...")
+                self.output.write("The scrolls are written in an ancient tongue. Improvising...")
             self._create_initial_world()
             return
         
         if not self.debug_mode:
-            print("The maze of twisty passages is taking shape...")
+            self.output.write("The maze of twisty passages is taking shape...")
             
         if self.debug_mode:
-            print(f"✓ Loaded {room_count} rooms from original Zork")
+            self.output.write(f"✓ Loaded {room_count} rooms from original Zork")
         
         # Load objects using new object loader
         object_loader = ZorkObjectLoader(self.object_manager, self.world, debug_mode=self.debug_mode)
         object_count = object_loader.load_from_mud_files(mud_directory)
         
         if not self.debug_mode:
-            print("Scattering treasures and hiding rusty swords...")
+            self.output.write("Scattering treasures and hiding rusty swords...")
             
         if self.debug_mode:
-            print(f"✓ Loaded {object_count} objects from canonical definitions")
+            self.output.write(f"✓ Loaded {object_count} objects from canonical definitions")
         
         # Set starting room to West of House (just like original Zork)
         starting_room = "WHOUS"
         if starting_room not in self.world.rooms:
             if self.debug_mode:
-                print("Warning: Starting room WHOUS not found. Using first available room.")
+                self.output.write("Warning: Starting room WHOUS not found. Using first available room.")
             starting_room = list(self.world.rooms.keys())[0] if self.world.rooms else "UNKNOWN"
         
         self.player.current_room = starting_room
         
+        # Snapshot the freshly built world before anything can change it
+        if world_cache is not None:
+            world_cache.save(WorldImage(world=self.world,
+                                        object_manager=self.object_manager,
+                                        npc_manager=self.npc_manager,
+                                        starting_room=starting_room))
+        
         # Add a subtle completion hint for non-debug mode
         if not self.debug_mode:
-            print("Ready to explore the Great Underground Empire!")
+            self.output.write("Ready to explore the Great Underground Empire!")
+    
+    def _fork_world(self, world_base: WorldBase) -> None:
+        """Play on a copy-on-write view of a shared base world."""
+        self.world, self.object_manager = world_base.fork()
+        self.player.current_room = world_base.starting_room
+        self._attach_containment()
+    
+    def _load_world_image(self, world_cache: WorldImageCache) -> bool:
+        """Restore world, objects and NPCs from a precompiled world image. Returns True on success."""
+        image = world_cache.load()
+        if image is None:
+            return False
+        
+        self.world = image.world
+        self.object_manager = image.object_manager
+        self.npc_manager = image.npc_manager
+        for npc in self.npc_manager.npcs.values():
+            if hasattr(npc, 'thief_behavior'):
+                npc.thief_behavior.rng = self.rng.npc
+        self.player.current_room = image.starting_room
+        self._attach_containment()
+        self.world_loaded_from_cache = True
+        
+        if self.debug_mode:
+            self.output.write(f"✓ Loaded {len(self.world)} rooms and {len(self.object_manager)} objects from world image")
+        else:
+            self.output.write("Ready to explore the Great Underground Empire!")
+        return True
     
     def _load_objects_from_mud_files(self, mud_directory: Path) -> None:
         """Load and create objects from .mud files and place them in rooms."""
@@ -1595,70 +1755,27 @@ Revision 88 / Serial number 840726
     def _handle_bulk_action(self, verb: str, bulk_obj: 'GameObject') -> None:
         """Handle bulk actions like 'take all', 'drop valuables', etc. (canonical VALUABLES&C)."""
         bulk_type = bulk_obj.get_bulk_type()
-        current_room = self.world.get_room(self.player.current_room)
         
         # Get the list of candidate objects based on bulk type
-        candidate_objects = []
-        
-        if bulk_type == "all":
-            # All visible, takeable objects in room (for TAKE) or inventory (for DROP)
-            if verb == "take":
-                if current_room:
-                    for item_id in current_room.items:
-                        obj = self.object_manager.get_object(item_id)
-                        if obj and obj.is_takeable() and not obj.is_bulk_action():
-                            candidate_objects.append(obj)
-                    # Also check open containers in room
-                    for item_id in current_room.items:
-                        container = self.object_manager.get_object(item_id)
-                        if container and container.is_container() and container.is_open():
-                            for contained_id in container.get_contents():
-                                contained_obj = self.object_manager.get_object(contained_id)
-                                if contained_obj and contained_obj.is_takeable():
-                                    candidate_objects.append(contained_obj)
-            elif verb == "drop":
-                for item_id in self.player.inventory:
-                    obj = self.object_manager.get_object(item_id)
-                    if obj and not obj.is_bulk_action():
-                        candidate_objects.append(obj)
-                        
-        elif bulk_type == "valuables":
-            # Only objects with treasure value > 0
-            if verb == "take" and current_room:
-                for item_id in current_room.items:
-                    obj = self.object_manager.get_object(item_id)
-                    if obj and obj.is_takeable() and obj.get_attribute("treasure_value", 0) > 0:
-                        candidate_objects.append(obj)
-            elif verb == "drop":
-                for item_id in self.player.inventory:
-                    obj = self.object_manager.get_object(item_id)
-                    if obj and obj.get_attribute("treasure_value", 0) > 0:
-                        candidate_objects.append(obj)
-                        
-        elif bulk_type == "possessions":
-            # Items you're carrying (mainly for DROP)
-            for item_id in self.player.inventory:
-                obj = self.object_manager.get_object(item_id)
-                if obj and not obj.is_bulk_action():
-                    candidate_objects.append(obj)
+        candidate_objects = self.scope_cache.get_bulk_candidates(verb, bulk_type)
         
         # Check if we found any objects
         if not candidate_objects:
             if bulk_type == "all":
                 if verb == "take":
-                    print("I don't see anything to take.")
+                    self._fail("I don't see anything to take.")
                 else:
-                    print("You aren't carrying anything.")
+                    self._fail("You aren't carrying anything.")
             elif bulk_type == "valuables":
-                print("I couldn't find any valuables.")
+                self._fail("I couldn't find any valuables.")
             else:
-                print("I couldn't find anything.")
+                self._fail("I couldn't find anything.")
             return
         
         # Check for too many objects (canonical limit)
         max_bulk_objects = 20  # Reasonable limit to prevent spam
         if len(candidate_objects) > max_bulk_objects:
-            print("I can't do everything, because I ran out of room.")  # Canonical message
+            self.output.write("I can't do everything, because I ran out of room.")  # Canonical message
             candidate_objects = candidate_objects[:max_bulk_objects]
         
         # Process each object
@@ -1673,17 +1790,17 @@ Revision 88 / Serial number 840726
         
         # Summary message
         if success_count == 0:
-            print("Nothing was accomplished.")
+            self._fail("Nothing was accomplished.")
         elif success_count == 1:
-            print("Done.")
+            self.output.write("Done.")
         else:
-            print(f"Done. ({success_count} objects affected)")
+            self.output.write(f"Done. ({success_count} objects affected)")
             
     def _try_bulk_take(self, obj: 'GameObject') -> bool:
         """Try to take an object as part of bulk action. Returns True if successful."""
         # Check if player can carry it
         if self.player.is_inventory_full():
-            print(f"{obj.name}: Your load is too heavy.")
+            self.output.write(f"{obj.name}: Your load is too heavy.")
             return False
             
         # Find where object is located
@@ -1698,7 +1815,7 @@ Revision 88 / Serial number 840726
             if current_room:
                 current_room.remove_item(obj.id)
                 self.player.add_to_inventory(obj.id)
-                print(f"{obj.name}: Taken.")
+                self.output.write(f"{obj.name}: Taken.")
                 return True
         elif location_type == "container":
             # Take from container
@@ -1706,10 +1823,10 @@ Revision 88 / Serial number 840726
             if container and container.is_open():
                 container.remove_from_container(obj.id)
                 self.player.add_to_inventory(obj.id)
-                print(f"{obj.name}: Taken.")
+                self.output.write(f"{obj.name}: Taken.")
                 return True
             elif container and not container.is_open():
-                print(f"{obj.name}: The {container.name} is closed.")
+                self.output.write(f"{obj.name}: The {container.name} is closed.")
                 return False
                 
         return False
@@ -1721,16 +1838,16 @@ Revision 88 / Serial number 840726
             if current_room:
                 self.player.remove_from_inventory(obj.id)
                 current_room.add_item(obj.id)
-                print(f"{obj.name}: Dropped.")
+                self.output.write(f"{obj.name}: Dropped.")
                 return True
         return False
 
     def _create_initial_world(self) -> None:
         """Create minimal fallback world if .mud files fail to load."""
         if self.debug_mode:
-            print("Creating minimal fallback world...")
+            self.output.write("Creating minimal fallback world...")
         else:
-            print("The Implementers are improvising a simple realm...")
+            self.output.write("The Implementers are improvising a simple realm...")
         
         # Create basic West of House for fallback
         west_house = Room(
@@ -1745,22 +1862,24 @@ Revision 88 / Serial number 840726
         object_loader = ZorkObjectLoader(self.object_manager, self.world)
         object_loader._create_canonical_objects()
         object_count = len(self.object_manager.objects)
-        print(f"✓ Created {object_count} fallback objects")
+        self.output.write(f"✓ Created {object_count} fallback objects")
         
         # Delete this massive method content and replace with simple fallback
         # Since the rest of the method is 450+ lines of old test world code
 
     # ========== Save/Load System ==========
 
-    def save_game(self, filename: str = None) -> bool:
+    def save_game(self, filename: str = None, background: bool = False) -> bool:
         """
         Save the current game state to a file.
         
         Args:
             filename: Optional filename. If not provided, generates timestamp-based name.
+            background: Only take a snapshot now and leave serializing and writing
+                to the autosave thread (see finish_saves()); nothing is printed
             
         Returns:
-            True if save was successful, False otherwise.
+            True if save was successful (for background saves: queued), False otherwise.
         """
         if filename is None:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1769,41 +1888,43 @@ Revision 88 / Serial number 840726
         # Sanitize filename to prevent path traversal attacks
         sanitized_filename = self._sanitize_filename(filename)
         if not sanitized_filename:
-            print("Invalid filename provided.")
+            self.output.write("Invalid filename provided.")
             return False
         
         try:
-            game_state = self._collect_game_state()
-            
             # Ensure saves directory exists
-            saves_dir = Path("saves")
-            saves_dir.mkdir(exist_ok=True)
+            saves_dir = self.saves_dir
+            saves_dir.mkdir(parents=True, exist_ok=True)
             
             # Use sanitized filename and ensure it resolves within saves directory
             save_path = saves_dir / sanitized_filename
             
             # Security check: ensure resolved path is within saves directory
             if not self._is_safe_path(save_path, saves_dir):
-                print("Invalid save path detected.")
+                self.output.write("Invalid save path detected.")
                 return False
             
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(game_state, f, indent=2, ensure_ascii=False)
+            if background:
+                self._queue_save(save_path)
+                return True
+            
+            self.finish_saves()  # Don't write while the autosave thread might
+            self._write_save(save_path)
             
-            print(f"Game saved as {save_path}")
+            self.output.write(f"Game saved as {save_path}")
             return True
             
         except (IOError, OSError) as e:
             logging.warning(f"IO error saving game: {type(e).__name__}")
-            print("Failed to save game: IO error.")
+            self.output.write("Failed to save game: IO error.")
             return False
-        except json.JSONEncodeError as e:
+        except (TypeError, ValueError) as e:
             logging.warning(f"JSON encoding error saving game: {type(e).__name__}")
-            print("Failed to save game: encoding error.")
+            self.output.write("Failed to save game: encoding error.")
             return False
         except Exception as e:
             logging.warning(f"Unexpected error saving game: {type(e).__name__}")
-            print("Failed to save game: unexpected error.")
+            self.output.write("Failed to save game: unexpected error.")
             return False
     
     def load_game(self, filename: str) -> bool:
@@ -1819,52 +1940,139 @@ Revision 88 / Serial number 840726
         # Sanitize filename to prevent path traversal attacks
         sanitized_filename = self._sanitize_filename(filename)
         if not sanitized_filename:
-            print("Invalid filename provided.")
+            self.output.write("Invalid filename provided.")
             return False
             
         try:
-            saves_dir = Path("saves")
+            saves_dir = self.saves_dir
             save_path = saves_dir / sanitized_filename
             
             # Security check: ensure resolved path is within saves directory
             if not self._is_safe_path(save_path, saves_dir):
-                print("Invalid save path detected.")
+                self.output.write("Invalid save path detected.")
                 return False
             
+            self.finish_saves()  # An autosave of this file may still be being written
             if not save_path.exists():
-                print(f"Save file {sanitized_filename} not found.")
+                self.output.write(f"Save file {sanitized_filename} not found.")
                 return False
             
             # Additional security: check file size to prevent memory exhaustion
             if save_path.stat().st_size > 10 * 1024 * 1024:  # 10MB limit
-                print("Save file too large.")
+                self.output.write("Save file too large.")
                 return False
             
-            with open(save_path, 'r', encoding='utf-8') as f:
-                game_state = json.load(f)
+            game_state, chain = read_save(save_path)
             
             # Validate loaded data structure
             if not self._validate_game_state(game_state):
-                print("Invalid save file format.")
+                self.output.write("Invalid save file format.")
                 return False
             
             self._restore_game_state(game_state)
-            print(f"Game loaded from {save_path}")
+            self._mark_saved(chain)  # The game now matches the file, so the next save can be a delta
+            self.output.write(f"Game loaded from {save_path}")
             return True
             
         except (IOError, OSError) as e:
             logging.warning(f"IO error loading game: {type(e).__name__}")
-            print("Failed to load game: file access error.")
+            self.output.write("Failed to load game: file access error.")
             return False
         except json.JSONDecodeError as e:
             logging.warning(f"JSON decode error loading game: {type(e).__name__}")
-            print("Failed to load game: invalid file format.")
+            self.output.write("Failed to load game: invalid file format.")
             return False
         except Exception as e:
             logging.warning(f"Unexpected error loading game: {type(e).__name__}")
-            print("Failed to load game: unexpected error.")
+            self.output.write("Failed to load game: unexpected error.")
             return False
     
+    def _write_save(self, save_path: Path) -> None:
+        """
+        Write the game to a save file: a delta if the file is the one this
+        game last saved to or loaded, otherwise a full checkpoint.
+        """
+        self._take_changes()
+        header = self._save_header()
+        chain, self._save_chain = self._save_chain, None  # Only kept if the write succeeds
+        if chain is not None and chain.can_append(save_path):
+            delta, prints = self._collect_game_state_changes(chain)
+            append_delta(chain, header, delta, prints)
+            chain.pending.clear()
+        else:
+            chain = write_checkpoint(save_path, header, self._collect_game_state())
+        self._save_chain = chain
+    
+    def _mark_saved(self, chain: Optional[SaveChain]) -> None:
+        """Start tracking changes anew from a loaded save (chain is None for an older save that can't take deltas)."""
+        self._save_chain = chain
+        self.tracker.clear()
+        if self.autosaver is not None:
+            self.autosaver.rebase()
+            self.autosaver.last_moves = self.score_manager.moves
+    
+    def _save_header(self) -> SaveHeader:
+        room = self.world.peek_room(self.player.current_room)
+        return new_header(SAVE_VERSION, room.name if room is not None else self.player.current_room,
+                          self.score_manager.moves, self.score_manager.current_score)
+    
+    def _take_changes(self) -> None:
+        """Hand what changed since the last save or snapshot to every save target that hasn't got it yet."""
+        changes = self.tracker.take()
+        for target in (self._save_chain, self.autosaver):
+            if target is not None:
+                target.pending.update(changes)
+    
+    # ----- Autosave -----
+    
+    def enable_autosave(self, every: int = DEFAULT_AUTOSAVE_MOVES, filename: str = AUTOSAVE_FILENAME) -> None:
+        """Save to filename in the background every `every` moves (0 turns it off)."""
+        self.hooks.unregister("autosave")
+        self.autosave_every = every
+        self.autosave_filename = filename
+        if every > 0:
+            self.hooks.register(HookStage.END_OF_TURN, GameEngine._autosave_turn, name="autosave")
+    
+    def _autosave_turn(self, context: TurnContext) -> None:
+        """End-of-turn hook: queue an autosave once enough moves have passed."""
+        if self.player.awaiting_disambiguation or not self.running:
+            return  # A pending question can't be saved, and a finished game needn't be
+        last_moves = self.autosaver.last_moves if self.autosaver is not None else 0
+        if self.score_manager.moves - last_moves >= self.autosave_every:
+            self.save_game(self.autosave_filename, background=True)
+    
+    def _queue_save(self, save_path: Path) -> None:
+        """Snapshot the game for the autosave thread (the first snapshot of a file copies everything)."""
+        autosaver = self.autosaver
+        if autosaver is None or autosaver.path != save_path:
+            if autosaver is not None:
+                autosaver.close()
+            autosaver = self.autosaver = Autosaver(save_path)
+        self._take_changes()
+        header = self._save_header()
+        if autosaver.has_base:
+            entries = self._collect_entries(autosaver.pending)  # Room, object and NPC entries are copies already
+            snapshot = SaveSnapshot(header, entries, self._detached(self._collect_save_sections()))
+        else:
+            state = self._collect_game_state()
+            state.update(self._detached(sections_of(state)))
+            snapshot = SaveSnapshot(header, state=state)
+            autosaver.has_base = True
+        autosaver.pending.clear()
+        autosaver.last_moves = self.score_manager.moves
+        autosaver.submit(snapshot)
+    
+    @staticmethod
+    def _detached(sections: Dict[str, Any]) -> Dict[str, Any]:
+        """Copies of save sections that may share lists with the game (the RNG state is built fresh)."""
+        return {key: value if key == "rng_state" else copy.deepcopy(value) for key, value in sections.items()}
+    
+    def finish_saves(self, timeout: Optional[float] = None) -> bool:
+        """Wait for background saves to be written. Returns False on timeout."""
+        if self.autosaver is None:
+            return True
+        return self.autosaver.flush(timeout)
+    
     def _sanitize_filename(self, filename: str) -> str:
         """
         Sanitize filename to prevent path traversal and other security issues.
@@ -1938,35 +2146,111 @@ Revision 88 / Serial number 840726
         if not isinstance(game_state, dict):
             return False
         
-        # Check for required top-level keys
-        required_keys = ['player', 'world_state', 'score_system', 'combinations']
+        # Check for required top-level keys (saves written by _collect_game_state, or the older layout)
+        if 'player_state' in game_state:
+            player_key, required_keys = 'player_state', ['player_state', 'world_state']
+        else:
+            player_key, required_keys = 'player', ['player', 'world_state', 'score_system', 'combinations']
         if not all(key in game_state for key in required_keys):
             return False
         
         # Basic validation of player data
-        if not isinstance(game_state.get('player'), dict):
+        if not isinstance(game_state.get(player_key), dict):
             return False
         
         # Check for dangerous content that shouldn't be in save files
-        game_str = json.dumps(game_state)
-        dangerous_patterns = ['__import__', 'eval(', 'exec(', 'os.system', '__reduce__', '__call__']
-        if any(pattern in game_str for pattern in dangerous_patterns):
+        if self._has_dangerous_content(game_state):
             logging.warning("Dangerous content detected in save file")
             return False
         
         return True
+    
+    def _has_dangerous_content(self, value: Any) -> bool:
+        """Check every string (keys included) in loaded save data for code-like patterns."""
+        dangerous_patterns = ('__import__', 'eval(', 'exec(', 'os.system', '__reduce__', '__call__')
+        pending = [value]
+        while pending:
+            item = pending.pop()
+            if isinstance(item, str):
+                if any(pattern in item for pattern in dangerous_patterns):
+                    return True
+            elif isinstance(item, dict):
+                pending.extend(item)
+                pending.extend(item.values())
+            elif isinstance(item, list):
+                pending.extend(item)
+        return False
 
     def _collect_game_state(self) -> Dict[str, Any]:
         """Collect all game state that needs to be saved."""
         
-        # Collect world state (rooms and their items)
-        world_state = {}
-        for room_id, room in self.world.rooms.items():
-            world_state[room_id] = {
-                "items": room.items.copy(),
-                "visited": room.visited,
-                "flags": list(room.flags)
-            }
+        # Collect world state (rooms and their items), object attributes and NPC locations
+        world_state = {room.id: self._room_save_state(room) for room in self.world.iter_rooms()}
+        object_state = {obj.id: self._object_save_state(obj) for obj in self.object_manager.iter_objects()}
+        npc_state = {npc.id: self._npc_save_state(npc) for npc in self.npc_manager.npcs.values()}
+        
+        # Create complete game state
+        game_state = {
+            "version": SAVE_VERSION,
+            "timestamp": datetime.datetime.now().isoformat(),
+            "world_state": world_state,
+            "object_state": object_state,
+            "npc_state": npc_state,
+            **self._collect_save_sections()
+        }
+        
+        return game_state
+    
+    def _collect_game_state_changes(self, chain: SaveChain) -> Tuple[Dict[str, Any], Dict[str, bytes]]:
+        """
+        Collect what changed since the save the chain ends with.
+        
+        Returns:
+            (delta with the touched rooms, objects and NPCs and the changed
+            sections, fingerprints of every section for the next delta)
+        """
+        delta: Dict[str, Any] = {"timestamp": datetime.datetime.now().isoformat()}
+        delta.update(self._collect_entries(chain.pending))
+        sections, prints = changed_sections(chain.fingerprints, self._collect_save_sections())
+        delta.update(sections)
+        return delta, prints
+    
+    def _collect_entries(self, changes: ChangeSet) -> Dict[str, Dict[str, Any]]:
+        """Save entries of the changed rooms, objects and NPCs, by section (empty sections left out)."""
+        rooms = {}
+        for room_id in changes.rooms:
+            room = self.world.peek_room(room_id)
+            if room is not None:
+                rooms[room_id] = self._room_save_state(room)
+        objects = {}
+        for object_id in changes.objects:
+            obj = self.object_manager.peek_object(object_id)
+            if obj is not None:
+                objects[object_id] = self._object_save_state(obj)
+        npcs = {npc_id: self._npc_save_state(self.npc_manager.npcs[npc_id])
+                for npc_id in changes.npcs if npc_id in self.npc_manager.npcs}
+        entries = {}
+        for key, section in (("world_state", rooms), ("object_state", objects), ("npc_state", npcs)):
+            if section:
+                entries[key] = section
+        return entries
+    
+    @staticmethod
+    def _room_save_state(room: Room) -> Dict[str, Any]:
+        return {"items": room.items.copy(), "visited": room.visited, "flags": encode_flags(room.flags)}
+    
+    @staticmethod
+    def _object_save_state(obj: GameObject) -> Dict[str, Any]:
+        # Contents lists and the like are copied, so a background save doesn't share them with the game
+        return {"attributes": {name: copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+                               for name, value in obj.attributes.items()}}
+    
+    @staticmethod
+    def _npc_save_state(npc: Any) -> Dict[str, Any]:
+        return {"location": npc.location}
+    
+    def _collect_save_sections(self) -> Dict[str, Any]:
+        """Collect the game state besides rooms, objects and NPCs (small, whatever the world's size)."""
         
         # Collect player state
         player_state = {
@@ -1998,34 +2282,55 @@ Revision 88 / Serial number 840726
             if hasattr(self.puzzle_manager, 'save_state'):
                 puzzle_state = self.puzzle_manager.save_state()
         
-        # Create complete game state
-        game_state = {
-            "version": "1.2.0",
-            "timestamp": datetime.datetime.now().isoformat(),
-            "world_state": world_state,
+        return {
             "player_state": player_state,
             "score_state": score_state,
             "combination_state": combination_state,
-            "puzzle_state": puzzle_state
+            "puzzle_state": puzzle_state,
+            "rng_state": self.rng.get_state(),
+            "schedule_state": self.scheduler.get_state()
         }
-        
-        return game_state
     
     def _restore_game_state(self, game_state: Dict[str, Any]) -> None:
         """Restore game state from saved data."""
         
+        # Loading isn't a turn that can be undone, and earlier turns no longer apply
+        self.journal.discard_turn()
+        self.journal.clear()
+        
         # Validate save version compatibility
         saved_version = game_state.get("version", "unknown")
-        print(f"Loading save from version {saved_version}")
+        self.output.write(f"Loading save from version {saved_version}")
         
         # Restore world state
         if "world_state" in game_state:
             for room_id, room_data in game_state["world_state"].items():
+                current = self.world.peek_room(room_id)
+                if current is None:
+                    continue
+                items = room_data.get("items", [])
+                visited = room_data.get("visited", False)
+                flags = to_mask(room_data.get("flags", 0))  # Masks, or flag name lists from older saves
+                if current.items == items and current.visited == visited and current.flags == flags:
+                    continue  # Unchanged, so a session's shared room stays shared
                 room = self.world.get_room(room_id)
-                if room:
-                    room.items = room_data.get("items", [])
-                    room.visited = room_data.get("visited", False)
-                    room.flags = set(room_data.get("flags", []))
+                room.items = items
+                room.visited = visited
+                room.set_flags(flags)
+        
+        # Restore object attributes (saves before 1.3.0 have none)
+        for object_id, object_data in game_state.get("object_state", {}).items():
+            current = self.object_manager.peek_object(object_id)
+            attributes = object_data.get("attributes")
+            if current is None or attributes is None or dict(current.attributes) == attributes:
+                continue  # Unchanged objects stay shared too
+            self.object_manager.get_object(object_id).attributes = attributes
+        
+        # Restore NPC locations
+        for npc_id, npc_data in game_state.get("npc_state", {}).items():
+            npc = self.npc_manager.get_npc(npc_id)
+            if npc is not None and "location" in npc_data:
+                npc.location = npc_data["location"]
         
         # Restore player state
         if "player_state" in game_state:
@@ -2057,20 +2362,48 @@ Revision 88 / Serial number 840726
             if puzzle_data and hasattr(self.puzzle_manager, 'restore_state'):
                 self.puzzle_manager.restore_state(puzzle_data)
         
-        print("Game state restored successfully!")
+        # Resume the random streams and the event queue where the save left them
+        if "rng_state" in game_state:
+            self.rng.set_state(game_state["rng_state"])
+        if "schedule_state" in game_state:
+            self.scheduler.set_state(game_state["schedule_state"])
+        
+        # Room items and inventory were replaced wholesale
+        self.object_manager.containment.rebuild(self.world, self.player, self.object_manager)
+        
+        self.output.write("Game state restored successfully!")
     
     def list_saves(self) -> List[str]:
         """List all available save files."""
-        saves_dir = Path("saves")
+        return [name for name, _ in self._list_save_headers()]
+    
+    def _list_save_headers(self) -> List[Tuple[str, Optional[SaveHeader]]]:
+        """
+        List save files with their headers, most recent first.
+        
+        Only each file's fixed-size header is read; older saves have no
+        header (None) and are dated by their modification time.
+        """
+        saves_dir = self.saves_dir
         if not saves_dir.exists():
             return []
         
         save_files = []
         for file_path in saves_dir.glob("*.json"):
-            save_files.append(file_path.name)
+            header = read_header(file_path)
+            if header is not None:
+                saved_at = header.timestamp
+            else:
+                try:
+                    saved_at = datetime.datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+                except OSError:
+                    continue
+            save_files.append((saved_at, file_path.name, header))
         
-        return sorted(save_files, reverse=True)  # Most recent first
+        save_files.sort(key=lambda entry: (entry[0], entry[1]), reverse=True)  # Most recent first
+        return [(name, header) for _, name, header in save_files]
     
+    @verb_handler("save", usage="save [filename]", category="Game Management")
     def _handle_save(self, command: Command) -> None:
         """Handle save command."""
         filename = None
@@ -2081,21 +2414,51 @@ Revision 88 / Serial number 840726
         
         success = self.save_game(filename)
         if not success:
-            print("Save failed. Please try again.")
-    
+            self.output.write("Save failed. Please try again.")
+    
+    @verb_handler("undo", arguments=ARGS_NONE, consumes_move=False, usage="undo", category="Game Management")
+    def _handle_undo(self) -> None:
+        """Handle undo command - take back the last turn that changed anything."""
+        turn = self.journal.undo()
+        if turn is None:
+            self._fail("There is nothing to undo.")
+            return
+        self.player.current_room = turn.snapshot.get("room", self.player.current_room)
+        if "schedule" in turn.snapshot:
+            self.scheduler.set_state(turn.snapshot["schedule"])
+        self.output.write(f"[{turn.user_input}: undone.]")
+    
+    @verb_handler("again", arguments=ARGS_NONE, consumes_move=False, usage="again (or g)",
+                  category="Game Management")
+    def _handle_again(self) -> None:
+        """Reached only when there is no previous command (otherwise AGAIN is replaced after parsing)."""
+        self._fail("There is no command to repeat.")
+    
+    @verb_handler("oops", arguments=ARGS_NONE, consumes_move=False, usage="oops <word>",
+                  category="Game Management")
+    def _handle_oops(self) -> None:
+        """Reached only when OOPS has nothing to correct (otherwise it is replaced after parsing)."""
+        self._fail("There was no word to replace!")
+    
+    @verb_handler("restore", "load", usage="restore [filename]", category="Game Management")
     def _handle_restore(self, command: Command) -> None:
         """Handle restore/load command."""
         if not command.noun:
             # Show available saves
-            saves = self.list_saves()
+            saves = self._list_save_headers()
             if not saves:
-                print("No saved games found.")
+                self._fail("No saved games found.")
                 return
             
-            print("Available saved games:")
-            for i, save_file in enumerate(saves, 1):
-                print(f"  {i}. {save_file}")
-            print("Use 'restore <filename>' to load a specific save.")
+            self.output.write("Available saved games:")
+            for i, (save_file, header) in enumerate(saves, 1):
+                if header is None:
+                    self.output.write(f"  {i}. {save_file}")
+                else:
+                    saved_at = header.timestamp[:16].replace("T", " ")
+                    self.output.write(f"  {i}. {save_file} - {header.room}, {header.moves} moves, "
+                                      f"score {header.score} ({saved_at})")
+            self.output.write("Use 'restore <filename>' to load a specific save.")
             return
         
         filename = command.noun
@@ -2108,81 +2471,85 @@ Revision 88 / Serial number 840726
     
     # ========== NPC Command Handlers ==========
     
+    @verb_handler("talk", usage="talk to <someone>", category="Communication")
     def _handle_talk(self, command: Command) -> None:
         """Handle talk command."""
         if not command.noun:
-            print("Talk to whom?")
+            self._fail("Talk to whom?")
             return
         
         npc = self.npc_manager.find_npc_by_name(command.noun, self.player.current_room)
         if not npc:
-            print(f"I don't see {command.noun} here.")
+            self._fail(f"I don't see {command.noun} here.")
             return
         
         dialogue_text = self.npc_manager.start_conversation(npc.id)
         if dialogue_text:
-            print(dialogue_text)
+            self.output.write(dialogue_text)
         else:
-            print(f"{npc.name} doesn't seem to want to talk right now.")
+            self._fail(f"{npc.name} doesn't seem to want to talk right now.")
     
+    @verb_handler("ask", usage="ask <someone> about <topic>", category="Communication")
     def _handle_ask(self, command: Command) -> None:
         """Handle ask command (ask <npc> about <topic>)."""
         if not command.noun:
-            print("Ask whom?")
+            self._fail("Ask whom?")
             return
         
         if not command.noun2:
-            print(f"Ask {command.noun} about what?")
+            self._fail(f"Ask {command.noun} about what?")
             return
         
         npc = self.npc_manager.find_npc_by_name(command.noun, self.player.current_room)
         if not npc:
-            print(f"I don't see {command.noun} here.")
+            self._fail(f"I don't see {command.noun} here.")
             return
         
         topic = command.noun2
         response = self.npc_manager.ask_about_topic(npc.id, topic)
         
         if response:
-            print(f"{npc.name}: \"{response}\"")
+            self.output.write(f"{npc.name}: \"{response}\"")
         else:
-            print(f"{npc.name} doesn't know anything about that.")
+            self.output.write(f"{npc.name} doesn't know anything about that.")
     
+    @verb_handler("greet", usage="greet <someone>", category="Communication")
     def _handle_greet(self, command: Command) -> None:
         """Handle greet command."""
         if not command.noun:
             # Greet all NPCs in room
             current_room = self.world.get_room(self.player.current_room)
             if not current_room:
-                print("You are in an unknown location.")
+                self._fail("You are in an unknown location.")
                 return
             
             npcs_here = self.npc_manager.get_npcs_in_room(self.player.current_room)
             if not npcs_here:
-                print("There's no one here to greet.")
+                self._fail("There's no one here to greet.")
                 return
             
             for npc in npcs_here:
                 greeting = self.npc_manager.greet_npc(npc.id)
                 if greeting:
-                    print(f"You greet {npc.name}. {greeting}")
+                    self.output.write(f"You greet {npc.name}. {greeting}")
             return
         
         npc = self.npc_manager.find_npc_by_name(command.noun, self.player.current_room)
         if not npc:
-            print(f"I don't see {command.noun} here.")
+            self._fail(f"I don't see {command.noun} here.")
             return
         
         greeting = self.npc_manager.greet_npc(npc.id)
         if greeting:
-            print(f"You greet {npc.name}. {greeting}")
+            self.output.write(f"You greet {npc.name}. {greeting}")
         else:
-            print(f"{npc.name} acknowledges your greeting.")
+            self.output.write(f"{npc.name} acknowledges your greeting.")
     
+    @verb_handler("say", arguments=ARGS_COMMAND_INPUT, usage="say <text>", category="Communication")
     def _handle_say(self, command: Command, user_input: str) -> None:
         """Handle say command (say "<text>")."""
         if not user_input or len(user_input.strip()) == 0:
-            print("Say what?")
+            self._fail("Say what?")
             return
         
         # Extract quoted text from user input
@@ -2192,27 +2559,27 @@ Revision 88 / Serial number 840726
             say_match = re.search(r'say\s+(.+)', user_input, re.IGNORECASE)
         
         if not say_match:
-            print("Say what?")
+            self._fail("Say what?")
             return
         
         text_to_say = say_match.group(1).strip()
         if not text_to_say:
-            print("Say what?")
+            self._fail("Say what?")
             return
         
         # Check if there are any NPCs in the room
         npcs_here = self.npc_manager.get_npcs_in_room(self.player.current_room)
         if not npcs_here:
-            print(f"You say \"{text_to_say}\" to the empty air.")
+            self.output.write(f"You say \"{text_to_say}\" to the empty air.")
             return
         
-        print(f"You say \"{text_to_say}\"")
+        self.output.write(f"You say \"{text_to_say}\"")
         
         # Let each NPC respond to what was said
         for npc in npcs_here:
             response = self.npc_manager.respond_to_speech(npc.id, text_to_say)
             if response:
-                print(f"{npc.name}: \"{response}\"")
+                self.output.write(f"{npc.name}: \"{response}\"")
             # Note: NPCs may choose not to respond, which is fine
     
     def _create_initial_npcs(self) -> None:
@@ -2293,7 +2660,7 @@ Revision 88 / Serial number 840726
         
         # Create the canonical Thief NPC (Phase 2 of Canonical NPCs feature)
         from .entities.thief import create_canonical_thief, integrate_thief_behaviors
-        thief = create_canonical_thief(self.npc_manager, starting_room="WHOUS")
+        thief = create_canonical_thief(self.npc_manager, starting_room="WHOUS", rng=self.rng.npc)
         self.npc_manager.add_npc(thief)
         
         # Integrate Thief behaviors into game engine
@@ -2301,10 +2668,11 @@ Revision 88 / Serial number 840726
     
     # ===== COMBAT SYSTEM HANDLERS =====
     
+    @verb_handler("attack", usage="attack <someone> with <weapon>", category="Combat")
     def _handle_attack(self, command: Command) -> None:
         """Handle attack or fight commands."""
         if not command.noun:
-            print("Attack what?")
+            self._fail("Attack what?")
             return
         
         # Find target
@@ -2321,12 +2689,12 @@ Revision 88 / Serial number 840726
                 break
         
         if not target_npc:
-            print(f"There is no {command.noun} here to attack.")
+            self._fail(f"There is no {command.noun} here to attack.")
             return
         
         # Check if already in combat
         if self.combat_manager.is_in_combat(self.player.current_room):
-            print("You are already engaged in combat!")
+            self._fail("You are already engaged in combat!")
             return
         
         # Start combat
@@ -2337,7 +2705,7 @@ Revision 88 / Serial number 840726
         )
         
         if not success:
-            print("Unable to start combat at this time.")
+            self._fail("Unable to start combat at this time.")
             return
         
         # Execute the first attack
@@ -2348,12 +2716,12 @@ Revision 88 / Serial number 840726
             target_npc.name
         )
         
-        print(action.description)
+        self.output.write(action.description)
         
         # Check if NPC was defeated
         if not target_npc.combat_stats.is_alive():
             self.combat_manager.end_combat(self.player.current_room, winner="player")
-            print(f"\nThe {target_npc.name} has been defeated!")
+            self.output.write(f"\nThe {target_npc.name} has been defeated!")
             
             # Handle Thief loot dropping
             if (target_npc.id == "THIEF" and hasattr(target_npc, 'thief_behavior')):
@@ -2362,15 +2730,15 @@ Revision 88 / Serial number 840726
                 
                 if loot:
                     current_room = self.world.get_room(self.player.current_room)
-                    print("\nThe thief's possessions scatter as he falls:")
+                    self.output.write("\nThe thief's possessions scatter as he falls:")
                     
                     for item_id in loot:
                         obj = self.object_manager.get_object(item_id)
                         if obj and current_room:
                             current_room.add_item(item_id)
-                            print(f"  A {obj.name} clatters to the ground.")
+                            self.output.write(f"  A {obj.name} clatters to the ground.")
                 else:
-                    print("The thief had no stolen goods on him.")
+                    self.output.write("The thief had no stolen goods on him.")
             
             # Remove NPC from room (or mark as defeated)
             self.npc_manager.move_npc(target_npc.id, "DEFEATED")
@@ -2384,29 +2752,30 @@ Revision 88 / Serial number 840726
             "You"
         )
         
-        print(counter_action.description)
+        self.output.write(counter_action.description)
         
         # Check if player was defeated
         if not self.player.combat_stats.is_alive():
             self.combat_manager.end_combat(self.player.current_room, winner=target_npc.id)
-            print("\nYou have been defeated! Game over.")
+            self.output.write("\nYou have been defeated! Game over.")
             self.running = False
             return
         
-        print(f"\nYour health: {self.player.combat_stats.current_health}/{self.player.combat_stats.max_health}")
-        print(f"{target_npc.name}'s health: {target_npc.combat_stats.current_health}/{target_npc.combat_stats.max_health}")
+        self.output.write(f"\nYour health: {self.player.combat_stats.current_health}/{self.player.combat_stats.max_health}")
+        self.output.write(f"{target_npc.name}'s health: {target_npc.combat_stats.current_health}/{target_npc.combat_stats.max_health}")
     
+    @verb_handler("defend", category="Combat")
     def _handle_defend(self, command: Command) -> None:
         """Handle defend command."""
         if not self.combat_manager.is_in_combat(self.player.current_room):
-            print("You are not in combat.")
+            self._fail("You are not in combat.")
             return
         
         # Defending gives temporary bonuses for the next attack
         self.player.combat_stats.block_chance += 20
         self.player.combat_stats.dodge_chance += 15
         
-        print("You take a defensive stance, improving your ability to block and dodge attacks.")
+        self.output.write("You take a defensive stance, improving your ability to block and dodge attacks.")
         
         # Find the NPC we're fighting
         participants = self.combat_manager.get_combat_participants(self.player.current_room)
@@ -2417,12 +2786,12 @@ Revision 88 / Serial number 840726
                 break
         
         if not npc_id:
-            print("No opponent found.")
+            self.output.write("No opponent found.")
             return
         
         target_npc = self.npc_manager.get_npc(npc_id)
         if not target_npc:
-            print("Your opponent has vanished.")
+            self.output.write("Your opponent has vanished.")
             return
         
         # NPC attacks the defending player
@@ -2433,7 +2802,7 @@ Revision 88 / Serial number 840726
             "You"
         )
         
-        print(action.description)
+        self.output.write(action.description)
         
         # Reset defensive bonuses after the attack
         self.player.combat_stats.block_chance = max(0, self.player.combat_stats.block_chance - 20)
@@ -2442,34 +2811,34 @@ Revision 88 / Serial number 840726
         # Check if player was defeated
         if not self.player.combat_stats.is_alive():
             self.combat_manager.end_combat(self.player.current_room, winner=target_npc.id)
-            print("\nYou have been defeated! Game over.")
+            self.output.write("\nYou have been defeated! Game over.")
             self.running = False
             return
         
-        print(f"\nYour health: {self.player.combat_stats.current_health}/{self.player.combat_stats.max_health}")
-        print(f"{target_npc.name}'s health: {target_npc.combat_stats.current_health}/{target_npc.combat_stats.max_health}")
+        self.output.write(f"\nYour health: {self.player.combat_stats.current_health}/{self.player.combat_stats.max_health}")
+        self.output.write(f"{target_npc.name}'s health: {target_npc.combat_stats.current_health}/{target_npc.combat_stats.max_health}")
     
+    @verb_handler("flee", category="Combat")
     def _handle_flee(self, command: Command) -> None:
         """Handle flee command."""
         if not self.combat_manager.is_in_combat(self.player.current_room):
-            print("You are not in combat.")
+            self._fail("You are not in combat.")
             return
         
         success = self.combat_manager.attempt_flee("player", self.player.current_room)
         
         if success:
-            print("You successfully flee from combat!")
+            self.output.write("You successfully flee from combat!")
             
             # Try to move to a random adjacent room
             current_room = self.world.get_room(self.player.current_room)
             if current_room and current_room.exits:
-                import random
-                exit_dir = random.choice(list(current_room.exits.keys()))
+                exit_dir = self.rng.combat.choice(list(current_room.exits.keys()))
                 self._handle_movement(exit_dir)
             else:
-                print("But you have nowhere to flee to! You remain in place.")
+                self.output.write("But you have nowhere to flee to! You remain in place.")
         else:
-            print("You attempt to flee but cannot escape!")
+            self.output.write("You attempt to flee but cannot escape!")
             
             # Find the NPC we're fighting and let them attack
             participants = self.combat_manager.get_combat_participants(self.player.current_room)
@@ -2488,14 +2857,15 @@ Revision 88 / Serial number 840726
                         target_npc.name,
                         "You"
                     )
-                    print(action.description)
+                    self.output.write(action.description)
                     
                     # Check if player was defeated
                     if not self.player.combat_stats.is_alive():
                         self.combat_manager.end_combat(self.player.current_room, winner=target_npc.id)
-                        print("\nYou have been defeated! Game over.")
+                        self.output.write("\nYou have been defeated! Game over.")
                         self.running = False
 
+    @verb_handler("debug", usage="debug [menu|npc|combat|world|objects]", debug_only=True)
     def _handle_debug_command(self, command: Command) -> None:
         """Handle debug commands available only in debug mode."""
         if not command.noun:
@@ -2514,211 +2884,298 @@ Revision 88 / Serial number 840726
             self._debug_world_info()
         elif debug_action == "objects":
             self._debug_object_info()
+        elif debug_action == "scope":
+            self._debug_scope_cache()
+        elif debug_action == "hooks":
+            self._debug_hooks()
+        elif debug_action == "parser":
+            self._debug_parse_cache()
+        elif debug_action.startswith("where"):
+            self._debug_where_is(debug_action[len("where"):].strip())
+        elif debug_action.startswith("path"):
+            self._debug_path(debug_action[len("path"):].split())
         else:
-            print(f"Unknown debug command: {debug_action}")
-            print("Try 'debug menu' for available options.")
+            self.output.write(f"Unknown debug command: {debug_action}")
+            self.output.write("Try 'debug menu' for available options.")
     
     def _show_debug_menu(self) -> None:
         """Show available debug commands."""
-        print("\n" + "="*50)
-        print("DEBUG MENU")
-        print("="*50)
-        print("Available debug commands:")
-        print("  debug npc     - Test NPC conversation system")
-        print("  debug combat  - Test combat system")
-        print("  debug world   - Show world/room information")
-        print("  debug objects - Show object information")
-        print("  debug menu    - Show this menu")
-        print("="*50)
+        self.output.write("\n" + "="*50)
+        self.output.write("DEBUG MENU")
+        self.output.write("="*50)
+        self.output.write("Available debug commands:")
+        self.output.write("  debug npc     - Test NPC conversation system")
+        self.output.write("  debug combat  - Test combat system")
+        self.output.write("  debug world   - Show world/room information")
+        self.output.write("  debug objects - Show object information")
+        self.output.write("  debug where <object> - Show where an object is")
+        self.output.write("  debug scope   - Show scope cache hits/misses per command")
+        self.output.write("  debug hooks   - Show time spent in each turn hook and step")
+        self.output.write("  debug parser  - Show parse cache hits/misses")
+        self.output.write("  debug path [from] <to> - Show the shortest route between rooms")
+        self.output.write("  debug menu    - Show this menu")
+        self.output.write("="*50)
     
     def _debug_npc_system(self) -> None:
         """Comprehensive NPC system testing and demonstration."""
-        print("\n" + "="*50)
-        print("NPC SYSTEM DEBUG TEST")
-        print("="*50)
+        self.output.write("\n" + "="*50)
+        self.output.write("NPC SYSTEM DEBUG TEST")
+        self.output.write("="*50)
         
         # Show NPCs in current room
-        print("\n1. NPCs in current room:")
+        self.output.write("\n1. NPCs in current room:")
         npcs_here = self.npc_manager.get_npcs_in_room(self.player.current_room)
         if npcs_here:
             for npc in npcs_here:
-                print(f"   - {npc.name}: {npc.description}")
+                self.output.write(f"   - {npc.name}: {npc.description}")
         else:
-            print("   No NPCs in current room.")
+            self.output.write("   No NPCs in current room.")
         
         # Show all NPCs in game
-        print("\n2. All NPCs in game:")
+        self.output.write("\n2. All NPCs in game:")
         for npc_id, npc in self.npc_manager.npcs.items():
             room_name = "Unknown"
             room = self.world.get_room(npc.location)
             if room:
                 room_name = room.name
-            print(f"   - {npc.name} ({npc_id}) in {room_name}")
+            self.output.write(f"   - {npc.name} ({npc_id}) in {room_name}")
         
         # Test NPC interactions if NPCs are present
         if npcs_here:
-            print("\n3. Testing NPC interactions:")
+            self.output.write("\n3. Testing NPC interactions:")
             
             # Test greeting
             test_npc = npcs_here[0]
-            print(f"\n   Testing greet with {test_npc.name}:")
+            self.output.write(f"\n   Testing greet with {test_npc.name}:")
             greeting = self.npc_manager.greet_npc(test_npc.id)
-            print(f"   Result: {greeting}")
+            self.output.write(f"   Result: {greeting}")
             
             # Test conversation start
-            print(f"\n   Testing conversation with {test_npc.name}:")
+            self.output.write(f"\n   Testing conversation with {test_npc.name}:")
             conversation = self.npc_manager.start_conversation(test_npc.id)
             if conversation:
-                print(f"   {test_npc.name}: \"{conversation}\"")
+                self.output.write(f"   {test_npc.name}: \"{conversation}\"")
             else:
-                print(f"   {test_npc.name} doesn't want to talk.")
+                self.output.write(f"   {test_npc.name} doesn't want to talk.")
                 
             # Test topic questions
-            print(f"\n   Testing topic questions with {test_npc.name}:")
+            self.output.write(f"\n   Testing topic questions with {test_npc.name}:")
             topics = ["treasure", "grue", "help", "zork"]
             for topic in topics:
                 response = self.npc_manager.ask_about_topic(test_npc.id, topic)
                 if response:
-                    print(f"   Ask about {topic}: \"{response}\"")
+                    self.output.write(f"   Ask about {topic}: \"{response}\"")
                 else:
-                    print(f"   Ask about {topic}: No response")
+                    self.output.write(f"   Ask about {topic}: No response")
             
             # Test speech responses
-            print(f"\n   Testing speech responses:")
+            self.output.write(f"\n   Testing speech responses:")
             test_phrases = ["hello", "help me", "treasure hunting"]
             for phrase in test_phrases:
                 response = self.npc_manager.respond_to_speech(test_npc.id, phrase)
                 if response:
-                    print(f"   Say \"{phrase}\": {test_npc.name} responds \"{response}\"")
+                    self.output.write(f"   Say \"{phrase}\": {test_npc.name} responds \"{response}\"")
                 else:
-                    print(f"   Say \"{phrase}\": No response")
+                    self.output.write(f"   Say \"{phrase}\": No response")
         
-        print("\n" + "="*50)
-        print("NPC DEBUG TEST COMPLETE")
-        print("="*50)
-        print("Try these commands in the game:")
+        self.output.write("\n" + "="*50)
+        self.output.write("NPC DEBUG TEST COMPLETE")
+        self.output.write("="*50)
+        self.output.write("Try these commands in the game:")
         if npcs_here:
             npc_name = npcs_here[0].name
-            print(f"  talk {npc_name}")
-            print(f"  ask {npc_name} about treasure")
-            print(f"  greet {npc_name}")
-            print(f"  say \"hello everyone\"")
+            self.output.write(f"  talk {npc_name}")
+            self.output.write(f"  ask {npc_name} about treasure")
+            self.output.write(f"  greet {npc_name}")
+            self.output.write(f"  say \"hello everyone\"")
         else:
-            print("  (No NPCs in current room - try 'go' to find them)")
+            self.output.write("  (No NPCs in current room - try 'go' to find them)")
     
     def _debug_world_info(self) -> None:
         """Show world and room debug information."""
-        print("\n" + "="*50)
-        print("WORLD DEBUG INFO")
-        print("="*50)
+        self.output.write("\n" + "="*50)
+        self.output.write("WORLD DEBUG INFO")
+        self.output.write("="*50)
         
         current_room = self.world.get_room(self.player.current_room)
         if current_room:
-            print(f"Current Room: {current_room.name} ({current_room.id})")
-            print(f"Description: {current_room.description}")
-            print(f"Exits: {list(current_room.exits.keys())}")
-            print(f"Items: {current_room.items}")
-            print(f"Visited: {current_room.visited}")
-            print(f"Flags: {current_room.flags}")
-        
-        print(f"\nTotal Rooms: {len(self.world.rooms)}")
-        print(f"Total Objects: {len(self.object_manager.objects)}")
-        print(f"Total NPCs: {len(self.npc_manager.npcs)}")
-        
-        print("\nPlayer Info:")
-        print(f"  Inventory: {self.player.inventory}")
-        print(f"  Score: {self.player.score}")
-        print(f"  Brief Mode: {self.player.brief_mode}")
+            self.output.write(f"Current Room: {current_room.name} ({current_room.id})")
+            self.output.write(f"Description: {current_room.description}")
+            self.output.write(f"Exits: {list(current_room.exits.keys())}")
+            self.output.write(f"Items: {current_room.items}")
+            self.output.write(f"Visited: {current_room.visited}")
+            self.output.write(f"Flags: {', '.join(current_room.flag_names()) or 'none'}")
+        
+        self.output.write(f"\nTotal Rooms: {len(self.world.rooms)}")
+        self.output.write(f"Total Objects: {len(self.object_manager.objects)}")
+        self.output.write(f"Total NPCs: {len(self.npc_manager.npcs)}")
+        
+        self.output.write("\nPlayer Info:")
+        self.output.write(f"  Inventory: {self.player.inventory}")
+        self.output.write(f"  Score: {self.player.score}")
+        self.output.write(f"  Brief Mode: {self.player.brief_mode}")
     
     def _debug_object_info(self) -> None:
         """Show object debug information."""
-        print("\n" + "="*50)
-        print("OBJECT DEBUG INFO")
-        print("="*50)
+        self.output.write("\n" + "="*50)
+        self.output.write("OBJECT DEBUG INFO")
+        self.output.write("="*50)
         
         # Objects in current room
         current_room = self.world.get_room(self.player.current_room)
         if current_room and current_room.items:
-            print("\nObjects in current room:")
+            self.output.write("\nObjects in current room:")
             for item_id in current_room.items:
                 obj = self.object_manager.get_object(item_id)
                 if obj:
-                    print(f"  - {obj.name} ({item_id}): {obj.description}")
+                    self.output.write(f"  - {obj.name} ({item_id}): {obj.description}")
         else:
-            print("\nNo objects in current room.")
+            self.output.write("\nNo objects in current room.")
         
         # Objects in inventory
         if self.player.inventory:
-            print("\nObjects in inventory:")
+            self.output.write("\nObjects in inventory:")
             for item_id in self.player.inventory:
                 obj = self.object_manager.get_object(item_id)
                 if obj:
-                    print(f"  - {obj.name} ({item_id}): {obj.description}")
+                    self.output.write(f"  - {obj.name} ({item_id}): {obj.description}")
         else:
-            print("\nNo objects in inventory.")
+            self.output.write("\nNo objects in inventory.")
+        
+        self.output.write(f"\nTotal objects loaded: {len(self.object_manager.objects)}")
+    
+    def _debug_scope_cache(self) -> None:
+        """Show scope cache hit/miss counters per command verb."""
+        self.output.write("\n" + "="*50)
+        self.output.write("SCOPE CACHE")
+        self.output.write("="*50)
+        lines = self.scope_cache.format_stats()
+        self.output.write("\n".join(lines) if lines else "  No scope lookups yet.")
+    
+    def _debug_hooks(self) -> None:
+        """Show per-hook and per-step timing counters."""
+        self.output.write("\n" + "="*50)
+        self.output.write("TURN HOOKS")
+        self.output.write("="*50)
+        lines = self.hooks.format_stats()
+        self.output.write("\n".join(lines) if lines else "  No hooks registered.")
+    
+    def _debug_parse_cache(self) -> None:
+        """Show parse cache size and hit/miss counters."""
+        self.output.write("\n" + "="*50)
+        self.output.write("PARSE CACHE")
+        self.output.write("="*50)
+        self.output.write("\n".join(self.parser.format_cache_stats()))
+    
+    def _debug_where_is(self, noun: str) -> None:
+        """Show the containment path of every object matching noun."""
+        if not noun:
+            self.output.write("Where is what?")
+            return
+        
+        matches = self.object_manager.find_objects_by_name(noun)
+        if not matches:
+            self.output.write(f"No object matches '{noun}'.")
+            return
+        
+        for obj in matches:
+            chain = self.object_manager.get_location_chain(obj.id, self.world, self.player)
+            if not chain:
+                self.output.write(f"  {obj.name} ({obj.id}): nowhere")
+                continue
+            path = []
+            for location_type, holder_id in chain:
+                if location_type == "inventory":
+                    path.append("your inventory")
+                else:
+                    path.append(f"{location_type} {holder_id}")
+            self.output.write(f"  {obj.name} ({obj.id}): in " + " -> ".join(path))
+    
+    def _debug_path(self, room_ids: List[str]) -> None:
+        """Show the shortest route to a room (from the current room unless two IDs are given)."""
+        if not room_ids or len(room_ids) > 2:
+            self.output.write("Usage: debug path [from] <to>")
+            return
         
-        print(f"\nTotal objects loaded: {len(self.object_manager.objects)}")
+        room_ids = [room_id.upper() for room_id in room_ids]
+        start, target = (room_ids if len(room_ids) == 2 else [self.player.current_room, room_ids[0]])
+        for room_id in (start, target):
+            if room_id not in self.world.rooms:
+                self.output.write(f"No room with ID '{room_id}'.")
+                return
+        
+        graph = self.world.get_graph()
+        path = graph.shortest_path(start, target)
+        if path is None:
+            self.output.write(f"No route from {start} to {target}.")
+        elif not path.directions:
+            self.output.write(f"{start} and {target} are the same room.")
+        else:
+            steps = " -> ".join(f"{direction} {room_id}" for direction, room_id in zip(path.directions, path.rooms[1:]))
+            self.output.write(f"{start}: {steps} ({len(path)} move{'s' if len(path) != 1 else ''})")
+        info = graph.cache_info()
+        self.output.write(f"  Path cache: {info['hits']} hits, {info['misses']} misses, {info['size']}/{info['max_size']} entries")
     
     def _debug_combat_system(self) -> None:
         """Comprehensive combat system testing and demonstration."""
-        print("\n" + "="*50)
-        print("COMBAT SYSTEM DEBUG TEST")
-        print("="*50)
+        self.output.write("\n" + "="*50)
+        self.output.write("COMBAT SYSTEM DEBUG TEST")
+        self.output.write("="*50)
         
         # Show current combat status
-        print("\n1. Current Combat Status:")
+        self.output.write("\n1. Current Combat Status:")
         if self.combat_manager.is_in_combat(self.player.current_room):
             status = self.combat_manager.get_combat_status(self.player.current_room)
-            print(f"   Combat active in room: {self.player.current_room}")
-            print(f"   Participants: {', '.join(status['participants'])}")
-            print(f"   Round: {status['round_number']}")
+            self.output.write(f"   Combat active in room: {self.player.current_room}")
+            self.output.write(f"   Participants: {', '.join(status['participants'])}")
+            self.output.write(f"   Round: {status['round_number']}")
         else:
-            print("   No active combat.")
+            self.output.write("   No active combat.")
         
         # Show player combat stats
-        print("\n2. Player Combat Stats:")
+        self.output.write("\n2. Player Combat Stats:")
         stats = self.player.combat_stats
-        print(f"   Health: {stats.current_health}/{stats.max_health}")
-        print(f"   Attack Power: {stats.attack_power}")
-        print(f"   Defense: {stats.defense}")
-        print(f"   Accuracy: {stats.accuracy}%")
-        print(f"   Dodge: {stats.dodge_chance}%")
-        print(f"   Block: {stats.block_chance}%")
-        print(f"   Critical: {stats.critical_chance}%")
-        print(f"   Weapon: {stats.weapon.name if stats.weapon else 'None'}")
+        self.output.write(f"   Health: {stats.current_health}/{stats.max_health}")
+        self.output.write(f"   Attack Power: {stats.attack_power}")
+        self.output.write(f"   Defense: {stats.defense}")
+        self.output.write(f"   Accuracy: {stats.accuracy}%")
+        self.output.write(f"   Dodge: {stats.dodge_chance}%")
+        self.output.write(f"   Block: {stats.block_chance}%")
+        self.output.write(f"   Critical: {stats.critical_chance}%")
+        self.output.write(f"   Weapon: {stats.weapon.name if stats.weapon else 'None'}")
         
         # Show NPCs and their combat stats
-        print("\n3. NPCs in current room and their combat stats:")
+        self.output.write("\n3. NPCs in current room and their combat stats:")
         npcs_here = self.npc_manager.get_npcs_in_room(self.player.current_room)
         if npcs_here:
             for npc in npcs_here:
-                print(f"   {npc.name}:")
-                print(f"     Health: {npc.combat_stats.current_health}/{npc.combat_stats.max_health}")
-                print(f"     Attack: {npc.combat_stats.attack_power}, Defense: {npc.combat_stats.defense}")
-                print(f"     Accuracy: {npc.combat_stats.accuracy}%, Dodge: {npc.combat_stats.dodge_chance}%")
+                self.output.write(f"   {npc.name}:")
+                self.output.write(f"     Health: {npc.combat_stats.current_health}/{npc.combat_stats.max_health}")
+                self.output.write(f"     Attack: {npc.combat_stats.attack_power}, Defense: {npc.combat_stats.defense}")
+                self.output.write(f"     Accuracy: {npc.combat_stats.accuracy}%, Dodge: {npc.combat_stats.dodge_chance}%")
         else:
-            print("   No NPCs in current room.")
+            self.output.write("   No NPCs in current room.")
         
         # Show recent combat actions
-        print("\n4. Recent Combat Actions:")
+        self.output.write("\n4. Recent Combat Actions:")
         recent_actions = self.combat_manager.get_recent_actions(3)
         if recent_actions:
             for action in recent_actions:
-                print(f"   - {action.description}")
+                self.output.write(f"   - {action.description}")
         else:
-            print("   No recent combat actions.")
+            self.output.write("   No recent combat actions.")
         
         # Combat testing options
-        print("\n5. Combat Testing:")
-        print("   Use 'attack <npc>' to start combat with an NPC")
-        print("   Use 'defend' while in combat to take defensive stance")
-        print("   Use 'flee' to attempt to escape from combat")
+        self.output.write("\n5. Combat Testing:")
+        self.output.write("   Use 'attack <npc>' to start combat with an NPC")
+        self.output.write("   Use 'defend' while in combat to take defensive stance")
+        self.output.write("   Use 'flee' to attempt to escape from combat")
         
         # Healing option for testing
         if self.player.combat_stats.current_health < self.player.combat_stats.max_health:
-            print("\n6. Debug Healing:")
+            self.output.write("\n6. Debug Healing:")
             restored = self.player.combat_stats.heal(self.player.combat_stats.max_health)
             if restored > 0:
-                print(f"   Player healed for {restored} health (debug mode).")
+                self.output.write(f"   Player healed for {restored} health (debug mode).")
         
-        print("="*50)
\ No newline at end of file
+        self.output.write("="*50)
\ No newline at end of file
@@ -0,0 +1,171 @@
+"""
+Turn Hook Pipeline - Extension points around each command.
+
+Subsystems used to extend the engine by wrapping GameEngine methods in
+closures, which stacked up, re-parsed the input, and hid where turn time
+went. Instead they register hooks for the stage of the turn they care
+about:
+
+    PRE_PARSE      raw input, before parsing (and before a pending
+                   disambiguation answer is handled)
+    POST_PARSE     right after parsing; context.command may be None
+    PRE_DISPATCH   before the verb handler runs
+    POST_DISPATCH  after the verb handler ran
+    END_OF_TURN    after everything else, every turn (clock events)
+
+Every hook receives (game_engine, context). The TurnContext carries the
+raw input and the Command parsed once for the whole turn. A hook can set
+context.handled to skip the rest of the normal processing; END_OF_TURN
+hooks run regardless.
+
+Within a stage hooks run in ascending priority order, then in the order
+they were registered. Each hook's calls and run time are counted so
+"debug hooks" can show which subsystem eats turn latency.
+"""
+
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+from .parser.command_parser import Command
+
+
+class HookStage(Enum):
+    """Points in a turn where hooks run."""
+    PRE_PARSE = "pre_parse"
+    POST_PARSE = "post_parse"
+    PRE_DISPATCH = "pre_dispatch"
+    POST_DISPATCH = "post_dispatch"
+    END_OF_TURN = "end_of_turn"
+
+
+DEFAULT_PRIORITY = 100
+
+
+@dataclass
+class TurnContext:
+    """State of one turn as it moves through the pipeline."""
+    user_input: str
+    command: Optional[Command] = None  # Parsed once, shared by every hook
+    handled: bool = False  # Set by a hook to skip the rest of the normal processing
+    failed: bool = False  # The command didn't do anything (unknown verb, missing object, no exit)
+    data: Dict[str, Any] = field(default_factory=dict)  # Scratch space for hooks to pass things along
+
+
+# hook(game_engine, context)
+HookCallback = Callable[[Any, TurnContext], None]
+
+
+@dataclass
+class TimingStats:
+    """Call count and run time of one hook or built-in step."""
+    calls: int = 0
+    total_time: float = 0.0  # Seconds
+    max_time: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.calls += 1
+        self.total_time += seconds
+        if seconds > self.max_time:
+            self.max_time = seconds
+
+
+@dataclass
+class Hook:
+    """A registered hook."""
+    name: str
+    stage: HookStage
+    callback: HookCallback
+    priority: int = DEFAULT_PRIORITY
+    order: int = 0  # Registration order, breaks priority ties
+    stats: TimingStats = field(default_factory=TimingStats)
+
+
+class HookPipeline:
+    """Registered hooks per stage, with timing counters."""
+
+    def __init__(self) -> None:
+        self._hooks: Dict[HookStage, List[Hook]] = {stage: [] for stage in HookStage}
+        self._registered = 0
+        self.step_stats: Dict[str, TimingStats] = {}  # Built-in steps, e.g. "parse", "dispatch"
+
+    def register(self, stage: HookStage, callback: HookCallback, priority: int = DEFAULT_PRIORITY,
+                 name: Optional[str] = None) -> Hook:
+        """
+        Add a hook.
+
+        Args:
+            stage: When in the turn it runs
+            callback: callback(game_engine, context)
+            priority: Lower values run earlier within the stage
+            name: Label for timing stats and unregister() (default: the callback's name)
+
+        Returns:
+            The registered Hook
+        """
+        self._registered += 1
+        hook = Hook(name=name or getattr(callback, "__qualname__", repr(callback)), stage=stage,
+                    callback=callback, priority=priority, order=self._registered)
+        hooks = self._hooks[stage]
+        hooks.append(hook)
+        hooks.sort(key=lambda h: (h.priority, h.order))
+        return hook
+
+    def unregister(self, name: str, stage: Optional[HookStage] = None) -> int:
+        """Remove hooks by name (optionally only in one stage). Returns the number removed."""
+        removed = 0
+        for hook_stage, hooks in self._hooks.items():
+            if stage is not None and hook_stage is not stage:
+                continue
+            kept = [hook for hook in hooks if hook.name != name]
+            removed += len(hooks) - len(kept)
+            hooks[:] = kept
+        return removed
+
+    def hooks(self, stage: HookStage) -> List[Hook]:
+        """Hooks of a stage in run order."""
+        return list(self._hooks[stage])
+
+    def run(self, stage: HookStage, game_engine: Any, context: TurnContext) -> None:
+        """Run a stage's hooks; stops early once a hook marks the turn handled (except END_OF_TURN)."""
+        hooks = self._hooks[stage]
+        if not hooks:
+            return
+        stop_when_handled = stage is not HookStage.END_OF_TURN
+        clock = time.perf_counter
+        for hook in hooks:
+            if stop_when_handled and context.handled:
+                break
+            start = clock()
+            try:
+                hook.callback(game_engine, context)
+            finally:
+                hook.stats.record(clock() - start)
+
+    def record_step(self, name: str, seconds: float) -> None:
+        """Count time spent in a built-in step of the turn."""
+        stats = self.step_stats.get(name)
+        if stats is None:
+            stats = self.step_stats[name] = TimingStats()
+        stats.record(seconds)
+
+    def reset_stats(self) -> None:
+        """Zero every timing counter."""
+        for hooks in self._hooks.values():
+            for hook in hooks:
+                hook.stats = TimingStats()
+        self.step_stats.clear()
+
+    def format_stats(self) -> List[str]:
+        """Human-readable timing per hook and built-in step, slowest first."""
+        rows = [(f"{hook.stage.value}:{hook.name}", hook.stats)
+                for hooks in self._hooks.values() for hook in hooks]
+        rows.extend((f"step:{name}", stats) for name, stats in self.step_stats.items())
+        rows.sort(key=lambda row: row[1].total_time, reverse=True)
+        lines = []
+        for label, stats in rows:
+            average = stats.total_time / stats.calls * 1e6 if stats.calls else 0.0
+            lines.append(f"  {label:<44} calls {stats.calls:>6}  total {stats.total_time * 1000:>8.2f} ms  "
+                         f"avg {average:>7.1f} us  max {stats.max_time * 1e6:>7.1f} us")
+        return lines
@@ -0,0 +1,126 @@
+"""
+Undo Journal - Per-turn inverse operations for UNDO and AGAIN.
+
+Snapshotting the game state with _collect_game_state every turn would
+copy the whole world. Instead, the code that changes the world records
+how to reverse each change while a turn runs:
+
+    rooms       items added and removed (at their list position), visited, flags
+    player      inventory added and removed
+    objects     attribute writes and container contents
+    NPCs        moves (NPCManager.move_npc / place_npc)
+    score       moves, treasures found and deposited, achievements
+    puzzles     flags and step progress
+
+A record is just a function and its arguments, e.g. (room.remove_item,
+("LAMP",)), so a turn costs what it changed, however big the world is.
+Rooms, objects, the player and the NPC manager reach the journal through
+the engine's ChangeTracker (see changes.py); the score and puzzle
+managers hold it directly.
+A few engine values that change by plain assignment (the player's room
+and the event queue) are kept as a small snapshot with each turn.
+
+Turns are kept in a ring buffer: once it holds `depth` turns, the oldest
+is dropped. Turns that changed nothing (INVENTORY, SCORE, errors and
+refused commands) aren't kept, so UNDO always reverses the last turn that
+did something. The move counter goes up on those turns too, but is
+recorded as a note: undoing an earlier turn puts the counter back, and a
+turn with only notes isn't kept.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+DEFAULT_UNDO_DEPTH = 100  # Turns that can be undone
+
+# (function, arguments) that reverses one change
+UndoRecord = Tuple[Callable[..., Any], Tuple[Any, ...]]
+
+# Marks an attribute, flag or achievement that wasn't set before the change
+UNSET = object()
+
+
+@dataclass
+class JournalTurn:
+    """The changes made by one turn."""
+    user_input: str
+    records: List[UndoRecord] = field(default_factory=list)  # In the order the changes were made
+    snapshot: Dict[str, Any] = field(default_factory=dict)  # Engine values restored as a whole
+    notes: int = 0  # Records that don't make the turn worth undoing on their own (see note())
+
+
+class UndoJournal:
+    """Ring buffer of the last turns' inverse operations."""
+
+    def __init__(self, depth: int = DEFAULT_UNDO_DEPTH) -> None:
+        self.turns: Deque[JournalTurn] = deque(maxlen=depth)
+        self.current: Optional[JournalTurn] = None  # Turn being recorded (None = not recording)
+
+    @property
+    def depth(self) -> int:
+        """Most turns kept."""
+        return self.turns.maxlen
+
+    @property
+    def recording(self) -> bool:
+        return self.current is not None
+
+    def record(self, undo: Callable[..., Any], *args: Any) -> None:
+        """Remember how to reverse a change made during the current turn."""
+        turn = self.current
+        if turn is not None:
+            turn.records.append((undo, args))
+
+    def note(self, undo: Callable[..., Any], *args: Any) -> None:
+        """Like record(), for bookkeeping (the move counter) that alone doesn't make the turn undoable."""
+        turn = self.current
+        if turn is not None:
+            turn.records.append((undo, args))
+            turn.notes += 1
+
+    def begin_turn(self, user_input: str, snapshot: Optional[Dict[str, Any]] = None) -> JournalTurn:
+        """Start recording a turn."""
+        self.current = JournalTurn(user_input, snapshot=snapshot or {})
+        return self.current
+
+    def end_turn(self) -> Optional[JournalTurn]:
+        """Stop recording; the turn is kept if it changed anything. Returns the kept turn."""
+        turn, self.current = self.current, None
+        if turn is None or len(turn.records) == turn.notes:
+            return None
+        self.turns.append(turn)
+        return turn
+
+    def discard_turn(self) -> None:
+        """Stop recording the current turn without keeping it."""
+        self.current = None
+
+    def undo(self) -> Optional[JournalTurn]:
+        """
+        Reverse the newest kept turn.
+
+        Its records run newest first, with recording paused so the reversal
+        isn't journaled itself.
+
+        Returns:
+            The undone turn (for its snapshot), or None if there was nothing to undo
+        """
+        if not self.turns:
+            return None
+        turn = self.turns.pop()
+        paused, self.current = self.current, None
+        try:
+            for undo, args in reversed(turn.records):
+                undo(*args)
+        finally:
+            self.current = paused
+        return turn
+
+    def clear(self) -> None:
+        """Forget every turn (after loading a save, for instance)."""
+        self.turns.clear()
+
+    def __len__(self) -> int:
+        """Return number of turns that can be undone."""
+        return len(self.turns)
@@ -0,0 +1,174 @@
+"""
+Output Channel - Where game text goes.
+
+GameEngine writes all player-facing text through an OutputChannel instead
+of print(). During a turn the text is buffered and handed to the sinks in
+one piece when the turn ends, and _process_command returns it as a
+string. A turn that waits for input (QUIT's confirmation) flushes what it
+has written first, so the question is on screen before the player is
+asked. Outside a turn (startup messages, direct handler calls) text goes
+straight to the sinks.
+
+Sinks decide where text ends up: the terminal, memory (tests and headless
+runs), a transcript file, or a network session.
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, TextIO, Union
+
+
+class OutputSink(ABC):
+    """Destination for game text."""
+
+    @abstractmethod
+    def write(self, text: str) -> None:
+        """Deliver a chunk of text (usually one whole turn)."""
+
+    def close(self) -> None:
+        """Release any resources held by the sink."""
+
+
+class TerminalSink(OutputSink):
+    """Writes to stdout (looked up on each write, so redirection and capture keep working)."""
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        self.stream = stream  # None = whatever sys.stdout is at write time
+
+    def write(self, text: str) -> None:
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(text)
+        stream.flush()
+
+
+class MemorySink(OutputSink):
+    """Keeps text in memory."""
+
+    def __init__(self) -> None:
+        self.chunks: List[str] = []
+
+    def write(self, text: str) -> None:
+        self.chunks.append(text)
+
+    def getvalue(self) -> str:
+        """All text written so far."""
+        return "".join(self.chunks)
+
+    def clear(self) -> None:
+        """Forget written text."""
+        self.chunks.clear()
+
+
+class FileTranscriptSink(OutputSink):
+    """Appends text to a transcript file."""
+
+    def __init__(self, path: Union[str, Path], mode: str = "a", encoding: str = "utf-8") -> None:
+        self.path = Path(path)
+        self._file = open(self.path, mode, encoding=encoding)
+
+    def write(self, text: str) -> None:
+        self._file.write(text)
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+class NetworkSink(OutputSink):
+    """
+    Sends text to a network session.
+
+    Args:
+        send: Callable taking bytes, e.g. socket.sendall or asyncio StreamWriter.write
+        encoding: Text encoding on the wire
+        line_ending: Replacement for "\\n" (e.g. "\\r\\n" for telnet clients)
+    """
+
+    def __init__(self, send: Callable[[bytes], Any], encoding: str = "utf-8", line_ending: str = "\n") -> None:
+        self.send = send
+        self.encoding = encoding
+        self.line_ending = line_ending
+
+    def write(self, text: str) -> None:
+        if self.line_ending != "\n":
+            text = text.replace("\n", self.line_ending)
+        self.send(text.encode(self.encoding))
+
+
+class OutputChannel:
+    """Per-engine text channel with per-turn buffering and pluggable sinks."""
+
+    def __init__(self, sinks: Optional[Iterable[OutputSink]] = None) -> None:
+        self.sinks: List[OutputSink] = list(sinks) if sinks is not None else [TerminalSink()]
+        self._buffer: List[str] = []
+        self._turn_starts: List[int] = []  # Buffer position where each open turn began
+        self._flushed = 0  # Buffered chunks already sent to the sinks by flush()
+
+    @classmethod
+    def memory(cls) -> "OutputChannel":
+        """Channel that only keeps text in memory (headless engines and tests)."""
+        return cls([MemorySink()])
+
+    def add_sink(self, sink: OutputSink) -> None:
+        """Also deliver text to sink."""
+        self.sinks.append(sink)
+
+    def remove_sink(self, sink: OutputSink) -> None:
+        """Stop delivering text to sink."""
+        if sink in self.sinks:
+            self.sinks.remove(sink)
+
+    def write(self, *values: Any, sep: str = " ", end: str = "\n") -> None:
+        """Write values like print() does."""
+        text = sep.join(map(str, values)) + end
+        if self._turn_starts:
+            self._buffer.append(text)
+        else:
+            self._emit(text)
+
+    @property
+    def in_turn(self) -> bool:
+        """True while a turn's text is being buffered."""
+        return bool(self._turn_starts)
+
+    def begin_turn(self) -> None:
+        """Start buffering a turn (turns may nest; only the outermost flushes)."""
+        self._turn_starts.append(len(self._buffer))
+
+    def flush(self) -> None:
+        """Send the text buffered so far to the sinks now; the turn still returns it when it ends."""
+        if self._flushed < len(self._buffer):
+            text = "".join(self._buffer[self._flushed:])
+            self._flushed = len(self._buffer)
+            self._emit(text)
+
+    def end_turn(self) -> str:
+        """
+        Finish the innermost turn.
+
+        Returns:
+            Text written since the matching begin_turn(); when the outermost
+            turn ends, everything buffered is sent to the sinks at once
+        """
+        start = self._turn_starts.pop() if self._turn_starts else 0
+        text = "".join(self._buffer[start:])
+        if not self._turn_starts:
+            buffered = "".join(self._buffer[self._flushed:])
+            self._buffer.clear()
+            self._flushed = 0
+            if buffered:
+                self._emit(buffered)
+        return text
+
+    def _emit(self, text: str) -> None:
+        for sink in self.sinks:
+            sink.write(text)
+
+    def close(self) -> None:
+        """Flush anything buffered and close all sinks."""
+        while self._turn_starts:
+            self.end_turn()
+        for sink in self.sinks:
+            sink.close()
@@ -1,18 +1,52 @@
 """Command parser - Handles user input and command interpretation."""
 
-from typing import List, Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import List, Dict, Optional
 import re
 
+_WORD = re.compile(r"\w+")
+# Where chained commands split ("take lamp. n, then open window"); quoted text is skipped
+_COMMAND_SEPARATOR = re.compile(r'"[^"]*"|[.,]|\bthen\b', re.IGNORECASE)
+
+DEFAULT_PARSE_CACHE_SIZE = 512
+
 
 class Command:
-    """Represents a parsed user command."""
+    """
+    Represents a parsed user command.
+    
+    Commands are immutable: the parser hands the same instance to every
+    repeat of an input, so a handler changing one would change later turns.
+    """
+    
+    __slots__ = ("verb", "noun", "preposition", "noun2")
     
     def __init__(self, verb: str, noun: Optional[str] = None, preposition: Optional[str] = None, 
                  noun2: Optional[str] = None):
-        self.verb = verb.lower()
-        self.noun = noun.lower() if noun else None
-        self.preposition = preposition.lower() if preposition else None  
-        self.noun2 = noun2.lower() if noun2 else None
+        set_field = object.__setattr__
+        set_field(self, "verb", verb.lower())
+        set_field(self, "noun", noun.lower() if noun else None)
+        set_field(self, "preposition", preposition.lower() if preposition else None)
+        set_field(self, "noun2", noun2.lower() if noun2 else None)
+    
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"Command is immutable (tried to set {name!r})")
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Command is immutable (tried to delete {name!r})")
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Command):
+            return NotImplemented
+        return (self.verb, self.noun, self.preposition, self.noun2) == \
+            (other.verb, other.noun, other.preposition, other.noun2)
+    
+    def __hash__(self) -> int:
+        return hash((self.verb, self.noun, self.preposition, self.noun2))
+    
+    def __repr__(self) -> str:
+        return (f"Command(verb={self.verb!r}, noun={self.noun!r}, "
+                f"preposition={self.preposition!r}, noun2={self.noun2!r})")
     
     def __str__(self) -> str:
         parts = [self.verb]
@@ -25,10 +59,44 @@ class Command:
         return " ".join(parts)
 
 
-class CommandParser:
-    """Parses user input into structured commands."""
+class _VocabularyNode:
+    """A node of the parser's word trie; the path from the root spells a word or phrase."""
+    
+    __slots__ = ("children", "verb", "preposition", "article")
     
     def __init__(self) -> None:
+        self.children: Dict[str, "_VocabularyNode"] = {}
+        self.verb: Optional[str] = None  # Canonical verb if the path is a verb or verb phrase
+        self.preposition = False
+        self.article = False
+    
+    def insert(self, words: List[str]) -> "_VocabularyNode":
+        """Return the node for a word sequence, creating it if needed."""
+        node = self
+        for word in words:
+            child = node.children.get(word)
+            if child is None:
+                child = node.children[word] = _VocabularyNode()
+            node = child
+        return node
+
+
+class CommandParser:
+    """
+    Parses user input into structured commands.
+    
+    Results are kept in an LRU cache keyed by the input's words, so the
+    commands players repeat all game ("n", "look", "take lamp") are parsed
+    once.
+    """
+    
+    def __init__(self, cache_size: int = DEFAULT_PARSE_CACHE_SIZE) -> None:
+        # Parse cache: normalized input -> Command, least recently used first
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache: "OrderedDict[str, Command]" = OrderedDict()
+        
         # Comprehensive verb synonyms based on original Zork vocabulary
         self.verb_synonyms = {
             # Movement commands (single letter shortcuts)
@@ -170,7 +238,7 @@ class CommandParser:
             "across", "over", "above", "beside", "near", "by", "against", "around"
         }
         
-        # Multi-word verb synonyms (order matters - longer phrases first)
+        # Multi-word verb synonyms (the longest phrase at the start of the input wins)
         self.multi_word_verbs = {
             "pick up": "take", "put out": "extinguish", "blow out": "extinguish", "snuff out": "extinguish",
             "take off": "remove", "put on": "wear",
@@ -183,54 +251,146 @@ class CommandParser:
         
         # Articles and fillers to ignore 
         self.articles = {"a", "an", "the", "my", "some", "any"}
+        
+        self.compile_vocabulary()
     
     def parse(self, user_input: str) -> Optional[Command]:
-        """Parse user input into a Command object."""
-        if not user_input.strip():
+        """Parse user input into a Command object (cached by the input's words)."""
+        # Words are runs of letters/digits; punctuation and spacing only separate them
+        words = _WORD.findall(user_input.lower())
+        if not words:
             return None
-            
-        # Normalize input and handle multi-word verbs
-        normalized_input = self._normalize_input(user_input.strip().lower())
         
-        # Clean and tokenize input
-        tokens = self._tokenize(normalized_input)
-        if not tokens:
-            return None
+        key = " ".join(words)
+        cache = self._cache
+        command = cache.get(key)
+        if command is not None:
+            self.cache_hits += 1
+            try:
+                cache.move_to_end(key)
+            except KeyError:
+                pass  # Evicted meanwhile by another engine sharing this parser
+            return command
         
-        # Extract verb (first meaningful word)
-        verb = self._normalize_verb(tokens[0])
+        self.cache_misses += 1
+        command = self._parse_words(words)
+        if command is not None and self.cache_size > 0:
+            cache[key] = command
+            if len(cache) > self.cache_size:
+                try:
+                    cache.popitem(last=False)
+                except KeyError:
+                    pass
+        return command
+    
+    def split_commands(self, user_input: str) -> List[str]:
+        """Split a line into its chained commands at periods, commas and THEN."""
+        segments = []
+        start = 0
+        for match in _COMMAND_SEPARATOR.finditer(user_input):
+            if match.group().startswith('"'):
+                continue
+            segments.append(user_input[start:match.start()])
+            start = match.end()
+        segments.append(user_input[start:])
+        return [segment.strip() for segment in segments if segment.strip()]
+    
+    def parse_many(self, user_input: str) -> List[Command]:
+        """
+        Parse a line of chained commands, e.g. "take lamp. n. n then open window".
         
-        # Parse remaining tokens for objects
-        remaining_tokens = tokens[1:]
-        noun, preposition, noun2 = self._extract_objects(remaining_tokens)
+        Returns:
+            The commands in order, up to (not including) the first one that doesn't parse
+        """
+        commands = []
+        for segment in self.split_commands(user_input):
+            command = self.parse(segment)
+            if command is None:
+                break
+            commands.append(command)
+        return commands
+    
+    def _parse_words(self, words: List[str]) -> Optional[Command]:
+        """Build a Command in one left-to-right pass over the input's words."""
+        count = len(words)
+        children = self._vocabulary.children
         
-        # Apply noun synonyms
-        if noun:
-            noun = self._normalize_noun(noun)
-        if noun2:
-            noun2 = self._normalize_noun(noun2)
+        # Skip leading articles
+        position = 0
+        while position < count:
+            node = children.get(words[position])
+            if node is None or not node.article:
+                break
+            position += 1
+        if position == count:
+            return None
         
-        return Command(verb, noun, preposition, noun2)
-    
-    def _normalize_input(self, text: str) -> str:
-        """Handle multi-word verb phrases before tokenization."""
-        # Replace multi-word verbs (longest first to avoid conflicts)
-        for phrase, replacement in sorted(self.multi_word_verbs.items(), key=len, reverse=True):
-            if text.startswith(phrase + " ") or text == phrase:
-                text = text.replace(phrase, replacement, 1)
+        # Verb: the longest known verb phrase here, otherwise the word itself
+        verb = words[position]
+        verb_end = position + 1
+        node = self._vocabulary
+        for index in range(position, count):
+            node = node.children.get(words[index])
+            if node is None:
                 break
-        return text
-    
-    def _tokenize(self, text: str) -> List[str]:
-        """Split text into tokens, removing punctuation and articles."""
-        # Remove punctuation and split
-        text = re.sub(r'[^\w\s]', ' ', text)
-        tokens = text.split()
+            if node.verb is not None:
+                verb = node.verb
+                verb_end = index + 1
+        
+        # Objects: noun phrase, first preposition, second noun phrase (articles dropped)
+        noun_words: List[str] = []
+        noun2_words: List[str] = []
+        target = noun_words
+        preposition = None
+        for index in range(verb_end, count):
+            word = words[index]
+            node = children.get(word)
+            if node is not None:
+                if node.article:
+                    continue
+                if node.preposition and preposition is None:
+                    preposition = word
+                    target = noun2_words
+                    continue
+            target.append(word)
         
-        # Remove articles
-        tokens = [token for token in tokens if token not in self.articles]
+        noun = self._normalize_noun(" ".join(noun_words)) if noun_words else None
+        noun2 = self._normalize_noun(" ".join(noun2_words)) if noun2_words else None
+        return Command(verb, noun, preposition, noun2)
+    
+    def compile_vocabulary(self) -> None:
+        """
+        Build the word trie used by parse() from the synonym, preposition and article tables.
         
-        return tokens
+        Called once by __init__; call it again after changing any of those tables.
+        """
+        root = _VocabularyNode()
+        for phrase, canonical in self.verb_synonyms.items():
+            root.insert(phrase.split()).verb = canonical
+        # Multi-word verbs map to a verb that is itself normalized (e.g. "pick up" -> take)
+        for phrase, replacement in self.multi_word_verbs.items():
+            root.insert(phrase.split()).verb = self._normalize_verb(replacement)
+        for word in self.prepositions:
+            root.insert([word]).preposition = True
+        for word in self.articles:
+            root.insert([word]).article = True
+        self._vocabulary = root
+        self.clear_cache()
+    
+    def clear_cache(self) -> None:
+        """Drop cached parses and reset the hit/miss counters."""
+        self._cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    def format_cache_stats(self) -> List[str]:
+        """Human-readable parse cache counters."""
+        total = self.cache_hits + self.cache_misses
+        rate = self.cache_hits / total * 100 if total else 0.0
+        return [
+            f"  entries {len(self._cache):>5} / {self.cache_size}",
+            f"  hits    {self.cache_hits:>5}  misses {self.cache_misses:>5}  ({rate:.0f}% hit)",
+        ]
     
     def _normalize_verb(self, verb: str) -> str:
         """Convert verb synonyms to standard form."""
@@ -252,30 +412,3 @@ class CommandParser:
             return " ".join(normalized_words)
         
         return noun
-    
-    def _extract_objects(self, tokens: List[str]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
-        """Extract noun, preposition, and second noun from remaining tokens."""
-        if not tokens:
-            return None, None, None
-        
-        # Find preposition if any
-        preposition_index = None
-        for i, token in enumerate(tokens):
-            if token in self.prepositions:
-                preposition_index = i
-                break
-        
-        if preposition_index is None:
-            # No preposition, treat all as one noun phrase
-            noun = " ".join(tokens)
-            return noun, None, None
-        else:
-            # Split around preposition
-            noun1_tokens = tokens[:preposition_index]
-            preposition = tokens[preposition_index]
-            noun2_tokens = tokens[preposition_index + 1:]
-            
-            noun1 = " ".join(noun1_tokens) if noun1_tokens else None
-            noun2 = " ".join(noun2_tokens) if noun2_tokens else None
-            
-            return noun1, preposition, noun2
\ No newline at end of file
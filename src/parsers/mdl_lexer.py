@@ -0,0 +1,115 @@
+"""
+MDL Lexer for Zork Source Files
+
+Single-pass tokenizer for original Zork .mud files (MDL format). The lexer
+walks the source text once with a compiled master pattern and never copies
+the remaining text, so whole files are tokenized in linear time.
+"""
+
+import re
+from bisect import bisect_left
+from typing import Iterator, List, NamedTuple, Optional
+
+
+# Token kinds produced by the lexer
+TOKEN_OPEN = "<"
+TOKEN_CLOSE = ">"
+TOKEN_LPAREN = "("
+TOKEN_RPAREN = ")"
+TOKEN_STRING = "STRING"  # "quoted text" (value excludes the quotes)
+TOKEN_VAR = "VAR"        # ,VARNAME global reference (value excludes the comma)
+TOKEN_NEXIT = "NEXIT"    # #NEXIT blocked exit marker
+TOKEN_ATOM = "ATOM"      # bare identifiers such as ROOM, EXIT, DOOR, GET-OBJ
+
+
+class MDLToken(NamedTuple):
+    """A single lexical token from MDL source text."""
+
+    kind: str
+    value: str
+    start: int  # Offset of the first character in the source text
+    end: int    # Offset just past the last character in the source text
+
+
+class MDLLexer:
+    """Streaming tokenizer for MDL source text."""
+
+    _TOKEN_PATTERN = re.compile(r'''
+        "(?P<STRING>(?:[^"\\]|\\.)*)"
+      | (?P<NEXIT>\#NEXIT)
+      | ,(?P<VAR>[A-Z][A-Z0-9-]*)
+      | (?P<PUNCT>[<>()])
+      | (?P<ATOM>[^\s<>()"\#,;\[\]{}]+)
+    ''', re.VERBOSE | re.DOTALL)
+
+    def tokenize(self, text: str, pos: int = 0) -> Iterator[MDLToken]:
+        """
+        Yield tokens from text starting at pos.
+
+        Characters that cannot start a token (whitespace, comment markers,
+        brackets we don't model) are skipped without producing output.
+        """
+        for match in self._TOKEN_PATTERN.finditer(text, pos):
+            kind = match.lastgroup
+            if kind == "PUNCT":
+                value = match.group(kind)
+                yield MDLToken(value, value, match.start(), match.end())
+            else:
+                yield MDLToken(kind, match.group(kind), match.start(), match.end())
+
+
+class MDLTokenStream:
+    """
+    Fully tokenized MDL source with precomputed bracket matches.
+
+    Matching indices for every '<' / '>' and '(' / ')' pair are resolved in
+    the same pass that builds the token list, so skipping a nested structure
+    is a single lookup instead of a bracket-counting scan.
+    """
+
+    def __init__(self, text: str, lexer: Optional[MDLLexer] = None) -> None:
+        self.text = text
+        self.tokens: List[MDLToken] = []
+        self.matches: List[int] = []  # token index -> matching bracket index (-1 if none)
+        self._starts: Optional[List[int]] = None
+
+        angle_stack: List[int] = []
+        paren_stack: List[int] = []
+
+        for index, token in enumerate((lexer or MDLLexer()).tokenize(text)):
+            self.tokens.append(token)
+            self.matches.append(-1)
+
+            kind = token.kind
+            if kind == TOKEN_OPEN:
+                angle_stack.append(index)
+            elif kind == TOKEN_CLOSE:
+                if angle_stack:
+                    opener = angle_stack.pop()
+                    self.matches[opener] = index
+                    self.matches[index] = opener
+            elif kind == TOKEN_LPAREN:
+                paren_stack.append(index)
+            elif kind == TOKEN_RPAREN:
+                if paren_stack:
+                    opener = paren_stack.pop()
+                    self.matches[opener] = index
+                    self.matches[index] = opener
+
+    def __len__(self) -> int:
+        """Return number of tokens in the stream."""
+        return len(self.tokens)
+
+    def index_at(self, pos: int) -> int:
+        """Return the index of the first token starting at or after text offset pos."""
+        if self._starts is None:
+            self._starts = [token.start for token in self.tokens]
+        return bisect_left(self._starts, pos)
+
+    def is_form(self, index: int, head: str) -> bool:
+        """Check if the token at index opens a <HEAD ...> form."""
+        tokens = self.tokens
+        return (index + 1 < len(tokens)
+                and tokens[index].kind == TOKEN_OPEN
+                and tokens[index + 1].kind == TOKEN_ATOM
+                and tokens[index + 1].value == head)
@@ -5,10 +5,23 @@ Parses original Zork .mud files (MDL format) to extract room data.
 """
 
 import re
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from itertools import repeat
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    from .mdl_lexer import (
+        MDLLexer, MDLTokenStream, TOKEN_OPEN, TOKEN_CLOSE, TOKEN_LPAREN, TOKEN_RPAREN,
+        TOKEN_STRING, TOKEN_VAR, TOKEN_NEXIT, TOKEN_ATOM
+    )
+except ImportError:
+    from mdl_lexer import (
+        MDLLexer, MDLTokenStream, TOKEN_OPEN, TOKEN_CLOSE, TOKEN_LPAREN, TOKEN_RPAREN,
+        TOKEN_STRING, TOKEN_VAR, TOKEN_NEXIT, TOKEN_ATOM
+    )
+
 
 @dataclass
 class RoomData:
@@ -26,95 +39,131 @@ class RoomData:
 class MDLParser:
     """Parser for MDL (.mud) files containing Zork room definitions."""
     
+    # Resolve key exit variables to their actual room destinations
+    # Based on analysis of original .mud files (None = blocked exit)
+    EXIT_VARIABLE_MAPPINGS: Dict[str, Optional[str]] = {
+        # Kitchen/House connections - DOOR objects need context-aware resolution 
+        # KITCHEN-WINDOW connects KITCH<->EHOUS bidirectionally
+        "KITCHEN-WINDOW": "KITCHEN-WINDOW",  # Special marker for context resolution
+        
+        # Tree climbing attempts (blocked exits)
+        "NOTREE": None,  # #NEXIT "There is no tree here suitable for climbing."
+        
+        # Water/dam areas
+        "CURRENT": None,  # #NEXIT "The current is too strong."
+        "CLIFFS": None,  # #NEXIT related to cliffs
+        
+        # Mirror room variables
+        "MR-G": "MRG",
+        "MR-A": "MRA", 
+        "MR-B": "MRB",
+        "MR-C": "MRC",
+        "MR-D": "MRD", 
+        "MIREX": "INMIR",  # Mirror entrance
+        "MOUT": "MRA",     # Mirror exit
+        
+        # Endgame variables
+        "CD": "FDOOR",     # Closed door
+        "OD": "FDOOR",     # Open door  
+        "WD": "FDOOR",     # Wooden door
+        "FOUT": None,      # Blocked exit
+        
+        # Bank variables
+        "BKALARM": None,   # Bank alarm system
+        
+        # Other common blocked exits
+        "CXGNOME": None,   # Blocked by gnome
+        "DOME-FLAG": None, # Conditional exit
+        
+        # Add the specific ones causing our issues
+        "XBIN": None,
+        "XCIN": None, 
+        "LEDIN": None,
+        "SAFIN": None,
+    }
+    
+    _FLAG_PATTERN = re.compile(r'R[A-Z]+BIT')
+    _VARIABLE_NAME_PATTERN = re.compile(r'[A-Z][A-Z0-9-]*')
+    
     def __init__(self, debug_mode: bool = False):
         self.rooms: Dict[str, RoomData] = {}
         self.debug_mode = debug_mode
         self.variables: Dict[str, str] = {}  # Variable name -> value lookup
+        self.lexer = MDLLexer()
+        self._stream: Optional[MDLTokenStream] = None  # Tokens for the text being parsed
         
     def parse_room_block(self, text: str, start_pos: int) -> Tuple[Optional[RoomData], int]:
         """
         Parse a single <ROOM ...> block starting at start_pos.
         Returns (RoomData, end_position) or (None, start_pos) if no room found.
+        
+        The text is tokenized once and reused across calls with the same
+        string, so walking a file block by block stays linear.
         """
-        # Find room start pattern
-        room_match = re.search(r'<ROOM\s+"([^"]+)"', text[start_pos:])
-        if not room_match:
+        stream = self._get_stream(text)
+        span = self._find_room_span(stream, stream.index_at(start_pos))
+        if span is None:
             return None, start_pos
-            
-        room_id = room_match.group(1)
-        room_start = start_pos + room_match.start()
-        
-        # Find the end of this room definition
-        remaining_text = text[room_start:]
-        
-        # Look for the complete room structure by counting < and > brackets
-        bracket_count = 0
-        pos = 0
-        found_first_bracket = False
-        
-        while pos < len(remaining_text):
-            char = remaining_text[pos]
-            if char == '<':
-                bracket_count += 1
-                found_first_bracket = True
-            elif char == '>' and found_first_bracket:
-                bracket_count -= 1
-                # When bracket count reaches 0, we've found the end of our room
-                if bracket_count == 0:
-                    break
-            pos += 1
-        
-        if bracket_count != 0:
-            # Fallback: find the next room or end of text
-            next_room_pos = remaining_text.find('<ROOM', 1)
-            if next_room_pos == -1:
-                room_text = remaining_text  # Take rest of file
-            else:
-                room_text = remaining_text[:next_room_pos]
-        else:
-            room_text = remaining_text[:pos + 1]
         
-        # Debug for LROOM
-        if room_id == "LROOM":
-            pass  # Debug removed
+        room_start, room_end = span
+        end_pos = stream.tokens[room_end - 1].end
+        return self._parse_room_span(stream, room_start, room_end), end_pos
+    
+    def _get_stream(self, text: str) -> MDLTokenStream:
+        """Return the token stream for text, tokenizing it only on first use."""
+        if self._stream is None or self._stream.text is not text:
+            self._stream = MDLTokenStream(text, self.lexer)
+        return self._stream
+    
+    def _find_room_span(self, stream: MDLTokenStream, index: int) -> Optional[Tuple[int, int]]:
+        """
+        Find the next <ROOM "ID" ...> form at or after token index.
+        Returns (start_index, end_index) with end exclusive, or None if no room remains.
+        """
+        tokens = stream.tokens
+        count = len(tokens)
+        
+        while index + 2 < count:
+            if (stream.is_form(index, "ROOM") and tokens[index + 2].kind == TOKEN_STRING
+                    and tokens[index + 2].value):
+                close = stream.matches[index]
+                if close != -1:
+                    return index, close + 1
+                
+                # Unbalanced room - fall back to the next room or end of file
+                end = index + 1
+                while end < count and not stream.is_form(end, "ROOM"):
+                    end += 1
+                return index, end
+            index += 1
         
+        return None
+    
+    def _parse_room_span(self, stream: MDLTokenStream, start: int, end: int) -> Optional[RoomData]:
+        """Parse the room whose tokens occupy [start, end)."""
+        room_id = stream.tokens[start + 2].value
         try:
-            room_data = self._parse_room_content(room_id, room_text)
-            return room_data, room_start + pos + 1
+            return self._parse_room_content(room_id, stream, start, end)
         except Exception as e:
             print(f"Warning: Failed to parse room {room_id}: {e}")
-            return None, room_start + pos + 1
+            return None
     
-    def _parse_room_content(self, room_id: str, room_text: str) -> RoomData:
+    def _parse_room_content(self, room_id: str, stream: MDLTokenStream,
+                            start: int, end: int) -> RoomData:
         """Parse the content within a room definition."""
         
         # Set room context for variable resolution
         self._current_room_id = room_id
         
-        # Extract quoted strings and variable references in order
-        tokens = []
-        
-        # Find all quoted strings and variable references
-        quotes = list(re.finditer(r'"((?:[^"\\]|\\.)*)"', room_text))
-        variables = list(re.finditer(r',([A-Z][A-Z0-9-]*)', room_text))
-        
-        # Combine and sort by position
-        all_tokens = []
-        for match in quotes:
-            all_tokens.append((match.start(), 'quote', match.group(1)))
-        for match in variables:
-            all_tokens.append((match.start(), 'variable', match.group(0)))
-        
-        all_tokens.sort(key=lambda x: x[0])
-        
-        # Extract values in order, resolving variables
+        # Extract quoted strings and variable references in order, resolving variables
         values = []
-        for pos, token_type, value in all_tokens:
-            if token_type == 'quote':
-                values.append(value)
-            elif token_type == 'variable':
-                resolved = self._resolve_variable(value)
-                values.append(resolved)
+        tokens = stream.tokens
+        for index in range(start, end):
+            token = tokens[index]
+            if token.kind == TOKEN_STRING:
+                values.append(token.value)
+            elif token.kind == TOKEN_VAR:
+                values.append(self._resolve_variable(token.value))
         
         # MDL Room format analysis - smart detection of description vs name  
         long_description = ""
@@ -175,16 +224,13 @@ class MDLParser:
             long_description = self._get_canonical_description(room_id)
         
         # Parse exits
-        exits = self._parse_exits(room_text, room_id)
-        
-        # Parse objects
-        objects = self._parse_objects(room_text)
+        exits = self._parse_exits(stream, start, end, room_id)
         
         # Parse objects
-        objects = self._parse_objects(room_text)
+        objects = self._parse_objects(stream, start, end)
         
         # Parse room flags
-        flags = self._parse_flags(room_text)
+        flags = self._parse_flags(stream, start, end)
         
         return RoomData(
             id=room_id,
@@ -272,433 +318,366 @@ class MDLParser:
             name = " ".join(words).replace(",", "").replace(".", "")
             return name if name else room_id
     
-    def _parse_exits(self, room_text: str, room_id: str) -> Dict[str, str]:
-        """Parse exits from <EXIT ...> pattern."""
-        exits = {}
-        
-        # Find the start of EXIT block
-        exit_start = room_text.find('<EXIT')
-        if exit_start == -1:
-            return exits
-        
-        # Find the matching closing bracket by counting nesting
-        bracket_count = 0
-        i = exit_start
-        exit_end = -1
-        
-        while i < len(room_text):
-            if room_text[i] == '<':
-                bracket_count += 1
-            elif room_text[i] == '>':
-                bracket_count -= 1
-                if bracket_count == 0:
-                    exit_end = i
-                    break
-            i += 1
-        
-        if exit_end != -1:
-            # Extract content between <EXIT and closing >
-            exit_content = room_text[exit_start + 5:exit_end].strip()
-            exits = self._parse_exit_content(exit_content, room_id)
-        
-        return exits
+    def _parse_exits(self, stream: MDLTokenStream, start: int, end: int,
+                     room_id: str) -> Dict[str, str]:
+        """Parse exits from the first <EXIT ...> form within [start, end)."""
+        for index in range(start, end):
+            if stream.is_form(index, "EXIT"):
+                close = stream.matches[index]
+                if close == -1 or close >= end:
+                    return {}
+                return self._parse_exit_content(stream, index + 2, close, room_id)
+        
+        return {}
     
-    def _parse_objects(self, room_text: str) -> List[str]:
+    def _parse_objects(self, stream: MDLTokenStream, start: int, end: int) -> List[str]:
         """Parse objects from object list pattern."""
         objects = []
+        tokens = stream.tokens
         
         # Look for parentheses blocks that contain GET-OBJ patterns
-        # Use DOTALL to handle multi-line object lists
-        paren_matches = re.findall(r'\(([^)]*)\)', room_text, re.DOTALL)
-        
-        for paren_content in paren_matches:
-            # Check if this parentheses block contains GET-OBJ patterns
-            if 'GET-OBJ' in paren_content:
-                # Extract all GET-OBJ references from this block
-                obj_refs = re.findall(r'<GET-OBJ\s+"([^"]+)">', paren_content, re.DOTALL)
-                objects.extend(obj_refs)
-                # Only process the first GET-OBJ block we find
+        index = start
+        while index < end:
+            if tokens[index].kind != TOKEN_LPAREN:
+                index += 1
+                continue
+            
+            # The block runs to the first closing parenthesis
+            block_end = index + 1
+            while block_end < end and tokens[block_end].kind != TOKEN_RPAREN:
+                block_end += 1
+            if block_end >= end:
                 break
+            
+            # Extract all <GET-OBJ "ID"> references from this block
+            has_get_obj = False
+            for ref in range(index + 1, block_end):
+                token = tokens[ref]
+                if token.kind != TOKEN_ATOM or token.value != "GET-OBJ":
+                    continue
+                has_get_obj = True
+                if (tokens[ref - 1].kind == TOKEN_OPEN and ref + 2 < block_end
+                        and tokens[ref + 1].kind == TOKEN_STRING and tokens[ref + 1].value
+                        and tokens[ref + 2].kind == TOKEN_CLOSE):
+                    objects.append(tokens[ref + 1].value)
+
+            # Only process the first GET-OBJ block we find
+            if has_get_obj:
+                break
+            index = block_end + 1
         
         return objects
     
-    def _parse_flags(self, room_text: str) -> List[str]:
+    def _parse_flags(self, stream: MDLTokenStream, start: int, end: int) -> List[str]:
         """Parse room flags from flag patterns.""" 
         flags = []
-        flag_patterns = re.findall(r'R[A-Z]+BIT', room_text)
-        flags.extend(flag_patterns)
+        tokens = stream.tokens
+        for index in range(start, end):
+            token = tokens[index]
+            if token.kind == TOKEN_VAR or token.kind == TOKEN_ATOM:
+                flags.extend(self._FLAG_PATTERN.findall(token.value))
         return flags
 
-    def _parse_exit_content(self, exit_content: str, room_id: str) -> Dict[str, str]:
-        """Parse complex exit structures from MDL format."""
+    def _parse_exit_content(self, stream: MDLTokenStream, start: int, end: int,
+                            room_id: str) -> Dict[str, str]:
+        """Parse complex exit structures from the tokens in [start, end)."""
         exits = {}
+        tokens = stream.tokens
         
-        # Remove newlines and multiple spaces for easier parsing
-        exit_content = ' '.join(exit_content.split())
-        
-        # Split into individual direction-destination pairs
+        # Walk direction-destination pairs
         # Handle quoted strings, DOOR structures, NEXIT, CEXIT, etc.
-        i = 0
-        while i < len(exit_content):
-            # Skip whitespace
-            while i < len(exit_content) and exit_content[i].isspace():
+        i = start
+        while i < end:
+            # Look for direction (quoted string)
+            if tokens[i].kind != TOKEN_STRING:
+                # Not a quoted direction, skip this token
                 i += 1
+                continue
             
-            if i >= len(exit_content):
+            direction = tokens[i].value
+            i += 1
+            if not direction:
+                continue
+            
+            if i >= end:
                 break
-                
-            # Look for direction (quoted string)
-            if exit_content[i] == '"':
-                direction, i = self._extract_quoted_string(exit_content, i)
-                if not direction:
-                    continue
-                    
-                # Skip whitespace after direction
-                while i < len(exit_content) and exit_content[i].isspace():
-                    i += 1
-                    
-                if i >= len(exit_content):
-                    break
-                
-                # Parse the destination based on what follows
-                destination = None
-                
-                if exit_content[i:].startswith('#NEXIT'):
-                    # Blocked exit - skip this entirely
-                    i = self._skip_nexit(exit_content, i)
-                    continue
-                elif exit_content[i] == '<':
-                    # Complex structure (DOOR, CEXIT, etc.)
-                    if exit_content[i:].startswith('<DOOR'):
-                        destination, i = self._parse_door_structure(exit_content, i, room_id)
-                    elif exit_content[i:].startswith('<CEXIT'):
-                        destination, i = self._parse_cexit_structure(exit_content, i)
-                    else:
-                        # Unknown structure - skip it
-                        i = self._skip_structure(exit_content, i)
-                elif exit_content[i] == '"':
-                    # Simple room name
-                    destination, i = self._extract_quoted_string(exit_content, i)
-                elif exit_content[i] == ',':
-                    # Variable reference like ,MR-G - extract the variable name
-                    destination, i = self._extract_variable_ref(exit_content, i)
+            
+            # Parse the destination based on what follows
+            token = tokens[i]
+            destination = None
+            
+            if token.kind == TOKEN_NEXIT:
+                # Blocked exit - skip this entirely
+                i = self._skip_nexit(stream, i, end)
+                continue
+            elif token.kind == TOKEN_OPEN:
+                # Complex structure (DOOR, CEXIT, etc.)
+                if stream.is_form(i, "DOOR"):
+                    destination, i = self._parse_door_structure(stream, i, room_id)
+                elif stream.is_form(i, "CEXIT"):
+                    destination, i = self._parse_cexit_structure(stream, i)
                 else:
-                    # Try to extract unquoted identifier
-                    destination, i = self._extract_identifier(exit_content, i)
-                
-                if destination and direction:
-                    # Context-aware resolution for KITCHEN-WINDOW 
-                    if destination == "KITCHEN-WINDOW":
-                        # KITCHEN-WINDOW is a bidirectional door between KITCH and EHOUS
-                        # Need to determine context from parent room ID that will be set later
-                        # For now, store as special marker to be resolved in room_loader
-                        exits[direction.lower()] = "KITCHEN-WINDOW-MARKER"  
-                    else:
-                        exits[direction.lower()] = destination
-                    
+                    # Unknown structure - skip it
+                    i = self._skip_structure(stream, i)
+            elif token.kind == TOKEN_STRING:
+                # Simple room name
+                destination = token.value or None
+                i += 1
+            elif token.kind == TOKEN_VAR:
+                # Variable reference like ,MR-G - resolve the variable name
+                destination = self._resolve_exit_variable(token.value)
+                i += 1
+            elif token.kind == TOKEN_ATOM:
+                # Unquoted identifier
+                destination = token.value
+                i += 1
             else:
-                # Not a quoted direction, skip this token
                 i += 1
-        
-        return exits
-
-    def _extract_quoted_string(self, text: str, start: int) -> Tuple[Optional[str], int]:
-        """Extract a quoted string starting at position start."""
-        if start >= len(text) or text[start] != '"':
-            return None, start
             
-        i = start + 1
-        result = ""
+            if destination and direction:
+                # Context-aware resolution for KITCHEN-WINDOW 
+                if destination == "KITCHEN-WINDOW":
+                    # KITCHEN-WINDOW is a bidirectional door between KITCH and EHOUS
+                    # Need to determine context from parent room ID that will be set later
+                    # For now, store as special marker to be resolved in room_loader
+                    exits[direction.lower()] = "KITCHEN-WINDOW-MARKER"  
+                else:
+                    exits[direction.lower()] = destination
         
-        while i < len(text) and text[i] != '"':
-            result += text[i]
-            i += 1
-            
-        if i < len(text) and text[i] == '"':
-            i += 1  # Skip closing quote
-            
-        return result if result else None, i
+        return exits
 
-    def _skip_nexit(self, text: str, start: int) -> int:
+    def _skip_nexit(self, stream: MDLTokenStream, start: int, end: int) -> int:
         """Skip a #NEXIT structure."""
+        tokens = stream.tokens
         i = start
         
         # Skip all #NEXIT tokens (there can be multiple)
-        while i < len(text) and text[i:i+6] == '#NEXIT':
-            i += 6  # Skip '#NEXIT'
-            
-            # Skip whitespace after #NEXIT
-            while i < len(text) and text[i].isspace():
-                i += 1
+        while i < end and tokens[i].kind == TOKEN_NEXIT:
+            i += 1
         
         # Skip the optional quoted message if present
-        if i < len(text) and text[i] == '"':
-            _, i = self._extract_quoted_string(text, i)
+        if i < end and tokens[i].kind == TOKEN_STRING:
+            i += 1
             
         return i
 
-    def _parse_door_structure(self, text: str, start: int, current_room_id: str) -> Tuple[Optional[str], int]:
+    def _form_strings(self, stream: MDLTokenStream, start: int) -> Tuple[List[str], int]:
+        """
+        Collect the quoted strings inside the form opened at token index start.
+        Returns (strings, index after the form), or ([], -1) if the form is unbalanced.
+        """
+        close = stream.matches[start]
+        if close == -1:
+            return [], -1
+        
+        tokens = stream.tokens
+        strings = [tokens[i].value for i in range(start + 1, close) if tokens[i].kind == TOKEN_STRING]
+        return strings, close + 1
+
+    def _parse_door_structure(self, stream: MDLTokenStream, start: int,
+                              current_room_id: str) -> Tuple[Optional[str], int]:
         """Parse a DOOR structure: <DOOR "object" "room1" "room2" "message">
         Returns the OTHER room in the door connection (not current_room_id)."""
-        if not text[start:].startswith('<DOOR'):
+        if not stream.is_form(start, "DOOR"):
             return None, start
-            
-        # Find the end of the DOOR structure
-        bracket_count = 0
-        i = start
-        
-        while i < len(text):
-            if text[i] == '<':
-                bracket_count += 1
-            elif text[i] == '>':
-                bracket_count -= 1
-                if bracket_count == 0:
-                    break
-            i += 1
-            
-        if bracket_count != 0:
-            return None, i
-            
-        door_content = text[start:i+1]
         
-        # Extract the rooms from the DOOR structure
         # Format: <DOOR "object" "room1" "room2" "message">
-        quoted_strings = re.findall(r'"([^"]*)"', door_content)
+        quoted_strings, next_index = self._form_strings(stream, start)
+        if next_index == -1:
+            return None, len(stream)
         
         if len(quoted_strings) >= 3:
             # Use room2 as the destination (the third quoted string)
-            return quoted_strings[2], i + 1
+            return quoted_strings[2], next_index
             
-        return None, i + 1
+        return None, next_index
 
-    def _parse_cexit_structure(self, text: str, start: int) -> Tuple[Optional[str], int]:
+    def _parse_cexit_structure(self, stream: MDLTokenStream, start: int) -> Tuple[Optional[str], int]:
         """Parse a CEXIT structure: <CEXIT "flag" "room" "message" <> action>"""
-        if not text[start:].startswith('<CEXIT'):
+        if not stream.is_form(start, "CEXIT"):
             return None, start
-            
-        # Find the end of the CEXIT structure
-        bracket_count = 0
-        i = start
         
-        while i < len(text):
-            if text[i] == '<':
-                bracket_count += 1
-            elif text[i] == '>':
-                bracket_count -= 1
-                if bracket_count == 0:
-                    break
-            i += 1
-            
-        if bracket_count != 0:
-            return None, i
-            
-        cexit_content = text[start:i+1]
-        
-        # Extract the room from the CEXIT structure  
         # Format: <CEXIT "flag" "room" "message" <> action>
-        quoted_strings = re.findall(r'"([^"]*)"', cexit_content)
+        quoted_strings, next_index = self._form_strings(stream, start)
+        if next_index == -1:
+            return None, len(stream)
         
         if len(quoted_strings) >= 2:
             # Room is usually the second quoted string
-            return quoted_strings[1], i + 1
+            return quoted_strings[1], next_index
             
-        return None, i + 1
+        return None, next_index
 
-    def _skip_structure(self, text: str, start: int) -> int:
+    def _skip_structure(self, stream: MDLTokenStream, start: int) -> int:
         """Skip an unknown < > structure."""
-        bracket_count = 0
-        i = start
-        
-        while i < len(text):
-            if text[i] == '<':
-                bracket_count += 1
-            elif text[i] == '>':
-                bracket_count -= 1
-                if bracket_count == 0:
-                    break
-            i += 1
-            
-        return i + 1 if i < len(text) else i
+        close = stream.matches[start]
+        return close + 1 if close != -1 else len(stream)
 
-    def _extract_variable_ref(self, text: str, start: int) -> Tuple[Optional[str], int]:
-        """Extract a variable reference like ,MR-G"""
-        if start >= len(text) or text[start] != ',':
-            return None, start
-            
-        i = start + 1
-        result = ""
-        
-        # Extract identifier characters
-        while i < len(text) and (text[i].isalnum() or text[i] in '-_'):
-            result += text[i]
-            i += 1
-            
-        # Resolve key variables to their actual room destinations
-        # Based on analysis of original .mud files
-        variable_mappings = {
-            # Kitchen/House connections - DOOR objects need context-aware resolution 
-            # KITCHEN-WINDOW connects KITCH<->EHOUS bidirectionally
-            "KITCHEN-WINDOW": "KITCHEN-WINDOW",  # Special marker for context resolution
-            
-            # Tree climbing attempts (blocked exits)
-            "NOTREE": None,  # #NEXIT "There is no tree here suitable for climbing."
-            
-            # Water/dam areas
-            "CURRENT": None,  # #NEXIT "The current is too strong."
-            "CLIFFS": None,  # #NEXIT related to cliffs
-            
-            # Mirror room variables
-            "MR-G": "MRG",
-            "MR-A": "MRA", 
-            "MR-B": "MRB",
-            "MR-C": "MRC",
-            "MR-D": "MRD", 
-            "MIREX": "INMIR",  # Mirror entrance
-            "MOUT": "MRA",     # Mirror exit
-            
-            # Endgame variables
-            "CD": "FDOOR",     # Closed door
-            "OD": "FDOOR",     # Open door  
-            "WD": "FDOOR",     # Wooden door
-            "FOUT": None,      # Blocked exit
-            
-            # Bank variables
-            "BKALARM": None,   # Bank alarm system
-            
-            # Other common blocked exits
-            "CXGNOME": None,   # Blocked by gnome
-            "DOME-FLAG": None, # Conditional exit
-            
-            # Add the specific ones causing our issues
-            "XBIN": None,
-            "XCIN": None, 
-            "LEDIN": None,
-            "SAFIN": None,
-        }
-        
-        resolved = variable_mappings.get(result)
-        if resolved is None:
-            # This is a blocked exit or unresolved variable - skip it
-            return None, i
-        else:
-            return resolved, i
-
-    def _extract_identifier(self, text: str, start: int) -> Tuple[Optional[str], int]:
-        """Extract an unquoted identifier."""
-        i = start
-        result = ""
-        
-        # Extract identifier characters until whitespace or special chars
-        while i < len(text) and (text[i].isalnum() or text[i] in '-_'):
-            result += text[i]
-            i += 1
-            
-        return result if result else None, i
+    def _resolve_exit_variable(self, var_name: str) -> Optional[str]:
+        """Resolve an exit variable reference like ,MR-G to its destination room."""
+        # Blocked exits and unresolved variables resolve to None and are skipped
+        return self.EXIT_VARIABLE_MAPPINGS.get(var_name)
     
-    def _parse_variables(self, content: str):
-        """Parse PSETG and SETG variable definitions from the content."""
-        # Find all PSETG and SETG variable assignments
+    def _parse_variables(self, stream: MDLTokenStream) -> None:
+        """Parse PSETG and SETG variable definitions from the token stream."""
         # Format: <PSETG VARNAME "value"> or <SETG VARNAME "value">
-        pattern = r'<(?:P?SETG)\s+([A-Z][A-Z0-9-]*)\s+"([^"]*)">'
-        matches = re.findall(pattern, content, re.MULTILINE)
-        
-        for var_name, var_value in matches:
-            self.variables[var_name] = var_value
+        tokens = stream.tokens
+        for index in range(len(tokens) - 4):
+            if (tokens[index].kind == TOKEN_OPEN
+                    and tokens[index + 1].kind == TOKEN_ATOM
+                    and tokens[index + 1].value in ("PSETG", "SETG")
+                    and tokens[index + 2].kind == TOKEN_ATOM
+                    and self._VARIABLE_NAME_PATTERN.fullmatch(tokens[index + 2].value)
+                    and tokens[index + 3].kind == TOKEN_STRING
+                    and tokens[index + 4].kind == TOKEN_CLOSE):
+                self.variables[tokens[index + 2].value] = tokens[index + 3].value
     
-    def _resolve_variable(self, var_ref: str) -> str:
-        """Resolve a variable reference like ',STFORE' to its value."""
-        if var_ref.startswith(','):
-            var_name = var_ref[1:]  # Remove the comma
-            value = self.variables.get(var_name, var_ref)
-            
-            # Special handling for DEAD end rooms - some use DEADEND when they should use SDEADEND  
-            if var_name == "DEADEND":
-                room_context = getattr(self, '_current_room_id', None)
-                if room_context and room_context in ['DEAD3', 'DEAD4', 'DEAD5', 'DEAD6', 'DEAD7']:
-                    # These rooms should use the full dead end description
-                    return self.variables.get("SDEADEND", "You have come to a dead end in the maze.")
-            
-            return value  # Return original ref if not found
-        return var_ref
+    def _resolve_variable(self, var_name: str) -> str:
+        """Resolve a variable reference like ,STFORE (given as STFORE) to its value."""
+        value = self.variables.get(var_name, f",{var_name}")
+        
+        # Special handling for DEAD end rooms - some use DEADEND when they should use SDEADEND  
+        if var_name == "DEADEND":
+            room_context = getattr(self, '_current_room_id', None)
+            if room_context and room_context in ['DEAD3', 'DEAD4', 'DEAD5', 'DEAD6', 'DEAD7']:
+                # These rooms should use the full dead end description
+                return self.variables.get("SDEADEND", "You have come to a dead end in the maze.")
+        
+        return value  # Return original ref if not found
     
     def parse_file(self, file_path: Path) -> Dict[str, RoomData]:
         """Parse an entire .mud file and extract all room definitions."""
         
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-        except Exception as e:
-            print(f"Error reading file {file_path}: {e}")
+        content = self._read_source(file_path)
+        if content is None:
             return {}
         
+        # Tokenize once; both passes below walk the same token stream
+        stream = MDLTokenStream(content, self.lexer)
+        
         # First pass: parse all variable definitions
-        self._parse_variables(content)
+        self._parse_variables(stream)
         
         # Second pass: parse rooms
+        return self._parse_rooms(stream)
+    
+    def _read_source(self, file_path: Path) -> Optional[str]:
+        """Read a .mud file, returning None if it can't be read."""
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                return f.read()
+        except Exception as e:
+            print(f"Error reading file {file_path}: {e}")
+            return None
+    
+    def _parse_rooms(self, stream: MDLTokenStream) -> Dict[str, RoomData]:
+        """Parse every <ROOM ...> block in the token stream."""
         rooms = {}
-        pos = 0
+        index = 0
         
-        while pos < len(content):
-            room_data, new_pos = self.parse_room_block(content, pos)
+        while True:
+            span = self._find_room_span(stream, index)
+            if span is None:
+                break
             
+            room_data = self._parse_room_span(stream, *span)
             if room_data:
                 rooms[room_data.id] = room_data
                 if self.debug_mode:
                     print(f"Parsed room: {room_data.id} - {room_data.short_name}")
             
-            # Advance position
-            if new_pos <= pos:
-                pos += 1  # Prevent infinite loop
-            else:
-                pos = new_pos
+            index = span[1]
         
         return rooms
     
-    def parse_directory(self, directory_path: Path) -> Dict[str, RoomData]:
-        """Parse all .mud files in a directory."""
+    def parse_directory(self, directory_path: Path, workers: int = 1) -> Dict[str, RoomData]:
+        """
+        Parse all .mud files in a directory.
         
-        all_rooms = {}
+        Variables are collected from every file before any room is parsed, so
+        a room can reference a PSETG/SETG defined in another file. Files are
+        processed in sorted order; later definitions win for both variables
+        and duplicate room IDs.
         
-        for mud_file in directory_path.glob("*.mud"):
+        Args:
+            directory_path: Directory containing .mud files
+            workers: Number of worker processes (1 parses in this process)
+            
+        Returns:
+            Dictionary of room ID to RoomData, identical for any worker count
+        """
+        mud_files = sorted(directory_path.glob("*.mud"))
+        
+        if workers > 1 and len(mud_files) > 1:
+            try:
+                return self._parse_directory_parallel(mud_files, workers)
+            except (BrokenExecutor, OSError, NotImplementedError) as e:
+                # Process pools are unavailable on some platforms/sandboxes, or their workers get killed
+                if self.debug_mode:
+                    print(f"Parallel parsing unavailable ({type(e).__name__}), parsing serially")
+        
+        # First phase: tokenize every file and collect its variables
+        streams = []
+        for mud_file in mud_files:
+            content = self._read_source(mud_file)
+            if content is None:
+                continue
+            stream = MDLTokenStream(content, self.lexer)
+            self._parse_variables(stream)
+            streams.append((mud_file, stream))
+        
+        # Second phase: parse rooms with the complete variable table
+        all_rooms = {}
+        for mud_file, stream in streams:
             if self.debug_mode:
                 print(f"Parsing {mud_file.name}...")
-            file_rooms = self.parse_file(mud_file)
-            all_rooms.update(file_rooms)
+            all_rooms.update(self._parse_rooms(stream))
+        
+        return all_rooms
+    
+    def _parse_directory_parallel(self, mud_files: List[Path], workers: int) -> Dict[str, RoomData]:
+        """Two-phase parse of mud_files fanned out to a process pool."""
+        with ProcessPoolExecutor(max_workers=min(workers, len(mud_files))) as pool:
+            # First phase: collect variables from every file
+            readable_files = []
+            for mud_file, variables in zip(mud_files, pool.map(_collect_file_variables, mud_files)):
+                if variables is None:
+                    continue
+                self.variables.update(variables)
+                readable_files.append(mud_file)
+            
+            # Second phase: parse rooms with the merged variable table
+            all_rooms = {}
+            for mud_file, file_rooms in zip(readable_files,
+                                            pool.map(_parse_file_rooms, readable_files,
+                                                     repeat(self.variables), repeat(self.debug_mode))):
+                if self.debug_mode:
+                    print(f"Parsed {mud_file.name}: {len(file_rooms)} rooms")
+                all_rooms.update(file_rooms)
         
         return all_rooms
 
 
-    def _extract_balanced_brackets(self, text: str, start_pattern: str) -> Optional[str]:
-        """Extract content between balanced angle brackets starting with start_pattern."""
-        start_index = text.find(start_pattern)
-        if start_index == -1:
-            return None
-            
-        # Find the opening bracket
-        bracket_start = text.find('<', start_index)
-        if bracket_start == -1:
-            return None
-            
-        # Count brackets to find the matching closing bracket
-        bracket_count = 0
-        i = bracket_start
-        
-        while i < len(text):
-            if text[i] == '<':
-                bracket_count += 1
-            elif text[i] == '>':
-                bracket_count -= 1
-                if bracket_count == 0:
-                    # Found the matching closing bracket
-                    # Return content between the brackets (excluding the < >)
-                    content_start = bracket_start + len(start_pattern)
-                    while content_start < i and text[content_start].isspace():
-                        content_start += 1
-                    
-                    return text[content_start:i].strip()
-            i += 1
-            
+def _collect_file_variables(file_path: Path) -> Optional[Dict[str, str]]:
+    """Worker: return the PSETG/SETG table of one file, or None if unreadable."""
+    parser = MDLParser()
+    content = parser._read_source(file_path)
+    if content is None:
         return None
+    if "SETG" not in content:
+        return {}  # No definitions, skip tokenizing
+    parser._parse_variables(MDLTokenStream(content, parser.lexer))
+    return parser.variables
+
+
+def _parse_file_rooms(file_path: Path, variables: Dict[str, str], debug_mode: bool) -> Dict[str, RoomData]:
+    """Worker: parse the rooms of one file against a shared variable table."""
+    parser = MDLParser(debug_mode=debug_mode)
+    parser.variables = dict(variables)
+    content = parser._read_source(file_path)
+    if content is None:
+        return {}
+    return parser._parse_rooms(MDLTokenStream(content, parser.lexer))
 
 
 def main():
@@ -3,13 +3,23 @@ Multi-Step Puzzle System for Zork
 
 Implements authentic Zork-style puzzles with state management, scoring,
 and complex multi-step interactions modeled after original MIT Zork.
+
+Only the current step of each active puzzle can fire, so the manager keeps
+those steps in a trigger index keyed by (required_room, verb). A command
+looks up its own room and verb (plus the "any room" / "any verb" buckets)
+and evaluates just those triggers. A puzzle is re-indexed when it advances;
+a step gated on flags stays out of the index until set_flag() satisfies
+them.
 """
 
-from typing import Dict, Any, Callable, Optional, List, Tuple, Union
+from typing import Dict, Any, Callable, Optional, List, Set, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
+from .hooks import HookStage
+from .journal import UNSET
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,6 +41,7 @@ class PuzzleStep:
     required_objects: List[str] = field(default_factory=list)  # Objects needed in inventory
     required_room: Optional[str] = None  # Specific room requirement
     required_flags: List[str] = field(default_factory=list)  # Game flags that must be set
+    trigger_verbs: List[str] = field(default_factory=list)  # Parser verbs that can trigger it (empty = any)
     score_reward: int = 0
     completion_message: str = ""
     failure_message: str = ""
@@ -74,6 +85,10 @@ class Puzzle:
         return False
 
 
+# Trigger index key: (required_room, verb); None stands for any room / any verb
+TriggerKey = Tuple[Optional[str], Optional[str]]
+
+
 class PuzzleManager:
     """Manages all puzzles and their states in the game."""
     
@@ -83,10 +98,18 @@ class PuzzleManager:
         self.global_flags: Dict[str, Any] = {}  # Game-wide puzzle flags
         self.completed_puzzles: List[str] = []
         self.total_puzzle_score = 0
+        self.trigger_checks = 0  # Trigger conditions evaluated (for profiling)
+        self._trigger_index: Dict[TriggerKey, Dict[str, PuzzleStep]] = {}  # key -> puzzle_id -> current step
+        self._index_keys: Dict[str, List[TriggerKey]] = {}  # puzzle_id -> keys it is indexed under
+        self._flag_waiters: Dict[str, Set[str]] = {}  # flag -> puzzles whose current step requires it
+        self._puzzle_order: Dict[str, int] = {}  # Registration order, so triggers fire in a stable order
+        self.journal = None  # UndoJournal of the engine (set by the engine)
         
     def register_puzzle(self, puzzle: Puzzle) -> None:
         """Register a new puzzle."""
         self.puzzles[puzzle.id] = puzzle
+        self._puzzle_order.setdefault(puzzle.id, len(self._puzzle_order))
+        self._index_puzzle(puzzle)
         logger.info(f"Registered puzzle: {puzzle.name} ({puzzle.id})")
         
     def get_puzzle(self, puzzle_id: str) -> Optional[Puzzle]:
@@ -95,8 +118,23 @@ class PuzzleManager:
         
     def set_flag(self, flag_name: str, value: Any = True) -> None:
         """Set a global puzzle flag."""
+        was_set = bool(self.global_flags.get(flag_name))
+        if self.journal is not None:
+            self.journal.record(self._restore_flag, flag_name, self.global_flags.get(flag_name, UNSET))
         self.global_flags[flag_name] = value
         logger.debug(f"Set puzzle flag: {flag_name} = {value}")
+        if was_set != bool(value):
+            # Steps gated on this flag may have become (un)triggerable
+            for puzzle_id in list(self._flag_waiters.get(flag_name, ())):
+                self._index_puzzle(self.puzzles[puzzle_id])
+        
+    def _restore_flag(self, flag_name: str, value: Any) -> None:
+        """Put back a flag's earlier value (UNSET: it wasn't set)."""
+        if value is UNSET:
+            self.set_flag(flag_name, False)
+            del self.global_flags[flag_name]
+        else:
+            self.set_flag(flag_name, value)
         
     def get_flag(self, flag_name: str, default: Any = False) -> Any:
         """Get a global puzzle flag value."""
@@ -105,6 +143,57 @@ class PuzzleManager:
     def check_flag(self, flag_name: str) -> bool:
         """Check if a flag is set (truthy)."""
         return bool(self.get_flag(flag_name))
+    
+    def _unindex_puzzle(self, puzzle_id: str) -> None:
+        """Remove a puzzle from the trigger index and its flag subscriptions."""
+        for key in self._index_keys.pop(puzzle_id, ()):
+            bucket = self._trigger_index.get(key)
+            if bucket is not None:
+                bucket.pop(puzzle_id, None)
+                if not bucket:
+                    del self._trigger_index[key]
+        for waiters in self._flag_waiters.values():
+            waiters.discard(puzzle_id)
+    
+    def _index_puzzle(self, puzzle: Puzzle) -> None:
+        """Index the current step of a puzzle (called whenever the puzzle changes)."""
+        self._unindex_puzzle(puzzle.id)
+        if puzzle.is_complete() or puzzle.is_failed():
+            return
+        step = puzzle.get_current_step()
+        if not step:
+            return
+        
+        for flag in step.required_flags:
+            self._flag_waiters.setdefault(flag, set()).add(puzzle.id)
+        if not all(self.check_flag(flag) for flag in step.required_flags):
+            return  # Waiting for set_flag()
+        
+        keys = [(step.required_room, verb) for verb in (step.trigger_verbs or [None])]
+        for key in keys:
+            self._trigger_index.setdefault(key, {})[puzzle.id] = step
+        self._index_keys[puzzle.id] = keys
+    
+    def rebuild_index(self) -> None:
+        """Re-index every puzzle (after puzzles or flags were changed directly)."""
+        self._trigger_index.clear()
+        self._index_keys.clear()
+        self._flag_waiters.clear()
+        for puzzle in self.puzzles.values():
+            self._index_puzzle(puzzle)
+    
+    def get_trigger_candidates(self, command_verb: str, room_id: Optional[str]) -> List[Tuple[Puzzle, PuzzleStep]]:
+        """Current steps that a command in room_id could trigger, in registration order."""
+        index = self._trigger_index
+        found: Dict[str, PuzzleStep] = {}
+        for key in ((room_id, command_verb), (room_id, None), (None, command_verb), (None, None)):
+            bucket = index.get(key)
+            if bucket:
+                found.update(bucket)
+        if not found:
+            return []
+        order = self._puzzle_order
+        return [(self.puzzles[puzzle_id], found[puzzle_id]) for puzzle_id in sorted(found, key=order.__getitem__)]
         
     def attempt_puzzle_action(self, command_verb: str, target_object: str = None, 
                             target_room: str = None, **kwargs) -> Tuple[bool, str]:
@@ -115,19 +204,17 @@ class PuzzleManager:
         triggered_any = False
         result_message = ""
         
-        # Check all active puzzles for potential triggers
-        for puzzle in self.puzzles.values():
-            if puzzle.is_complete() or puzzle.is_failed():
-                continue
-                
-            current_step = puzzle.get_current_step()
-            if not current_step:
-                continue
+        # Only the active steps indexed under this room and verb can fire
+        candidates = self.get_trigger_candidates(command_verb, self.game.player.current_room)
+        for puzzle, current_step in candidates:
+            if puzzle.is_complete() or puzzle.is_failed() or puzzle.get_current_step() is not current_step:
+                continue  # Changed behind the manager's back; rebuild_index() picks it up
                 
             # Check if this command could trigger the current step
             if self._can_trigger_step(puzzle, current_step, command_verb, 
                                     target_object, target_room, **kwargs):
                 success, message = self._execute_puzzle_step(puzzle, current_step, **kwargs)
+                self._index_puzzle(puzzle)
                 if success:
                     triggered_any = True
                     if message:
@@ -147,9 +234,8 @@ class PuzzleManager:
                 return False
                 
         # Check required objects in inventory
-        player_inventory = set(self.game.player.inventory)
-        required_objects = set(step.required_objects)
-        if not required_objects.issubset(player_inventory):
+        player_inventory = self.game.player.inventory
+        if not all(obj_id in player_inventory for obj_id in step.required_objects):
             return False
             
         # Check required flags
@@ -158,6 +244,7 @@ class PuzzleManager:
                 return False
                 
         # Execute the step's trigger condition
+        self.trigger_checks += 1
         try:
             return step.trigger_condition(
                 game=self.game,
@@ -173,6 +260,9 @@ class PuzzleManager:
             
     def _execute_puzzle_step(self, puzzle: Puzzle, step: PuzzleStep, **kwargs) -> Tuple[bool, str]:
         """Execute a puzzle step action."""
+        if self.journal is not None:
+            self.journal.record(self._restore_progress, puzzle, puzzle.state, puzzle.current_step,
+                                puzzle.total_score, len(self.completed_puzzles), self.total_puzzle_score)
         try:
             # Execute the step action
             result = step.action(
@@ -207,6 +297,16 @@ class PuzzleManager:
             puzzle.state = PuzzleState.FAILED
             return False, step.failure_message or "Something went wrong."
             
+    def _restore_progress(self, puzzle: Puzzle, state: PuzzleState, current_step: int, score: int,
+                          completed: int, total_score: int) -> None:
+        """Put a puzzle back where it was before a step ran (for UNDO)."""
+        puzzle.state = state
+        puzzle.current_step = current_step
+        puzzle.total_score = score
+        del self.completed_puzzles[completed:]
+        self.total_puzzle_score = total_score
+        self._index_puzzle(puzzle)
+            
     def get_puzzle_status(self) -> Dict[str, Any]:
         """Get status of all puzzles for debugging/save games."""
         return {
@@ -236,6 +336,8 @@ class PuzzleManager:
                 puzzle.state = PuzzleState(data["state"])
                 puzzle.current_step = data["current_step"]
                 puzzle.total_score = data["score"]
+        
+        self.rebuild_index()
 
 
 # ============================================================================
@@ -262,7 +364,7 @@ def _create_mailbox_puzzle() -> Puzzle:
         return (command_verb == "open" and 
                 target_object and 
                 target_object.lower() in ["mailbox", "box"] and
-                "MAILBOX" in game.object_manager.get_all_objects())
+                "MAILBOX" in game.object_manager.objects)
     
     def open_mailbox_action(game, puzzle_manager, **kwargs):
         # Mailbox opening is handled by normal game mechanics
@@ -277,7 +379,8 @@ def _create_mailbox_puzzle() -> Puzzle:
         action=open_mailbox_action,
         score_reward=5,
         completion_message="You have opened the mailbox! Welcome to Zork!",
-        required_room="SHOUS"  # South of House
+        required_room="SHOUS",  # South of House
+        trigger_verbs=["open"]
     )
     
     return Puzzle(
@@ -316,6 +419,7 @@ def _create_grate_key_puzzle() -> Puzzle:
             command_verb == "take" and target_object and "key" in target_object.lower()
         ),
         action=lambda **kwargs: True,
+        trigger_verbs=["take"],
         score_reward=5,
         completion_message="The keys might be useful for unlocking something..."
     )
@@ -328,6 +432,7 @@ def _create_grate_key_puzzle() -> Puzzle:
         action=unlock_grate_action,
         required_objects=["KEYS"],
         required_room="MGRAT",
+        trigger_verbs=["unlock"],
         score_reward=10,
         completion_message="The grate creaks open, revealing a dark passage below!",
         failure_message="The grate won't budge."
@@ -374,6 +479,7 @@ def _create_dam_control_puzzle() -> Puzzle:
         trigger_condition=turn_bolt_trigger,
         action=turn_bolt_action,
         required_room="DAM_CONTROL",
+        trigger_verbs=["turn", "push", "press"],
         score_reward=15,
         completion_message="The dam machinery rumbles as water levels change!",
         failure_message="Nothing seems to happen."
@@ -419,6 +525,7 @@ def _create_treasure_collection_puzzle() -> Puzzle:
         description="Collect valuable treasures throughout the game",
         trigger_condition=treasure_taken_trigger,
         action=treasure_taken_action,
+        trigger_verbs=["take"],
         score_reward=0,  # Variable based on treasure
         completion_message="You have collected a valuable treasure!"
     )
@@ -442,32 +549,22 @@ def integrate_puzzles_into_game(game_engine):
     # Create and attach puzzle manager
     game_engine.puzzle_manager = create_authentic_zork_puzzles(game_engine)
     
-    # Store original command processor for chaining
-    original_process_command = game_engine._process_command
+    # Check puzzle triggers before normal processing, using the turn's parsed command
+    game_engine.hooks.register(HookStage.PRE_DISPATCH, _check_puzzle_triggers, name="puzzles")
     
-    def enhanced_process_command(user_input: str):
-        """Enhanced command processor that checks for puzzle triggers."""
-        
-        # Parse the command
-        command = game_engine.parser.parse(user_input)
-        
-        # Check if this command triggers any puzzles (before normal processing)
-        if command:
-            triggered, message = game_engine.puzzle_manager.attempt_puzzle_action(
-                command_verb=command.verb,
-                target_object=command.noun,
-                target_room=game_engine.player.current_room,
-                user_input=user_input,
-                command=command
-            )
-            
-            if triggered and message:
-                print(message)
-        
-        # Continue with normal command processing
-        return original_process_command(user_input)
-    
-    # Replace the command processor
-    game_engine._process_command = enhanced_process_command
+    return game_engine.puzzle_manager
+
+
+def _check_puzzle_triggers(game_engine, context) -> None:
+    """Pre-dispatch hook: let the command advance any puzzle it triggers."""
+    command = context.command
+    triggered, message = game_engine.puzzle_manager.attempt_puzzle_action(
+        command_verb=command.verb,
+        target_object=command.noun,
+        target_room=game_engine.player.current_room,
+        user_input=context.user_input,
+        command=command
+    )
     
-    return game_engine.puzzle_manager
\ No newline at end of file
+    if triggered and message:
+        game_engine.output.write(message)
@@ -7,7 +7,8 @@ from typing import List, Dict
 class ZorkResponses:
     """Collection of authentic Zork-style snarky responses."""
     
-    def __init__(self) -> None:
+    def __init__(self, rng=None) -> None:
+        self.rng = rng if rng is not None else random  # Picks between equivalent responses
         # Unknown command responses - CANONICAL ZORK RESPONSES
         # Based on original parser.mud and action files  
         self.unknown_commands = [
@@ -207,7 +208,7 @@ class ZorkResponses:
 
     def get_unknown_command_response(self, input_text: str = "") -> str:
         """Get a random response for unknown commands."""
-        response = random.choice(self.unknown_commands)
+        response = self.rng.choice(self.unknown_commands)
         if "{word}" in response and input_text:
             # Extract first word for the response
             first_word = input_text.split()[0] if input_text.split() else input_text
@@ -217,33 +218,33 @@ class ZorkResponses:
     def get_special_command_response(self, command: str) -> str:
         """Get response for special Easter egg commands."""
         if command.lower() in self.special_commands:
-            return random.choice(self.special_commands[command.lower()])
+            return self.rng.choice(self.special_commands[command.lower()])
         return self.get_unknown_command_response(command)
     
     def get_cant_go_response(self) -> str:
         """Get a random 'can't go that way' response."""
-        return random.choice(self.cant_go_responses)
+        return self.rng.choice(self.cant_go_responses)
     
     def get_dont_see_object_response(self, object_name: str) -> str:
         """Get a random 'don't see object' response."""
-        response = random.choice(self.dont_see_object)
+        response = self.rng.choice(self.dont_see_object)
         return response.replace("{object}", object_name)
     
     def get_cant_do_that_response(self) -> str:
         """Get a random 'can't do that' response."""
-        return random.choice(self.cant_do_that)
+        return self.rng.choice(self.cant_do_that)
     
     def get_inventory_response(self, response_type: str, object_name: str = "") -> str:
         """Get inventory-related responses."""
         if response_type in self.inventory_responses:
-            response = random.choice(self.inventory_responses[response_type])
+            response = self.rng.choice(self.inventory_responses[response_type])
             return response.replace("{object}", object_name)
         return "Something happened."
     
     def get_action_response(self, action_type: str, object_name: str = "") -> str:
         """Get action-specific responses."""
         if action_type in self.action_responses:
-            response = random.choice(self.action_responses[action_type])
+            response = self.rng.choice(self.action_responses[action_type])
             return response.replace("{object}", object_name)
         return "Something happened."
     
@@ -0,0 +1,285 @@
+"""
+Save Files - A full checkpoint followed by appended per-save deltas.
+
+Writing the whole game state as indented JSON on every save costs as much
+as the world is big, although the turns between two saves usually touch a
+handful of rooms and objects. A save file is instead a series of JSON
+lines:
+
+    header      fixed-width line: format, version, time, room, moves and
+                score for the RESTORE listing, and the delta count
+                (rewritten in place on every save)
+    checkpoint  the complete state from GameEngine._collect_game_state()
+    delta ...   one line per later save: the rooms, objects and NPCs
+                changed since the save before it, and any other section
+                (player, score, puzzles, RNG streams, ...) that differs
+
+Saving again to the file the engine last wrote or loaded appends a delta.
+Anything else (a new file, a file changed behind the engine's back, a
+delta chain longer than MAX_DELTAS or bigger than its checkpoint) writes
+a fresh checkpoint, which also compacts the file.
+
+Checkpoints are written to a temporary file that then replaces the save,
+so an existing save is never left half-written. Loading replays the
+deltas over the checkpoint; a delta cut short by a crash is ignored, so
+the game comes back as of the save before it. Files from before this
+format (one indented JSON object) still load.
+"""
+
+import datetime
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+SAVE_FORMAT = "zork-save"
+HEADER_SIZE = 256  # Bytes, including the newline; the header is padded to this width
+MAX_DELTAS = 32  # Deltas appended before a save writes a new checkpoint
+
+# Sections that map IDs to entries; a delta carries only the changed entries
+KEYED_SECTIONS = ("world_state", "object_state", "npc_state")
+
+# Sections describing the file rather than the game
+META_SECTIONS = ("version", "timestamp")
+
+_MAGIC = b'{"format": "' + SAVE_FORMAT.encode() + b'"'
+
+
+@dataclass
+class SaveHeader:
+    """What RESTORE lists about a save, and the bookkeeping for compaction."""
+    version: str
+    timestamp: str
+    room: str = ""  # Name of the player's room
+    moves: int = 0
+    score: int = 0
+    deltas: int = 0  # Deltas after the checkpoint
+    checkpoint_bytes: int = 0
+    delta_bytes: int = 0
+
+    def encode(self) -> bytes:
+        """The header line, padded with spaces to HEADER_SIZE."""
+        values = {"format": SAVE_FORMAT, **asdict(self)}
+        line = json.dumps(values, ensure_ascii=False).encode("utf-8")
+        while len(line) >= HEADER_SIZE and values["room"]:
+            values["room"] = values["room"][:len(values["room"]) // 2]  # Long room names are shortened
+            line = json.dumps(values, ensure_ascii=False).encode("utf-8")
+        return line.ljust(HEADER_SIZE - 1) + b"\n"
+
+    @classmethod
+    def decode(cls, line: bytes) -> Optional["SaveHeader"]:
+        """Parse a header line; None if it isn't one."""
+        if not line.startswith(_MAGIC):
+            return None
+        try:
+            values = json.loads(line)
+            values.pop("format")
+            return cls(**values)
+        except (ValueError, TypeError):
+            return cls(version="", timestamp="")  # Damaged while being rewritten; the save itself is fine
+
+
+@dataclass
+class ChangeSet:
+    """IDs of the rooms, objects and NPCs changed since some save."""
+    rooms: Set[str] = field(default_factory=set)
+    objects: Set[str] = field(default_factory=set)
+    npcs: Set[str] = field(default_factory=set)
+
+    def update(self, other: "ChangeSet") -> None:
+        self.rooms |= other.rooms
+        self.objects |= other.objects
+        self.npcs |= other.npcs
+
+    def clear(self) -> None:
+        self.rooms.clear()
+        self.objects.clear()
+        self.npcs.clear()
+
+
+@dataclass
+class SaveChain:
+    """The save file an engine last wrote or loaded, which its next save can append to."""
+    path: Path
+    header: SaveHeader
+    size: int  # File size after that write; any other size means someone else changed the file
+    fingerprints: Dict[str, bytes] = field(default_factory=dict)  # Unkeyed sections as written (see changed_sections)
+    pending: ChangeSet = field(default_factory=ChangeSet)  # Changed since that write
+
+    def can_append(self, path: Path) -> bool:
+        """True if a save to path can be a delta rather than a new checkpoint."""
+        header = self.header
+        if path != self.path or header.deltas >= MAX_DELTAS or header.delta_bytes >= header.checkpoint_bytes:
+            return False
+        try:
+            return path.stat().st_size == self.size
+        except OSError:
+            return False
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def sections_of(state: Dict[str, Any]) -> Dict[str, Any]:
+    """The unkeyed sections of a full game state (player, score, RNG, ...)."""
+    return {key: value for key, value in state.items() if key not in KEYED_SECTIONS and key not in META_SECTIONS}
+
+
+def fingerprints(sections: Dict[str, Any]) -> Dict[str, bytes]:
+    """
+    Serialized form of each unkeyed section, to tell later which changed.
+
+    Sections may share lists with the live game, so they are compared as
+    written rather than kept. Each RNG stream gets its own entry.
+    """
+    prints = {}
+    for key, value in sections.items():
+        if key == "rng_state" and isinstance(value, dict):
+            prints["rng_state"] = _dumps(value.get("seed"))
+            for name, stream in value.get("streams", {}).items():
+                prints[f"rng_state.{name}"] = _dumps(stream)
+        else:
+            prints[key] = _dumps(value)
+    return prints
+
+
+def changed_sections(saved: Dict[str, bytes], sections: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, bytes]]:
+    """
+    Unkeyed sections that differ from their fingerprints in saved.
+
+    Returns:
+        (the changed sections, fingerprints of all sections); a changed
+        rng_state carries only the streams that were drawn from
+    """
+    prints = fingerprints(sections)
+    changed = {}
+    for key, value in sections.items():
+        if key == "rng_state" and isinstance(value, dict):
+            streams = {name: stream for name, stream in value.get("streams", {}).items()
+                       if saved.get(f"rng_state.{name}") != prints[f"rng_state.{name}"]}
+            if streams or saved.get(key) != prints[key]:
+                changed[key] = {"seed": value.get("seed"), "streams": streams}
+        elif saved.get(key) != prints[key]:
+            changed[key] = value
+    return changed, prints
+
+
+def apply_delta(state: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    """Bring a full state up to date with one delta."""
+    for key, value in delta.items():
+        if key in KEYED_SECTIONS:
+            state.setdefault(key, {}).update(value)
+        elif key == "rng_state" and isinstance(state.get(key), dict):
+            state[key]["seed"] = value.get("seed", state[key].get("seed"))
+            state[key].setdefault("streams", {}).update(value.get("streams", {}))
+        else:
+            state[key] = value
+
+
+def new_header(version: str, room: str, moves: int, score: int) -> SaveHeader:
+    """Header for a save made now."""
+    return SaveHeader(version=version, timestamp=datetime.datetime.now().isoformat(),
+                      room=room, moves=moves, score=score)
+
+
+def write_checkpoint(path: Path, header: SaveHeader, state: Dict[str, Any]) -> SaveChain:
+    """
+    Write a file holding only a checkpoint of the full state.
+
+    The file is written beside the save under a temporary name, flushed to
+    disk and then moved over the save, so a crash leaves the old save whole.
+
+    Returns:
+        The chain later saves can append deltas to
+    """
+    body = _dumps(state) + b"\n"
+    header.deltas = 0
+    header.checkpoint_bytes = len(body)
+    header.delta_bytes = 0
+    temp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(header.encode())
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
+    return SaveChain(path, header, HEADER_SIZE + len(body), fingerprints(sections_of(state)))
+
+
+def append_delta(chain: SaveChain, header: SaveHeader, delta: Dict[str, Any], prints: Dict[str, bytes]) -> None:
+    """
+    Append a delta to a chain's file and update its header.
+
+    The delta line goes first, so a crash part-way leaves either the
+    earlier file or a torn last line that loading ignores.
+
+    Args:
+        chain: Chain to extend (updated in place)
+        header: Header for this save; its counts are carried on from the chain's
+        delta: Changed entries and sections
+        prints: Fingerprints of every unkeyed section as of this save
+    """
+    line = _dumps(delta) + b"\n"
+    header.deltas = chain.header.deltas + 1
+    header.checkpoint_bytes = chain.header.checkpoint_bytes
+    header.delta_bytes = chain.header.delta_bytes + len(line)
+    with open(chain.path, "r+b") as f:
+        f.seek(chain.size)
+        f.write(line)
+        f.truncate()
+        f.flush()
+        f.seek(0)
+        f.write(header.encode())
+    chain.header = header
+    chain.size += len(line)
+    chain.fingerprints = prints
+
+
+def read_header(path: Path) -> Optional[SaveHeader]:
+    """Read just the header of a save file (None for older files or unreadable ones)."""
+    try:
+        with open(path, "rb") as f:
+            return SaveHeader.decode(f.read(HEADER_SIZE))
+    except OSError:
+        return None
+
+
+def read_save(path: Path) -> Tuple[Dict[str, Any], Optional[SaveChain]]:
+    """
+    Read a save file.
+
+    Returns:
+        (full game state with every delta applied, chain the next save can
+        append to); the chain is None for older whole-JSON saves
+
+    Raises:
+        json.JSONDecodeError: If the checkpoint (or an older save) isn't valid JSON
+    """
+    with open(path, "rb") as f:
+        first = f.readline()
+        header = SaveHeader.decode(first)
+        if header is None:
+            return json.loads(first + f.read()), None
+        state = json.loads(f.readline())
+        size = f.tell()
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # Torn by a crash while appending
+            try:
+                delta = json.loads(line)
+            except ValueError:
+                break
+            if not isinstance(delta, dict):
+                break
+            apply_delta(state, delta)
+            size += len(line)
+    return state, SaveChain(path, header, size, fingerprints(sections_of(state)))
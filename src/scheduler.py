@@ -0,0 +1,164 @@
+"""
+Turn Scheduler - Game-clock events for NPCs and timed objects.
+
+The game clock is the move counter: it advances only when the player does
+something that takes a move, so NPC behavior is the same whether commands
+arrive from a person typing or from a script at full speed.
+
+Events are (due_turn, npc_id, action) entries in a priority queue. Each
+turn the engine calls advance() with the current move count and only the
+events that are due are popped and run; nothing polls idle NPCs.
+
+Actions are registered by name (register_action) and events refer to
+them by name, so the queue itself is plain data that saves with the game.
+An action handler is called as handler(game_engine, event) and may return
+a number of turns to run the event again after; otherwise periodic events
+repeat after their interval and one-shot events are done. A handler stops
+a periodic event by setting event.cancelled.
+"""
+
+import heapq
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# handler(game_engine, event) -> turns until it runs again, or None
+ActionHandler = Callable[[Any, "ScheduledEvent"], Optional[int]]
+
+
+@dataclass(order=True)
+class ScheduledEvent:
+    """One queued action."""
+    due_turn: int
+    sequence: int  # Events due on the same turn run in the order they were scheduled
+    npc_id: str = field(compare=False)  # NPC (or object, e.g. a lamp) the event belongs to
+    action: str = field(compare=False)
+    interval: Optional[int] = field(default=None, compare=False)  # Repeat every N turns (None = one-shot)
+    cancelled: bool = field(default=False, compare=False)
+
+
+class TurnScheduler:
+    """Priority queue of game-clock events keyed by (npc_id, action)."""
+
+    def __init__(self) -> None:
+        self.current_turn = 0
+        self.handlers: Dict[str, ActionHandler] = {}
+        self.events_run = 0
+        self._queue: List[ScheduledEvent] = []
+        self._events: Dict[Tuple[str, str], ScheduledEvent] = {}  # Live event per (npc_id, action)
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        """Number of pending events."""
+        return len(self._events)
+
+    def register_action(self, action: str, handler: ActionHandler) -> None:
+        """Make action runnable by events."""
+        self.handlers[action] = handler
+
+    def schedule(self, npc_id: str, action: str, delay: int = 1,
+                 interval: Optional[int] = None) -> ScheduledEvent:
+        """
+        Queue an action, replacing any pending event with the same npc_id and action.
+
+        Args:
+            npc_id: Owner of the event
+            action: Registered action name
+            delay: Turns from now until it is due (at least 1)
+            interval: Repeat every interval turns after that (None = run once)
+
+        Returns:
+            The queued event
+        """
+        if interval is not None and interval < 1:
+            raise ValueError(f"Event interval must be at least 1 turn, got {interval}")
+        return self._push(npc_id, action, self.current_turn + max(1, delay), interval)
+
+    def _push(self, npc_id: str, action: str, due_turn: int, interval: Optional[int]) -> ScheduledEvent:
+        self.cancel(npc_id, action)
+        self._sequence += 1
+        event = ScheduledEvent(due_turn, self._sequence, npc_id, action, interval)
+        heapq.heappush(self._queue, event)
+        self._events[(npc_id, action)] = event
+        return event
+
+    def cancel(self, npc_id: str, action: str) -> bool:
+        """Drop a pending event. Returns True if there was one."""
+        event = self._events.pop((npc_id, action), None)
+        if event is None:
+            return False
+        event.cancelled = True  # Left in the heap and skipped when popped
+        return True
+
+    def cancel_all(self, npc_id: str) -> int:
+        """Drop every pending event of an NPC. Returns the number dropped."""
+        keys = [key for key in self._events if key[0] == npc_id]
+        for npc, action in keys:
+            self.cancel(npc, action)
+        return len(keys)
+
+    def get_event(self, npc_id: str, action: str) -> Optional[ScheduledEvent]:
+        """The pending event for (npc_id, action), if any."""
+        return self._events.get((npc_id, action))
+
+    def turns_until(self, npc_id: str, action: str) -> Optional[int]:
+        """Turns left before an event is due (None if not scheduled)."""
+        event = self._events.get((npc_id, action))
+        return None if event is None else max(0, event.due_turn - self.current_turn)
+
+    def advance(self, turn: int, game_engine: Any) -> int:
+        """
+        Move the clock to turn and run every event due by then, earliest first.
+
+        Returns:
+            Number of events run
+        """
+        self.current_turn = max(self.current_turn, turn)
+        queue = self._queue
+        ran = 0
+        while queue and queue[0].due_turn <= self.current_turn:
+            event = heapq.heappop(queue)
+            if event.cancelled:
+                continue
+            del self._events[(event.npc_id, event.action)]
+            handler = self.handlers.get(event.action)
+            if handler is None:
+                logger.warning(f"No handler for scheduled action {event.action!r} ({event.npc_id})")
+                continue
+
+            delay = handler(game_engine, event)
+            ran += 1
+            if event.cancelled or (event.npc_id, event.action) in self._events:
+                continue  # Stopped, or the handler scheduled a replacement itself
+            if delay is None:
+                delay = event.interval
+            if delay is not None:
+                self._push(event.npc_id, event.action, self.current_turn + max(1, delay), event.interval)
+        self.events_run += ran
+        return ran
+
+    def pending(self) -> List[ScheduledEvent]:
+        """Pending events in the order they will run."""
+        return sorted(self._events.values())
+
+    def clear(self) -> None:
+        """Drop every event (registered actions are kept)."""
+        self._queue.clear()
+        self._events.clear()
+
+    def get_state(self) -> Dict[str, Any]:
+        """JSON-safe snapshot of the clock and queue."""
+        return {
+            "turn": self.current_turn,
+            "events": [[event.due_turn, event.npc_id, event.action, event.interval]
+                       for event in self.pending()],
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """Replace the clock and queue with a get_state() snapshot."""
+        self.clear()
+        self.current_turn = int(state.get("turn", 0))
+        for due_turn, npc_id, action, interval in state.get("events", []):
+            self._push(npc_id, action, int(due_turn), interval)
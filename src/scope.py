@@ -0,0 +1,123 @@
+"""
+Per-turn Scope Cache
+
+Computes what the player can reach (room items, inventory and the contents
+of open containers in either) once, and reuses it until the world changes.
+Staleness is detected with the world mutation version kept by the object
+manager's ContainmentIndex, plus the player's room and the identity of the
+room item and inventory lists (which a restore may replace wholesale).
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .entities.objects import GameObject
+
+
+@dataclass
+class Scope:
+    """Snapshot of the player's surroundings for one world version."""
+    # Objects reachable for noun resolution, in lookup order (room first, then inventory)
+    reachable: List[GameObject] = field(default_factory=list)
+    # Objects reachable when only the inventory counts (e.g. drop)
+    inventory: List[GameObject] = field(default_factory=list)
+    has_light: bool = False  # A lit light source is in the room or inventory
+    # Bulk action candidates keyed by (verb, bulk_type)
+    bulk_candidates: Dict[Tuple[str, str], List[GameObject]] = field(default_factory=dict)
+
+
+class ScopeCache:
+    """Caches the player's Scope and counts hits and misses per command verb."""
+
+    def __init__(self, game_engine) -> None:
+        self.game_engine = game_engine
+        self.current_verb = "(none)"  # Verb whose lookups are being counted
+        self.stats: Dict[str, List[int]] = {}  # verb -> [hits, misses]
+        self._scope: Optional[Scope] = None
+        self._key: Tuple = ()
+
+    def get(self) -> Scope:
+        """Return the current scope, recomputing it only if the world changed."""
+        engine = self.game_engine
+        object_manager = engine.object_manager
+        room = engine.world.peek_room(engine.player.current_room)  # Read only: a session doesn't copy it
+        room_items = room.items if room else None
+        inventory = engine.player.inventory
+        version = object_manager.containment.version
+
+        counts = self.stats.setdefault(self.current_verb, [0, 0])
+        if self._scope is not None:
+            cached_manager, cached_version, cached_room, cached_items, cached_inventory = self._key
+            if (cached_version == version and cached_manager is object_manager and cached_room is room
+                    and cached_items is room_items and cached_inventory is inventory):
+                counts[0] += 1
+                return self._scope
+
+        counts[1] += 1
+        self._scope = self._compute(room)
+        self._key = (object_manager, version, room, room_items, inventory)
+        return self._scope
+
+    def invalidate(self) -> None:
+        """Drop the cached scope."""
+        self._scope = None
+        self._key = ()
+
+    def reset_stats(self) -> None:
+        """Clear hit/miss counters."""
+        self.stats.clear()
+
+    def _compute(self, current_room) -> Scope:
+        """Walk the room, inventory and open containers once."""
+        get_object = self.game_engine.object_manager.get_object
+        scope = Scope()
+        inventory_objects = [obj for obj in map(get_object, self.game_engine.player.inventory) if obj]
+        room_objects = [obj for obj in map(get_object, current_room.items) if obj] if current_room else []
+
+        # Noun resolution order: each item followed by the contents of it if it's an open container
+        for holder_list in (room_objects, inventory_objects):
+            for obj in holder_list:
+                if not obj.is_bulk_action():
+                    scope.reachable.append(obj)
+                if obj.is_container() and obj.is_open():
+                    scope.reachable.extend(self._open_contents(obj))
+        scope.inventory = [obj for obj in inventory_objects if not obj.is_bulk_action()]
+
+        scope.has_light = any(obj.is_lit() for obj in inventory_objects) or \
+            any(obj.is_lit() for obj in room_objects)
+
+        # Bulk candidates (TAKE ALL / TAKE VALUABLES / DROP ALL / DROP VALUABLES / POSSESSIONS)
+        take_all = [obj for obj in room_objects if obj.is_takeable() and not obj.is_bulk_action()]
+        for container in room_objects:
+            if container.is_container() and container.is_open():
+                take_all.extend(obj for obj in self._open_contents(container) if obj.is_takeable())
+        carried = scope.inventory
+        scope.bulk_candidates = {
+            ("take", "all"): take_all,
+            ("drop", "all"): carried,
+            ("take", "valuables"): [obj for obj in room_objects
+                                    if obj.is_takeable() and obj.get_attribute("treasure_value", 0) > 0],
+            ("drop", "valuables"): [obj for obj in inventory_objects
+                                    if obj.get_attribute("treasure_value", 0) > 0],
+            ("take", "possessions"): carried,
+            ("drop", "possessions"): carried,
+        }
+        return scope
+
+    def _open_contents(self, container: GameObject) -> List[GameObject]:
+        """Objects inside an open container."""
+        get_object = self.game_engine.object_manager.get_object
+        return [obj for obj in map(get_object, container.get_contents()) if obj]
+
+    def get_bulk_candidates(self, verb: str, bulk_type: str) -> List[GameObject]:
+        """Candidates for a bulk action (a fresh list the caller may trim)."""
+        return list(self.get().bulk_candidates.get((verb, bulk_type), []))
+
+    def format_stats(self) -> List[str]:
+        """Human-readable hit/miss counts per verb."""
+        lines = []
+        for verb, (hits, misses) in sorted(self.stats.items()):
+            total = hits + misses
+            rate = hits / total * 100 if total else 0.0
+            lines.append(f"  {verb:<12} hits {hits:>5}  misses {misses:>5}  ({rate:.0f}% hit)")
+        return lines
@@ -48,6 +48,7 @@ class ScoreManager:
         self.achievement_scores: Dict[str, int] = {}
         self.moves: int = 0
         self.raw_score: int = 0
+        self.journal = None  # UndoJournal of the engine (set by the engine)
         
     def _create_canonical_treasures(self) -> Dict[str, TreasureScore]:
         """Create treasures with authentic OFVAL/OTVAL values from original Zork."""
@@ -89,6 +90,7 @@ class ScoreManager:
         """Award OFVAL points for finding a treasure. Returns points awarded."""
         treasure_id = treasure_id.upper()
         if treasure_id in self.treasures and not self.treasures[treasure_id].found:
+            self._record(setattr, self.treasures[treasure_id], "found", False)
             self.treasures[treasure_id].found = True
             return self.treasures[treasure_id].ofval
         return 0
@@ -97,18 +99,31 @@ class ScoreManager:
         """Award OTVAL points for depositing treasure in trophy case. Returns points awarded.""" 
         treasure_id = treasure_id.upper()
         if treasure_id in self.treasures and not self.treasures[treasure_id].deposited:
+            self._record(setattr, self.treasures[treasure_id], "deposited", False)
             self.treasures[treasure_id].deposited = True
             return self.treasures[treasure_id].otval
         return 0
     
     def add_achievement(self, achievement_id: str, points: int) -> None:
         """Add achievement-based score (like lighting shaft, solving puzzles)."""
+        if achievement_id in self.achievement_scores:
+            self._record(self.achievement_scores.__setitem__, achievement_id,
+                         self.achievement_scores[achievement_id])
+        else:
+            self._record(self.achievement_scores.pop, achievement_id)
         self.achievement_scores[achievement_id] = points
     
     def increment_moves(self) -> None:
         """Increment move counter."""
+        if self.journal is not None:
+            self.journal.note(setattr, self, "moves", self.moves)  # Every turn moves; not undoable alone
         self.moves += 1
     
+    def _record(self, undo, *args) -> None:
+        """Pass the journal how to reverse a score change (ignored without a journal)."""
+        if self.journal is not None:
+            self.journal.record(undo, *args)
+    
     def get_rank(self) -> ScoreRank:
         """Get player ranking based on score percentage (from original rooms.mud)."""
         pct = self.percentage
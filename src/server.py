@@ -0,0 +1,335 @@
+"""
+Game Server - Many concurrent games in one process.
+
+An asyncio server that hosts one GameEngine per connection over TCP or a
+Unix socket. The protocol is plain lines: the client sends a command
+terminated by a newline, and the server answers with the turn's text
+followed by the prompt ("> ", with no newline). On connect the server sends
+the welcome and the first room description, then the prompt. A line may
+chain commands ("take lamp. n"), as in the terminal game.
+
+Engines are synchronous, so every command runs on a worker thread. The
+event loop only moves lines and text, and a command that runs longer than
+the timeout is answered with a notice instead of holding the connection.
+The session's next command waits until that command is done. Each session
+buffers its own output (a MemorySink drained on the event loop), so engines
+never touch the connection.
+
+By default every session forks from one shared base world built at start
+(see src/sessions.py), so a session costs only the rooms and objects it
+has changed rather than a whole world.
+
+Each session keeps its saves, both the player's own and the eviction
+save, in a directory of its own under saves/sessions, so SAVE and RESTORE
+never reach another player's games. Sessions idle longer than the idle
+timeout are saved there with the engine's own save_game and dropped from
+memory. The next command rebuilds the engine and restores it with
+load_game. The directory is deleted when the connection closes.
+"""
+
+import asyncio
+import logging
+import shutil
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set
+
+from .batch import EngineOptions, ScriptRunner
+from .game import GameEngine
+from .output import MemorySink, OutputChannel
+from .sessions import WorldBase
+
+logger = logging.getLogger(__name__)
+
+PROMPT = "> "
+ENCODING = "utf-8"
+MAX_LINE_BYTES = 4096  # Longer input lines close the connection
+SESSION_SAVE_DIR = Path("saves") / "sessions"  # One directory per session below this
+SESSION_SAVE_PREFIX = "session_"
+TIMEOUT_MESSAGE = "That is taking too long. Your command will finish in the background.\n"
+
+
+@dataclass
+class ServerOptions:
+    """Where to listen and how to run sessions."""
+    host: str = "127.0.0.1"
+    port: int = 4000  # 0 = pick a free port
+    unix_path: Optional[str] = None  # Listen on a Unix socket instead of TCP
+    command_timeout: float = 5.0  # Seconds before a command is answered with TIMEOUT_MESSAGE
+    idle_timeout: float = 300.0  # Seconds without input before a session is saved to disk and unloaded
+    workers: Optional[int] = None  # Engine threads (None = ThreadPoolExecutor default)
+    shared_world: bool = True  # Fork sessions from one base world instead of building a world each
+    engine: EngineOptions = field(default_factory=EngineOptions)
+
+
+@dataclass
+class ServerStats:
+    """Counters for the whole server."""
+    sessions_opened: int = 0
+    turns: int = 0
+    timeouts: int = 0
+    evictions: int = 0
+    restores: int = 0
+
+
+class Session:
+    """One connection's game."""
+
+    def __init__(self) -> None:
+        self.id = uuid.uuid4().hex[:12]
+        self.sink = MemorySink()
+        self.engine: Optional[GameEngine] = None  # None while evicted to disk
+        self.evicted = False
+        self.last_active = time.monotonic()
+        self.turns = 0
+        self.lock = asyncio.Lock()  # One engine call at a time
+        self.overdue: Optional[Future] = None  # Call that timed out; its output goes out with the next turn
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    @property
+    def save_dir(self) -> Path:
+        """Directory holding this session's saves."""
+        return SESSION_SAVE_DIR / self.id
+
+    @property
+    def save_name(self) -> str:
+        """Save file used while the session is evicted."""
+        return f"{SESSION_SAVE_PREFIX}{self.id}.json"
+
+    @property
+    def busy(self) -> bool:
+        return self.lock.locked() or self.overdue is not None
+
+    def drain(self) -> str:
+        """Text the engine wrote since the last drain."""
+        text = self.sink.getvalue()
+        self.sink.clear()
+        return text
+
+
+class GameServer:
+    """Hosts a GameEngine per connection."""
+
+    def __init__(self, options: Optional[ServerOptions] = None) -> None:
+        self.options = options or ServerOptions()
+        self.sessions: Dict[str, Session] = {}
+        self.stats = ServerStats()
+        self._runner = ScriptRunner(self.options.engine)
+        self._executor = ThreadPoolExecutor(max_workers=self.options.workers, thread_name_prefix="session")
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._evictor: Optional[asyncio.Task] = None
+        self._connections: Set[asyncio.Task] = set()
+        self._world_base: Optional[WorldBase] = None
+
+    async def start(self) -> "GameServer":
+        """Start listening and evicting idle sessions."""
+        options = self.options
+        if options.shared_world and self._world_base is None:
+            loop = asyncio.get_running_loop()
+            self._world_base = await loop.run_in_executor(self._executor, self._runner.build_world_base)
+        if options.unix_path:
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=options.unix_path,
+                                                           limit=MAX_LINE_BYTES)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, options.host, options.port,
+                                                      limit=MAX_LINE_BYTES)
+        self._evictor = asyncio.create_task(self._evict_idle_sessions())
+        logger.info(f"Game server listening on {self.address}")
+        return self
+
+    @property
+    def address(self) -> Any:
+        """(host, port) for TCP, or the socket path."""
+        if self._server is None or not self._server.sockets:
+            return None
+        return self._server.sockets[0].getsockname()
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening, end every session and remove their save files."""
+        if self._evictor is not None:
+            self._evictor.cancel()
+        if self._server is not None:
+            self._server.close()
+        # Hang up on every client so their connection handlers finish normally
+        for session in list(self.sessions.values()):
+            if session.writer is not None:
+                session.writer.close()
+        if self._connections:
+            await asyncio.gather(*self._connections, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+        self._executor.shutdown(wait=False)
+
+    # ----- Connections -----
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        session = Session()
+        session.writer = writer
+        self.sessions[session.id] = session
+        self.stats.sessions_opened += 1
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            async with session.lock:
+                text = await self._call(session, self._open_session, session)
+            await self._send(writer, text + PROMPT)
+
+            while session.engine is None or session.engine.running:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    await self._send(writer, "Input line too long.\n")
+                    break
+                if not line:
+                    break  # Client went away
+                command = line.decode(ENCODING, errors="replace").strip()
+                session.last_active = time.monotonic()
+                if not command:
+                    await self._send(writer, PROMPT)
+                    continue
+
+                async with session.lock:
+                    text = await self._overdue_output(session)
+                    text += await self._call(session, self._play, session, command)
+                session.last_active = time.monotonic()
+                ended = session.engine is not None and not session.engine.running
+                await self._send(writer, text if ended else text + PROMPT)
+        except ConnectionError:
+            pass
+        except Exception as e:
+            logger.warning(f"Session {session.id} failed: {type(e).__name__}: {e}")
+        finally:
+            self._connections.discard(task)
+            self._end_session(session)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, text: str) -> None:
+        writer.write(text.encode(ENCODING))
+        await writer.drain()
+
+    async def _call(self, session: Session, function: Callable[..., str], *args) -> str:
+        """Run an engine call on a worker thread, giving up waiting after the command timeout."""
+        future = self._executor.submit(function, *args)
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)),
+                                          self.options.command_timeout)
+        except asyncio.TimeoutError:
+            session.overdue = future
+            self.stats.timeouts += 1
+            logger.warning(f"Session {session.id}: command timed out after {self.options.command_timeout}s")
+            return TIMEOUT_MESSAGE
+
+    @staticmethod
+    async def _overdue_output(session: Session) -> str:
+        """Output of a call that timed out earlier, waiting for it to finish if it still runs."""
+        future, session.overdue = session.overdue, None
+        if future is None:
+            return ""
+        result = await asyncio.wrap_future(future)
+        return result if isinstance(result, str) else ""
+
+    def _end_session(self, session: Session) -> None:
+        """Forget a session and delete its saves (no later connection can reach them)."""
+        self.sessions.pop(session.id, None)
+        shutil.rmtree(session.save_dir, ignore_errors=True)
+        session.engine = None
+
+    # ----- Engine calls (worker threads) -----
+
+    def _build_engine(self, session: Session) -> GameEngine:
+        engine = self._runner.build_engine(OutputChannel([session.sink]), self._world_base)
+        engine.saves_dir = session.save_dir
+        # A network player leaves by disconnecting, so "quit" needs no confirmation line
+        engine.read_input = lambda prompt: "y"
+        return engine
+
+    def _open_session(self, session: Session) -> str:
+        """Build the engine and return the opening text."""
+        engine = session.engine = self._build_engine(session)
+        session.drain()  # Drop world-building chatter
+        engine.output.begin_turn()
+        engine._show_welcome()
+        engine._look_around()
+        engine.output.end_turn()
+        return session.drain()
+
+    def _play(self, session: Session, command: str) -> str:
+        """Run one input line (restoring the session first if it was evicted)."""
+        if session.engine is None:
+            self._restore(session)
+        session.engine._process_input(command)
+        session.turns += 1
+        self.stats.turns += 1
+        return session.drain()
+
+    def _evict(self, session: Session) -> bool:
+        """Save the session to disk and drop its engine. Returns True if it was unloaded."""
+        engine = session.engine
+        if engine is None or engine.player.awaiting_disambiguation:
+            return False  # A pending disambiguation question isn't saved
+        saved = engine.save_game(session.save_name)
+        session.drain()
+        if not saved:
+            logger.warning(f"Session {session.id}: could not save for eviction, keeping it in memory")
+            return False
+        session.engine = None
+        session.evicted = True
+        self.stats.evictions += 1
+        return True
+
+    def _restore(self, session: Session) -> None:
+        """Rebuild an evicted session's engine from its save."""
+        engine = self._build_engine(session)
+        loaded = engine.load_game(session.save_name)
+        session.drain()
+        if not loaded:
+            logger.warning(f"Session {session.id}: eviction save could not be loaded, starting over")
+        session.engine = engine
+        self.stats.restores += 1
+
+    # ----- Idle eviction -----
+
+    async def _evict_idle_sessions(self) -> None:
+        """Periodically unload sessions that have been idle past the idle timeout."""
+        idle_timeout = self.options.idle_timeout
+        interval = max(0.05, min(idle_timeout / 2, 30.0))
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            for session in list(self.sessions.values()):
+                if session.engine is None or session.busy or now - session.last_active < idle_timeout:
+                    continue
+                async with session.lock:
+                    await self._call(session, self._evict, session)
+
+
+async def serve(options: ServerOptions) -> None:
+    """Run a server until cancelled."""
+    server = await GameServer(options).start()
+    print(f"Serving Zork on {server.address} (Ctrl-C to stop)")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def run_server(options: ServerOptions) -> None:
+    """Blocking entry point for main.py --serve."""
+    try:
+        asyncio.run(serve(options))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
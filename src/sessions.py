@@ -0,0 +1,320 @@
+"""
+World Sessions - Many games on one shared, read-only base world.
+
+A GameEngine used to build its own World, ObjectManager and canonical
+objects, although nearly all of that data (room names, descriptions,
+exits, object names, aliases and descriptions) never changes during play.
+A WorldBase holds one fully built world that is never modified again, and
+fork() gives each session a copy-on-write view of it:
+
+    base = WorldBase.from_engine(GameEngine(use_mud_files=False))
+    game = GameEngine(world_base=base)
+
+Session rooms and objects start out as the base's own. The first time a
+session looks one up by ID (world.get_room, object_manager.get_object,
+...), it gets a private copy that later writes go to. Strings, names and
+the object name index stay shared. A fork therefore costs a few empty
+dicts, and a session grows only by the rooms and objects it has touched.
+
+Code that only reads every room or object (saving, graph building) uses
+World.iter_rooms() and ObjectManager.iter_objects(), which don't copy.
+NPCs, the player, score and puzzle state are small and stay per engine.
+"""
+
+import copy
+from typing import Any, Callable, Dict, Iterator, List, Mapping, MutableMapping, Optional, Set, Tuple
+
+from .entities.containment import ContainmentIndex, LOCATION_CONTAINER, LOCATION_INVENTORY, LOCATION_ROOM
+from .entities.objects import GameObject
+from .entities.object_manager import ObjectManager
+from .parser.command_parser import CommandParser
+from .world.room import Room
+from .world.room_flags import FlagLike, RoomFlagIndex
+from .world.world import World
+from .world.graph import WorldGraph
+
+
+class OverlayDict(MutableMapping):
+    """
+    A dict layered over a shared base mapping that it never modifies.
+
+    Reading a base key copies its value into the overlay first (when a copy
+    function is given), so callers can mutate what they get. Writes and
+    deletions stay in the overlay. Without a copy function values are
+    treated as immutable and reads don't copy.
+    """
+
+    def __init__(self, base: Mapping, copy_value: Optional[Callable[[Any], Any]] = None) -> None:
+        self.base = base
+        self.local: Dict[Any, Any] = {}  # Copied or written values
+        self.removed: Set[Any] = set()  # Base keys deleted in the overlay
+        self._copy_value = copy_value
+
+    def __getitem__(self, key: Any) -> Any:
+        local = self.local
+        if key in local:
+            return local[key]
+        if key in self.removed:
+            raise KeyError(key)
+        value = self.base[key]
+        if self._copy_value is not None:
+            value = local[key] = self._copy_value(value)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.local[key] = value
+        self.removed.discard(key)
+
+    def __delitem__(self, key: Any) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self.local.pop(key, None)
+        if key in self.base:
+            self.removed.add(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.local or (key in self.base and key not in self.removed)
+
+    def __iter__(self) -> Iterator[Any]:
+        removed = self.removed
+        for key in self.base:
+            if key not in removed:
+                yield key
+        base = self.base
+        for key in self.local:
+            if key not in base:
+                yield key
+
+    def __len__(self) -> int:
+        base = self.base
+        return len(base) - len(self.removed) + sum(1 for key in self.local if key not in base)
+
+    def peek(self, key: Any, default: Any = None) -> Any:
+        """Get a value without copying it; the result must not be modified."""
+        local = self.local
+        if key in local:
+            return local[key]
+        if key in self.removed:
+            return default
+        return self.base.get(key, default)
+
+    def peek_values(self) -> Iterator[Any]:
+        """Every value without copying; the results must not be modified."""
+        local, base = self.local, self.base
+        for key in self:
+            yield local[key] if key in local else base[key]
+
+    def reset(self) -> None:
+        """Drop every local change, showing the base again."""
+        self.local.clear()
+        self.removed.clear()
+
+    def copy(self) -> Dict[Any, Any]:
+        """A plain dict of the current contents (copies every base value)."""
+        return dict(self.items())
+
+
+class SessionFlagIndex(RoomFlagIndex):
+    """Room flag index of a session: the base index for shared rooms, its own for copied ones."""
+
+    def __init__(self, base: RoomFlagIndex, world_rooms: OverlayDict) -> None:
+        super().__init__()
+        self.base = base
+        self.world_rooms = world_rooms
+
+    def rooms_with(self, flag: FlagLike) -> List[Any]:
+        """Rooms that have any of the given flag bits (copying the shared ones found)."""
+        copied = self.world_rooms.local
+        shared = [room.id for room in self.base.rooms_with(flag)
+                  if room.id not in copied and room.id in self.world_rooms]
+        return [self.world_rooms[room_id] for room_id in shared] + super().rooms_with(flag)
+
+
+class SessionWorld(World):
+    """A World whose rooms are copied from a base World the first time they are looked up."""
+
+    def __init__(self, base: World) -> None:
+        super().__init__()
+        self.base = base
+        self.rooms = OverlayDict(base.rooms, self._copy_room)
+        self.flag_index = SessionFlagIndex(base.flag_index, self.rooms)
+        self._exits_changed = False  # Until then the base graph is still right
+
+    def _copy_room(self, room: Room) -> Room:
+        """Private copy of a base room (text shared, exits, items and state copied)."""
+        clone = Room(id=room.id, name=room.name, description=room.description, exits=room.exits,
+                     items=list(room.items), flags=room.flags, visited=room.visited)
+        clone.flag_index = self.flag_index
+        self.flag_index.add_room(clone)
+        clone.exit_listener = self
+        # The session's containment index already shows the base room's items
+        clone.containment = self.containment
+        clone.tracker = self.tracker
+        return clone
+
+    def add_room(self, room: Room) -> None:
+        super().add_room(room)
+        self._exits_changed = True
+
+    def attach_containment(self, containment: Any) -> None:
+        """Attach copied rooms; shared rooms' items are already in the session index's base."""
+        self.containment = containment
+        for room in self.rooms.local.values():
+            self._attach_room(room)
+
+    def attach_tracker(self, tracker: Any) -> None:
+        """Attach copied rooms; shared rooms get the tracker when they are copied."""
+        self.tracker = tracker
+        for room in self.rooms.local.values():
+            room.tracker = tracker
+
+    def peek_room(self, room_id: str) -> Optional[Room]:
+        return self.rooms.peek(room_id)
+
+    def iter_rooms(self) -> Iterator[Room]:
+        return self.rooms.peek_values()
+
+    def copied_rooms(self) -> List[Room]:
+        """Rooms this session has its own copy of."""
+        return list(self.rooms.local.values())
+
+    def get_graph(self) -> WorldGraph:
+        if not self._exits_changed:
+            return self.base.get_graph()
+        return super().get_graph()
+
+    def invalidate_graph(self) -> None:
+        self._exits_changed = True
+        super().invalidate_graph()
+
+    def rebuild_flag_index(self) -> None:
+        # Shared rooms still have their base masks
+        self.flag_index.rebuild(self.rooms.local.values())
+
+
+class SessionContainmentIndex(ContainmentIndex):
+    """Containment index over a base index's placements; only moves made in the session are stored."""
+
+    def __init__(self, base: ContainmentIndex) -> None:
+        super().__init__()
+        self.base = base
+        self.parents = OverlayDict(base.parents)  # Parents are tuples, so nothing is copied
+
+    def rebuild(self, world, player, object_manager) -> None:
+        """Go back to the base placements, then re-record the session's copied rooms and containers."""
+        self.parents.reset()
+        self.version += 1
+        for room in world.copied_rooms():
+            base_room = world.base.peek_room(room.id)
+            if base_room is not None:
+                for item_id in base_room.items:
+                    self.release(item_id, LOCATION_ROOM, room.id)
+            for item_id in room.items:
+                self.place(item_id, LOCATION_ROOM, room.id)
+        for item_id in player.inventory:
+            self.place(item_id, LOCATION_INVENTORY)
+        for obj in object_manager.copied_objects():
+            base_obj = object_manager.base.get_object(obj.id)
+            if base_obj is not None:
+                for item_id in base_obj.get_contents():
+                    self.release(item_id, LOCATION_CONTAINER, obj.id)
+            for item_id in obj.get_contents():
+                self.place(item_id, LOCATION_CONTAINER, obj.id)
+
+
+class SessionObjectManager(ObjectManager):
+    """An ObjectManager whose objects are copied from a base manager the first time they are looked up."""
+
+    def __init__(self, base: ObjectManager) -> None:
+        super().__init__()
+        self.base = base
+        self.containment = SessionContainmentIndex(base.containment)
+        self.objects = OverlayDict(base.objects, self._copy_object)
+        self._shadowed: Set[str] = set()  # Base IDs re-indexed in the session; their base entries don't apply
+
+    def _copy_object(self, obj: GameObject) -> GameObject:
+        """Private copy of a base object (text shared, attributes copied)."""
+        state = obj.__getstate__()
+        state["aliases"] = list(obj.aliases)
+        state["_extra"] = copy.deepcopy(obj._extra)
+        state["containment"] = self.containment
+        state["tracker"] = self.tracker
+        clone = obj.__class__.__new__(obj.__class__)
+        clone.__setstate__(state)
+        return clone
+
+    def peek_object(self, object_id: str) -> Optional[GameObject]:
+        return self.objects.peek(object_id)
+
+    def _unindex_object(self, object_id: str) -> None:
+        super()._unindex_object(object_id)
+        if object_id in self.base.objects:
+            self._shadowed.add(object_id)
+
+    def _ids_named(self, key: str) -> Optional[Set[str]]:
+        ids = self.base._ids_named(key)
+        if ids and self._shadowed:
+            ids = ids - self._shadowed
+        local = self._name_index.get(key)
+        if local:
+            ids = local | ids if ids else local
+        return ids
+
+    def _position(self, object_id: str) -> int:
+        position = self.base._positions.get(object_id)
+        if position is None:
+            position = len(self.base._positions) + self._positions[object_id]
+        return position
+
+    def _bulk_ids(self) -> Set[str]:
+        return (self.base._bulk_ids() - self._shadowed) | self._bulk_action_ids
+
+    def iter_objects(self) -> Iterator[GameObject]:
+        return self.objects.peek_values()
+
+    def attach_tracker(self, tracker: Any) -> None:
+        """Attach copied objects; shared objects get the tracker when they are copied."""
+        self.tracker = tracker
+        for obj in self.objects.local.values():
+            obj.tracker = tracker
+
+    def copied_objects(self) -> List[GameObject]:
+        """Objects this session has its own copy of."""
+        return list(self.objects.local.values())
+
+
+class WorldBase:
+    """
+    A built world shared read-only by every session forked from it.
+
+    The engine a base is taken from must not be played afterwards, since
+    its rooms and objects become the shared originals.
+    """
+
+    def __init__(self, world: World, object_manager: ObjectManager, starting_room: str,
+                 parser: Optional[CommandParser] = None) -> None:
+        self.world = world
+        self.object_manager = object_manager
+        self.starting_room = starting_room
+        self.parser = parser  # Vocabulary and parse cache are shared too (Commands are immutable)
+
+    @classmethod
+    def from_engine(cls, engine: Any) -> "WorldBase":
+        """Use a freshly built GameEngine's world, objects and parser as the base."""
+        return cls(engine.world, engine.object_manager, engine.player.current_room, engine.parser)
+
+    def fork(self) -> Tuple[SessionWorld, SessionObjectManager]:
+        """A new session's world and object manager; costs the same however big the base is."""
+        return SessionWorld(self.world), SessionObjectManager(self.object_manager)
+
+    def session_size(self, world: SessionWorld, object_manager: SessionObjectManager) -> Dict[str, int]:
+        """How much of the base a session has copied."""
+        return {"rooms": len(world.rooms.local), "objects": len(object_manager.objects.local),
+                "placements": len(object_manager.containment.parents.local),
+                "base_rooms": len(self.world.rooms), "base_objects": len(self.object_manager.objects)}
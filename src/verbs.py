@@ -0,0 +1,156 @@
+"""
+Verb Registry for Command Dispatch
+
+Maps canonical verbs (as produced by CommandParser) to handler descriptors.
+GameEngine handlers register with the @verb_handler decorator; plugins add
+their own verbs at integration time with VerbRegistry.register().
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# Argument signatures: what a handler receives after the engine
+ARGS_NONE = ()                           # handler(engine)
+ARGS_COMMAND = ("command",)              # handler(engine, command)
+ARGS_COMMAND_INPUT = ("command", "user_input")  # handler(engine, command, user_input)
+
+# Canonical movement directions accepted as verbs and by "go <direction>"
+DIRECTIONS = (
+    "north", "south", "east", "west", "northeast", "northwest",
+    "southeast", "southwest", "up", "down", "in", "out", "enter", "exit"
+)
+
+# Order of categories in the help listing; unknown categories follow
+HELP_CATEGORIES = [
+    "Movement", "Actions", "Object Interaction", "Container Operations",
+    "Light Sources", "Locks", "Object Combinations", "Tool Usage",
+    "Communication", "Combat", "Game Management", "Display", "Other"
+]
+
+
+@dataclass(frozen=True)
+class VerbDescriptor:
+    """Describes how a verb is dispatched."""
+    verbs: Tuple[str, ...]  # Canonical verb first, then aliases
+    handler: Callable
+    arguments: Tuple[str, ...] = ARGS_COMMAND
+    consumes_move: bool = True
+    usage: str = ""  # Shown in help, e.g. "take <object>"
+    category: str = "Other"
+    debug_only: bool = False  # Only dispatched when the engine is in debug mode
+
+    @property
+    def name(self) -> str:
+        """Canonical verb."""
+        return self.verbs[0]
+
+    def invoke(self, engine, command, user_input: str) -> None:
+        """Call the handler with the arguments its signature asks for."""
+        if self.arguments == ARGS_COMMAND:
+            self.handler(engine, command)
+        elif self.arguments == ARGS_NONE:
+            self.handler(engine)
+        else:
+            self.handler(engine, command, user_input)
+
+
+def verb_handler(*verbs: str, arguments: Tuple[str, ...] = ARGS_COMMAND, consumes_move: bool = True,
+                 usage: str = "", category: str = "Other", debug_only: bool = False) -> Callable:
+    """
+    Mark a GameEngine method as the handler for one or more verbs.
+
+    The descriptor is attached to the function and collected by
+    VerbRegistry.from_class() when the class registry is built.
+    """
+    def decorator(func: Callable) -> Callable:
+        descriptor = VerbDescriptor(verbs=verbs, handler=func, arguments=arguments,
+                                    consumes_move=consumes_move, usage=usage,
+                                    category=category, debug_only=debug_only)
+        func.verb_descriptors = getattr(func, "verb_descriptors", ()) + (descriptor,)
+        return func
+    return decorator
+
+
+class VerbRegistry:
+    """Dictionary of verb -> VerbDescriptor with help introspection."""
+
+    def __init__(self) -> None:
+        self._verbs: Dict[str, VerbDescriptor] = {}
+
+    @classmethod
+    def from_class(cls, owner: type) -> 'VerbRegistry':
+        """Build a registry from @verb_handler methods defined on owner and its bases."""
+        registry = cls()
+        for klass in reversed(owner.__mro__):
+            for attribute in vars(klass).values():
+                for descriptor in getattr(attribute, "verb_descriptors", ()):
+                    registry.add(descriptor)
+        return registry
+
+    def copy(self) -> 'VerbRegistry':
+        """Return an independent registry with the same verbs."""
+        registry = VerbRegistry()
+        registry._verbs = dict(self._verbs)
+        return registry
+
+    def add(self, descriptor: VerbDescriptor) -> None:
+        """Add a descriptor under all of its verbs, replacing earlier registrations."""
+        for verb in descriptor.verbs:
+            self._verbs[verb] = descriptor
+
+    def register(self, *verbs: str, handler: Callable, **options) -> VerbDescriptor:
+        """
+        Register a plugin handler for one or more verbs.
+
+        Args:
+            verbs: Canonical verb followed by any aliases
+            handler: Callable taking the engine plus the arguments in options["arguments"]
+            options: Remaining VerbDescriptor fields (consumes_move, usage, category, ...)
+
+        Returns:
+            The registered descriptor
+        """
+        descriptor = VerbDescriptor(verbs=verbs, handler=handler, **options)
+        self.add(descriptor)
+        return descriptor
+
+    def unregister(self, verb: str) -> None:
+        """Remove a verb (aliases of the same descriptor are kept)."""
+        self._verbs.pop(verb, None)
+
+    def get(self, verb: str) -> Optional[VerbDescriptor]:
+        """Look up the descriptor for a verb."""
+        return self._verbs.get(verb)
+
+    def __contains__(self, verb: str) -> bool:
+        return verb in self._verbs
+
+    def __len__(self) -> int:
+        return len(self._verbs)
+
+    def descriptors(self) -> List[VerbDescriptor]:
+        """Unique descriptors in registration order."""
+        seen = {}
+        for descriptor in self._verbs.values():
+            seen.setdefault(id(descriptor), descriptor)
+        return list(seen.values())
+
+    def __iter__(self) -> Iterator[VerbDescriptor]:
+        return iter(self.descriptors())
+
+    def help_lines(self, include_debug: bool = False) -> List[str]:
+        """Build the help listing grouped by category."""
+        grouped: Dict[str, List[str]] = {}
+        for descriptor in self.descriptors():
+            if descriptor.debug_only and not include_debug:
+                continue
+            verbs = [verb for verb in descriptor.verbs if self._verbs.get(verb) is descriptor]
+            if not verbs:
+                continue
+            entry = descriptor.usage or ", ".join(verbs)
+            grouped.setdefault(descriptor.category, []).append(entry)
+
+        categories = [c for c in HELP_CATEGORIES if c in grouped]
+        categories += [c for c in grouped if c not in HELP_CATEGORIES]
+        return [f"  {category}: {', '.join(grouped[category])}" for category in categories]
@@ -0,0 +1,354 @@
+"""
+World Graph - Compiled room connectivity for path queries and audits.
+
+WorldGraph compiles a World's exits into integer-indexed compressed
+sparse row (CSR) arrays: the exits of room i are edges
+offsets[i]..offsets[i+1] of targets/directions. Queries run over these
+arrays instead of walking room.exits dictionaries, and unweighted shortest
+paths are memoized in an LRU cache.
+
+A WorldGraph is a snapshot. World.get_graph() compiles one on demand and
+drops it whenever a room is added or any room's exits change, so the cache
+can never return a path through an exit that no longer exists. Sessions
+forked from a shared base world (see src/sessions.py) share the base's
+graph, and its cache, from several threads until their own exits change.
+"""
+
+import heapq
+from array import array
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Opposite of each compass direction, for direction-aware one-way checks
+REVERSE_DIRECTIONS: Dict[str, str] = {
+    "north": "south", "south": "north",
+    "east": "west", "west": "east",
+    "northeast": "southwest", "southwest": "northeast",
+    "northwest": "southeast", "southeast": "northwest",
+    "up": "down", "down": "up",
+}
+
+# (from_room_id, direction, to_room_id)
+Edge = Tuple[str, str, str]
+
+# Returns the cost of taking an exit, or None if it can't be taken
+WeightFunction = Callable[[str, str, str], Optional[float]]
+
+_UNCACHED = object()  # Cache miss marker (None is a cached "unreachable")
+
+
+@dataclass(frozen=True)
+class GraphPath:
+    """A route between two rooms."""
+    rooms: Tuple[str, ...]  # Start room first, target room last
+    directions: Tuple[str, ...]  # Exit taken from each room but the last
+    cost: float = 0.0
+
+    def __len__(self) -> int:
+        """Number of moves."""
+        return len(self.directions)
+
+
+class WorldGraph:
+    """Read-only CSR adjacency of a World with BFS, Dijkstra and SCC queries."""
+
+    DEFAULT_CACHE_SIZE = 512
+
+    def __init__(self, world, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        rooms = list(world.iter_rooms())
+        self.room_ids: List[str] = [room.id for room in rooms]
+        self.index: Dict[str, int] = {room_id: i for i, room_id in enumerate(self.room_ids)}
+        self.offsets = array("i", [0])
+        self.targets = array("i")
+        self.directions: List[str] = []
+        self.broken_exits: List[Edge] = []  # Exits to rooms that don't exist
+
+        for room_id, room in zip(self.room_ids, rooms):
+            for direction, target_id in room.exits.items():
+                target = self.index.get(target_id)
+                if target is None:
+                    self.broken_exits.append((room_id, direction, target_id))
+                    continue
+                self.targets.append(target)
+                self.directions.append(direction)
+            self.offsets.append(len(self.targets))
+
+        self.cache_size = cache_size
+        self._path_cache: "OrderedDict[Tuple[int, int], Optional[GraphPath]]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def __len__(self) -> int:
+        """Return number of rooms."""
+        return len(self.room_ids)
+
+    def __contains__(self, room_id: str) -> bool:
+        return room_id in self.index
+
+    @property
+    def edge_count(self) -> int:
+        """Number of exits that lead to existing rooms."""
+        return len(self.targets)
+
+    def neighbors(self, room_id: str) -> List[Tuple[str, str]]:
+        """(direction, target_room_id) for each valid exit of a room."""
+        i = self.index.get(room_id)
+        if i is None:
+            return []
+        room_ids, directions, targets = self.room_ids, self.directions, self.targets
+        return [(directions[e], room_ids[targets[e]]) for e in range(self.offsets[i], self.offsets[i + 1])]
+
+    def _bfs(self, start: int, target: int = -1,
+             allowed: Optional[Set[int]] = None) -> Tuple[List[int], array, array]:
+        """
+        Breadth-first search over the CSR arrays.
+
+        Args:
+            start: Start room index
+            target: Stop as soon as this room index is reached (-1 = visit everything)
+            allowed: Only enter rooms whose index is in this set
+
+        Returns:
+            (rooms in visit order, parent room per index, edge used per index); -1 = none
+        """
+        count = len(self.room_ids)
+        parent = array("i", [-1]) * count
+        via_edge = array("i", [-1]) * count
+        offsets, targets = self.offsets, self.targets
+        parent[start] = start
+        order = [start]
+        queue = deque(order)
+        while queue:
+            current = queue.popleft()
+            if current == target:
+                break
+            for edge in range(offsets[current], offsets[current + 1]):
+                nxt = targets[edge]
+                if parent[nxt] == -1 and (allowed is None or nxt in allowed):
+                    parent[nxt] = current
+                    via_edge[nxt] = edge
+                    order.append(nxt)
+                    queue.append(nxt)
+        return order, parent, via_edge
+
+    def _trace(self, start: int, target: int, parent: array, via_edge: array,
+               cost: Optional[float] = None) -> GraphPath:
+        """Rebuild the route to target from BFS/Dijkstra parent links (cost defaults to the move count)."""
+        rooms = [target]
+        directions = []
+        current = target
+        while current != start:
+            directions.append(self.directions[via_edge[current]])
+            current = parent[current]
+            rooms.append(current)
+        rooms.reverse()
+        directions.reverse()
+        if cost is None:
+            cost = float(len(directions))
+        return GraphPath(tuple(self.room_ids[i] for i in rooms), tuple(directions), cost)
+
+    def reachable_from(self, start: str, within: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Rooms reachable from start, in breadth-first order (start included).
+
+        Args:
+            start: Starting room ID
+            within: Only traverse these rooms (start is always included)
+        """
+        i = self.index.get(start)
+        if i is None:
+            return []
+        allowed = None if within is None else {self.index[r] for r in within if r in self.index}
+        order, _, _ = self._bfs(i, allowed=allowed)
+        return [self.room_ids[j] for j in order]
+
+    def bfs_tree(self, start: str) -> List[Tuple[str, int, Optional[str], Optional[str]]]:
+        """
+        Breadth-first spanning tree from start.
+
+        Returns:
+            (room_id, depth, parent_room_id, direction_from_parent) in visit order
+        """
+        i = self.index.get(start)
+        if i is None:
+            return []
+        order, parent, via_edge = self._bfs(i)
+        depth = {i: 0}
+        tree = []
+        for j in order:
+            if j == i:
+                tree.append((self.room_ids[j], 0, None, None))
+                continue
+            depth[j] = depth[parent[j]] + 1
+            tree.append((self.room_ids[j], depth[j], self.room_ids[parent[j]], self.directions[via_edge[j]]))
+        return tree
+
+    def distances_from(self, start: str) -> Dict[str, int]:
+        """Number of moves from start to every reachable room."""
+        return {room_id: depth for room_id, depth, _, _ in self.bfs_tree(start)}
+
+    def shortest_path(self, start: str, target: str) -> Optional[GraphPath]:
+        """Fewest-moves route from start to target, or None if unreachable (cached)."""
+        i = self.index.get(start)
+        j = self.index.get(target)
+        if i is None or j is None:
+            return None
+
+        key = (i, j)
+        cache = self._path_cache
+        path = cache.get(key, _UNCACHED)
+        if path is not _UNCACHED:
+            self.cache_hits += 1
+            try:
+                cache.move_to_end(key)
+            except KeyError:
+                pass  # Evicted by another session sharing this graph
+            return path
+
+        self.cache_misses += 1
+        _, parent, via_edge = self._bfs(i, target=j)
+        path = None
+        if parent[j] != -1:
+            path = self._trace(i, j, parent, via_edge)
+        cache[key] = path
+        if len(cache) > self.cache_size:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                pass
+        return path
+
+    def weighted_path(self, start: str, target: str, weight: WeightFunction) -> Optional[GraphPath]:
+        """
+        Cheapest route by Dijkstra's algorithm.
+
+        Args:
+            start: Starting room ID
+            target: Destination room ID
+            weight: weight(from_id, direction, to_id) -> cost >= 0, or None to forbid the exit
+
+        Returns:
+            GraphPath with its total cost, or None if unreachable
+        """
+        i = self.index.get(start)
+        j = self.index.get(target)
+        if i is None or j is None:
+            return None
+
+        count = len(self.room_ids)
+        best = [float("inf")] * count
+        parent = array("i", [-1]) * count
+        via_edge = array("i", [-1]) * count
+        best[i] = 0.0
+        parent[i] = i
+        heap = [(0.0, i)]
+        room_ids, directions, offsets, targets = self.room_ids, self.directions, self.offsets, self.targets
+        while heap:
+            cost, current = heapq.heappop(heap)
+            if current == j:
+                return self._trace(i, j, parent, via_edge, cost)
+            if cost > best[current]:
+                continue
+            for edge in range(offsets[current], offsets[current + 1]):
+                nxt = targets[edge]
+                step = weight(room_ids[current], directions[edge], room_ids[nxt])
+                if step is None:
+                    continue
+                new_cost = cost + step
+                if new_cost < best[nxt]:
+                    best[nxt] = new_cost
+                    parent[nxt] = current
+                    via_edge[nxt] = edge
+                    heapq.heappush(heap, (new_cost, nxt))
+        return None
+
+    def strongly_connected_components(self) -> List[List[str]]:
+        """
+        Groups of rooms that can all reach each other (iterative Tarjan).
+
+        Returns:
+            Components, largest first; rooms within a component in world order
+        """
+        count = len(self.room_ids)
+        offsets, targets = self.offsets, self.targets
+        index_of = [-1] * count
+        lowlink = [0] * count
+        on_stack = [False] * count
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+
+        for root in range(count):
+            if index_of[root] != -1:
+                continue
+            # Each frame: (node, next edge to examine)
+            work = [(root, offsets[root])]
+            index_of[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            while work:
+                node, edge = work[-1]
+                if edge < offsets[node + 1]:
+                    work[-1] = (node, edge + 1)
+                    nxt = targets[edge]
+                    if index_of[nxt] == -1:
+                        index_of[nxt] = lowlink[nxt] = counter
+                        counter += 1
+                        stack.append(nxt)
+                        on_stack[nxt] = True
+                        work.append((nxt, offsets[nxt]))
+                    elif on_stack[nxt]:
+                        lowlink[node] = min(lowlink[node], index_of[nxt])
+                    continue
+                work.pop()
+                if work:
+                    caller = work[-1][0]
+                    lowlink[caller] = min(lowlink[caller], lowlink[node])
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+
+        components.sort(key=len, reverse=True)
+        return [[self.room_ids[i] for i in component] for component in components]
+
+    def one_way_edges(self, reverse_directions: Optional[Dict[str, str]] = None) -> List[Edge]:
+        """
+        Exits with no way back.
+
+        Args:
+            reverse_directions: If given, only exits whose direction is a key are
+                checked, and the way back must be the mapped reverse direction
+                (e.g. REVERSE_DIRECTIONS). Otherwise any exit back counts.
+
+        Returns:
+            (from_room_id, direction, to_room_id) for each one-way exit
+        """
+        offsets, targets, directions, room_ids = self.offsets, self.targets, self.directions, self.room_ids
+        one_way = []
+        for i in range(len(room_ids)):
+            for edge in range(offsets[i], offsets[i + 1]):
+                j = targets[edge]
+                back_edges = range(offsets[j], offsets[j + 1])
+                if reverse_directions is None:
+                    has_reverse = any(targets[back] == i for back in back_edges)
+                else:
+                    reverse = reverse_directions.get(directions[edge])
+                    if reverse is None:
+                        continue
+                    has_reverse = any(targets[back] == i and directions[back] == reverse for back in back_edges)
+                if not has_reverse:
+                    one_way.append((room_ids[i], directions[edge], room_ids[j]))
+        return one_way
+
+    def cache_info(self) -> Dict[str, int]:
+        """Shortest-path cache counters."""
+        return {"hits": self.cache_hits, "misses": self.cache_misses,
+                "size": len(self._path_cache), "max_size": self.cache_size}
@@ -1,8 +1,81 @@
 """Room class - Represents a game location."""
 
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional
 from dataclasses import dataclass, field
 
+from .room_flags import FlagLike, flag_bit, flag_names, to_mask
+
+
+class ExitMap(dict):
+    """direction -> room_id dict that tells the room's World when exits change."""
+    
+    _room = None  # Owning Room (class default so unpickling can fill items first)
+    
+    def _changed(self) -> None:
+        room = self._room
+        if room is not None and room.exit_listener is not None:
+            room.exit_listener.invalidate_graph()
+    
+    def _record(self, direction: str) -> None:
+        """Journal how to put an exit back the way it is now (opened or closed by puzzles)."""
+        room = self._room
+        tracker = room.tracker if room is not None else None
+        if tracker is not None and tracker.recording:
+            tracker.record(self._restore, direction, self.get(direction))
+    
+    def _restore(self, direction: str, room_id: Optional[str]) -> None:
+        if room_id is None:
+            self.pop(direction, None)
+        else:
+            self[direction] = room_id
+    
+    def __setitem__(self, direction: str, room_id: str) -> None:
+        self._record(direction)
+        super().__setitem__(direction, room_id)
+        self._changed()
+    
+    def __delitem__(self, direction: str) -> None:
+        self._record(direction)
+        super().__delitem__(direction)
+        self._changed()
+    
+    def __ior__(self, other):
+        self.update(other)
+        return self
+    
+    def update(self, *args, **kwargs) -> None:
+        changes = dict(*args, **kwargs)
+        for direction in changes:
+            self._record(direction)
+        super().update(changes)
+        self._changed()
+    
+    def setdefault(self, direction: str, room_id: str = None) -> str:
+        if direction in self:
+            return self[direction]
+        self[direction] = room_id
+        return room_id
+    
+    def pop(self, direction: str, *default):
+        if direction in self:
+            self._record(direction)
+        result = super().pop(direction, *default)
+        self._changed()
+        return result
+    
+    def popitem(self):
+        if self:
+            self._record(next(reversed(self)))
+        result = super().popitem()
+        self._changed()
+        return result
+    
+    def clear(self) -> None:
+        for direction in self:
+            self._record(direction)
+        super().clear()
+        self._changed()
+
 
 @dataclass
 class Room:
@@ -19,10 +92,38 @@ class Room:
     id: str
     name: str
     description: str
-    exits: Dict[str, str] = field(default_factory=dict)  # direction -> room_id
+    exits: Dict[str, str] = field(default_factory=dict)  # direction -> room_id (an ExitMap once set)
     items: List[str] = field(default_factory=list)  # item IDs in this room
-    flags: Set[str] = field(default_factory=set)  # room properties (dark, etc.)
+    flags: int = 0  # RoomFlag bitmask (names or a set of names are accepted and converted)
     visited: bool = False
+    containment: Optional[Any] = field(default=None, repr=False, compare=False)  # ContainmentIndex
+    tracker: Optional[Any] = field(default=None, repr=False, compare=False)  # ChangeTracker of the engine
+    flag_index: Optional[Any] = field(default=None, repr=False, compare=False)  # RoomFlagIndex
+    exit_listener: Optional[Any] = field(default=None, repr=False, compare=False)  # World (drops its graph)
+    
+    def __post_init__(self) -> None:
+        self.flags = to_mask(self.flags)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # The tracker belongs to the engine; don't pickle it into world images
+        state = self.__dict__.copy()
+        state["tracker"] = None
+        return state
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "exits":
+            # Wrap so in-place edits (room.exits["down"] = ...) are seen too
+            value = ExitMap(value)
+            value._room = self
+            listener = self.__dict__.get("exit_listener")
+            if listener is not None:
+                listener.invalidate_graph()
+        elif name == "visited":
+            tracker = self.__dict__.get("tracker")
+            if tracker is not None and value != self.visited:
+                tracker.record(setattr, self, "visited", self.visited)
+                tracker.room_changed(self.id)
+        object.__setattr__(self, name, value)
     
     def get_exit(self, direction: str) -> Optional[str]:
         """Get the room ID for a given direction, if exit exists."""
@@ -32,26 +133,62 @@ class Room:
         """Add an item to this room."""
         if item_id not in self.items:
             self.items.append(item_id)
+            if self.tracker is not None:
+                self.tracker.record(self.remove_item, item_id)
+                self.tracker.room_changed(self.id)
+        if self.containment is not None:
+            self.containment.place(item_id, "room", self.id)
+    
+    def insert_item(self, index: int, item_id: str) -> None:
+        """Add an item at a position in the room's list (where UNDO puts it back)."""
+        if item_id not in self.items:
+            self.items.insert(index, item_id)
+            if self.tracker is not None:
+                self.tracker.room_changed(self.id)
+        if self.containment is not None:
+            self.containment.place(item_id, "room", self.id)
     
     def remove_item(self, item_id: str) -> bool:
         """Remove an item from this room. Returns True if item was present."""
         try:
-            self.items.remove(item_id)
-            return True
+            index = self.items.index(item_id)
         except ValueError:
             return False
+        del self.items[index]
+        if self.tracker is not None:
+            self.tracker.record(self.insert_item, index, item_id)
+            self.tracker.room_changed(self.id)
+        if self.containment is not None:
+            self.containment.release(item_id, "room", self.id)
+        return True
     
-    def has_flag(self, flag: str) -> bool:
-        """Check if room has a specific flag."""
-        return flag in self.flags
+    def has_flag(self, flag: FlagLike) -> bool:
+        """Check if room has a specific flag (a name, MDL bit name or RoomFlag; any bit of a mask)."""
+        return self.flags & flag_bit(flag) != 0
     
-    def set_flag(self, flag: str) -> None:
+    def set_flag(self, flag: FlagLike) -> None:
         """Set a flag on this room."""
-        self.flags.add(flag)
+        self.set_flags(self.flags | to_mask(flag))
     
-    def clear_flag(self, flag: str) -> None:
+    def clear_flag(self, flag: FlagLike) -> None:
         """Clear a flag from this room."""
-        self.flags.discard(flag)
+        self.set_flags(self.flags & ~flag_bit(flag))
+    
+    def set_flags(self, flags: Any) -> None:
+        """Replace all flags (a mask or a collection of names) and update the world's index."""
+        old_mask = self.flags
+        self.flags = to_mask(flags)
+        if self.flag_index is not None:
+            self.flag_index.update(self, old_mask, self.flags)
+        if self.tracker is not None:
+            self.tracker.record(self.set_flags, old_mask)
+            self.tracker.room_changed(self.id)
+        if self.containment is not None:
+            self.containment.touch()
+    
+    def flag_names(self) -> List[str]:
+        """Names of the flags set on this room."""
+        return flag_names(self.flags)
     
     def get_description(self, force_brief: bool = False, force_verbose: bool = False, include_name: bool = True) -> str:
         """
@@ -0,0 +1,184 @@
+"""Room flags - Interned room properties and the flag-to-rooms index."""
+
+import logging
+from enum import IntFlag
+from typing import Any, Dict, Iterable, List, Union
+
+logger = logging.getLogger(__name__)
+
+
+class RoomFlag(IntFlag):
+    """Room properties, stored on each Room as a plain int bitmask."""
+    DARK = 1 << 0
+    VISITED = 1 << 1
+    DEADLY = 1 << 2
+    DANGEROUS = 1 << 3
+    SACRED = 1 << 4
+    OUTDOOR = 1 << 5
+    WATER = 1 << 6
+    NOISY = 1 << 7
+    COLD = 1 << 8
+    LIGHT = 1 << 9  # Lit without a light source
+    LAND = 1 << 10
+    AIR = 1 << 11
+    HOUSE = 1 << 12
+    NWALL = 1 << 13  # No walls (e.g. outdoor edge rooms)
+    FILL = 1 << 14  # Water can be filled here
+    MUNG = 1 << 15  # Room has been destroyed
+    BUCKET = 1 << 16
+    ENDGAME = 1 << 17
+
+
+# Canonical mapping from the MDL room bits to engine flags
+MDL_FLAG_NAMES: Dict[str, RoomFlag] = {
+    "RSEENBIT": RoomFlag.VISITED,
+    "RLIGHTBIT": RoomFlag.LIGHT,
+    "RLANDBIT": RoomFlag.LAND,
+    "RWATERBIT": RoomFlag.WATER,
+    "RAIRBIT": RoomFlag.AIR,
+    "RSACREDBIT": RoomFlag.SACRED,
+    "RFILLBIT": RoomFlag.FILL,
+    "RMUNGBIT": RoomFlag.MUNG,
+    "RBUCKBIT": RoomFlag.BUCKET,
+    "RHOUSEBIT": RoomFlag.HOUSE,
+    "RNWALLBIT": RoomFlag.NWALL,
+    "RENDGAME": RoomFlag.ENDGAME,
+}
+
+CANONICAL_FLAGS = 0
+for _flag in RoomFlag:
+    CANONICAL_FLAGS |= int(_flag)
+
+# Every accepted spelling -> plain int bit. Members hash like their values,
+# so RoomFlag.DARK and 1 both resolve here too.
+_BITS: Dict[Any, int] = {}
+# bit -> engine name, including flags interned at runtime
+_NAMES: Dict[int, str] = {}
+for _flag in RoomFlag:
+    _BITS[_flag.name.lower()] = int(_flag)
+    _BITS[_flag] = int(_flag)
+    _NAMES[int(_flag)] = _flag.name.lower()
+for _mdl_name, _flag in MDL_FLAG_NAMES.items():
+    _BITS[_mdl_name] = int(_flag)
+
+FlagLike = Union[str, int]
+
+
+def flag_bit(flag: FlagLike) -> int:
+    """Resolve an engine name, MDL bit name or RoomFlag to its bit(s); 0 if unknown."""
+    bit = _BITS.get(flag)
+    if bit is not None:
+        return bit
+    if isinstance(flag, int):
+        return int(flag)
+    return 0
+
+
+def intern_flag(name: str) -> int:
+    """Get the bit for a flag name, assigning a new bit above RoomFlag to unknown names."""
+    bit = _BITS.get(name)
+    if bit is None:
+        bit = 1 << (len(_NAMES))
+        _BITS[name] = bit
+        _NAMES[bit] = name
+        logger.debug(f"Interned room flag {name!r} as bit {bit}")
+    return bit
+
+
+def to_mask(flags: Union[FlagLike, Iterable[FlagLike], None], intern: bool = True) -> int:
+    """
+    Convert a mask, a flag name or a collection of names to an int bitmask.
+
+    Args:
+        flags: int/RoomFlag mask, a single name, or an iterable of names/flags
+        intern: Give unknown names their own bit instead of skipping them
+
+    Returns:
+        Combined bitmask
+    """
+    if flags is None:
+        return 0
+    if isinstance(flags, int):
+        return int(flags)
+    if isinstance(flags, str):
+        flags = (flags,)
+    mask = 0
+    for flag in flags:
+        bit = flag_bit(flag)
+        if not bit:
+            if intern and isinstance(flag, str) and flag:
+                bit = intern_flag(flag)
+            else:
+                logger.debug(f"Ignoring unknown room flag {flag!r}")
+        mask |= bit
+    return mask
+
+
+def flag_names(mask: int) -> List[str]:
+    """Engine names of the flags set in mask, in bit order."""
+    return [name for bit, name in _NAMES.items() if mask & bit]
+
+
+def encode_flags(mask: int) -> Union[int, List[str]]:
+    """
+    Compact save-file form of a mask.
+
+    Canonical flags are saved as the int mask itself; a mask using flags
+    interned at runtime (whose bits differ between runs) is saved by name.
+    to_mask() reads both forms back.
+    """
+    if mask & ~CANONICAL_FLAGS:
+        return flag_names(mask)
+    return mask
+
+
+class RoomFlagIndex:
+    """
+    Maps each flag bit -> rooms that have it, keyed by room ID.
+
+    Rooms report every flag change here, so "all rooms with flag X" is a
+    dictionary lookup instead of a scan of the world.
+    """
+
+    def __init__(self) -> None:
+        self.rooms: Dict[int, Dict[str, Any]] = {int(flag): {} for flag in RoomFlag}
+
+    def add_room(self, room: Any) -> None:
+        """Index every flag currently set on a room."""
+        self.update(room, 0, room.flags)
+
+    def remove_room(self, room: Any) -> None:
+        """Forget a room under all of its flags."""
+        self.update(room, room.flags, 0)
+
+    def update(self, room: Any, old_mask: int, new_mask: int) -> None:
+        """Move a room between flag buckets after its mask changed."""
+        changed = old_mask ^ new_mask
+        while changed:
+            bit = changed & -changed
+            changed ^= bit
+            if new_mask & bit:
+                self.rooms.setdefault(bit, {})[room.id] = room
+            else:
+                bucket = self.rooms.get(bit)
+                if bucket is not None and bucket.get(room.id) is room:
+                    del bucket[room.id]
+
+    def rooms_with(self, flag: FlagLike) -> List[Any]:
+        """Rooms that have any of the given flag bits."""
+        mask = flag_bit(flag)
+        if mask & (mask - 1) == 0:
+            return list(self.rooms.get(mask, {}).values())
+        # Combined mask: union of the buckets, each room once
+        found: Dict[str, Any] = {}
+        for bit, rooms in self.rooms.items():
+            if mask & bit:
+                found.update(rooms)
+        return list(found.values())
+
+    def rebuild(self, rooms: Iterable[Any]) -> None:
+        """Rebuild the index from the rooms' current masks."""
+        for bucket in self.rooms.values():
+            bucket.clear()
+        for room in rooms:
+            self.add_room(room)
@@ -11,22 +11,25 @@ from typing import Dict, Set
 try:
     from ..world.world import World
     from ..world.room import Room  
+    from ..world.room_flags import to_mask
     from ..parsers.mdl_parser import MDLParser, RoomData
 except ImportError:
     import sys
     sys.path.append(str(Path(__file__).parent.parent))
     from world.world import World
     from world.room import Room  
+    from world.room_flags import to_mask
     from parsers.mdl_parser import MDLParser, RoomData
 
 
 class ZorkRoomLoader:
     """Loads rooms from original Zork .mud files into our World system."""
     
-    def __init__(self, world: World, debug_mode: bool = False):
+    def __init__(self, world: World, debug_mode: bool = False, parse_workers: int = 1):
         self.world = world
         self.parser = MDLParser(debug_mode=debug_mode)
         self.debug_mode = debug_mode
+        self.parse_workers = parse_workers  # >1 parses .mud files in a process pool
         
     def load_from_mud_files(self, mud_directory: Path) -> int:
         """
@@ -37,7 +40,7 @@ class ZorkRoomLoader:
             print(f"Loading Zork rooms from {mud_directory}...")
         
         # Parse all .mud files
-        room_data = self.parser.parse_directory(mud_directory)
+        room_data = self.parser.parse_directory(mud_directory, workers=self.parse_workers)
         
         if not room_data:
             if self.debug_mode:
@@ -110,7 +113,7 @@ class ZorkRoomLoader:
             description=description,
             exits=exits,
             items=data.objects,  # Add objects from parser
-            flags=set(data.flags) if data.flags else set()  # Add flags from parser
+            flags=to_mask(data.flags, intern=False)  # MDL R*BIT names from parser
         )
     
     def _get_canonical_description(self, room_id: str, room_name: str) -> str:
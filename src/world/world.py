@@ -1,7 +1,9 @@
 """World class - Contains and manages all rooms."""
 
-from typing import Dict, Optional, List
+from typing import Any, Dict, Iterator, Optional, List
 from .room import Room
+from .room_flags import FlagLike, RoomFlagIndex
+from .graph import WorldGraph
 
 
 class World:
@@ -9,27 +11,90 @@ class World:
     
     def __init__(self) -> None:
         self.rooms: Dict[str, Room] = {}
+        self.containment: Optional[Any] = None  # ContainmentIndex shared with objects and player
+        self.tracker: Optional[Any] = None  # ChangeTracker of the engine (set by the engine)
+        self.flag_index = RoomFlagIndex()  # flag -> rooms, kept current by Room.set_flag/clear_flag
+        self._graph: Optional[WorldGraph] = None  # Compiled on demand, dropped when exits change
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # The graph is a cache and the tracker belongs to the engine; don't pickle them into world images
+        state = self.__dict__.copy()
+        state["_graph"] = None
+        state["tracker"] = None
+        return state
     
     def add_room(self, room: Room) -> None:
         """Add a room to the world."""
+        replaced = self.rooms.get(room.id)
+        if replaced is not None and replaced is not room:
+            self.flag_index.remove_room(replaced)
+            replaced.flag_index = None
+            replaced.exit_listener = None
         self.rooms[room.id] = room
+        room.flag_index = self.flag_index
+        self.flag_index.add_room(room)
+        room.exit_listener = self
+        self._graph = None
+        room.tracker = self.tracker
+        if self.containment is not None:
+            self._attach_room(room)
+    
+    def attach_containment(self, containment: Any) -> None:
+        """Report item moves in every room (current and future) to a ContainmentIndex."""
+        self.containment = containment
+        for room in self.rooms.values():
+            self._attach_room(room)
+    
+    def attach_tracker(self, tracker: Any) -> None:
+        """Report changes to every room (current and future) to a ChangeTracker."""
+        self.tracker = tracker
+        for room in self.rooms.values():
+            room.tracker = tracker
+    
+    def _attach_room(self, room: Room) -> None:
+        """Connect a room to the containment index and record its current items."""
+        room.containment = self.containment
+        for item_id in room.items:
+            self.containment.place(item_id, "room", room.id)
     
     def get_room(self, room_id: str) -> Optional[Room]:
         """Get a room by its ID."""
         return self.rooms.get(room_id)
     
+    def peek_room(self, room_id: str) -> Optional[Room]:
+        """Get a room for reading only (a session world doesn't copy it for this)."""
+        return self.rooms.get(room_id)
+    
+    def iter_rooms(self) -> Iterator[Room]:
+        """Every room, for reading only (a session world doesn't copy them for this)."""
+        return iter(self.rooms.values())
+    
     def validate_exits(self) -> List[str]:
         """Validate that all exits point to existing rooms. Returns list of errors."""
         errors = []
-        for room in self.rooms.values():
+        for room in self.iter_rooms():
             for direction, target_id in room.exits.items():
                 if target_id not in self.rooms:
                     errors.append(f"Room {room.id}: Exit '{direction}' points to non-existent room '{target_id}'")
         return errors
     
-    def get_rooms_with_flag(self, flag: str) -> List[Room]:
+    def get_graph(self) -> WorldGraph:
+        """Get the compiled connectivity graph, rebuilding it if exits changed."""
+        if self._graph is None:
+            self._graph = WorldGraph(self)
+        return self._graph
+    
+    def invalidate_graph(self) -> None:
+        """Drop the compiled graph (called by rooms when their exits change)."""
+        self._graph = None
+    
+    def get_rooms_with_flag(self, flag: FlagLike) -> List[Room]:
         """Get all rooms that have a specific flag."""
-        return [room for room in self.rooms.values() if room.has_flag(flag)]
+        return self.flag_index.rooms_with(flag)
+    
+    def rebuild_flag_index(self) -> None:
+        """Re-index room flags (after masks were assigned directly)."""
+        self.flag_index.rebuild(self.rooms.values())
     
     def __len__(self) -> int:
         """Return number of rooms in the world."""
@@ -0,0 +1,170 @@
+"""
+World Image Cache
+
+Stores a precompiled snapshot of the world loaded from .mud files so later
+startups can skip lexing, parsing and object placement entirely. The image
+sits next to the .mud sources and is keyed by a content hash of those files
+plus the game's own source code, so any edit to either rebuilds it.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import pickle
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of WorldImage changes in a way the key cannot detect
+WORLD_IMAGE_VERSION = 1
+WORLD_IMAGE_FILENAME = "world.image"
+WORLD_IMAGE_MAGIC = b"ZORKIMG"
+
+# Root package of the game code (e.g. "src")
+_PACKAGE_ROOT = __name__.split(".")[0]
+_SOURCE_ROOT = Path(__file__).resolve().parent.parent
+_SAFE_BUILTINS = {"set", "frozenset", "dict", "list", "tuple", "object"}
+
+# The game classes an image holds, as (module, class name); nothing else is unpickled
+_SAFE_CLASSES = frozenset((f"{_PACKAGE_ROOT}.{module}", name) for module, name in (
+    ("entities.combat", "CombatStats"),
+    ("entities.containment", "ContainmentIndex"),
+    ("entities.npc", "DialogueNode"),
+    ("entities.npc", "DialogueResponse"),
+    ("entities.npc", "NPC"),
+    ("entities.npc_manager", "NPCManager"),
+    ("entities.object_manager", "ObjectManager"),
+    ("entities.objects", "GameObject"),
+    ("entities.thief", "ThiefBehavior"),
+    ("world.room", "ExitMap"),
+    ("world.room", "Room"),
+    ("world.room_flags", "RoomFlagIndex"),
+    ("world.world", "World"),
+    ("world.world_image", "WorldImage"),
+))
+
+
+@dataclass
+class WorldImage:
+    """Snapshot of everything built from the .mud sources at startup."""
+    world: Any           # World
+    object_manager: Any  # ObjectManager
+    npc_manager: Any     # NPCManager
+    starting_room: str
+
+
+class _WorldImageUnpickler(pickle.Unpickler):
+    """Unpickler that only resolves the game classes in an image and a few safe builtins."""
+
+    def find_class(self, module: str, name: str) -> Any:
+        # Protocol 4 resolves a dotted name attribute by attribute ("os.getcwd"
+        # from any module importing os), so only plain names are looked up
+        if "." not in name and ((module == "builtins" and name in _SAFE_BUILTINS)
+                                or (module, name) in _SAFE_CLASSES):
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f"Refusing to load {module}.{name} from world image")
+
+
+class WorldImageCache:
+    """Reads and writes the precompiled world image for a .mud directory."""
+
+    def __init__(self, mud_directory: Path, debug_mode: bool = False) -> None:
+        self.mud_directory = Path(mud_directory)
+        self.image_path = self.mud_directory / WORLD_IMAGE_FILENAME
+        self.debug_mode = debug_mode
+        self._key: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        """Content hash of the .mud files and the code that loads them."""
+        if self._key is None:
+            self._key = self._compute_key()
+        return self._key
+
+    def _compute_key(self) -> str:
+        """Hash image version, Python version, .mud sources and game source files."""
+        digest = hashlib.sha256()
+        digest.update(f"{WORLD_IMAGE_VERSION}:{sys.version_info[:2]}".encode())
+
+        for label, root, pattern in (("mud", self.mud_directory, "*.mud"),
+                                     ("src", _SOURCE_ROOT, "**/*.py")):
+            for path in sorted(root.glob(pattern)):
+                digest.update(f"{label}:{path.relative_to(root).as_posix()}\0".encode())
+                digest.update(path.read_bytes())
+                digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    def _header(self) -> bytes:
+        """Fixed header: magic, format version and content key."""
+        return WORLD_IMAGE_MAGIC + f" {WORLD_IMAGE_VERSION} {self.key}\n".encode()
+
+    def load(self) -> Optional[WorldImage]:
+        """
+        Load the world image if one exists and matches the current sources.
+
+        Returns:
+            The cached WorldImage, or None if missing, stale or unreadable
+        """
+        if not self.image_path.exists():
+            return None
+
+        try:
+            with open(self.image_path, "rb") as f:
+                header = f.readline()
+                if header != self._header():
+                    if self.debug_mode:
+                        print(f"World image {self.image_path} is stale, rebuilding")
+                    return None
+                image = _WorldImageUnpickler(f).load()
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.warning(f"Could not read world image: {type(e).__name__}")
+            return None
+
+        if not isinstance(image, WorldImage):
+            logger.warning("World image has unexpected contents, ignoring it")
+            return None
+        return image
+
+    def save(self, image: WorldImage) -> bool:
+        """
+        Write the world image atomically next to the .mud sources.
+
+        Returns:
+            True if the image was written, False otherwise
+        """
+        buffer = io.BytesIO()
+        buffer.write(self._header())
+        try:
+            pickle.dump(image, buffer, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning(f"Could not snapshot world: {type(e).__name__}")
+            return False
+
+        temp_path = self.image_path.with_name(self.image_path.name + ".tmp")
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(buffer.getvalue())
+            os.replace(temp_path, self.image_path)
+        except OSError as e:
+            logger.warning(f"Could not write world image: {type(e).__name__}")
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            return False
+
+        if self.debug_mode:
+            print(f"✓ Wrote world image to {self.image_path}")
+        return True
+
+    def clear(self) -> None:
+        """Remove the world image so the next startup rebuilds it."""
+        try:
+            self.image_path.unlink()
+        except FileNotFoundError:
+            pass
@@ -7,7 +7,7 @@ Identifies missing connections and suggests fixes for world connectivity issues
 import sys
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
-from collections import defaultdict, deque
+from collections import defaultdict
 import json
 
 # Add src to path for imports
@@ -62,26 +62,9 @@ class ConnectivityGapAnalyzer:
         return results
     
     def _find_reachable_rooms(self, start_room: str) -> None:
-        """Find all reachable rooms using BFS."""
+        """Find all reachable rooms using BFS over the compiled world graph."""
         
-        queue = deque([start_room])
-        
-        while queue:
-            room_id = queue.popleft()
-            
-            if room_id in self.reachable_rooms:
-                continue
-                
-            room = self.world.get_room(room_id)
-            if not room:
-                continue
-                
-            self.reachable_rooms.add(room_id)
-            
-            # Add connected rooms
-            for target in room.exits.values():
-                if target not in self.reachable_rooms and target in self.world.rooms:
-                    queue.append(target)
+        self.reachable_rooms = set(self.world.get_graph().reachable_from(start_room))
         
         # Identify unreachable rooms
         all_rooms = set(self.world.rooms.keys())
@@ -96,27 +79,10 @@ class ConnectivityGapAnalyzer:
         while unassigned:
             # Start new cluster with first unassigned room
             seed_room = next(iter(unassigned))
-            cluster_rooms = set()
-            queue = deque([seed_room])
             
             # BFS within unreachable rooms only
-            while queue:
-                room_id = queue.popleft()
-                
-                if room_id in cluster_rooms:
-                    continue
-                    
-                room = self.world.get_room(room_id)
-                if not room or room_id not in unassigned:
-                    continue
-                    
-                cluster_rooms.add(room_id)
-                unassigned.remove(room_id)
-                
-                # Add connected unreachable rooms
-                for target in room.exits.values():
-                    if target in unassigned and target not in cluster_rooms:
-                        queue.append(target)
+            cluster_rooms = set(self.world.get_graph().reachable_from(seed_room, within=unassigned))
+            unassigned -= cluster_rooms
             
             # Analyze cluster
             cluster_info = self._analyze_cluster(cluster_rooms)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Autosave Benchmark
+Plays the same turns on synthetic grid worlds of growing size twice:
+once saving synchronously every few turns, once autosaving on the
+background thread. Reports how long each save holds up the turn it
+happens in, after a first full save to the file. Enough saves are made
+for the delta chain to be compacted: a synchronous save then writes a
+whole checkpoint inside the turn, a background save still only takes its
+snapshot. Both files are then loaded into fresh sessions and must match
+the game.
+
+Usage:
+    python tests/benchmark_autosave.py [--rooms 100,1000,10000] [--saves N] [--turns N] [--seed N]
+"""
+
+import sys
+import argparse
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Tuple
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game import GameEngine
+from src.output import OutputChannel
+from src.savefile import MAX_DELTAS
+from tests.benchmark_sessions import build_base
+from tests.benchmark_undo import next_command, world_state
+
+
+def run(rooms: int, background: bool, args) -> Tuple[float, float, bool]:
+    """Returns (mean ms a save blocks the turn, worst ms, load matched)."""
+    rng = random.Random(args.seed)
+    base = build_base(rooms, rooms // 2, rng)
+
+    def session() -> GameEngine:
+        game = GameEngine(use_mud_files=False, output=OutputChannel.memory(), world_base=base, seed=args.seed)
+        game.scheduler.cancel_all("THIEF")
+        game.player.current_room = "R0"
+        return game
+
+    game = session()
+    name = "background.json" if background else "sync.json"
+    game.save_game(name, background=background)  # The first save of a file is a full one either way
+    game.finish_saves()
+    blocked = []
+    for save in range(args.saves):
+        for n in range(args.turns):
+            game._process_command(next_command(game, save * args.turns + n, rng))
+            if game.player.awaiting_disambiguation:
+                game._process_command("cancel")  # Two things of the same name; a pending question isn't saved
+        start = time.perf_counter()
+        game.save_game(name, background=background)
+        blocked.append(time.perf_counter() - start)
+    game.finish_saves()
+
+    restored = session()
+    matched = restored.load_game(name) and world_state(restored) == world_state(game)
+    return sum(blocked) * 1000 / len(blocked), max(blocked) * 1000, matched
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark background autosaves against synchronous saves")
+    parser.add_argument("--rooms", default="100,1000,10000",
+                        help="Comma-separated world sizes (default: 100,1000,10000)")
+    parser.add_argument("--saves", type=int, default=MAX_DELTAS + 8,
+                        help=f"Saves per world (default: {MAX_DELTAS + 8})")
+    parser.add_argument("--turns", type=int, default=5, help="Turns between saves (default: 5)")
+    parser.add_argument("--seed", type=int, default=1980)
+    args = parser.parse_args()
+
+    print(f"💾 {args.saves} saves per world, {args.turns} turns apart")
+    results = []
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        try:
+            for rooms in (int(size) for size in args.rooms.split(",")):
+                sync_ms, sync_worst, sync_matched = run(rooms, False, args)
+                background_ms, background_worst, background_matched = run(rooms, True, args)
+                matched = sync_matched and background_matched
+                results.append((sync_worst, background_worst, matched))
+                print(f"   {rooms:>6} rooms: synchronous {sync_ms:7.3f} ms (worst {sync_worst:8.3f})   "
+                      f"background {background_ms:7.3f} ms (worst {background_worst:8.3f})  "
+                      f"{'✅' if matched else '❌'}")
+        finally:
+            os.chdir(original_cwd)
+
+    if not all(matched for _, _, matched in results):
+        print("❌ Loading a save did not give back the game")
+        sys.exit(1)
+    sync_worst, background_worst, _ = results[-1]
+    if background_worst * 5 > sync_worst:
+        print(f"❌ Background saves did not block the turn much less than synchronous ones "
+              f"({background_worst:.3f} ms against {sync_worst:.3f} ms)")
+        sys.exit(1)
+    print(f"✅ Worst background save blocked {sync_worst / background_worst:.1f}x less than a synchronous one")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Combination Lookup Benchmark
+Times can_interact and get_available_interactions as the rule catalogue
+grows, to check that lookups stay flat instead of scanning every rule.
+
+Usage:
+    python tests/benchmark_combinations.py [--lookups N] [--seed N]
+"""
+
+import sys
+import argparse
+import random
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.combinations import InteractionRule, InteractionType, ObjectCombinationManager
+
+VERBS = ["combine", "heat", "break", "pour", "use"]
+SIZES = [10, 100, 1000, 10000]
+
+
+def build_manager(rules: int, objects: int, rng: random.Random) -> ObjectCombinationManager:
+    """Built-in rules plus synthetic ones between random objects."""
+    manager = ObjectCombinationManager()
+    types = list(InteractionType)
+    for n in range(rules):
+        manager.add_interaction_rule(InteractionRule(
+            id=f"rule{n}", interaction_type=rng.choice(types),
+            primary_object=f"OBJ{rng.randrange(objects)}",
+            secondary_object=f"OBJ{rng.randrange(objects)}" if rng.random() < 0.9 else None,
+        ))
+    return manager
+
+
+def time_lookups(manager: ObjectCombinationManager, lookups: int, objects: int, seed: int) -> float:
+    """Microseconds per can_interact + get_available_interactions pair."""
+    rng = random.Random(seed)
+    queries = [(f"OBJ{rng.randrange(objects)}", f"OBJ{rng.randrange(objects)}", rng.choice(VERBS))
+               for _ in range(lookups)]
+    start = time.perf_counter()
+    for primary, secondary, verb in queries:
+        manager.can_interact(primary, secondary, verb)
+        manager.get_available_interactions(primary)
+    return (time.perf_counter() - start) / lookups * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark combination rule lookups")
+    parser.add_argument("--lookups", type=int, default=20000, help="Lookups per size (default: 20000)")
+    parser.add_argument("--seed", type=int, default=1980)
+    args = parser.parse_args()
+
+    print("🔧 Combination lookups vs. rule count")
+    timings = []
+    for size in SIZES:
+        objects = max(20, size // 2)
+        manager = build_manager(size, objects, random.Random(args.seed))
+        per_lookup = time_lookups(manager, args.lookups, objects, args.seed)
+        timings.append(per_lookup)
+        print(f"   {size:>6} rules: {per_lookup:6.2f} us/lookup")
+
+    growth = timings[-1] / timings[0]
+    print(f"   {SIZES[-1] // SIZES[0]}x the rules cost {growth:.1f}x per lookup")
+    if growth < 10:
+        print("✅ Lookups stay flat as rules are added")
+    else:
+        print("❌ Lookups grow with the rule count")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+GameObject Memory and Predicate Benchmark
+Compares the packed GameObject against a plain dict-backed object with the
+same attributes: bytes per object and time for the predicates run during
+every scope walk.
+
+Usage:
+    python tests/benchmark_objects.py [--objects N] [--rounds N]
+"""
+
+import sys
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.entities.objects import GameObject
+
+
+class DictObject:
+    """The original dict-backed layout, kept here as the comparison baseline."""
+
+    def __init__(self, id: str, name: str, description: str, attributes: Dict[str, Any]) -> None:
+        self.id = id
+        self.name = name
+        self.description = description
+        self.attributes = attributes
+        self.aliases: List[str] = []
+        self.containment = None
+
+    def get_attribute(self, name: str, default: Any = None) -> Any:
+        return self.attributes.get(name, default)
+
+    def is_takeable(self) -> bool:
+        return self.get_attribute("takeable", False)
+
+    def is_container(self) -> bool:
+        return self.get_attribute("container", False)
+
+    def is_open(self) -> bool:
+        return self.get_attribute("open", False)
+
+    def is_bulk_action(self) -> bool:
+        return self.get_attribute("bulk_action", False)
+
+
+def make_attributes(i: int) -> Dict[str, Any]:
+    """Attributes typical of the canonical objects."""
+    attributes = {"takeable": i % 3 != 0, "weight": i % 20 + 1}
+    if i % 4 == 0:
+        attributes.update(container=True, openable=True, open=i % 8 == 0, capacity=5, contents=[])
+    if i % 10 == 0:
+        attributes.update(treasure=True, treasure_value=i % 15 + 1)
+    return attributes
+
+
+def measure_memory(factory: Callable, count: int) -> float:
+    """Bytes allocated per object built by factory."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(f"OBJ{i}", f"object {i}", "An object.", make_attributes(i)) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(objects) == count
+    return (after - before) / count
+
+
+def measure_predicates(objects: List, rounds: int) -> float:
+    """Seconds for rounds of the scope-walk predicates over every object."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for obj in objects:
+            if not obj.is_bulk_action() and obj.is_takeable():
+                pass
+            if obj.is_container() and obj.is_open():
+                pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="GameObject memory and predicate benchmark")
+    parser.add_argument("--objects", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"📦 GameObject benchmark ({args.objects} objects)")
+    dict_bytes = measure_memory(DictObject, args.objects)
+    packed_bytes = measure_memory(GameObject, args.objects)
+    print(f"   Memory:     dict {dict_bytes:7.0f} B/object   packed {packed_bytes:7.0f} B/object   "
+          f"({(1 - packed_bytes / dict_bytes) * 100:.0f}% smaller)")
+
+    dict_objects = [DictObject(f"OBJ{i}", "", "", make_attributes(i)) for i in range(args.objects)]
+    packed_objects = [GameObject(f"OBJ{i}", "", "", make_attributes(i)) for i in range(args.objects)]
+    dict_time = measure_predicates(dict_objects, args.rounds)
+    packed_time = measure_predicates(packed_objects, args.rounds)
+    print(f"   Predicates: dict {dict_time * 1000:7.1f} ms          packed {packed_time * 1000:7.1f} ms          "
+          f"({dict_time / packed_time:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
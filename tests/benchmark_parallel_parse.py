@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Parallel Parsing Benchmark
+Compares serial and process-pool MDLParser.parse_directory on a multi-file
+source tree and checks that both produce identical rooms.
+
+Usage:
+    python tests/benchmark_parallel_parse.py [--mud-dir DIR] [--workers N] [--runs N]
+
+When no .mud directory is available a synthetic multi-file tree is generated.
+"""
+
+import sys
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.parsers.mdl_parser import MDLParser
+
+
+def write_synthetic_tree(directory: Path, files: int, rooms_per_file: int) -> None:
+    """Write files .mud files whose rooms reference variables defined in other files."""
+    for n in range(files):
+        blocks = [f'<PSETG DESC{n} "This is part of area {n}. Passages twist off in several '
+                  f'directions and the walls are slick with moisture.">']
+        for i in range(rooms_per_file):
+            blocks.append(
+                f'<ROOM "F{n}R{i}"\n'
+                f'       ,DESC{(n + 1) % files}\n'
+                f'       "Area {n} Room {i}"\n'
+                f'       <EXIT "NORTH" "F{n}R{i + 1}" "SOUTH" "F{n}R{i - 1}"\n'
+                f'             "WEST" <CEXIT "MAGIC-FLAG" "F{n}R0" "The way is shut.">\n'
+                f'             "DOWN" <DOOR "DOOR" "F{n}R{i}" "F{(n + 1) % files}R{i}">\n'
+                f'             "UP" #NEXIT "You can\'t climb the walls.">\n'
+                f'       (<GET-OBJ "ROCK"> <GET-OBJ "LAMP">)\n'
+                f'       <>\n'
+                f'       <+ ,RLANDBIT ,RLIGHTBIT>>'
+            )
+        (directory / f"area{n:02d}.mud").write_text("\n".join(blocks))
+
+
+def time_parse(mud_dir: Path, workers: int, runs: int) -> List[float]:
+    """Time parse_directory with the given worker count."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        MDLParser().parse_directory(mud_dir, workers=workers)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serial vs parallel .mud parsing benchmark")
+    parser.add_argument("--mud-dir", type=Path, default=Path("zork_mtl_source"))
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--rooms-per-file", type=int, default=1500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        mud_dir = args.mud_dir
+        if not mud_dir.exists():
+            mud_dir = Path(temp_dir)
+            write_synthetic_tree(mud_dir, args.files, args.rooms_per_file)
+            print(f"🏗️  {args.mud_dir} not found, using {args.files} synthetic files "
+                  f"x {args.rooms_per_file} rooms")
+
+        serial = MDLParser().parse_directory(mud_dir)
+        parallel = MDLParser().parse_directory(mud_dir, workers=max(args.workers, 2))
+        print(f"✅ Outputs identical: {serial == parallel} ({len(serial)} rooms)")
+
+        print(f"⚡ Parse benchmark ({args.runs} runs each, {args.workers} workers)")
+        serial_time = statistics.median(time_parse(mud_dir, 1, args.runs))
+        parallel_time = statistics.median(time_parse(mud_dir, args.workers, args.runs))
+        print(f"   serial   median {serial_time * 1000:8.1f} ms")
+        print(f"   parallel median {parallel_time * 1000:8.1f} ms")
+        print(f"   Speedup: {serial_time / parallel_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
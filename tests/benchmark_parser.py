@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Command Parser Benchmark
+Parses a generated corpus of commands with the trie-based CommandParser and
+with the original regex/scan implementation (both uncached), checks that both produce the
+same commands, and reports the time per parse.
+
+Usage:
+    python tests/benchmark_parser.py [--commands N] [--rounds N] [--seed N]
+"""
+
+import sys
+import argparse
+import random
+import re
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.parser.command_parser import Command, CommandParser
+
+NOUNS = ["lamp", "brass lantern", "sword", "mailbox", "small mailbox", "leaflet", "rope", "box",
+         "door", "egg", "jewel-encrusted egg", "me", "all", "window", "sack", "bottle", "troll"]
+FILLERS = ["", "the ", "a ", "my "]
+
+
+class RegexCommandParser(CommandParser):
+    """The original parser: phrase scan, regex tokenizer, then a preposition scan."""
+
+    def parse(self, user_input: str) -> Optional[Command]:
+        if not user_input.strip():
+            return None
+        normalized_input = self._normalize_input(user_input.strip().lower())
+        tokens = self._tokenize(normalized_input)
+        if not tokens:
+            return None
+        verb = self._normalize_verb(tokens[0])
+        noun, preposition, noun2 = self._extract_objects(tokens[1:])
+        if noun:
+            noun = self._normalize_noun(noun)
+        if noun2:
+            noun2 = self._normalize_noun(noun2)
+        return Command(verb, noun, preposition, noun2)
+
+    def _normalize_input(self, text: str) -> str:
+        for phrase, replacement in sorted(self.multi_word_verbs.items(), key=len, reverse=True):
+            if text.startswith(phrase + " ") or text == phrase:
+                text = text.replace(phrase, replacement, 1)
+                break
+        return text
+
+    def _tokenize(self, text: str) -> List[str]:
+        text = re.sub(r'[^\w\s]', ' ', text)
+        return [token for token in text.split() if token not in self.articles]
+
+    def _extract_objects(self, tokens: List[str]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        if not tokens:
+            return None, None, None
+        preposition_index = None
+        for i, token in enumerate(tokens):
+            if token in self.prepositions:
+                preposition_index = i
+                break
+        if preposition_index is None:
+            return " ".join(tokens), None, None
+        noun1_tokens = tokens[:preposition_index]
+        noun2_tokens = tokens[preposition_index + 1:]
+        return (" ".join(noun1_tokens) if noun1_tokens else None, tokens[preposition_index],
+                " ".join(noun2_tokens) if noun2_tokens else None)
+
+
+def make_corpus(parser: CommandParser, count: int, rng: random.Random) -> List[str]:
+    """Commands of the shapes players type: verb, verb noun, verb noun prep noun, phrasal verbs."""
+    verbs = list(parser.verb_synonyms) + list(parser.multi_word_verbs)
+    prepositions = sorted(parser.prepositions)
+    corpus = []
+    for _ in range(count):
+        shape = rng.random()
+        verb = rng.choice(verbs)
+        if shape < 0.2:
+            corpus.append(verb)
+        elif shape < 0.7:
+            corpus.append(f"{verb} {rng.choice(FILLERS)}{rng.choice(NOUNS)}")
+        else:
+            corpus.append(f"{verb} {rng.choice(FILLERS)}{rng.choice(NOUNS)} {rng.choice(prepositions)} "
+                          f"{rng.choice(FILLERS)}{rng.choice(NOUNS)}")
+    return corpus
+
+
+def fields(command: Optional[Command]) -> Optional[Tuple[Optional[str], ...]]:
+    """Comparable form of a parse result."""
+    if command is None:
+        return None
+    return command.verb, command.noun, command.preposition, command.noun2
+
+
+def time_parser(parser: CommandParser, corpus: List[str], rounds: int) -> float:
+    """Best-of-rounds microseconds per parse."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for line in corpus:
+            parser.parse(line)
+        best = min(best, time.perf_counter() - start)
+    return best / len(corpus) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the command parser")
+    parser.add_argument("--commands", type=int, default=20000, help="Corpus size (default: 20000)")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds, best is kept (default: 5)")
+    parser.add_argument("--seed", type=int, default=1980)
+    args = parser.parse_args()
+
+    trie, regex, cached = CommandParser(cache_size=0), RegexCommandParser(cache_size=0), CommandParser()
+    corpus = make_corpus(trie, args.commands, random.Random(args.seed))
+
+    print(f"🔤 {len(corpus)} commands, best of {args.rounds} rounds")
+    regex_time = time_parser(regex, corpus, args.rounds)
+    trie_time = time_parser(trie, corpus, args.rounds)
+    cached_time = time_parser(cached, corpus, args.rounds)
+    print(f"   Regex/scan parser: {regex_time:6.2f} us/parse")
+    print(f"   Trie parser:       {trie_time:6.2f} us/parse")
+    print(f"   Trie + parse cache:{cached_time:6.2f} us/parse  "
+          f"({cached.cache_hits / (cached.cache_hits + cached.cache_misses) * 100:.0f}% hit, unique corpus)")
+
+    # Play sessions repeat a few commands ("n", "look", "take lamp") most of the time
+    rng = random.Random(args.seed)
+    hot = ["n", "s", "e", "w", "look", "i", "take lamp", "open mailbox", "read leaflet", "x sword"]
+    session = [rng.choice(hot) if rng.random() < 0.8 else rng.choice(corpus) for _ in corpus]
+    cached.clear_cache()
+    session_time = time_parser(cached, session, args.rounds)
+    print(f"   Trie + parse cache:{session_time:6.2f} us/parse  "
+          f"({cached.cache_hits / (cached.cache_hits + cached.cache_misses) * 100:.0f}% hit, play session)")
+    print(f"   Speedup:           {regex_time / trie_time:6.2f}x (uncached)")
+
+    mismatches = [line for line in corpus if fields(trie.parse(line)) != fields(regex.parse(line))]
+    if mismatches:
+        print(f"❌ {len(mismatches)} commands parse differently, e.g. {mismatches[0]!r}")
+        sys.exit(1)
+    print("✅ Both parsers produce the same commands")
+
+
+if __name__ == "__main__":
+    main()
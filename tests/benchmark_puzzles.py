@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Puzzle Trigger Benchmark
+Runs a synthetic catalogue of puzzles (default 1,000) against a stream of
+commands and compares the indexed PuzzleManager with the original loop over
+every puzzle. Both must fire the same steps.
+
+Usage:
+    python tests/benchmark_puzzles.py [--puzzles N] [--commands N] [--seed N]
+"""
+
+import sys
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game import GameEngine
+from src.output import OutputChannel
+from src.puzzles import Puzzle, PuzzleManager, PuzzleStep
+
+VERBS = ["take", "open", "push", "turn", "unlock", "read", "look", "inventory", "north", "drop"]
+
+
+class LinearPuzzleManager(PuzzleManager):
+    """The original behavior: check every active puzzle on every command."""
+
+    def attempt_puzzle_action(self, command_verb: str, target_object: str = None,
+                              target_room: str = None, **kwargs) -> Tuple[bool, str]:
+        triggered_any = False
+        result_message = ""
+        for puzzle in self.puzzles.values():
+            if puzzle.is_complete() or puzzle.is_failed():
+                continue
+            current_step = puzzle.get_current_step()
+            if not current_step:
+                continue
+            # The original set-based inventory check, done for every puzzle
+            if not set(current_step.required_objects).issubset(set(self.game.player.inventory)):
+                continue
+            if self._can_trigger_step(puzzle, current_step, command_verb, target_object, target_room, **kwargs):
+                success, message = self._execute_puzzle_step(puzzle, current_step, **kwargs)
+                if success:
+                    triggered_any = True
+                    if message:
+                        result_message += message + " "
+        return triggered_any, result_message.strip()
+
+
+def build_catalogue(manager: PuzzleManager, count: int, rooms: List[str], rng: random.Random,
+                    fired: List[str]) -> None:
+    """Register count puzzles of 1-3 steps spread over rooms and verbs, some gated on flags."""
+    for n in range(count):
+        steps = []
+        for i in range(rng.randint(1, 3)):
+            verb = rng.choice(VERBS[:6])
+            noun = f"thing{rng.randrange(20)}"
+            step_id = f"p{n}s{i}"
+
+            def trigger(game, command_verb, target_object, verb=verb, noun=noun, **kwargs):
+                return command_verb == verb and target_object == noun
+
+            def action(step_id=step_id, **kwargs):
+                fired.append(step_id)
+                return True
+
+            steps.append(PuzzleStep(
+                id=step_id, description=step_id, trigger_condition=trigger, action=action,
+                required_room=rng.choice(rooms), trigger_verbs=[verb],
+                required_flags=[f"flag{rng.randrange(10)}"] if rng.random() < 0.1 else [],
+            ))
+        manager.register_puzzle(Puzzle(id=f"p{n}", name=f"Puzzle {n}", description="", steps=steps))
+
+
+def make_commands(count: int, rooms: List[str], rng: random.Random) -> List[Tuple[str, str, str]]:
+    """(room, verb, noun) triples; most commands are everyday verbs that trigger nothing."""
+    return [(rng.choice(rooms), rng.choice(VERBS), f"thing{rng.randrange(20)}") for _ in range(count)]
+
+
+def run(manager_class, game: GameEngine, args, rooms: List[str]) -> Tuple[float, List[str], int]:
+    """Time one manager over the command stream. Returns (seconds, fired steps, trigger checks)."""
+    rng = random.Random(args.seed)
+    manager = manager_class(game)
+    fired: List[str] = []
+    build_catalogue(manager, args.puzzles, rooms, rng, fired)
+    commands = make_commands(args.commands, rooms, rng)
+
+    start = time.perf_counter()
+    for n, (room, verb, noun) in enumerate(commands):
+        game.player.current_room = room
+        if n % 500 == 0:
+            manager.set_flag(f"flag{n // 500 % 10}")
+        manager.attempt_puzzle_action(verb, noun, room)
+    return time.perf_counter() - start, fired, manager.trigger_checks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the puzzle trigger index")
+    parser.add_argument("--puzzles", type=int, default=1000, help="Synthetic puzzles (default: 1000)")
+    parser.add_argument("--commands", type=int, default=5000, help="Commands to run (default: 5000)")
+    parser.add_argument("--rooms", type=int, default=100, help="Rooms the puzzles are spread over")
+    parser.add_argument("--seed", type=int, default=1980)
+    args = parser.parse_args()
+
+    game = GameEngine(use_mud_files=False, output=OutputChannel.memory())
+    rooms = [f"ROOM{i}" for i in range(args.rooms)]
+
+    print(f"🧩 {args.puzzles} puzzles over {args.rooms} rooms, {args.commands} commands")
+    linear_time, linear_fired, linear_checks = run(LinearPuzzleManager, game, args, rooms)
+    indexed_time, indexed_fired, indexed_checks = run(PuzzleManager, game, args, rooms)
+
+    print(f"   Linear scan: {linear_time * 1000:8.1f} ms  "
+          f"({linear_checks / args.commands:7.2f} trigger checks/command)")
+    print(f"   Indexed:     {indexed_time * 1000:8.1f} ms  "
+          f"({indexed_checks / args.commands:7.2f} trigger checks/command)")
+    print(f"   Speedup:     {linear_time / indexed_time:8.1f}x")
+
+    if linear_fired == indexed_fired:
+        print(f"✅ Both fired the same {len(indexed_fired)} steps")
+    else:
+        print("❌ Indexed manager fired different steps than the linear scan")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Delta Save Benchmark
+Walks a synthetic grid world of growing size, saving to the same file
+every few turns, and compares what each save costs (time and bytes
+written) with writing a full checkpoint of the same game. Delta saves
+should cost what the turns since the last save changed, however big the
+world is; checkpoints grow with the world. The file is then loaded into a
+fresh session and must match the game.
+
+Usage:
+    python tests/benchmark_saves.py [--rooms 100,1000,10000] [--saves N] [--turns N] [--seed N]
+"""
+
+import sys
+import argparse
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Tuple
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game import GameEngine
+from src.output import OutputChannel
+from tests.benchmark_sessions import build_base
+from tests.benchmark_undo import next_command, world_state
+
+
+def run(rooms: int, args) -> Tuple[float, float, float, float, bool]:
+    """Returns (ms per delta save, bytes per delta, ms per checkpoint, checkpoint bytes, load matched)."""
+    rng = random.Random(args.seed)
+    base = build_base(rooms, rooms // 2, rng)
+
+    def session() -> GameEngine:
+        game = GameEngine(use_mud_files=False, output=OutputChannel.memory(), world_base=base, seed=args.seed)
+        game.scheduler.cancel_all("THIEF")
+        game.player.current_room = "R0"
+        return game
+
+    game = session()
+    path = Path("saves") / "bench.json"
+    game.save_game("bench.json")
+    delta_time = 0.0
+    size = path.stat().st_size
+    for save in range(args.saves):
+        for n in range(args.turns):
+            game._process_command(next_command(game, save * args.turns + n, rng))
+            if game.player.awaiting_disambiguation:
+                game._process_command("cancel")  # Two things of the same name; a pending question isn't saved
+        start = time.perf_counter()
+        game.save_game("bench.json")
+        delta_time += time.perf_counter() - start
+    delta_bytes = (path.stat().st_size - size) / args.saves
+
+    start = time.perf_counter()
+    game.save_game("checkpoint.json")
+    checkpoint_time = time.perf_counter() - start
+    checkpoint_bytes = (Path("saves") / "checkpoint.json").stat().st_size
+
+    restored = session()
+    matched = restored.load_game("bench.json") and world_state(restored) == world_state(game)
+    return (delta_time * 1000 / args.saves, delta_bytes, checkpoint_time * 1000, checkpoint_bytes, matched)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark delta saves against world size")
+    parser.add_argument("--rooms", default="100,1000,10000",
+                        help="Comma-separated world sizes (default: 100,1000,10000)")
+    parser.add_argument("--saves", type=int, default=20, help="Saves per world (default: 20)")
+    parser.add_argument("--turns", type=int, default=5, help="Turns between saves (default: 5)")
+    parser.add_argument("--seed", type=int, default=1980)
+    args = parser.parse_args()
+
+    print(f"💾 {args.saves} saves per world, {args.turns} turns apart")
+    results = []
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        try:
+            for rooms in (int(size) for size in args.rooms.split(",")):
+                delta_ms, delta_bytes, checkpoint_ms, checkpoint_bytes, matched = run(rooms, args)
+                results.append((delta_bytes, checkpoint_bytes, matched))
+                print(f"   {rooms:>6} rooms: delta {delta_ms:7.3f} ms {delta_bytes:>8,.0f} B   "
+                      f"checkpoint {checkpoint_ms:8.3f} ms {checkpoint_bytes:>10,} B  {'✅' if matched else '❌'}")
+        finally:
+            os.chdir(original_cwd)
+
+    smallest, largest = results[0], results[-1]
+    if not all(matched for _, _, matched in results):
+        print("❌ Loading the delta file did not give back the game")
+        sys.exit(1)
+    if largest[0] > 2 * smallest[0]:
+        print(f"❌ Delta size grew {largest[0] / smallest[0]:.1f}x with the world")
+        sys.exit(1)
+    print(f"✅ Delta size {largest[0] / smallest[0]:.1f}x from smallest to largest world "
+          f"(a checkpoint: {largest[1] / smallest[1]:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
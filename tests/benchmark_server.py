@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Game Server Load Generator
+Opens increasing numbers of concurrent sessions against the game server,
+plays a short walkthrough in each (with think time between commands, like
+a person typing) and reports turn latency per level. The largest level
+whose p99 stays under the target, divided by the CPU count, is the
+server's sessions per core.
+
+By default an in-process server is started on a free port with the fallback
+world; --connect points the generator at a server started with
+`python main.py --serve`.
+
+Usage:
+    python tests/benchmark_server.py [--sessions 10,50,100,200] [--p99-target MS]
+                                     [--think SECONDS] [--connect HOST:PORT]
+"""
+
+import sys
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.batch import EngineOptions, percentile
+from src.server import PROMPT, GameServer, ServerOptions
+
+WALKTHROUGH = ["look", "open mailbox", "take leaflet", "read leaflet", "inventory", "examine house",
+               "n", "s", "take lamp. turn on lamp", "drop leaflet", "score", "wait", "look"]
+
+
+async def play_session(host: str, port: int, commands: int, think: float, rng: random.Random,
+                       latencies: List[float]) -> int:
+    """One client: connect, then send commands and time each reply. Returns turns played."""
+    reader, writer = await asyncio.open_connection(host, port)
+    prompt = PROMPT.encode()
+    played = 0
+    try:
+        await reader.readuntil(prompt)
+        for n in range(commands):
+            await asyncio.sleep(rng.uniform(0, 2 * think))
+            start = time.perf_counter()
+            writer.write(f"{WALKTHROUGH[n % len(WALKTHROUGH)]}\n".encode())
+            await writer.drain()
+            await reader.readuntil(prompt)
+            latencies.append(time.perf_counter() - start)
+            played += 1
+    finally:
+        writer.close()
+    return played
+
+
+async def run_level(host: str, port: int, sessions: int, args) -> Tuple[float, List[float], int]:
+    """Run sessions concurrent clients. Returns (wall seconds, turn latencies, turns)."""
+    rng = random.Random(args.seed)
+    latencies: List[float] = []
+    start = time.perf_counter()
+    played = await asyncio.gather(*(
+        play_session(host, port, args.commands, args.think, random.Random(rng.random()), latencies)
+        for _ in range(sessions)
+    ))
+    return time.perf_counter() - start, latencies, sum(played)
+
+
+async def run(args) -> None:
+    server: Optional[GameServer] = None
+    if args.connect:
+        host, _, port = args.connect.rpartition(":")
+        port = int(port)
+    else:
+        server = await GameServer(ServerOptions(port=0, engine=EngineOptions(use_mud_files=False))).start()
+        host, port = server.address[:2]
+
+    cores = os.cpu_count() or 1
+    levels = [int(level) for level in args.sessions.split(",")]
+    print(f"🌐 {host}:{port}, {args.commands} commands per session, ~{args.think * 1000:.0f} ms think time, "
+          f"{cores} core(s)")
+    best = 0
+    try:
+        for sessions in levels:
+            wall, latencies, turns = await run_level(host, port, sessions, args)
+            p50, p99 = percentile(latencies, 50) * 1000, percentile(latencies, 99) * 1000
+            ok = p99 <= args.p99_target
+            if ok:
+                best = max(best, sessions)
+            print(f"   {sessions:>6} sessions: {turns / wall:>8,.0f} turns/sec  "
+                  f"p50 {p50:7.2f} ms  p99 {p99:7.2f} ms  {'✅' if ok else '❌'}")
+    finally:
+        if server is not None:
+            await server.close()
+
+    if best:
+        print(f"✅ {best / cores:,.0f} sessions per core with p99 under {args.p99_target:.0f} ms")
+    else:
+        print(f"❌ No level kept p99 under {args.p99_target:.0f} ms")
+        sys.exit(1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test the multi-session game server")
+    parser.add_argument("--sessions", default="10,50,100,200",
+                        help="Comma-separated concurrent session counts (default: 10,50,100,200)")
+    parser.add_argument("--commands", type=int, default=20, help="Commands per session (default: 20)")
+    parser.add_argument("--think", type=float, default=0.1,
+                        help="Mean seconds between a session's commands (default: 0.1)")
+    parser.add_argument("--p99-target", type=float, default=100.0,
+                        help="p99 turn latency budget in ms (default: 100)")
+    parser.add_argument("--connect", metavar="HOST:PORT", help="Use a running server instead of an in-process one")
+    parser.add_argument("--seed", type=int, default=1980)
+    args = parser.parse_args()
+
+    # The in-process server's eviction saves land in a scratch directory
+    with tempfile.TemporaryDirectory() as scratch:
+        cwd = os.getcwd()
+        os.chdir(scratch)
+        try:
+            asyncio.run(run(args))
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main()
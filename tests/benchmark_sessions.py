@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+World Session Memory Benchmark
+Builds a synthetic world (default 2,000 rooms and 1,000 objects, since the
+shipped .mud world may not be present), takes it as a shared WorldBase and
+measures bytes per session with tracemalloc at 1, 10, 100 and 10,000
+sessions.
+Every session makes a few typical changes (moves items, opens objects,
+visits rooms) before it is measured.
+
+Forked sessions are compared with sessions that deep-copy the world, which
+is what each engine building its own world amounts to. Copies are only
+measured up to --max-copies sessions; more would not fit in memory.
+
+Usage:
+    python tests/benchmark_sessions.py [--sessions 1,10,100,10000] [--rooms N] [--objects N]
+                                       [--changes N] [--max-copies N] [--max-engines N]
+"""
+
+import sys
+import argparse
+import copy
+import gc
+import random
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.entities.objects import GameObject
+from src.game import GameEngine
+from src.output import OutputChannel
+from src.sessions import WorldBase
+from src.world.room import Room
+
+ADJECTIVES = ["dusty", "narrow", "damp", "vast", "twisting", "silent", "crumbling", "glittering"]
+NOUNS = ["passage", "chamber", "grotto", "hall", "cavern", "gallery", "crawlway", "vault"]
+THINGS = ["coin", "skull", "candle", "scroll", "chalice", "bracelet", "figurine", "key"]
+
+
+def build_base(rooms: int, objects: int, rng: random.Random) -> WorldBase:
+    """Fallback engine plus a grid of synthetic rooms with objects scattered through them."""
+    template = GameEngine(use_mud_files=False, output=OutputChannel.memory())
+    width = max(1, int(rooms ** 0.5))
+    for n in range(rooms):
+        name = f"{rng.choice(ADJECTIVES).title()} {rng.choice(NOUNS).title()}"
+        exits = {}
+        if n % width:
+            exits["west"] = f"R{n - 1}"
+        if n % width < width - 1 and n + 1 < rooms:
+            exits["east"] = f"R{n + 1}"
+        if n >= width:
+            exits["north"] = f"R{n - width}"
+        if n + width < rooms:
+            exits["south"] = f"R{n + width}"
+        description = (f"You are in a {name.lower()}. " +
+                       " ".join(rng.choice(ADJECTIVES) + " " + rng.choice(NOUNS) for _ in range(12)) + ".")
+        template.world.add_room(Room(id=f"R{n}", name=name, description=description, exits=exits))
+
+    for n in range(objects):
+        thing = rng.choice(THINGS)
+        name = f"{rng.choice(ADJECTIVES)} {thing}"
+        obj = GameObject(id=f"O{n}", name=name, description=f"A {name}, worn smooth by the years.",
+                         attributes={"takeable": True, "weight": rng.randint(1, 10),
+                                     "open": False, "contents": []},
+                         aliases=[thing])
+        template.object_manager.add_object(obj)
+        template.world.get_room(f"R{rng.randrange(rooms)}").add_item(obj.id)
+    return WorldBase.from_engine(template)
+
+
+def play(world, object_manager, rooms: int, changes: int, rng: random.Random) -> None:
+    """A few typical mutations: visit rooms, open objects, carry items to another room."""
+    for _ in range(changes):
+        room = world.get_room(f"R{rng.randrange(rooms)}")
+        room.visited = True
+        if room.items:
+            item_id = room.items[0]
+            object_manager.get_object(item_id).set_attribute("open", True)
+            room.remove_item(item_id)
+            world.get_room(f"R{rng.randrange(rooms)}").add_item(item_id)
+
+
+def measure(count: int, make: Callable[[], object]) -> float:
+    """Bytes per session allocated by count calls of make (results kept alive)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [make() for _ in range(count)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del sessions
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure memory per world session")
+    parser.add_argument("--sessions", default="1,10,100,10000",
+                        help="Comma-separated session counts (default: 1,10,100,10000)")
+    parser.add_argument("--rooms", type=int, default=2000, help="Synthetic rooms (default: 2000)")
+    parser.add_argument("--objects", type=int, default=1000, help="Synthetic objects (default: 1000)")
+    parser.add_argument("--changes", type=int, default=5, help="Changes each session makes (default: 5)")
+    parser.add_argument("--max-copies", type=int, default=10,
+                        help="Largest session count measured for deep-copied worlds (default: 10)")
+    parser.add_argument("--max-engines", type=int, default=100,
+                        help="Largest session count measured for whole forked engines (default: 100)")
+    parser.add_argument("--seed", type=int, default=1980)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    base = build_base(args.rooms, args.objects, rng)
+    levels = [int(level) for level in args.sessions.split(",")]
+    print(f"🌍 {len(base.world)} rooms, {len(base.object_manager)} objects, "
+          f"{args.changes} changes per session")
+
+    def forked():
+        world, object_manager = base.fork()
+        world.attach_containment(object_manager.containment)
+        play(world, object_manager, args.rooms, args.changes, rng)
+        return world, object_manager
+
+    def copied():
+        world, object_manager = copy.deepcopy((base.world, base.object_manager))
+        play(world, object_manager, args.rooms, args.changes, rng)
+        return world, object_manager
+
+    def engine():
+        game = GameEngine(use_mud_files=False, output=OutputChannel.memory(), world_base=base)
+        play(game.world, game.object_manager, args.rooms, args.changes, rng)
+        return game
+
+    results: List[Tuple[int, float, Optional[float]]] = []
+    print(f"   {'sessions':>8}  {'forked world':>14}  {'forked engine':>14}  {'copied world':>14}")
+    for count in levels:
+        fork_bytes = measure(count, forked)
+        engine_bytes = measure(count, engine) if count <= args.max_engines else None
+        copy_bytes = measure(count, copied) if count <= args.max_copies else None
+        results.append((count, fork_bytes, copy_bytes))
+        engine_text = f"{engine_bytes:>12,.0f} B" if engine_bytes is not None else f"{'—':>14}"
+        copy_text = f"{copy_bytes:>12,.0f} B" if copy_bytes is not None else f"{'—':>14}"
+        print(f"   {count:>8}  {fork_bytes:>12,.0f} B  {engine_text}  {copy_text}")
+
+    copied_sizes = [size for _, _, size in results if size is not None]
+    largest_count, largest_fork, _ = results[-1]
+    if not copied_sizes:
+        print(f"✅ {largest_fork:,.0f} bytes per forked session at {largest_count:,} sessions")
+        return
+    ratio = largest_fork / min(copied_sizes)
+    if ratio <= 0.05:
+        print(f"✅ {largest_fork:,.0f} bytes per forked session at {largest_count:,} sessions "
+              f"({ratio:.1%} of a copied world)")
+    else:
+        print(f"❌ Forked sessions use {ratio:.1%} of a copied world's memory")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark for the World Image Cache
+Compares cold GameEngine startup (parse .mud files) against warm startup
+(load the precompiled world image).
+
+Usage:
+    python tests/benchmark_startup.py [--mud-dir DIR] [--runs N] [--rooms N]
+
+When no .mud directory is available a synthetic dungeon is generated.
+"""
+
+import sys
+import argparse
+import contextlib
+import io
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game import GameEngine
+from src.world.world_image import WorldImageCache
+
+
+def write_synthetic_dungeon(directory: Path, room_count: int) -> None:
+    """Write a synthetic .mud dungeon with room_count rooms in a ring."""
+    blocks = ['<PSETG STFORE "This is a forest, with trees in all directions around you.">']
+    room_ids = ["WHOUS"] + [f"R{i}" for i in range(1, room_count)]
+    for i, room_id in enumerate(room_ids):
+        north = room_ids[(i + 1) % room_count]
+        south = room_ids[i - 1]
+        blocks.append(
+            f'<ROOM "{room_id}"\n'
+            f'       "This is synthetic room {i}. Passages lead north and south, and a '
+            f'draft from somewhere below carries the smell of damp earth."\n'
+            f'       "Room {i}"\n'
+            f'       <EXIT "NORTH" "{north}" "SOUTH" "{south}" "UP" #NEXIT "The ceiling is too high.">\n'
+            f'       (<GET-OBJ "ROCK{i}">)\n'
+            f'       <>\n'
+            f'       <+ ,RLANDBIT ,RLIGHTBIT>>'
+        )
+    (directory / "dung.mud").write_text("\n".join(blocks))
+
+
+def time_startup(mud_dir: Path, runs: int, cold: bool) -> List[float]:
+    """Time GameEngine construction, clearing the world image first when cold."""
+    times = []
+    for _ in range(runs):
+        if cold:
+            WorldImageCache(mud_dir).clear()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = GameEngine(use_mud_files=True, mud_directory=mud_dir)
+        times.append(time.perf_counter() - start)
+        assert game.world_loaded_from_cache != cold
+    return times
+
+
+def report(label: str, times: List[float]) -> float:
+    """Print timing summary and return the median."""
+    median = statistics.median(times)
+    print(f"   {label:<6} median {median * 1000:8.1f} ms   min {min(times) * 1000:8.1f} ms   "
+          f"max {max(times) * 1000:8.1f} ms")
+    return median
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold vs warm startup benchmark")
+    parser.add_argument("--mud-dir", type=Path, default=Path("zork_mtl_source"))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--rooms", type=int, default=2000,
+                        help="Rooms in the synthetic dungeon when --mud-dir is missing")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        mud_dir = args.mud_dir
+        if not mud_dir.exists():
+            mud_dir = Path(temp_dir)
+            write_synthetic_dungeon(mud_dir, args.rooms)
+            print(f"🏗️  {args.mud_dir} not found, using synthetic dungeon with {args.rooms} rooms")
+
+        print(f"⚡ Startup benchmark ({args.runs} runs each)")
+        cold = report("cold", time_startup(mud_dir, args.runs, cold=True))
+        warm = report("warm", time_startup(mud_dir, args.runs, cold=False))
+        print(f"   Speedup: {cold / warm:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
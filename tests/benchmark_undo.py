@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Undo Journal Benchmark
+Walks a synthetic grid world of growing size, taking and dropping things,
+and compares what UNDO costs per turn with the journal against taking a
+_collect_game_state() snapshot every turn. The journal's cost should not
+depend on the size of the world; the snapshot's grows with it. Every turn
+is then undone and the world must match its starting state.
+
+Usage:
+    python tests/benchmark_undo.py [--rooms 100,1000,10000] [--turns N] [--seed N]
+"""
+
+import sys
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import Tuple
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game import GameEngine
+from src.output import OutputChannel
+from tests.benchmark_sessions import build_base
+
+
+def next_command(game: GameEngine, n: int, rng: random.Random) -> str:
+    """Move on, pick up what's lying around and drop things now and then."""
+    room = game.world.peek_room(game.player.current_room)
+    if n % 3 == 1 and room.items:
+        return f"take {game.object_manager.objects.peek(room.items[0]).name}"
+    if n % 7 == 2 and game.player.inventory:
+        return f"drop {game.object_manager.get_object(game.player.inventory[0]).name}"
+    return rng.choice(sorted(room.exits))
+
+
+def world_state(game: GameEngine):
+    return ({room.id: list(room.items) for room in game.world.iter_rooms()},
+            list(game.player.inventory), game.player.current_room)
+
+
+def run(rooms: int, args) -> Tuple[float, float, float, bool]:
+    """Returns (ms per turn, journal records per turn, snapshot ms per turn, undo restored everything)."""
+    rng = random.Random(args.seed)
+    base = build_base(rooms, rooms // 2, rng)
+    game = GameEngine(use_mud_files=False, output=OutputChannel.memory(), world_base=base, seed=args.seed)
+    game.scheduler.cancel_all("THIEF")
+    game.player.current_room = "R0"
+    game.journal = type(game.journal)(depth=args.turns)
+    game.tracker.journal = game.journal
+    for manager in (game.score_manager, game.puzzle_manager):
+        manager.journal = game.journal
+    before = world_state(game)
+
+    start = time.perf_counter()
+    for n in range(args.turns):
+        game._process_command(next_command(game, n, rng))
+    turn_time = (time.perf_counter() - start) / args.turns
+    records = sum(len(turn.records) for turn in game.journal.turns) / args.turns
+
+    snapshots = max(1, args.turns // 10)
+    start = time.perf_counter()
+    for _ in range(snapshots):
+        game._collect_game_state()
+    snapshot_time = (time.perf_counter() - start) / snapshots
+
+    while game.journal.undo() is not None:
+        pass
+    game.player.current_room = "R0"
+    return turn_time * 1000, records, snapshot_time * 1000, world_state(game) == before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark per-turn undo cost against world size")
+    parser.add_argument("--rooms", default="100,1000,10000",
+                        help="Comma-separated world sizes (default: 100,1000,10000)")
+    parser.add_argument("--turns", type=int, default=500, help="Turns played per world (default: 500)")
+    parser.add_argument("--seed", type=int, default=1980)
+    args = parser.parse_args()
+
+    print(f"↩️  {args.turns} turns per world")
+    results = []
+    for rooms in (int(size) for size in args.rooms.split(",")):
+        turn_ms, records, snapshot_ms, restored = run(rooms, args)
+        results.append((turn_ms, snapshot_ms, restored))
+        print(f"   {rooms:>6} rooms: turn {turn_ms:7.3f} ms  journal {records:5.1f} records/turn  "
+              f"snapshot {snapshot_ms:8.3f} ms/turn  {'✅' if restored else '❌'}")
+
+    smallest, largest = results[0], results[-1]
+    if not all(restored for _, _, restored in results):
+        print("❌ Undoing every turn did not restore the starting world")
+        sys.exit(1)
+    if largest[0] > 2 * smallest[0]:
+        print(f"❌ Turn cost grew {largest[0] / smallest[0]:.1f}x with the world")
+        sys.exit(1)
+    print(f"✅ Turn cost {largest[0] / smallest[0]:.1f}x from smallest to largest world "
+          f"(a snapshot per turn: {largest[1] / smallest[1]:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Shared fixtures for the engine tests."""
+
+import pytest
+
+from src.game import GameEngine
+from src.output import OutputChannel
+from src.world.room import Room
+
+
+def _quiet_game(**options) -> GameEngine:
+    """Fallback world with the thief's events cancelled, so it can't steal what a test picks up."""
+    game = GameEngine(use_mud_files=False, **options)
+    game.scheduler.cancel_all("THIEF")
+    return game
+
+
+@pytest.fixture
+def make_game():
+    """
+    Factory for a fallback world with a room north of WHOUS and the mailbox
+    and lamp at hand. Keyword arguments go to GameEngine (autosave_every=...).
+    """
+    def make(**options) -> GameEngine:
+        options.setdefault("output", OutputChannel.memory())
+        options.setdefault("seed", 7)
+        game = _quiet_game(**options)
+        game.world.add_room(Room(id="NHOUS", name="North of House", description="You are north of the house.",
+                                 exits={"south": "WHOUS"}))
+        whous = game.world.get_room("WHOUS")
+        whous.exits["north"] = "NHOUS"
+        for item_id in ("MAILBOX", "LAMP"):
+            whous.add_item(item_id)
+        return game
+    return make
+
+
+@pytest.fixture
+def game(make_game) -> GameEngine:
+    """A game from make_game with the default options."""
+    return make_game()
+
+
+@pytest.fixture
+def saved_state():
+    """Function giving a game's state as a save holds it, without the timestamp (to compare games)."""
+    def state(game: GameEngine):
+        state = game._collect_game_state()
+        del state["timestamp"]
+        return state
+    return state
+
+
+@pytest.fixture
+def debug_game() -> GameEngine:
+    """Fallback world in debug mode, as it starts."""
+    return _quiet_game(debug_mode=True, output=OutputChannel.memory())
+
+
+@pytest.fixture
+def scope_game() -> GameEngine:
+    """Fallback world in debug mode, printing to stdout, with the mailbox, sword and lamp in WHOUS."""
+    game = _quiet_game(debug_mode=True)
+    game._create_bulk_action_objects()
+    room = game.world.get_room("WHOUS")
+    for item_id in ["MAILBOX", "SWORD", "LAMP"]:
+        room.add_item(item_id)
+    return game
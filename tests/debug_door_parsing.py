@@ -24,18 +24,12 @@ test_content = '''
 def debug_exit_extraction():
     parser = MDLParser()
     
-    # Test the new balanced bracket extraction
-    exit_content = parser._extract_balanced_brackets(test_content, "<EXIT")
-    if exit_content:
-        print(f"Found EXIT content using balanced brackets:")
-        print(f"'{exit_content}'")
-        print()
-        
-        # Test parsing
-        exits = parser._parse_exits(exit_content, "LROOM")
-        print(f"Parsed exits: {exits}")
+    # Parse the room block with the token-based parser
+    room_data, _ = parser.parse_room_block(test_content, 0)
+    if room_data:
+        print(f"Parsed exits: {room_data.exits}")
     else:
-        print("No EXIT section found using balanced brackets")
+        print("No ROOM block found")
         
     # Also test the old regex method for comparison
     exit_match = re.search(r'<EXIT\s+([^>]*)>', test_content, re.DOTALL)
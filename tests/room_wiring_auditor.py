@@ -8,9 +8,10 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from typing import Dict, List, Set, Tuple, Optional
-from collections import defaultdict, deque
+from collections import defaultdict
 from dataclasses import dataclass
 from src.game import GameEngine
+from src.world.graph import REVERSE_DIRECTIONS
 
 
 @dataclass
@@ -163,71 +164,36 @@ class RoomWiringAuditor:
     
     def _test_connectivity_from_start(self) -> Set[str]:
         """Test which rooms are reachable from the starting room using BFS."""
-        start_room = "WHOUS"
-        visited = set()
-        queue = deque([start_room])
-        visited.add(start_room)
-        
-        while queue:
-            current_room_id = queue.popleft()
-            current_room = self.world.rooms.get(current_room_id)
-            
-            if not current_room:
-                continue
-                
-            for direction, target_id in current_room.exits.items():
-                if target_id in self.world.rooms and target_id not in visited:
-                    visited.add(target_id)
-                    queue.append(target_id)
-        
-        return visited
+        return set(self.world.get_graph().reachable_from("WHOUS"))
     
     def _find_one_way_connections(self) -> List[Dict[str, str]]:
         """Find connections that only go one way."""
         one_way_connections = []
         
-        # Mapping of reverse directions
-        reverse_dirs = {
-            "north": "south", "south": "north",
-            "east": "west", "west": "east",
-            "northeast": "southwest", "southwest": "northeast",
-            "northwest": "southeast", "southeast": "northwest",
-            "up": "down", "down": "up"
-        }
-        
-        for room_id, room in self.world.rooms.items():
-            for direction, target_id in room.exits.items():
-                if target_id not in self.world.rooms:
-                    continue  # Skip invalid exits (already reported)
-                
-                # Check if there's a reverse connection
-                target_room = self.world.rooms[target_id]
-                reverse_direction = reverse_dirs.get(direction)
-                
-                if reverse_direction:
-                    reverse_target = target_room.exits.get(reverse_direction)
-                    if reverse_target != room_id:
-                        one_way_connections.append({
-                            "from_room": room_id,
-                            "from_name": room.name,
-                            "to_room": target_id,
-                            "to_name": target_room.name,
-                            "direction": direction,
-                            "reverse_direction": reverse_direction,
-                            "has_reverse": reverse_target is not None,
-                            "reverse_target": reverse_target
-                        })
-                        
-                        # Only add as issue if it's a standard direction that should be bidirectional
-                        if direction in reverse_dirs:
-                            self.issues.append(WiringIssue(
-                                room_id=room_id,
-                                issue_type="one_way_connection",
-                                description=f"One-way connection {direction} to {target_id} (no reverse {reverse_direction})",
-                                direction=direction,
-                                target_room=target_id,
-                                severity="low"
-                            ))
+        for room_id, direction, target_id in self.world.get_graph().one_way_edges(REVERSE_DIRECTIONS):
+            room = self.world.rooms[room_id]
+            target_room = self.world.rooms[target_id]
+            reverse_direction = REVERSE_DIRECTIONS[direction]
+            reverse_target = target_room.exits.get(reverse_direction)
+            one_way_connections.append({
+                "from_room": room_id,
+                "from_name": room.name,
+                "to_room": target_id,
+                "to_name": target_room.name,
+                "direction": direction,
+                "reverse_direction": reverse_direction,
+                "has_reverse": reverse_target is not None,
+                "reverse_target": reverse_target
+            })
+            
+            self.issues.append(WiringIssue(
+                room_id=room_id,
+                issue_type="one_way_connection",
+                description=f"One-way connection {direction} to {target_id} (no reverse {reverse_direction})",
+                direction=direction,
+                target_room=target_id,
+                severity="low"
+            ))
         
         return one_way_connections
     
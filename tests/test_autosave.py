@@ -0,0 +1,107 @@
+"""Tests for background autosaves: snapshots, coalescing and atomic writes."""
+
+import os
+import threading
+
+import src.autosave
+from src.savefile import read_header
+
+
+def _loaded(make_game, name):
+    game = make_game()
+    assert game.load_game(name)
+    return game
+
+
+def test_autosave_every_n_moves(tmp_path, monkeypatch, make_game, saved_state):
+    """Test that the end-of-turn hook autosaves every N moves, later autosaves appending deltas."""
+    monkeypatch.chdir(tmp_path)
+    game = make_game(autosave_every=2)
+    game._process_command("open mailbox")
+    assert game.autosaver is None
+    game._process_command("take leaflet")
+    assert game.finish_saves(timeout=5)
+    assert read_header(tmp_path / "saves" / "autosave.json").moves == 2
+    assert "saved" not in game.output.sinks[0].getvalue()  # Autosaves are silent
+
+    for line in ("take lamp. n", "drop leaflet. s"):
+        game._process_input(line)
+        assert game.finish_saves(timeout=5)
+    assert read_header(tmp_path / "saves" / "autosave.json").deltas == 2
+    assert saved_state(_loaded(make_game, "autosave.json")) == saved_state(game)
+
+
+def test_bursts_coalesce_and_snapshots_are_taken_at_save_time(tmp_path, monkeypatch, game, make_game, saved_state):
+    """Test that saves queued while the worker is busy merge into one write of their combined changes."""
+    monkeypatch.chdir(tmp_path)
+    writing, release = threading.Event(), threading.Event()
+    append_delta = src.autosave.append_delta
+
+    def slow_append(*args):
+        writing.set()
+        release.wait(5)
+        append_delta(*args)
+
+    monkeypatch.setattr(src.autosave, "append_delta", slow_append)
+    game.save_game("burst.json", background=True)
+    game.finish_saves(timeout=5)
+
+    game._process_command("open mailbox")
+    game.save_game("burst.json", background=True)
+    assert writing.wait(5)  # The worker is stuck writing that one
+    for command in ["take leaflet", "take lamp", "n", "drop leaflet"]:
+        game._process_command(command)
+        game.save_game("burst.json", background=True)
+    expected = saved_state(game)
+    game._process_command("drop lamp")  # After the last save: must not reach the file
+
+    release.set()
+    assert game.finish_saves(timeout=5)
+    autosaver = game.autosaver
+    assert autosaver.coalesced == 3 and autosaver.written == 3 and autosaver.failed == 0
+    assert read_header(tmp_path / "saves" / "burst.json").deltas == 2
+    assert saved_state(_loaded(make_game, "burst.json")) == expected
+
+
+def test_failed_writes_leave_the_existing_save_whole(tmp_path, monkeypatch, game, make_game, saved_state):
+    """Test that a checkpoint that fails before os.replace keeps the old save and no temporary file."""
+    monkeypatch.chdir(tmp_path)
+    game._process_command("take lamp")
+    assert game.save_game("game.json")
+    saved = (tmp_path / "saves" / "game.json").read_bytes()
+
+    def failing_fsync(fd):
+        raise OSError("disk full")
+
+    game._process_command("n")
+    game.save_game("game.json", background=True)  # A new autosaver starts with a full checkpoint
+    monkeypatch.setattr(os, "fsync", failing_fsync)
+    game.finish_saves(timeout=5)
+    assert game.autosaver.failed == 1
+    assert (tmp_path / "saves" / "game.json").read_bytes() == saved
+    assert os.listdir(tmp_path / "saves") == ["game.json"]
+    assert _loaded(make_game, "game.json").player.current_room == "WHOUS"
+
+    monkeypatch.undo()
+    monkeypatch.chdir(tmp_path)
+    game._process_command("s")
+    game.save_game("game.json", background=True)
+    assert game.finish_saves(timeout=5) and game.autosaver.written == 1
+    assert saved_state(_loaded(make_game, "game.json")) == saved_state(game)
+
+
+def test_synchronous_saves_and_loads_wait_for_the_autosave(tmp_path, monkeypatch, game, make_game, saved_state):
+    """Test that save_game and load_game of the autosave file don't race the worker."""
+    monkeypatch.chdir(tmp_path)
+    game._process_command("take lamp")
+    game.save_game("game.json", background=True)
+    assert game.load_game("game.json")  # Waits for the write, then reads it
+    assert not game.autosaver.busy and "LAMP" in game.player.inventory
+
+    game._process_command("n")
+    game.save_game("game.json", background=True)
+    assert game.save_game("game.json")
+    game._process_command("s")
+    game.save_game("game.json", background=True)  # Rebased by the load: a whole checkpoint again
+    assert game.finish_saves(timeout=5)
+    assert saved_state(_loaded(make_game, "game.json")) == saved_state(game)
@@ -0,0 +1,121 @@
+"""Tests for headless script and batch runs."""
+
+import json
+import os
+
+import src.batch
+from src.batch import EngineOptions, ScriptRunner, load_script, percentile, run_batch
+
+TEST_WORLD = EngineOptions(use_mud_files=False)
+
+
+def _write(path, lines):
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_load_script_skips_blanks_and_comments(tmp_path):
+    """Test that blank lines and # comments are not commands."""
+    script = _write(tmp_path / "a.txt", ["# opening", "look", "", "  inventory  ", "#take all"])
+    assert load_script(script) == ["look", "inventory"]
+
+
+def test_percentile_nearest_rank():
+    """Test nearest-rank percentiles."""
+    samples = [float(n) for n in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([3.0], 99) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+def test_script_timings_and_transcript(tmp_path):
+    """Test that every command is timed under its verb and echoed to the transcript."""
+    script = _write(tmp_path / "walk.txt", ["look", "inventory", "look", "xyzzy plugh"])
+    result = ScriptRunner(TEST_WORLD).run(script, tmp_path / "out")
+
+    assert result.commands == 4
+    assert len(result.latencies["look"]) == 2
+    assert "inventory" in result.latencies
+    assert result.elapsed > 0 and result.commands_per_second > 0
+    assert not result.errors and not result.stopped_early
+
+    transcript = (tmp_path / "out" / "walk.transcript").read_text(encoding="utf-8")
+    assert "> inventory" in transcript
+    assert "white house" in transcript
+
+
+def test_chained_lines_run_like_interactive_input(tmp_path):
+    """Test that a script line chains commands as typed input does, stopping at a failure."""
+    script = _write(tmp_path / "chain.txt", ["look. inventory", "frobnicate, look"])
+    result = ScriptRunner(TEST_WORLD).run(script, tmp_path / "out")
+
+    assert result.commands == 2 and not result.errors
+    assert set(result.latencies) == {"look", "frobnicate"}
+    transcript = (tmp_path / "out" / "chain.transcript").read_text(encoding="utf-8")
+    assert "empty-handed" in transcript
+    assert transcript.count("white house") == 2  # Opening and the chained look, not the one after frobnicate
+
+
+
+def test_lines_are_parsed_only_by_their_timed_turn(tmp_path):
+    """Test that classifying a line doesn't parse it ahead of the turn (no extra parse cache hits)."""
+    engines = []
+
+    class Runner(ScriptRunner):
+        def build_engine(self, output, world_base=None):
+            engines.append(super().build_engine(output, world_base))
+            return engines[-1]
+
+    script = _write(tmp_path / "repeat.txt", ["look", "look", "inventory. look"])
+    result = Runner(TEST_WORLD).run(script)
+
+    parser = engines[0].parser
+    assert (parser.cache_hits, parser.cache_misses) == (2, 2)
+    assert len(result.latencies["look"]) == 2 and len(result.latencies["inventory"]) == 1
+
+def test_quit_confirmation_comes_from_script(tmp_path):
+    """Test that the quit prompt reads the next script line and ends the run."""
+    script = _write(tmp_path / "quit.txt", ["look", "quit", "y", "look"])
+    result = ScriptRunner(TEST_WORLD).run(script)
+
+    assert result.stopped_early
+    assert result.commands == 2
+    assert "y" not in result.latencies
+
+
+def test_batch_runs_each_script_on_a_fresh_engine(tmp_path):
+    """Test batch results, ordering and the JSON summary (serial and pooled)."""
+    scripts = tmp_path / "scripts"
+    scripts.mkdir()
+    _write(scripts / "b.txt", ["look", "score"])
+    _write(scripts / "a.txt", ["inventory"])
+    (scripts / "notes.md").write_text("not a script")
+
+    for workers in (1, 2):
+        out = tmp_path / f"out{workers}"
+        batch = run_batch(scripts, TEST_WORLD, out, workers=workers)
+
+        assert [r.script.rsplit("/", 1)[-1] for r in batch.scripts] == ["a.txt", "b.txt"]
+        assert batch.commands == 3
+        summary = json.loads((out / "summary.json").read_text(encoding="utf-8"))
+        assert summary["commands"] == 3
+        assert set(summary["verbs"]) == {"inventory", "look", "score"}
+        assert (out / "a.transcript").exists() and (out / "b.transcript").exists()
+
+
+def _killed_worker(*args):
+    """Worker that dies the way a sandbox kills forked processes."""
+    os._exit(1)
+
+
+def test_batch_runs_serially_when_pool_workers_die(tmp_path, monkeypatch):
+    """Test that a broken process pool falls back to running the scripts in this process."""
+    scripts = tmp_path / "scripts"
+    scripts.mkdir()
+    _write(scripts / "a.txt", ["look"])
+    _write(scripts / "b.txt", ["inventory"])
+    monkeypatch.setattr(src.batch, "_run_script_job", _killed_worker)
+
+    batch = run_batch(scripts, TEST_WORLD, workers=2)
+    assert batch.workers == 1 and batch.commands == 2
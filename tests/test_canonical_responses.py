@@ -18,6 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from src.game import GameEngine
 from src.responses import ZorkResponses
+from src.output import OutputChannel
 
 
 class CanonicalResponseValidator:
@@ -290,20 +291,14 @@ class CanonicalResponseValidator:
     
     def _capture_command_output(self, command: str) -> str:
         """Capture output from a command execution."""
-        import io
-        import contextlib
-        
         # Create fresh game state
-        self.game_engine = GameEngine(use_mud_files=True, mud_directory=Path("zork_mtl_source"))
+        self.game_engine = GameEngine(use_mud_files=True, mud_directory=Path("zork_mtl_source"),
+                                      output=OutputChannel.memory())
         
-        captured_output = io.StringIO()
         try:
-            with contextlib.redirect_stdout(captured_output):
-                self.game_engine._process_command(command)
+            return self.game_engine._process_command(command).strip()
         except Exception as e:
             return f"ERROR: {e}"
-        
-        return captured_output.getvalue().strip()
     
     def run_all_canonical_tests(self) -> Dict[str, Any]:
         """Run all canonical response validation tests."""
@@ -0,0 +1,79 @@
+"""Tests for the object combination rule indexes."""
+
+from src.combinations import InteractionRule, InteractionType, ObjectCombinationManager
+
+
+def _rule(rule_id, primary, secondary=None, interaction_type=InteractionType.COMBINE, **kwargs):
+    return InteractionRule(id=rule_id, interaction_type=interaction_type,
+                           primary_object=primary, secondary_object=secondary, **kwargs)
+
+
+def _manager():
+    manager = ObjectCombinationManager()
+    manager.interaction_rules.clear()
+    manager._rules_by_pair.clear()
+    manager._rules_by_object.clear()
+    manager._rule_order.clear()
+    return manager
+
+
+def test_lookup_by_pair_and_general_rules():
+    """Test pair lookups, rules without a secondary, and first-added-wins ordering."""
+    manager = _manager()
+    manager.add_interaction_rule(_rule("any_tool", "BOX", interaction_type=InteractionType.APPLY_TOOL))
+    manager.add_interaction_rule(_rule("crowbar", "BOX", "CROWBAR", interaction_type=InteractionType.APPLY_TOOL))
+    manager.add_interaction_rule(_rule("heat", "BOX", "TORCH", interaction_type=InteractionType.HEAT_WITH))
+
+    assert manager.can_interact("BOX", "CROWBAR", "use").id == "any_tool"
+    assert manager.can_interact("BOX", "TORCH", "heat").id == "heat"
+    assert manager.can_interact("BOX", "TORCH", "break") is None
+    assert manager.can_interact("BOX").id == "any_tool"
+    assert manager.can_interact("LAMP", "TORCH") is None
+
+
+def test_room_and_condition_filters():
+    """Test that room requirements and conditions still reject indexed candidates."""
+    manager = _manager()
+    manager.add_interaction_rule(_rule("cellar", "ROPE", "HOOK", required_room="CELLA"))
+    manager.add_interaction_rule(_rule("never", "ROPE", "HOOK", required_conditions=[lambda: False]))
+    manager.add_interaction_rule(_rule("always", "ROPE", "HOOK"))
+
+    assert manager.can_interact("ROPE", "HOOK", "combine", "CELLA").id == "cellar"
+    assert manager.can_interact("ROPE", "HOOK", "combine", "LROOM").id == "always"
+
+
+def test_hint_index_and_replacement():
+    """Test that rules are found by either object and replacing or removing a rule updates the indexes."""
+    manager = _manager()
+    manager.add_interaction_rule(_rule("a", "ROPE", "HOOK"))
+    manager.add_interaction_rule(_rule("b", "HOOK", "BEAM"))
+    assert [rule.id for rule in manager.get_available_interactions("HOOK")] == ["a", "b"]
+
+    manager.add_interaction_rule(_rule("a", "ROPE", "PEG"))
+    assert [rule.id for rule in manager.get_available_interactions("HOOK")] == ["b"]
+    assert manager.can_interact("ROPE", "HOOK") is None
+    assert manager.can_interact("ROPE", "PEG").id == "a"
+
+    assert manager.remove_interaction_rule("b").id == "b"
+    assert manager.remove_interaction_rule("b") is None
+    assert manager.get_available_interactions("BEAM") == []
+
+
+def test_first_added_wins_after_a_rule_is_removed():
+    """Test that a rule added after a removal still ranks behind every rule added before it."""
+    manager = _manager()
+    manager.add_interaction_rule(_rule("old", "BOX"))
+    manager.add_interaction_rule(_rule("spare", "BOX", "KEY"))
+    manager.add_interaction_rule(_rule("general", "BOX"))
+    manager.remove_interaction_rule("old")
+    manager.add_interaction_rule(_rule("key", "BOX", "KEY"))
+
+    assert [rule.id for rule in manager._candidate_rules("BOX", "KEY")] == ["spare", "general", "key"]
+    manager.remove_interaction_rule("spare")
+    assert manager.can_interact("BOX", "KEY").id == "general"
+
+def test_built_in_rules_are_indexed():
+    """Test that the default rules are reachable through the indexes."""
+    manager = ObjectCombinationManager()
+    assert manager.can_interact("BELL", "TORCH", "heat").id == "heat_bell"
+    assert sum(len(rules) for rules in manager._rules_by_pair.values()) == len(manager.interaction_rules)
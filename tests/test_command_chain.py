@@ -0,0 +1,68 @@
+"""Tests for chained commands on one input line."""
+
+from src.parser.command_parser import CommandParser
+
+
+def test_split_on_periods_commas_and_then():
+    """Test where a line splits, including quoted text that is left whole."""
+    parser = CommandParser()
+    assert parser.split_commands("take lamp. n, then open window.") == ["take lamp", "n", "open window"]
+    assert parser.split_commands('say "hello. goodbye" THEN wait') == ['say "hello. goodbye"', "wait"]
+    assert parser.split_commands(" . , ") == []
+    assert [str(command) for command in parser.parse_many("take lamp. n. n then open window")] == \
+        ["take lamp", "north", "north", "open window"]
+    assert [str(command) for command in parser.parse_many("n. the. s")] == ["north"]
+
+
+def test_chain_runs_each_command_as_a_turn(game):
+    """Test that each command in the chain takes its own move."""
+    moves = game.score_manager.moves
+    text = game._process_input("take lamp. n then s")
+    assert "LAMP" in game.player.inventory
+    assert game.player.current_room == "WHOUS"
+    assert game.score_manager.moves == moves + 3
+    assert "You are north of the house." in text
+
+
+def test_chain_stops_at_first_failure(game):
+    """Test that a failed command (no exit, unknown verb, missing object) ends the chain."""
+    game._process_input("s. take lamp")
+    assert "LAMP" not in game.player.inventory and game.turn_context.failed
+
+    game._process_input("frobnicate, take lamp")
+    assert "LAMP" not in game.player.inventory
+
+    game._process_input("take unicorn. n")
+    assert game.player.current_room == "WHOUS"
+
+    game._process_input("take lamp. n")
+    assert game.player.current_room == "NHOUS" and not game.turn_context.failed
+
+
+def test_chain_stops_when_a_handler_refuses(game):
+    """Test that take, drop and open refusals (not just unknown words) end the chain."""
+
+    assert "You cannot take that." in game._process_input("take mailbox. n")
+    assert game.player.current_room == "WHOUS" and game.turn_context.failed
+
+    game._process_input("drop lamp. n")
+    assert game.player.current_room == "WHOUS"
+
+    game._process_input("open lamp, take lamp")
+    assert "LAMP" not in game.player.inventory
+
+    game._process_input("open mailbox. open mailbox. n")
+    assert game.object_manager.get_object("MAILBOX").is_open()
+    assert game.player.current_room == "WHOUS"
+
+    game._process_input("take lamp. take lamp. n")
+    assert "LAMP" in game.player.inventory and game.player.current_room == "WHOUS"
+
+
+def test_chain_stops_at_disambiguation_prompt(game):
+    """Test that a disambiguation question ends the chain and the answer isn't split."""
+    lamp, torch = game.object_manager.get_object("LAMP"), game.object_manager.get_object("TORCH")
+    game._find_all_objects = lambda noun, check_inventory_only=False: [lamp, torch]
+    game._process_input("take light. n")
+    assert game.player.awaiting_disambiguation
+    assert game.player.current_room == "WHOUS"
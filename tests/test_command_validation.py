@@ -21,6 +21,7 @@ import random
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from src.game import GameEngine
+from src.output import OutputChannel
 from src.parser.command_parser import CommandParser, Command
 from src.responses import ZorkResponses
 from src.world.world import World
@@ -81,7 +82,8 @@ class ZorkCommandTester:
         """Initialize fresh game environment for testing."""
         print("🔧 Setting up test environment...")
         self.game_engine = GameEngine(use_mud_files=True, 
-                                     mud_directory=Path("zork_mtl_source"))
+                                     mud_directory=Path("zork_mtl_source"),
+                                     output=OutputChannel.memory())
         print("✅ Test environment ready")
         
     def define_test_categories(self):
@@ -245,16 +247,8 @@ class ZorkCommandTester:
                 # Execute setup command without capturing output
                 self.game_engine._process_command(test.context_setup)
             
-            # Capture output by redirecting stdout
-            import io
-            import contextlib
-            
-            captured_output = io.StringIO()
-            with contextlib.redirect_stdout(captured_output):
-                # Execute the test command
-                self.game_engine._process_command(test.command)
-            
-            actual_output = captured_output.getvalue().strip()
+            # Execute the test command; the engine returns the turn's output
+            actual_output = self.game_engine._process_command(test.command).strip()
             execution_time = time.time() - start_time
             
             # Validate based on test type
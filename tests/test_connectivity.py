@@ -7,7 +7,7 @@ Automated traversal and validation of the entire Zork game world
 import sys
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Tuple, Any
-from collections import deque, defaultdict
+from collections import defaultdict
 import json
 import time
 from dataclasses import dataclass
@@ -100,18 +100,9 @@ class ConnectivityTester:
         if start_room not in self.world.rooms:
             raise ValueError(f"Start room {start_room} not found in world")
         
-        queue = deque([(start_room, 0, None, None)])  # room_id, depth, from_room, direction
-        
-        while queue:
-            room_id, depth, from_room, direction = queue.popleft()
-            
-            if room_id in self.visited_rooms:
-                continue
-                
+        # Breadth-first spanning tree over the compiled world graph
+        for room_id, depth, from_room, direction in self.world.get_graph().bfs_tree(start_room):
             room = self.world.get_room(room_id)
-            if not room:
-                self.exit_errors.append((from_room or "UNKNOWN", direction or "UNKNOWN", room_id))
-                continue
             
             # Mark as visited and record info
             self.visited_rooms.add(room_id)
@@ -134,11 +125,6 @@ class ConnectivityTester:
             
             # Update max depth
             self.stats.max_depth = max(self.stats.max_depth, depth)
-            
-            # Add all exits to queue for exploration
-            for exit_dir, target_room in room.exits.items():
-                if target_room not in self.visited_rooms:
-                    queue.append((target_room, depth + 1, room_id, exit_dir))
                     
             # Progress indicator
             if len(self.visited_rooms) % 10 == 0:
@@ -343,31 +329,16 @@ def test_pathfinding(game: GameEngine, start: str, target: str) -> Optional[List
         print(f"❌ Target room {target} not found")
         return None
     
-    # BFS pathfinding
-    queue = deque([(start, [])])
-    visited = set()
-    
-    while queue:
-        current_room, path = queue.popleft()
-        
-        if current_room == target:
-            print(f"✅ Path found! Length: {len(path)} steps")
-            if path:
-                print(f"   Directions: {' → '.join(path)}")
-            else:
-                print(f"   (Start and target are the same room)")
-            return path
-            
-        if current_room in visited:
-            continue
-            
-        visited.add(current_room)
-        room = game.world.get_room(current_room)
-        
-        if room:
-            for direction, next_room in room.exits.items():
-                if next_room not in visited and next_room in game.world.rooms:
-                    queue.append((next_room, path + [direction]))
+    # Cached shortest path over the compiled world graph
+    graph_path = game.world.get_graph().shortest_path(start, target)
+    if graph_path is not None:
+        path = list(graph_path.directions)
+        print(f"✅ Path found! Length: {len(path)} steps")
+        if path:
+            print(f"   Directions: {' → '.join(path)}")
+        else:
+            print(f"   (Start and target are the same room)")
+        return path
     
     print(f"❌ No path found between {start} and {target}")
     return None
@@ -0,0 +1,117 @@
+"""Tests for the reverse containment index."""
+
+import random
+
+from src.game import GameEngine
+from src.world.room import Room
+from src.entities.containment import ContainmentIndex
+
+
+def _game_with_two_rooms():
+    """Fallback game with a second room connected to West of House."""
+    game = GameEngine(use_mud_files=False)
+    game.world.add_room(Room(id="NHOUS", name="North of House", description="North of the house.",
+                             items=["LAMP"]))
+    game.world.get_room("WHOUS").exits["north"] = "NHOUS"
+    return game
+
+
+def test_index_tracks_rooms_inventory_and_containers():
+    """Test that add/remove methods keep the parent map current."""
+    game = _game_with_two_rooms()
+    index = game.object_manager.containment
+    whous = game.world.get_room("WHOUS")
+    mailbox = game.object_manager.get_object("MAILBOX")
+
+    # Items present when rooms/objects are registered are indexed
+    assert index.get_parent("LAMP") == ("room", "NHOUS")
+    assert index.get_parent("LEAFLET") == ("container", "MAILBOX")
+
+    whous.add_item("MAILBOX")
+    assert index.get_parent("MAILBOX") == ("room", "WHOUS")
+    assert index.get_chain("LEAFLET") == [("container", "MAILBOX"), ("room", "WHOUS")]
+
+    mailbox.remove_from_container("LEAFLET")
+    game.player.add_to_inventory("LEAFLET")
+    assert index.get_parent("LEAFLET") == ("inventory", None)
+
+    game.player.remove_from_inventory("LEAFLET")
+    assert index.get_parent("LEAFLET") is None
+
+    # Removing from a holder that no longer owns the item leaves the newer entry alone
+    whous.add_item("SWORD")
+    game.player.add_to_inventory("SWORD")
+    whous.remove_item("SWORD")
+    assert index.get_parent("SWORD") == ("inventory", None)
+
+
+def test_find_object_location_matches_scan():
+    """Test indexed location queries against the original scan under random moves."""
+    game = _game_with_two_rooms()
+    rng = random.Random(42)
+    manager = game.object_manager
+    objects = list(manager.objects.values())
+    containers = [obj for obj in objects if obj.is_container()]
+    rooms = list(game.world.rooms.values())
+
+    def remove_everywhere(item_id):
+        for room in rooms:
+            room.remove_item(item_id)
+        game.player.remove_from_inventory(item_id)
+        for container in containers:
+            container.remove_from_container(item_id)
+
+    for step in range(400):
+        obj = rng.choice(objects)
+        remove_everywhere(obj.id)
+        choice = rng.randrange(4)
+        if choice == 0:
+            rng.choice(rooms).add_item(obj.id)
+        elif choice == 1:
+            game.player.add_to_inventory(obj.id)
+        elif choice == 2:
+            container = rng.choice(containers)
+            if container is not obj:
+                container.add_to_container(obj.id)
+        if rng.random() < 0.1:
+            game.player.move_to_room(rng.choice(rooms).id)
+
+        for candidate in objects:
+            assert (manager.find_object_location(candidate, game.world, game.player)
+                    == manager._scan_object_location(candidate, game.world, game.player)), (step, candidate.id)
+
+
+def test_direct_list_edits_fall_back_to_scan():
+    """Test that locations stay correct when lists are replaced without the add/remove methods."""
+    game = _game_with_two_rooms()
+    sword = game.object_manager.get_object("SWORD")
+
+    game.world.get_room("WHOUS").items = ["SWORD"]
+    assert game._find_object_location(sword) == ("room", None)
+
+    game.world.get_room("WHOUS").items = []
+    game.player.inventory = ["SWORD"]
+    assert game._find_object_location(sword) == ("inventory", None)
+
+    # Restoring a save rebuilds the index
+    game._restore_game_state({"player_state": {"inventory": ["SWORD"], "current_room": "NHOUS"}})
+    assert game.object_manager.containment.get_parent("SWORD") == ("inventory", None)
+    assert game.object_manager.containment.get_parent("LAMP") == ("room", "NHOUS")
+
+
+def test_debug_where(capsys):
+    """Test the debug where command prints the containment path."""
+    game = GameEngine(use_mud_files=False, debug_mode=True)
+    game.world.get_room("WHOUS").add_item("MAILBOX")
+    capsys.readouterr()
+
+    game._process_command("debug where leaflet")
+    assert "container MAILBOX -> room WHOUS" in capsys.readouterr().out
+
+
+def test_chain_stops_on_cycles():
+    """Test that malformed cyclic containment doesn't loop forever."""
+    index = ContainmentIndex()
+    index.place("A", "container", "B")
+    index.place("B", "container", "A")
+    assert len(index.get_chain("A")) == ContainmentIndex.MAX_DEPTH
@@ -0,0 +1,80 @@
+"""Tests for the turn hook pipeline."""
+
+from src.hooks import HookPipeline, HookStage, TurnContext
+
+
+def test_stages_run_in_order_by_priority(debug_game):
+    """Test stage order within a turn and priority order within a stage."""
+    seen = []
+    for stage in HookStage:
+        debug_game.hooks.register(stage, lambda g, c, s=stage: seen.append((s, "late")), priority=200)
+        debug_game.hooks.register(stage, lambda g, c, s=stage: seen.append((s, "early")), priority=10)
+
+    debug_game._process_command("inventory")
+
+    assert seen == [(stage, order) for stage in HookStage for order in ("early", "late")]
+
+
+def test_command_is_parsed_once_per_turn(debug_game):
+    """Test that hooks (including puzzles) share the turn's single parse."""
+    calls = []
+    original_parse = debug_game.parser.parse
+
+    def counting_parse(text):
+        calls.append(text)
+        return original_parse(text)
+
+    debug_game.parser.parse = counting_parse
+    commands = []
+    debug_game.hooks.register(HookStage.POST_DISPATCH, lambda g, c: commands.append(c.command))
+
+    debug_game._process_command("examine mailbox")
+
+    assert calls == ["examine mailbox"]
+    assert commands[0].verb == "examine" and commands[0].noun == "mailbox"
+
+
+def test_handled_skips_dispatch_but_not_end_of_turn(debug_game):
+    """Test that a hook can take over a command."""
+    ended = []
+
+    def intercept(g, context):
+        if context.command.verb == "inventory":
+            g.output.write("Intercepted.")
+            context.handled = True
+
+    debug_game.hooks.register(HookStage.PRE_DISPATCH, intercept, priority=1)
+    debug_game.hooks.register(HookStage.END_OF_TURN, lambda g, c: ended.append(c.user_input))
+
+    text = debug_game._process_command("inventory")
+
+    assert text == "Intercepted.\n"
+    assert ended == ["inventory"]
+
+
+def test_unregister_and_timing_stats():
+    """Test per-hook counters, built-in step timing and removal by name."""
+    pipeline = HookPipeline()
+    pipeline.register(HookStage.PRE_PARSE, lambda g, c: None, name="noop")
+    pipeline.register(HookStage.END_OF_TURN, lambda g, c: None, name="noop")
+    for _ in range(3):
+        pipeline.run(HookStage.PRE_PARSE, None, TurnContext("look"))
+    pipeline.record_step("parse", 0.001)
+
+    assert pipeline.hooks(HookStage.PRE_PARSE)[0].stats.calls == 3
+    assert pipeline.step_stats["parse"].calls == 1
+    assert any("pre_parse:noop" in line for line in pipeline.format_stats())
+
+    assert pipeline.unregister("noop", HookStage.PRE_PARSE) == 1
+    assert pipeline.hooks(HookStage.PRE_PARSE) == []
+    assert len(pipeline.hooks(HookStage.END_OF_TURN)) == 1
+
+
+def test_debug_hooks_shows_subsystems(debug_game):
+    """Test that 'debug hooks' reports the registered subsystems."""
+    debug_game._process_command("look")
+    text = debug_game._process_command("debug hooks")
+    assert "TURN HOOKS" in text
+    assert "pre_dispatch:puzzles" in text
+    assert "end_of_turn:scheduler" in text
+    assert "step:parse" in text
@@ -0,0 +1,153 @@
+"""Tests for the token-based MDL lexer and room parser."""
+
+import os
+from pathlib import Path
+
+from src.parsers.mdl_lexer import MDLLexer, MDLTokenStream, TOKEN_STRING, TOKEN_VAR, TOKEN_NEXIT
+import src.parsers.mdl_parser
+from src.parsers.mdl_parser import MDLParser
+
+
+LROOM_SOURCE = '''
+<ROOM "LROOM"
+       ""
+       "Living Room"
+       <EXIT "EAST" "KITCH"
+              "WEST" <CEXIT "MAGIC-FLAG" "BLROO" "The door is nailed shut.">
+              "DOWN" <DOOR "DOOR" "LROOM" "CELLA">>
+       (<GET-OBJ "WDOOR"> <GET-OBJ "DOOR"> <GET-OBJ "TCASE">
+        <GET-OBJ "LAMP"> <GET-OBJ "RUG"> <GET-OBJ "PAPER">
+        <GET-OBJ "SWORD">)
+       LIVING-ROOM
+       <+ ,RLANDBIT ,RLIGHTBIT ,RHOUSEBIT ,RSACREDBIT>>
+'''
+
+FOREST_SOURCE = '''
+<PSETG STFORE "This is a forest, with trees in all directions around you.">
+<SETG FOREST "Forest">
+<ROOM "FORE1"
+       ,STFORE
+       ,FOREST
+       <EXIT "NORTH" "FORE1" "EAST" "FORE3" "WEST" #NEXIT "The trees are too dense."
+             "UP" #NEXIT ,NOTREE "MIRROR" ,MR-G>
+       ()
+       <>
+       <+ ,RLANDBIT ,RLIGHTBIT>>
+'''
+
+
+def test_lexer_token_kinds():
+    """Test that the lexer emits brackets, strings, variables and #NEXIT in order."""
+    tokens = list(MDLLexer().tokenize('<EXIT "UP" #NEXIT ,NOTREE (x)>'))
+    kinds = [token.kind for token in tokens]
+    assert kinds == ["<", "ATOM", TOKEN_STRING, TOKEN_NEXIT, TOKEN_VAR, "(", "ATOM", ")", ">"]
+    assert tokens[2].value == "UP"
+    assert tokens[4].value == "NOTREE"
+
+
+def test_lexer_ignores_brackets_inside_strings():
+    """Test that brackets inside quoted strings do not unbalance forms."""
+    stream = MDLTokenStream('<ROOM "X" "a > b < c \\"quoted\\"">')
+    assert len(stream) == 5
+    assert stream.matches[0] == 4
+    assert stream.tokens[3].value == 'a > b < c \\"quoted\\"'
+
+
+def test_parse_room_block_with_door_and_cexit():
+    """Test exits, objects and flags for a room using DOOR and CEXIT structures."""
+    parser = MDLParser()
+    room, end_pos = parser.parse_room_block(LROOM_SOURCE, 0)
+
+    assert room.id == "LROOM"
+    assert room.short_name == "Living Room"
+    assert room.exits == {"east": "KITCH", "west": "BLROO", "down": "CELLA"}
+    assert room.objects == ["WDOOR", "DOOR", "TCASE", "LAMP", "RUG", "PAPER", "SWORD"]
+    assert room.flags == ["RLANDBIT", "RLIGHTBIT", "RHOUSEBIT", "RSACREDBIT"]
+    assert LROOM_SOURCE[end_pos - 2:end_pos] == ">>"
+
+    # No further rooms after the first block
+    assert parser.parse_room_block(LROOM_SOURCE, end_pos) == (None, end_pos)
+
+
+def test_parse_file_resolves_variables_and_skips_blocked_exits(tmp_path):
+    """Test PSETG/SETG resolution and #NEXIT / blocked variable exits."""
+    mud_file = tmp_path / "forest.mud"
+    mud_file.write_text(FOREST_SOURCE)
+
+    parser = MDLParser()
+    rooms = parser.parse_file(mud_file)
+
+    room = rooms["FORE1"]
+    assert room.long_description.startswith("This is a forest")
+    assert room.short_name == "Forest"
+    assert room.exits == {"north": "FORE1", "east": "FORE3", "mirror": "MRG"}
+    assert room.objects == []
+    assert parser.variables["FOREST"] == "Forest"
+
+
+def test_parse_file_handles_many_rooms(tmp_path):
+    """Test that a large file is parsed block by block without losing rooms."""
+    blocks = []
+    for i in range(500):
+        blocks.append(f'<ROOM "R{i}" "Room number {i} is a long test room description." '
+                      f'"Room {i}" <EXIT "NORTH" "R{i + 1}" "SOUTH" "R{i - 1}">>')
+    mud_file = tmp_path / "many.mud"
+    mud_file.write_text("\n".join(blocks))
+
+    rooms = MDLParser().parse_file(mud_file)
+
+    assert len(rooms) == 500
+    assert rooms["R250"].exits == {"north": "R251", "south": "R249"}
+    assert rooms["R499"].short_name == "Room 499"
+
+
+def _write_multi_file_tree(directory):
+    """Write a source tree whose rooms reference variables from other files."""
+    (directory / "defs.mud").write_text('<PSETG STFORE "This is a forest.">\n<SETG FOREST "Forest">')
+    for n in range(4):
+        blocks = [f'<SETG AREA{n} "Area {n}">']
+        for i in range(50):
+            blocks.append(f'<ROOM "A{n}R{i}" ,STFORE ,AREA{(n + 1) % 4} '
+                          f'<EXIT "NORTH" "A{n}R{i + 1}" "UP" #NEXIT "Too high." "DOWN" ,BLOCKED>>')
+        (directory / f"area{n}.mud").write_text("\n".join(blocks))
+
+
+def test_parse_directory_resolves_variables_across_files(tmp_path):
+    """Test that variables defined in any file are visible to rooms in every file."""
+    _write_multi_file_tree(tmp_path)
+
+    rooms = MDLParser().parse_directory(tmp_path)
+
+    assert len(rooms) == 200
+    assert rooms["A0R0"].long_description == "This is a forest."
+    assert rooms["A3R7"].short_name == "Area 0"  # defined in a file sorted before area3.mud
+    assert rooms["A0R7"].short_name == "Area 1"  # defined in a file sorted after area0.mud
+    assert rooms["A0R7"].exits == {"north": "A0R8"}
+
+
+def test_parallel_parse_directory_matches_serial(tmp_path):
+    """Test that the process pool produces exactly the serial result."""
+    _write_multi_file_tree(tmp_path)
+
+    serial_parser = MDLParser()
+    serial = serial_parser.parse_directory(tmp_path)
+    parallel_parser = MDLParser()
+    parallel = parallel_parser.parse_directory(tmp_path, workers=2)
+
+    assert list(parallel) == list(serial)
+    assert parallel == serial
+    assert parallel_parser.variables == serial_parser.variables
+
+
+def _killed_worker(*args):
+    """Worker that dies the way a sandbox kills forked processes."""
+    os._exit(1)
+
+
+def test_parse_directory_falls_back_when_workers_die(tmp_path, monkeypatch):
+    """Test that a broken process pool falls back to the serial parse instead of failing startup."""
+    _write_multi_file_tree(tmp_path)
+    serial = MDLParser().parse_directory(tmp_path)
+
+    monkeypatch.setattr(src.parsers.mdl_parser, "_collect_file_variables", _killed_worker)
+    assert MDLParser().parse_directory(tmp_path, workers=2) == serial
@@ -0,0 +1,114 @@
+"""Equivalence tests for the ObjectManager name/alias index."""
+
+import random
+
+from src.game import GameEngine
+from src.entities.objects import GameObject
+from src.entities.object_manager import ObjectManager
+
+
+def _reference_find_all_objects(game, noun, check_inventory_only=False):
+    """The original scan-everything lookup, used as the oracle."""
+    matches = []
+    for obj in game.object_manager.objects.values():
+        if obj.is_bulk_action() and obj.matches(noun):
+            matches.append(obj)
+
+    if check_inventory_only:
+        for item_id in game.player.inventory:
+            obj = game.object_manager.get_object(item_id)
+            if obj and obj.matches(noun) and not obj.is_bulk_action():
+                matches.append(obj)
+        return matches
+
+    current_room = game.world.get_room(game.player.current_room)
+    locations = (current_room.items if current_room else []) + game.player.inventory
+    for item_id in locations:
+        obj = game.object_manager.get_object(item_id)
+        if obj and obj.matches(noun) and not obj.is_bulk_action():
+            matches.append(obj)
+        if obj and obj.is_container() and obj.is_open():
+            for contained_id in obj.get_contents():
+                contained_obj = game.object_manager.get_object(contained_id)
+                if contained_obj and contained_obj.matches(noun):
+                    matches.append(contained_obj)
+    return matches
+
+
+def _candidate_nouns(objects, rng):
+    """Nouns that exercise every matches() rule plus near misses."""
+    nouns = {"", " ", "x", "zzzzz", "all", "ALL", "  Lamp  "}
+    for obj in objects:
+        name = obj.name
+        nouns.add(name)
+        nouns.add(name.upper())
+        nouns.update(obj.aliases)
+        nouns.update(name.split())
+        for length in (3, 4, 5, 6, 8):
+            if len(name) >= length:
+                start = rng.randrange(len(name) - length + 1)
+                nouns.add(name[start:start + length])
+                nouns.add(f" {name[start:start + length]} ")
+    return sorted(nouns)
+
+
+def test_find_objects_by_name_matches_scan():
+    """Test that the index returns exactly the objects matches() accepts, in order."""
+    manager = ObjectManager()
+    manager.add_object(GameObject(id="LAMP", name="brass lantern", description="", aliases=["lamp", "Lantern"]))
+    manager.add_object(GameObject(id="KNIFE1", name="rusty knife", description="", aliases=["knife"]))
+    manager.add_object(GameObject(id="KNIFE2", name="silver knife", description="", aliases=["knife", "blade"]))
+    manager.add_object(GameObject(id="EMPTY", name="", description=""))
+    manager.add_object(GameObject(id="ALL", name="all", description="", attributes={"bulk_action": True}))
+
+    rng = random.Random(5)
+    for noun in _candidate_nouns(manager.objects.values(), rng):
+        expected = [obj for obj in manager.objects.values() if obj.matches(noun)]
+        assert manager.find_objects_by_name(noun) == expected, noun
+
+    assert [obj.id for obj in manager.get_bulk_action_objects()] == ["ALL"]
+
+
+def test_reindex_after_rename_and_replace():
+    """Test that renamed or replaced objects are re-indexed."""
+    manager = ObjectManager()
+    obj = GameObject(id="BOTTLE", name="glass bottle", description="")
+    manager.add_object(obj)
+    manager.add_object(GameObject(id="WATER", name="quantity of water", description=""))
+
+    obj.name = "broken shards"
+    manager.reindex_object(obj)
+    assert manager.find_objects_by_name("bottle") == []
+    assert manager.find_objects_by_name("shards") == [obj]
+
+    replacement = GameObject(id="BOTTLE", name="green bottle", description="")
+    manager.add_object(replacement)
+    assert manager.find_objects_by_name("shards") == []
+    assert [o.id for o in manager.find_objects_by_name("bottle")] == ["BOTTLE"]
+    assert list(manager.objects) == ["BOTTLE", "WATER"]
+
+
+def test_find_all_objects_matches_reference_scan():
+    """Test engine scope lookup against the original implementation in many states."""
+    game = GameEngine(use_mud_files=False)
+    game._create_bulk_action_objects()
+    assert game.object_manager.get_bulk_action_objects()
+    rng = random.Random(1978)
+    object_ids = list(game.object_manager.objects)
+    containers = [obj for obj in game.object_manager.objects.values() if obj.is_container()]
+    nouns = _candidate_nouns(game.object_manager.objects.values(), rng)
+    room = game.world.get_room(game.player.current_room)
+
+    for trial in range(25):
+        # Shuffle objects between the room, inventory and open/closed containers
+        room.items = rng.sample(object_ids, rng.randint(0, 8))
+        game.player.inventory = rng.sample(object_ids, rng.randint(0, 5))
+        for container in containers:
+            container.set_attribute("contents", rng.sample(object_ids, rng.randint(0, 3)))
+            container.set_attribute("open", rng.random() < 0.6)
+
+        for noun in nouns:
+            for inventory_only in (False, True):
+                expected = _reference_find_all_objects(game, noun, inventory_only)
+                actual = game._find_all_objects(noun, inventory_only)
+                assert [o.id for o in actual] == [o.id for o in expected], (trial, noun, inventory_only)
@@ -0,0 +1,105 @@
+"""Compatibility tests for the packed GameObject attribute storage."""
+
+import copy
+import pickle
+
+from src.entities.objects import GameObject
+from src.entities.containment import ContainmentIndex
+
+
+def _lamp():
+    return GameObject(id="LAMP", name="brass lantern", description="A lamp.",
+                      attributes={"takeable": True, "light_source": True, "lit": False,
+                                  "light_turns": 330, "weight": 15, "portable": True},
+                      aliases=["lamp"])
+
+
+def test_get_attribute_matches_dict_semantics():
+    """Test that packed, typed and overflow attributes read back exactly as stored."""
+    lamp = _lamp()
+    assert lamp.get_attribute("takeable") is True
+    assert lamp.get_attribute("lit") is False
+    assert lamp.get_attribute("light_turns") == 330
+    assert lamp.get_attribute("portable") is True
+
+    # Unset attributes return the caller's default, even for packed names
+    assert lamp.get_attribute("open") is None
+    assert lamp.get_attribute("open", "unset") == "unset"
+    assert lamp.get_attribute("capacity", 7) == 7
+    assert lamp.get_capacity() == 0
+    assert not lamp.is_container() and not lamp.is_open()
+
+    # Values of unexpected types are kept as-is
+    lamp.set_attribute("open", "ajar")
+    lamp.set_attribute("weight", 2.5)
+    assert lamp.get_attribute("open") == "ajar"
+    assert lamp.get_weight() == 2.5
+    lamp.set_attribute("open", True)
+    lamp.set_attribute("weight", 3)
+    assert lamp.get_attribute("open") is True and lamp.get_weight() == 3
+    assert dict(lamp.attributes)["open"] is True
+
+
+def test_predicates():
+    """Test predicates against flag changes."""
+    lamp = _lamp()
+    assert lamp.is_takeable() and lamp.is_light_source() and not lamp.is_lit()
+    lamp.set_attribute("lit", True)
+    assert lamp.is_lit()
+    lamp.set_attribute("light_source", False)
+    assert not lamp.is_lit()
+    assert lamp.light_turns_remaining() == -1
+
+    box = GameObject(id="BOX", name="box", description="",
+                     attributes={"container": True, "openable": True, "open": False, "locked": True})
+    assert box.is_container() and not box.can_open()
+    box.set_attribute("locked", False)
+    assert box.can_open() and not box.can_close()
+    box.set_attribute("open", True)
+    assert box.add_to_container("COIN")
+    assert box.get_contents() == ["COIN"]
+
+
+def test_attributes_mapping_view():
+    """Test that obj.attributes reads, writes and deletes like the old dict."""
+    lamp = _lamp()
+    view = lamp.attributes
+    assert view["weight"] == 15
+    assert "lit" in view and "open" not in view
+    assert view.get("open", False) is False
+
+    view["open"] = True
+    view["readable_text"] = "Made in Frobozz"
+    assert lamp.is_open() and lamp.is_readable()
+    del view["open"]
+    assert lamp.get_attribute("open") is None
+    assert set(view) == {"takeable", "light_source", "lit", "light_turns", "weight",
+                         "portable", "readable_text"}
+
+    lamp.attributes = {"weight": 1}
+    assert dict(lamp.attributes) == {"weight": 1}
+
+
+def test_writes_bump_world_version():
+    """Test that attribute writes still invalidate caches keyed on the world version."""
+    lamp = _lamp()
+    lamp.containment = ContainmentIndex()
+    version = lamp.containment.version
+    lamp.set_attribute("lit", True)
+    lamp.attributes["weight"] = 4
+    del lamp.attributes["weight"]
+    assert lamp.containment.version == version + 3
+
+
+def test_equality_copy_and_pickle():
+    """Test equality, copying and pickling (the world image pickles objects)."""
+    assert _lamp() == _lamp()
+    lamp = _lamp()
+    lamp.set_attribute("contents", [])
+    assert lamp != _lamp()
+    assert _lamp() != GameObject(id="LAMP", name="brass lantern", description="A lamp.")
+
+    for clone in (pickle.loads(pickle.dumps(lamp)), copy.deepcopy(lamp)):
+        assert clone == lamp
+        assert clone.is_light_source() and clone.get_attribute("contents") == []
+    assert "brass lantern" in repr(lamp)
@@ -0,0 +1,115 @@
+"""Tests for the engine output channel and sinks."""
+
+import io
+
+import pytest
+
+from src.game import GameEngine
+from src.output import FileTranscriptSink, MemorySink, NetworkSink, OutputChannel, OutputSink, TerminalSink
+
+
+def test_turn_output_is_returned_and_flushed_once():
+    """Test that a turn buffers its text and hands it to the sinks in one write."""
+    sink = MemorySink()
+    game = GameEngine(use_mud_files=False, output=OutputChannel([sink]))
+    sink.clear()
+
+    text = game._process_command("inventory")
+    assert text.strip()
+    assert sink.chunks == [text]
+
+    assert game._process_command("xyzzy") == sink.chunks[-1]
+    assert len(sink.chunks) == 2
+
+
+def test_memory_channel_keeps_stdout_clean(capsys):
+    """Test that a headless engine writes nothing to the terminal during turns."""
+    game = GameEngine(use_mud_files=False, output=OutputChannel.memory())
+    capsys.readouterr()
+
+    text = game._process_command("look")
+    assert "white house" in text
+    assert capsys.readouterr().out == ""
+
+
+def test_default_channel_writes_to_terminal(capsys):
+    """Test that the default channel still reaches stdout."""
+    game = GameEngine(use_mud_files=False)
+    capsys.readouterr()
+    text = game._process_command("look")
+    assert capsys.readouterr().out == text
+
+
+def test_quit_question_is_shown_before_reading_the_answer():
+    """Test that QUIT's confirmation reaches the terminal before input is read, and only once."""
+    stream = io.StringIO()
+    game = GameEngine(use_mud_files=False, output=OutputChannel([TerminalSink(stream)]))
+    stream.truncate(0)
+    stream.seek(0)
+    shown = []
+
+    def read_input(prompt):
+        shown.append(stream.getvalue())
+        return "n"
+
+    game.read_input = read_input
+    text = game._process_command("quit")
+    assert "Are you sure you want to quit?" in shown[0]
+    assert "Are you sure you want to quit?" in text
+    assert stream.getvalue().count("Are you sure") == 1
+    assert game.running
+
+
+def test_engines_have_independent_output():
+    """Test that several engines in one process don't mix their text."""
+    first = GameEngine(use_mud_files=False, output=OutputChannel.memory())
+    second = GameEngine(use_mud_files=False, output=OutputChannel.memory())
+    second.world.get_room("WHOUS").add_item("SWORD")
+
+    assert "sword" not in first._process_command("look").lower()
+    assert "sword" in second._process_command("look").lower()
+
+
+def test_nested_turns_and_direct_writes():
+    """Test nesting and writes outside any turn."""
+    sink = MemorySink()
+    channel = OutputChannel([sink])
+
+    channel.write("outside")
+    assert sink.chunks == ["outside\n"]
+
+    channel.begin_turn()
+    channel.write("a", 1, sep="-")
+    channel.begin_turn()
+    channel.write("inner", end="")
+    assert channel.end_turn() == "inner"
+    assert sink.chunks == ["outside\n"]  # Still buffered
+    assert channel.end_turn() == "a-1\ninner"
+    assert sink.chunks == ["outside\n", "a-1\ninner"]
+
+
+def test_file_and_network_sinks(tmp_path):
+    """Test transcript and network sinks receive whole turns."""
+    sent = []
+    transcript = tmp_path / "transcript.txt"
+    channel = OutputChannel([FileTranscriptSink(transcript), NetworkSink(sent.append, line_ending="\r\n")])
+
+    channel.begin_turn()
+    channel.write("You are in a maze.")
+    channel.write("It is dark.")
+    channel.end_turn()
+    channel.close()
+
+    assert transcript.read_text() == "You are in a maze.\nIt is dark.\n"
+    assert sent == [b"You are in a maze.\r\nIt is dark.\r\n"]
+
+
+def test_sinks_must_implement_write():
+    """Test that a sink without write() is refused when it is made, not on the first turn."""
+    class SilentSink(OutputSink):
+        pass
+
+    with pytest.raises(TypeError):
+        SilentSink()
+    with pytest.raises(TypeError):
+        OutputSink()
@@ -0,0 +1,54 @@
+"""Tests for the parse cache and immutable commands."""
+
+import pytest
+
+from src.game import GameEngine
+from src.output import OutputChannel
+from src.parser.command_parser import Command, CommandParser
+
+
+def test_repeats_hit_the_cache():
+    """Test that inputs with the same words share one cached Command."""
+    parser = CommandParser()
+    first = parser.parse("take lamp")
+    assert parser.parse("  Take the... LAMP ") is not first  # Different words: "the" is part of the key
+    assert parser.parse("TAKE   lamp!") is first
+    assert (parser.cache_hits, parser.cache_misses) == (1, 2)
+    assert parser.parse("") is None and parser.parse("?") is None
+    assert parser.cache_misses == 2
+
+
+def test_cache_is_bounded_lru():
+    """Test that the least recently used entry is evicted first."""
+    parser = CommandParser(cache_size=2)
+    north = parser.parse("n")
+    parser.parse("look")
+    parser.parse("n")
+    parser.parse("i")  # Evicts "look"
+    assert parser.parse("n") is north
+    parser.parse("look")
+    assert parser.cache_misses == 4
+
+    uncached = CommandParser(cache_size=0)
+    assert uncached.parse("n") is not uncached.parse("n")
+
+
+def test_commands_are_immutable():
+    """Test that a handler can't change a cached command."""
+    command = CommandParser().parse("take lamp")
+    with pytest.raises(AttributeError):
+        command.noun = "sword"
+    with pytest.raises(AttributeError):
+        del command.verb
+    assert command == Command("TAKE", "Lamp") and hash(command) == hash(Command("take", "lamp"))
+
+
+def test_debug_parser_reports_counters():
+    """Test that 'debug parser' shows hits and misses."""
+    game = GameEngine(use_mud_files=False, debug_mode=True, output=OutputChannel.memory())
+    game._process_command("look")
+    game._process_command("look")
+    text = game._process_command("debug parser")
+    assert "PARSE CACHE" in text
+    assert "hits" in text and "misses" in text
+    assert game.parser.cache_hits >= 1
@@ -0,0 +1,45 @@
+"""Tests for the trie-based command parser."""
+
+import random
+
+from src.parser.command_parser import CommandParser
+from tests.benchmark_parser import RegexCommandParser, fields, make_corpus
+
+
+def test_same_commands_as_original_parser():
+    """Test that the trie parser matches the original parser on a generated corpus."""
+    trie, regex = CommandParser(), RegexCommandParser()
+    corpus = make_corpus(trie, 3000, random.Random(7))
+    corpus += ["", "   ", "?", "the", "with sword", "look at the lamp", "pick up",
+               "go up stairs", "put out the torch", "attack troll with the sword in anger",
+               "Take LAMP.", "get up", "remove sword", "use key on door", "x"]
+    for line in corpus:
+        assert fields(trie.parse(line)) == fields(regex.parse(line)), line
+
+
+def test_verb_phrases_and_objects():
+    """Test verb phrases, synonyms, articles and the first preposition split."""
+    parser = CommandParser()
+    assert fields(parser.parse("pick up the brass lantern")) == ("take", "brass lamp", None, None)
+    assert fields(parser.parse("turn on lamp")) == ("light", "lamp", None, None)
+    assert fields(parser.parse("kill the troll with a knife from box")) == \
+        ("attack", "troll", "with", "knife from box")
+    assert fields(parser.parse("put in box")) == ("put", None, "in", "box")
+    assert parser.parse("a the an") is None
+
+
+def test_phrases_ignore_spacing_and_punctuation():
+    """Test that phrasal verbs match however the words are separated."""
+    parser = CommandParser()
+    assert fields(parser.parse("pick   up lamp")) == ("take", "lamp", None, None)
+    assert fields(parser.parse("pick up, lamp")) == ("take", "lamp", None, None)
+    assert fields(parser.parse("the pick up lamp")) == ("take", "lamp", None, None)
+
+
+def test_compile_vocabulary_picks_up_table_changes():
+    """Test that edited tables take effect after compile_vocabulary."""
+    parser = CommandParser()
+    parser.multi_word_verbs["fiddle with"] = "touch"
+    parser.articles.add("yon")
+    parser.compile_vocabulary()
+    assert fields(parser.parse("fiddle with yon rope")) == ("touch", "rope", None, None)
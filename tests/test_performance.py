@@ -10,7 +10,6 @@ import time
 import statistics
 import gc
 from typing import List, Dict, Tuple
-from collections import deque
 import random
 
 # Add src to path for imports
@@ -70,27 +69,7 @@ class PerformanceTester:
     
     def _single_traversal(self, start_room: str) -> set:
         """Perform a single world traversal."""
-        
-        visited = set()
-        queue = deque([start_room])
-        
-        while queue:
-            room_id = queue.popleft()
-            
-            if room_id in visited:
-                continue
-                
-            room = self.world.get_room(room_id)
-            if not room:
-                continue
-                
-            visited.add(room_id)
-            
-            for target in room.exits.values():
-                if target not in visited and target in self.world.rooms:
-                    queue.append(target)
-        
-        return visited
+        return set(self.world.get_graph().reachable_from(start_room))
     
     def test_random_pathfinding(self, num_tests: int = 20) -> Dict[str, float]:
         """Test performance of pathfinding between random room pairs."""
@@ -138,32 +117,9 @@ class PerformanceTester:
         return stats
     
     def _find_path(self, start: str, target: str) -> List[str]:
-        """Find path between two rooms using BFS."""
-        
-        if start == target:
-            return []
-            
-        queue = deque([(start, [])])
-        visited = set()
-        
-        while queue:
-            current, path = queue.popleft()
-            
-            if current == target:
-                return path
-                
-            if current in visited:
-                continue
-                
-            visited.add(current)
-            room = self.world.get_room(current)
-            
-            if room:
-                for direction, next_room in room.exits.items():
-                    if next_room not in visited and next_room in self.world.rooms:
-                        queue.append((next_room, path + [direction]))
-        
-        return None  # No path found
+        """Find path between two rooms using the cached BFS of the world graph."""
+        path = self.world.get_graph().shortest_path(start, target)
+        return list(path.directions) if path is not None else None  # None = no path found
     
     def test_memory_usage(self) -> Dict[str, int]:
         """Test memory usage during traversal."""
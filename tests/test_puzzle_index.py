@@ -0,0 +1,101 @@
+"""Tests for the puzzle trigger index."""
+
+from src.game import GameEngine
+from src.output import OutputChannel
+from src.puzzles import Puzzle, PuzzleManager, PuzzleState, PuzzleStep
+
+
+def _step(step_id, verb=None, room=None, flags=(), fired=None):
+    def trigger(game, command_verb, target_object, **kwargs):
+        return True
+
+    def action(**kwargs):
+        if fired is not None:
+            fired.append(step_id)
+        return True
+
+    return PuzzleStep(id=step_id, description=step_id, trigger_condition=trigger, action=action,
+                      required_room=room, required_flags=list(flags),
+                      trigger_verbs=[verb] if verb else [])
+
+
+def _manager():
+    game = GameEngine(use_mud_files=False, output=OutputChannel.memory())
+    game.player.current_room = "WHOUS"
+    return PuzzleManager(game)
+
+
+def test_only_matching_room_and_verb_are_evaluated():
+    """Test that a command only evaluates the triggers indexed under its room and verb."""
+    manager = _manager()
+    fired = []
+    for i in range(50):
+        manager.register_puzzle(Puzzle(id=f"p{i}", name=f"p{i}", description="",
+                                       steps=[_step(f"s{i}", verb="push", room=f"ROOM{i}", fired=fired)]))
+    manager.register_puzzle(Puzzle(id="here", name="here", description="",
+                                   steps=[_step("here", verb="push", room="WHOUS", fired=fired)]))
+
+    manager.attempt_puzzle_action("look")
+    assert manager.trigger_checks == 0
+
+    triggered, _ = manager.attempt_puzzle_action("push", "button")
+    assert triggered and fired == ["here"]
+    assert manager.trigger_checks == 1
+
+
+def test_index_follows_puzzle_advance():
+    """Test that the next step is indexed once the current one fires."""
+    manager = _manager()
+    fired = []
+    manager.register_puzzle(Puzzle(id="two", name="two", description="",
+                                   steps=[_step("first", verb="open", fired=fired),
+                                          _step("second", verb="close", fired=fired)]))
+
+    assert manager.attempt_puzzle_action("close") == (False, "")
+    manager.attempt_puzzle_action("open")
+    manager.attempt_puzzle_action("open")
+    manager.attempt_puzzle_action("close")
+    assert fired == ["first", "second"]
+    assert manager.get_puzzle("two").state == PuzzleState.COMPLETED
+    assert manager.get_trigger_candidates("close", "WHOUS") == []
+
+
+def test_flag_gated_steps_wait_for_set_flag():
+    """Test that a flag-gated step enters and leaves the index with its flag."""
+    manager = _manager()
+    fired = []
+    manager.register_puzzle(Puzzle(id="gated", name="gated", description="",
+                                   steps=[_step("gated", verb="turn", flags=["power_on"], fired=fired)]))
+
+    assert manager.get_trigger_candidates("turn", "WHOUS") == []
+    manager.set_flag("power_on")
+    assert len(manager.get_trigger_candidates("turn", "WHOUS")) == 1
+    manager.set_flag("power_on", False)
+    assert manager.get_trigger_candidates("turn", "WHOUS") == []
+
+    manager.set_flag("power_on")
+    manager.attempt_puzzle_action("turn", "switch")
+    assert fired == ["gated"]
+
+
+def test_wildcard_steps_and_restored_status():
+    """Test any-room/any-verb steps and re-indexing after load_puzzle_status."""
+    manager = _manager()
+    manager.register_puzzle(Puzzle(id="any", name="any", description="", steps=[_step("anything")]))
+    assert len(manager.get_trigger_candidates("look", "NOWHERE")) == 1
+
+    status = manager.get_puzzle_status()
+    status["puzzles"]["any"]["state"] = PuzzleState.COMPLETED.value
+    manager.load_puzzle_status(status)
+    assert manager.get_trigger_candidates("look", "NOWHERE") == []
+
+
+def test_builtin_puzzles_still_trigger():
+    """Test the mailbox tutorial through the game's own pipeline."""
+    game = GameEngine(use_mud_files=False, output=OutputChannel.memory())
+    game.scheduler.cancel_all("THIEF")
+    game.player.move_to_room("SHOUS")
+    assert len(game.puzzle_manager.get_trigger_candidates("open", "SHOUS")) == 1
+    text = game._process_command("open mailbox")
+    assert "Welcome to Zork" in text
+    assert game.puzzle_manager.get_puzzle("mailbox_tutorial").is_complete()
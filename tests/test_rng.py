@@ -0,0 +1,66 @@
+"""Tests for the per-engine seeded random streams."""
+
+from src.game import GameEngine
+from src.output import OutputChannel
+from src.rng import STREAMS, GameRandom
+
+COMMANDS = ["attack thief", "xyzzyq", "flee", "attack thief", "frobnicate", "flee"]
+
+
+def _play(seed):
+    game = GameEngine(use_mud_files=False, output=OutputChannel.memory(), seed=seed)
+    return [game._process_command(command) for command in COMMANDS]
+
+
+def test_same_seed_same_streams():
+    """Test that streams are reproducible from the seed and differ from each other."""
+    first, second = GameRandom(1978), GameRandom(1978)
+    for name in STREAMS:
+        assert [first.stream(name).random() for _ in range(5)] == \
+            [second.stream(name).random() for _ in range(5)]
+    assert GameRandom(1978).combat.random() != GameRandom(1978).flavor.random()
+    assert GameRandom(1).combat.random() != GameRandom(2).combat.random()
+
+
+def test_streams_are_independent():
+    """Test that drawing from one stream doesn't shift another."""
+    quiet, busy = GameRandom(5), GameRandom(5)
+    for _ in range(100):
+        busy.flavor.choice(["Huh?", "What?"])
+    assert [quiet.combat.randint(1, 100) for _ in range(10)] == \
+        [busy.combat.randint(1, 100) for _ in range(10)]
+
+
+def test_state_round_trip_resumes_sequence():
+    """Test that get_state/set_state resumes every stream, and reseed restarts them."""
+    rng = GameRandom(42)
+    rng.npc.random()
+    state = rng.get_state()
+    expected = [rng.npc.random(), rng.world.random()]
+
+    restored = GameRandom(0)
+    restored.set_state(state)
+    assert restored.seed == 42
+    assert [restored.npc.random(), restored.world.random()] == expected
+
+    restored.reseed(42)
+    assert restored.npc.random() == GameRandom(42).npc.random()
+
+
+def test_engines_with_same_seed_play_identically():
+    """Test that whole turns (combat, flavor text, fleeing) replay from the seed."""
+    assert _play(7) == _play(7)
+    assert GameEngine(use_mud_files=False, output=OutputChannel.memory()).rng.seed is not None
+
+
+def test_rng_saved_with_game_state():
+    """Test that restoring a game resumes the saved random streams."""
+    game = GameEngine(use_mud_files=False, output=OutputChannel.memory(), seed=3)
+    game._process_command("attack thief")
+    state = game._collect_game_state()
+    expected = [game.rng.combat.random(), game.rng.flavor.random()]
+
+    other = GameEngine(use_mud_files=False, output=OutputChannel.memory(), seed=99)
+    other._restore_game_state(state)
+    assert other.rng.seed == 3
+    assert [other.rng.combat.random(), other.rng.flavor.random()] == expected
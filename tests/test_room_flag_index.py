@@ -0,0 +1,93 @@
+"""Tests for room flag bitmasks and the World flag-to-rooms index."""
+
+import random
+
+from src.game import GameEngine
+from src.world.room import Room
+from src.world.world import World
+from src.world.room_flags import RoomFlag, MDL_FLAG_NAMES, encode_flags, flag_names, to_mask
+
+
+def test_mdl_and_engine_names_share_bits():
+    """Test that MDL R*BIT names and engine names resolve to the same flags."""
+    room = Room(id="TEMPL", name="Temple", description="", flags=["RSACREDBIT", "RLIGHTBIT", "RLANDBIT"])
+    assert room.has_flag("sacred") and room.has_flag(RoomFlag.SACRED)
+    assert room.has_flag("light") and room.has_flag("RLIGHTBIT")
+    assert not room.has_flag("dark")
+    assert room.flag_names() == ["sacred", "light", "land"]
+    assert all(isinstance(flag, RoomFlag) for flag in MDL_FLAG_NAMES.values())
+    # Unknown MDL bits from the loader are dropped rather than interned
+    assert to_mask(["RLANDBIT", "RBOGUSBIT"], intern=False) == RoomFlag.LAND
+
+
+def test_index_matches_scan_under_random_changes():
+    """Test get_rooms_with_flag against a scan while flags change."""
+    world = World()
+    for i in range(30):
+        world.add_room(Room(id=f"R{i}", name=f"Room {i}", description="",
+                            flags={"dark"} if i % 3 == 0 else set()))
+    names = ["dark", "deadly", "sacred", "outdoor", "water", "dangerous"]
+    rng = random.Random(9)
+    rooms = list(world.rooms.values())
+
+    for _ in range(300):
+        room = rng.choice(rooms)
+        if rng.random() < 0.5:
+            room.set_flag(rng.choice(names))
+        else:
+            room.clear_flag(rng.choice(names))
+        for name in names:
+            expected = {r.id for r in rooms if r.has_flag(name)}
+            assert {r.id for r in world.get_rooms_with_flag(name)} == expected, name
+
+    deadly_or_dangerous = {r.id for r in rooms if r.has_flag("deadly") or r.has_flag("dangerous")}
+    assert {r.id for r in world.get_rooms_with_flag(RoomFlag.DEADLY | RoomFlag.DANGEROUS)} == deadly_or_dangerous
+
+
+def test_replaced_room_leaves_index():
+    """Test that re-adding a room ID drops the old room from the index."""
+    world = World()
+    world.add_room(Room(id="CELLA", name="Cellar", description="", flags={"dark"}))
+    world.add_room(Room(id="CELLA", name="Cellar", description=""))
+    assert world.get_rooms_with_flag("dark") == []
+
+
+def test_interned_flags():
+    """Test that flag names outside RoomFlag still work and are saved by name."""
+    room = Room(id="EDGE", name="Edge", description="")
+    room.set_flag("haunted")
+    assert room.has_flag("haunted")
+    assert encode_flags(room.flags) == ["haunted"]
+    room.set_flag("dark")
+    assert sorted(flag_names(to_mask(encode_flags(room.flags)))) == ["dark", "haunted"]
+    room.clear_flag("haunted")
+    assert encode_flags(room.flags) == int(RoomFlag.DARK)
+
+
+def test_save_state_round_trip():
+    """Test that save data stores compact masks and restores them into the index."""
+    game = GameEngine(use_mud_files=False)
+    game.world.get_room("WHOUS").set_flag("outdoor")
+    state = game._collect_game_state()
+    assert state["world_state"]["WHOUS"]["flags"] == int(RoomFlag.OUTDOOR)
+
+    game.world.get_room("WHOUS").clear_flag("outdoor")
+    game._restore_game_state(state)
+    assert game.world.get_room("WHOUS").has_flag("outdoor")
+    assert [room.id for room in game.world.get_rooms_with_flag("outdoor")] == ["WHOUS"]
+
+    # Saves from before the bitmask stored a list of names
+    state["world_state"]["WHOUS"]["flags"] = ["dark", "sacred"]
+    game._restore_game_state(state)
+    assert game.world.get_room("WHOUS").flag_names() == ["dark", "sacred"]
+
+
+def test_sacred_rooms_describe_as_before():
+    """Test that RSACREDBIT rooms (now SACRED) don't gain atmospheric text, while other flags keep theirs."""
+    game = GameEngine(use_mud_files=False)
+    room = game.world.get_room("WHOUS")
+    room.set_flags(["RSACREDBIT", "RLIGHTBIT", "RLANDBIT"])
+    assert game._get_atmospheric_description() is None
+
+    room.set_flag("cold")
+    assert game._get_atmospheric_description() == "The air is frigid here."
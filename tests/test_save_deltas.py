@@ -0,0 +1,113 @@
+"""Tests for save files made of a checkpoint and appended per-save deltas."""
+
+import json
+import pickle
+
+from src.savefile import HEADER_SIZE, MAX_DELTAS, read_header
+
+
+def _lines(tmp_path, name="game.json"):
+    return (tmp_path / "saves" / name).read_bytes().split(b"\n")[:-1]
+
+
+def test_later_saves_append_only_what_changed(tmp_path, monkeypatch, game, make_game, saved_state):
+    """Test that a second save appends a delta of the touched rooms and objects, and loads back whole."""
+    monkeypatch.chdir(tmp_path)
+    game._process_input("open mailbox. take leaflet")
+    assert game.save_game("game.json")
+    game._process_input("take lamp. close mailbox. n. drop leaflet")
+    assert game.save_game("game.json")
+
+    header, checkpoint, delta = _lines(tmp_path)
+    assert len(header) == HEADER_SIZE - 1 and json.loads(checkpoint)["version"] == "1.3.0"
+    delta = json.loads(delta)
+    assert set(delta["world_state"]) == {"WHOUS", "NHOUS"}
+    assert set(delta["object_state"]) == {"MAILBOX"}
+    assert delta["player_state"]["inventory"] == ["LAMP"]
+    assert "combination_state" not in delta and "npc_state" not in delta
+
+    restored = make_game()
+    assert restored.load_game("game.json")
+    assert saved_state(restored) == saved_state(game)
+    assert not restored.object_manager.get_object("MAILBOX").is_open()
+    assert read_header(tmp_path / "saves" / "game.json").deltas == 1
+
+
+def test_checkpoints_are_rewritten_when_deltas_cannot_apply(tmp_path, monkeypatch, game, make_game):
+    """Test compaction after MAX_DELTAS, and full saves to a new file or one changed by someone else."""
+    monkeypatch.chdir(tmp_path)
+    for n in range(MAX_DELTAS + 3):
+        game._process_command("n" if n % 2 == 0 else "s")
+        game.save_game("game.json")
+    assert len(_lines(tmp_path)) == 2 + 1  # Compacted at MAX_DELTAS, then one more delta
+
+    game.save_game("other.json")
+    game._process_command("n")
+    game.save_game("game.json")  # Last written was other.json, so game.json gets a checkpoint
+    assert len(_lines(tmp_path)) == 2
+
+    (tmp_path / "saves" / "game.json").write_bytes(b"\n".join(_lines(tmp_path)) + b"\n\n")
+    game._process_command("s")
+    game.save_game("game.json")
+    assert len(_lines(tmp_path)) == 2
+    restored = make_game()
+    assert restored.load_game("game.json") and restored.player.current_room == "WHOUS"
+
+
+def test_torn_delta_and_older_saves_load(tmp_path, monkeypatch, game, make_game):
+    """Test that a delta cut short is ignored and whole-JSON saves from older versions still load."""
+    monkeypatch.chdir(tmp_path)
+    game.save_game("game.json")
+    game._process_command("take lamp")
+    game.save_game("game.json")
+    path = tmp_path / "saves" / "game.json"
+    path.write_bytes(path.read_bytes()[:-10])
+
+    restored = make_game()
+    assert restored.load_game("game.json")
+    assert "LAMP" not in restored.player.inventory
+    restored._process_command("take mailbox")
+    assert restored.save_game("game.json")  # The torn tail forces a fresh checkpoint
+    assert len(_lines(tmp_path)) == 2
+
+    older = make_game()._collect_game_state()
+    older["player_state"]["current_room"] = "NHOUS"
+    for section in ("object_state", "npc_state"):
+        del older[section]
+    (tmp_path / "saves" / "older.json").write_text(json.dumps(older, indent=2))
+    restored = make_game()
+    assert restored.load_game("older.json") and restored.player.current_room == "NHOUS"
+
+
+def test_listing_reads_headers_and_loading_rejects_dangerous_deltas(tmp_path, monkeypatch, game, make_game):
+    """Test the RESTORE listing and that strings in deltas are checked like the rest of the save."""
+    monkeypatch.chdir(tmp_path)
+    game.save_game("first.json")
+    game._process_command("n")
+    game.save_game("second.json")
+    assert game.list_saves() == ["second.json", "first.json"]
+    listing = game._process_command("restore")
+    assert "second.json - North of House, 1 moves" in listing
+
+    game._process_command("s")
+    game.save_game("second.json")
+    path = tmp_path / "saves" / "second.json"
+    delta = json.dumps({"object_state": {"LAMP": {"attributes": {"note": "__import__('os')"}}}})
+    path.write_bytes(path.read_bytes() + delta.encode() + b"\n")
+    assert not make_game().load_game("second.json")
+
+
+def test_changes_are_tracked_by_the_engine_not_the_world(game):
+    """Test that the engine's ChangeTracker sees each turn's changes and never goes into a pickled world."""
+    game.tracker.clear()
+    game._process_input("open mailbox. take lamp. n")
+    changes = game.tracker.take()
+    assert changes.rooms == {"WHOUS", "NHOUS"} and changes.objects == {"MAILBOX"}
+    assert not game.tracker.changes.rooms and not hasattr(game.object_manager.containment, "journal")
+
+    game._process_command("undo")
+    assert game.tracker.changes.rooms == {"NHOUS"}  # Unvisited again, so saved again
+    world = pickle.loads(pickle.dumps(game.world))
+    objects = pickle.loads(pickle.dumps(game.object_manager))
+    assert world.tracker is None and world.get_room("WHOUS").tracker is None
+    assert objects.tracker is None and objects.get_object("MAILBOX").tracker is None
@@ -0,0 +1,137 @@
+"""Tests for the move-clock event scheduler."""
+
+import pytest
+
+from src.game import GameEngine
+from src.output import OutputChannel
+from src.scheduler import TurnScheduler
+
+
+def _recorder(log, delay=None):
+    def handler(game_engine, event):
+        log.append((event.npc_id, event.action, game_engine.scheduler.current_turn))
+        return delay
+    return handler
+
+
+class _Engine:
+    def __init__(self):
+        self.scheduler = TurnScheduler()
+
+
+def test_only_due_events_run_in_order():
+    """Test that advance pops due events by turn, then by scheduling order."""
+    engine, log = _Engine(), []
+    scheduler = engine.scheduler
+    scheduler.register_action("act", _recorder(log))
+    scheduler.schedule("B", "act", delay=2)
+    scheduler.schedule("A", "act", delay=2)
+    scheduler.schedule("C", "act", delay=5)
+
+    assert scheduler.advance(1, engine) == 0
+    assert scheduler.advance(2, engine) == 2
+    assert log == [("B", "act", 2), ("A", "act", 2)]
+    assert len(scheduler) == 1 and scheduler.turns_until("C", "act") == 3
+
+    # Skipping ahead runs everything that came due in between
+    scheduler.advance(10, engine)
+    assert log[-1] == ("C", "act", 10)
+    assert len(scheduler) == 0
+
+
+def test_periodic_events_and_handler_delays():
+    """Test repeating events, handler-chosen delays and stopping from a handler."""
+    engine, log = _Engine(), []
+    scheduler = engine.scheduler
+    scheduler.register_action("tick", _recorder(log))
+    scheduler.register_action("slow", _recorder(log, delay=4))
+    scheduler.schedule("NPC", "tick", delay=1, interval=3)
+    scheduler.schedule("NPC", "slow", delay=1)  # One-shot that keeps rescheduling itself
+
+    for turn in range(1, 11):
+        scheduler.advance(turn, engine)
+    assert [turn for _, action, turn in log if action == "tick"] == [1, 4, 7, 10]
+    assert [turn for _, action, turn in log if action == "slow"] == [1, 5, 9]
+
+    def stop(game_engine, event):
+        event.cancelled = True
+    scheduler.register_action("tick", stop)
+    scheduler.advance(13, engine)
+    assert scheduler.get_event("NPC", "tick") is None
+
+    with pytest.raises(ValueError):
+        scheduler.schedule("NPC", "tick", interval=0)
+
+
+def test_cancel_and_replace():
+    """Test that rescheduling replaces the pending event and cancel drops it."""
+    engine, log = _Engine(), []
+    scheduler = engine.scheduler
+    scheduler.register_action("act", _recorder(log))
+    scheduler.schedule("X", "act", delay=2)
+    scheduler.schedule("X", "act", delay=4)
+    scheduler.schedule("X", "other", delay=1)
+    scheduler.advance(3, engine)
+    assert log == []  # "other" has no handler; the first "act" was replaced
+
+    assert scheduler.cancel("X", "act")
+    assert not scheduler.cancel("X", "act")
+    scheduler.advance(10, engine)
+    assert log == []
+
+
+def test_state_round_trip():
+    """Test that the clock and queue survive get_state/set_state."""
+    engine, log = _Engine(), []
+    scheduler = engine.scheduler
+    scheduler.register_action("act", _recorder(log))
+    scheduler.schedule("A", "act", delay=3, interval=2)
+    scheduler.advance(1, engine)
+    state = scheduler.get_state()
+
+    restored = _Engine()
+    restored.scheduler.register_action("act", _recorder(log))
+    restored.scheduler.set_state(state)
+    assert restored.scheduler.current_turn == 1
+    restored.scheduler.advance(5, restored)
+    assert [turn for _, _, turn in log] == [5]
+    assert restored.scheduler.turns_until("A", "act") == 2
+
+
+def test_lamp_burns_down_on_the_move_clock():
+    """Test the lamp's dimming warning, burn-out, and banking unused turns."""
+    game = GameEngine(use_mud_files=False, output=OutputChannel.memory(), seed=1)
+    game.scheduler.cancel_all("THIEF")
+    lamp = game.object_manager.get_object("LAMP")
+    game.player.add_to_inventory("LAMP")
+    lamp.set_attribute("light_turns", 15)
+    lamp.set_attribute("lit", True)
+    game._schedule_burn_down(lamp)
+
+    # Put out after 4 moves: 11 turns of light are kept
+    game.scheduler.advance(4, game)
+    game._stop_burn_down(lamp)
+    assert lamp.get_attribute("light_turns") == 11
+    assert len(game.scheduler) == 0
+
+    lamp.set_attribute("lit", True)
+    game._schedule_burn_down(lamp)
+    game.output.begin_turn()
+    game.scheduler.advance(5, game)
+    assert "getting dim" in game.output.end_turn()
+    game.output.begin_turn()
+    game.scheduler.advance(15, game)
+    assert "burned out" in game.output.end_turn()
+    assert not lamp.is_lit() and lamp.get_attribute("burned_out")
+
+
+def test_schedule_saved_with_game_state():
+    """Test that pending events are saved and restored with the game."""
+    game = GameEngine(use_mud_files=False, output=OutputChannel.memory())
+    state = game._collect_game_state()
+    assert ["THIEF", "thief_steal"] in [event[1:3] for event in state["schedule_state"]["events"]]
+
+    other = GameEngine(use_mud_files=False, output=OutputChannel.memory())
+    other.scheduler.clear()
+    other._restore_game_state(state)
+    assert other.scheduler.get_state() == state["schedule_state"]
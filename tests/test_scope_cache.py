@@ -0,0 +1,71 @@
+"""Tests for the per-turn scope cache."""
+
+
+def test_repeated_lookups_hit_until_world_changes(scope_game):
+    """Test that lookups reuse the scope until something moves."""
+    cache = scope_game.scope_cache
+
+    first = cache.get()
+    assert cache.get() is first
+    assert scope_game._find_object("sword") is not None
+    assert cache.get() is first
+
+    scope_game.world.get_room("WHOUS").remove_item("SWORD")
+    scope_game.player.add_to_inventory("SWORD")
+    second = cache.get()
+    assert second is not first
+    assert [obj.id for obj in second.inventory] == ["SWORD"]
+
+    # Opening a container changes what is reachable
+    scope_game.object_manager.get_object("MAILBOX").set_attribute("open", True)
+    assert "LEAFLET" in [obj.id for obj in cache.get().reachable]
+
+    # Replacing lists wholesale (as restore does) is also detected
+    scope_game.player.inventory = []
+    assert cache.get().inventory == []
+
+
+def test_light_presence_follows_lamp_state(scope_game):
+    """Test that darkness checks see the lamp being lit and extinguished."""
+    lamp = scope_game.object_manager.get_object("LAMP")
+    scope_game.world.get_room("WHOUS").set_flag("dark")
+
+    lamp.set_attribute("lit", False)
+    assert scope_game._check_darkness()
+
+    lamp.set_attribute("lit", True)
+    assert not scope_game._check_darkness()
+
+    scope_game.world.get_room("WHOUS").remove_item("LAMP")
+    assert scope_game._check_darkness()
+
+
+def test_take_all_uses_cached_candidates(scope_game, capsys):
+    """Test that 'take all' picks up takeable room items and open container contents."""
+    scope_game.object_manager.get_object("MAILBOX").set_attribute("open", True)
+    expected = [obj.id for obj in scope_game.scope_cache.get_bulk_candidates("take", "all")]
+    assert "LEAFLET" in expected and "MAILBOX" not in expected
+
+    scope_game._process_command("take all")
+
+    assert set(expected) <= set(scope_game.player.inventory)
+    assert scope_game.scope_cache.get_bulk_candidates("take", "all") == []
+
+
+def test_stats_per_command(scope_game, capsys):
+    """Test that hits and misses are counted against the command verb."""
+    scope_game.scope_cache.reset_stats()
+
+    scope_game._process_command("examine sword")
+    scope_game._process_command("examine sword")
+    scope_game._process_command("take sword")
+
+    hits, misses = scope_game.scope_cache.stats["examine"]
+    assert misses == 1 and hits >= 1
+    assert scope_game.scope_cache.stats["take"][1] <= 1
+
+    capsys.readouterr()
+    scope_game._process_command("debug scope")
+    output = capsys.readouterr().out
+    assert "SCOPE CACHE" in output
+    assert "examine" in output
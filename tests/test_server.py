@@ -0,0 +1,168 @@
+"""Tests for the multi-session game server."""
+
+import asyncio
+import time
+
+from src.batch import EngineOptions
+from src.server import PROMPT, TIMEOUT_MESSAGE, GameServer, ServerOptions
+
+
+def _options(**overrides):
+    options = ServerOptions(port=0, engine=EngineOptions(use_mud_files=False, seed=1))
+    for name, value in overrides.items():
+        setattr(options, name, value)
+    return options
+
+
+async def _read_turn(reader):
+    return (await reader.readuntil(PROMPT.encode())).decode()
+
+
+async def _command(reader, writer, line):
+    writer.write(f"{line}\n".encode())
+    await writer.drain()
+    return await _read_turn(reader)
+
+
+def test_sessions_are_independent(tmp_path, monkeypatch):
+    """Test that two connections get their own games."""
+    monkeypatch.chdir(tmp_path)
+
+    async def scenario():
+        server = await GameServer(_options()).start()
+        host, port = server.address[:2]
+        first = await asyncio.open_connection(host, port)
+        second = await asyncio.open_connection(host, port)
+        assert "ZORK" in (await _read_turn(first[0])).upper()
+        await _read_turn(second[0])
+        assert len(server.sessions) == 2
+
+        sessions = list(server.sessions.values())
+        for session in sessions:
+            session.engine.scheduler.cancel_all("THIEF")
+        sessions[0].engine.world.get_room("WHOUS").add_item("LAMP")
+        text = await _command(*first, "take lamp")
+        assert "Taken" in text
+        assert "LAMP" in sessions[0].engine.player.inventory
+        assert "LAMP" not in sessions[1].engine.player.inventory
+
+        for reader, writer in (first, second):
+            writer.close()
+        await server.close()
+        return server.stats
+
+    stats = asyncio.run(scenario())
+    assert stats.sessions_opened == 2 and stats.turns == 1
+
+
+def test_quit_closes_the_connection(tmp_path, monkeypatch):
+    """Test that quitting ends the session without asking for a confirmation line."""
+    monkeypatch.chdir(tmp_path)
+
+    async def scenario():
+        server = await GameServer(_options()).start()
+        reader, writer = await asyncio.open_connection(*server.address[:2])
+        await _read_turn(reader)
+        writer.write(b"quit\n")
+        await writer.drain()
+        rest = (await reader.read()).decode()
+        await server.close()
+        return rest, server.sessions
+
+    rest, sessions = asyncio.run(scenario())
+    assert "Thanks for playing" in rest
+    assert sessions == {}
+
+
+def test_idle_session_is_evicted_and_restored(tmp_path, monkeypatch):
+    """Test that an idle game is saved to disk, unloaded, and picked up again on the next command."""
+    monkeypatch.chdir(tmp_path)
+
+    async def scenario():
+        server = await GameServer(_options(idle_timeout=0.1)).start()
+        reader, writer = await asyncio.open_connection(*server.address[:2])
+        await _read_turn(reader)
+        session = next(iter(server.sessions.values()))
+        session.engine.scheduler.cancel_all("THIEF")
+        session.engine.world.get_room("WHOUS").add_item("LAMP")
+        await _command(reader, writer, "take lamp")
+
+        for _ in range(50):
+            await asyncio.sleep(0.05)
+            if session.engine is None:
+                break
+        assert session.engine is None and (tmp_path / session.save_dir / session.save_name).exists()
+
+        text = await _command(reader, writer, "inventory")
+        assert "brass lamp" in text
+        writer.close()
+        await asyncio.sleep(0.05)
+        await server.close()
+        return server.stats, session
+
+    stats, session = asyncio.run(scenario())
+    assert stats.evictions >= 1 and stats.restores >= 1
+    assert not (tmp_path / session.save_dir).exists()
+
+
+def test_sessions_cannot_reach_each_others_saves(tmp_path, monkeypatch):
+    """Test that RESTORE and SAVE only see the session's own directory, not another's eviction save."""
+    monkeypatch.chdir(tmp_path)
+
+    async def scenario():
+        server = await GameServer(_options()).start()
+        host, port = server.address[:2]
+        first = await asyncio.open_connection(host, port)
+        await _read_turn(first[0])
+        second = await asyncio.open_connection(host, port)
+        await _read_turn(second[0])
+        evicted, other = server.sessions.values()
+        async with evicted.lock:
+            assert await server._call(evicted, server._evict, evicted)
+        eviction_save = tmp_path / evicted.save_dir / evicted.save_name
+        saved = eviction_save.read_bytes()
+
+        listing = await _command(*second, "restore")
+        loaded = await _command(*second, f"restore {evicted.save_name}")
+        await _command(*second, f"save {evicted.save_name}")
+        overwritten = eviction_save.read_bytes() != saved
+        own_copy = (tmp_path / other.save_dir / evicted.save_name).exists()
+        for reader, writer in (first, second):
+            writer.close()
+        await asyncio.sleep(0.05)
+        await server.close()
+        return listing, loaded, overwritten, own_copy
+
+    listing, loaded, overwritten, own_copy = asyncio.run(scenario())
+    assert "No saved games found" in listing
+    assert "not found" in loaded
+    assert not overwritten and own_copy
+
+
+def test_slow_command_times_out(tmp_path, monkeypatch):
+    """Test that a command running past the timeout is answered and finishes before the next one."""
+    monkeypatch.chdir(tmp_path)
+
+    async def scenario():
+        server = await GameServer(_options(command_timeout=0.05)).start()
+        reader, writer = await asyncio.open_connection(*server.address[:2])
+        await _read_turn(reader)
+        engine = next(iter(server.sessions.values())).engine
+        original = engine._process_input
+
+        def slow(line):
+            time.sleep(0.3)
+            return original(line)
+
+        engine._process_input = slow
+        first = await _command(reader, writer, "look")
+        engine._process_input = original
+        second = await _command(reader, writer, "inventory")
+        writer.close()
+        await server.close()
+        return first, second, server.stats
+
+    first, second, stats = asyncio.run(scenario())
+    assert TIMEOUT_MESSAGE in first
+    assert "open field west of a white house" in second  # The slow look's output arrives with the next turn
+    assert stats.timeouts == 1
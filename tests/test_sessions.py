@@ -0,0 +1,117 @@
+"""Tests for copy-on-write world sessions forked from a shared base world."""
+
+from src.entities.objects import GameObject
+from src.game import GameEngine
+from src.output import OutputChannel
+from src.sessions import OverlayDict, WorldBase
+from src.world.room import Room
+
+
+def _base():
+    """Fallback world with a second room and items in WHOUS, taken as a base."""
+    template = GameEngine(use_mud_files=False, output=OutputChannel.memory())
+    template.world.add_room(Room(id="NHOUS", name="North of House",
+                                 description="You are facing the north side of a white house.",
+                                 exits={"south": "WHOUS"}))
+    template.world.get_room("WHOUS").exits["north"] = "NHOUS"
+    for item_id in ("MAILBOX", "LAMP"):
+        template.world.get_room("WHOUS").add_item(item_id)
+    return WorldBase.from_engine(template)
+
+
+def _session(base):
+    game = GameEngine(use_mud_files=False, output=OutputChannel.memory(), world_base=base)
+    game.scheduler.cancel_all("THIEF")
+    return game
+
+
+def test_overlay_dict_copies_on_first_read():
+    """Test that reads copy base values once and writes and deletes never reach the base."""
+    base = {"a": [1], "b": [2]}
+    overlay = OverlayDict(base, list)
+    assert overlay.peek("a") is base["a"] and not overlay.local
+
+    overlay["a"].append(5)
+    assert overlay["a"] == [1, 5] and base["a"] == [1]
+    overlay["c"] = [3]
+    del overlay["b"]
+    assert list(overlay) == ["a", "c"] and len(overlay) == 2 and "b" not in overlay
+    assert base == {"a": [1], "b": [2]}
+
+    overlay.reset()
+    assert dict(overlay) == base
+
+
+def test_sessions_are_isolated_and_copy_only_what_they_touch():
+    """Test that play in one session changes neither the base nor another session."""
+    base = _base()
+    game, other = _session(base), _session(base)
+    assert base.session_size(game.world, game.object_manager)["rooms"] == 0
+
+    game._process_input("open mailbox. take leaflet. take lamp. n. drop leaflet")
+    assert "leaflet" in game._process_command("look")
+    size = base.session_size(game.world, game.object_manager)
+    assert size["rooms"] == 2 and size["objects"] <= 3
+
+    assert base.world.rooms["WHOUS"].items == ["MAILBOX", "LAMP"]
+    assert base.object_manager.objects["MAILBOX"].get_contents() == ["LEAFLET"]
+    assert not base.object_manager.objects["MAILBOX"].is_open()
+    assert not base.world.rooms["NHOUS"].visited
+
+    assert other.world.get_room("WHOUS").items == ["MAILBOX", "LAMP"]
+    assert "leaflet" in other._process_command("open mailbox")
+    assert other.object_manager.containment.get_parent("LEAFLET") == ("container", "MAILBOX")
+    assert game.object_manager.containment.get_parent("LEAFLET") == ("room", "NHOUS")
+
+
+def test_scope_lookups_leave_the_room_shared():
+    """Test that the scope cache reads the shared base room instead of copying it into the session."""
+    game = _session(_base())
+    scope = game.scope_cache.get()
+    assert game.scope_cache.get() is scope and game._find_object("lamp") is not None
+    assert game.world.copied_rooms() == []
+
+    game._process_command("take lamp")
+    assert [room.id for room in game.world.copied_rooms()] == ["WHOUS"]
+    assert game.scope_cache.get() is not scope
+
+def test_session_objects_and_name_index():
+    """Test added and renamed objects in a session without touching the base index."""
+    base = _base()
+    game = _session(base)
+    manager = game.object_manager
+
+    manager.add_object(GameObject(id="ROPE", name="coil of rope", description="A rope.",
+                                  attributes={"takeable": True}))
+    lamp = manager.get_object("LAMP")
+    lamp.name = "hurricane lantern"
+    manager.reindex_object(lamp)
+
+    assert manager.find_object_ids_by_name("rope") == {"ROPE"}
+    assert manager.find_object_ids_by_name("hurricane") == {"LAMP"}
+    assert "LAMP" not in manager.find_object_ids_by_name("brass lamp")
+    assert [obj.id for obj in manager.find_objects_by_name("sword")] == ["SWORD"]
+    assert base.object_manager.find_object_ids_by_name("brass lamp") == {"LAMP"}
+    assert base.object_manager.get_object("ROPE") is None
+    assert len(manager) == len(base.object_manager) + 1
+
+
+def test_save_restore_and_graph_in_sessions():
+    """Test that restoring keeps unchanged rooms shared and exit changes get the session its own graph."""
+    base = _base()
+    game = _session(base)
+    game._process_input("take lamp. n")
+    state = game._collect_game_state()
+
+    restored = _session(base)
+    restored._restore_game_state(state)
+    assert restored.player.current_room == "NHOUS"
+    assert restored.object_manager.containment.get_parent("LAMP") == ("inventory", None)
+    assert restored.object_manager.containment.get_parent("MAILBOX") == ("room", "WHOUS")
+    assert base.session_size(restored.world, restored.object_manager)["rooms"] == 2
+
+    assert game.world.get_graph() is base.world.get_graph()
+    game.world.get_room("NHOUS").exits["down"] = "CAVE"
+    graph = game.world.get_graph()
+    assert graph is not base.world.get_graph() and ("NHOUS", "down", "CAVE") in graph.broken_exits
+    assert "down" not in base.world.rooms["NHOUS"].exits
@@ -12,7 +12,6 @@ All tests validate authentic Zork Thief behaviors.
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock
-import time
 import sys
 from pathlib import Path
 
@@ -28,12 +27,13 @@ from entities.thief import (
     _handle_thief_movement
 )
 from entities.npc import NPC
+from world.world import World
+from world.room import Room
 from entities.objects import GameObject  
 from entities.object_manager import ObjectManager
 from entities.player import Player
 from entities.combat import CombatStats
-from world.world import World
-from world.room import Room
+from scheduler import TurnScheduler
 
 
 class TestThiefBehavior(unittest.TestCase):
@@ -50,31 +50,59 @@ class TestThiefBehavior(unittest.TestCase):
         # Create mock object manager
         self.object_manager = Mock(spec=ObjectManager)
         
+    def _scheduled_engine(self, thief):
+        """Mock engine with a real scheduler and the Thief's events registered."""
+        engine = Mock()
+        engine.scheduler = TurnScheduler()
+        engine.world = World()  # Nowhere to wander unless a test adds rooms
+        engine.npc_manager.get_npc = Mock(return_value=thief)
+        engine.player.current_room = thief.location
+        engine.player.inventory = ["GEM"]
+        gem = Mock()
+        gem.name = "gem"
+        gem.get_attribute = Mock(side_effect=lambda attr, default=None: {"treasure_value": 15}.get(attr, default))
+        engine.object_manager.get_object = Mock(return_value=gem)
+        integrate_thief_behaviors(engine)
+        return engine
+    
     def test_cooldown_mechanics(self):
-        """Test theft cooldown functionality."""
-        # Initially should be able to attempt theft
-        self.assertTrue(self.behavior.can_attempt_theft())
-        
-        # After setting last_theft_time to now, should be on cooldown
-        self.behavior.last_theft_time = time.time()
-        self.assertFalse(self.behavior.can_attempt_theft())
+        """Test that the theft cooldown is counted in moves, not seconds."""
+        thief = create_canonical_thief(Mock(), "TEST_ROOM")
+        engine = self._scheduled_engine(thief)
+        cooldown = thief.thief_behavior.theft_cooldown
         
-        # After cooldown period, should be able to attempt again
-        self.behavior.last_theft_time = time.time() - 35  # 35 seconds ago
-        self.assertTrue(self.behavior.can_attempt_theft())
+        with patch('entities.thief.random.random', return_value=0.5):  # Always succeed
+            engine.scheduler.advance(1, engine)
+            self.assertEqual(thief.thief_behavior.stolen_objects, ["GEM"])
+            self.assertEqual(engine.scheduler.turns_until("THIEF", "thief_steal"), cooldown)
+            
+            # Lies low until the cooldown has passed
+            for turn in range(2, 1 + cooldown):
+                engine.scheduler.advance(turn, engine)
+            self.assertEqual(len(thief.thief_behavior.stolen_objects), 1)
+            
+            engine.scheduler.advance(1 + cooldown, engine)
+            self.assertEqual(len(thief.thief_behavior.stolen_objects), 2)
     
     def test_movement_cooldown(self):
-        """Test movement timing mechanics."""
-        # Initially should be able to move  
-        self.assertTrue(self.behavior.can_move())
-        
-        # After setting movement_timer, should be on cooldown
-        self.behavior.movement_timer = time.time()
-        self.assertFalse(self.behavior.can_move())
-        
-        # After movement interval, should be able to move
-        self.behavior.movement_timer = time.time() - 50  # 50 seconds ago
-        self.assertTrue(self.behavior.can_move())
+        """Test that the Thief only gets a chance to wander every movement_interval moves."""
+        world = World()
+        world.add_room(Room(id="SOURCE_ROOM", name="Source", description="", exits={"north": "DEST_ROOM"}))
+        world.add_room(Room(id="DEST_ROOM", name="Dest", description=""))
+        thief = create_canonical_thief(Mock(), "SOURCE_ROOM")
+        engine = self._scheduled_engine(thief)
+        engine.world = world
+        engine.player.current_room = "ELSEWHERE"
+        interval = thief.thief_behavior.movement_interval
+        
+        with patch('entities.thief.random.random', return_value=0.2):  # Always move when due
+            for turn in range(1, interval):
+                engine.scheduler.advance(turn, engine)
+            self.assertEqual(thief.location, "SOURCE_ROOM")
+            
+            engine.scheduler.advance(interval, engine)
+            self.assertEqual(thief.location, "DEST_ROOM")
+            self.assertEqual(engine.scheduler.turns_until("THIEF", "thief_wander"), interval)
     
     def test_theft_target_prioritization(self):
         """Test that Thief prioritizes treasures and valuable items."""
@@ -126,9 +154,6 @@ class TestThiefBehavior(unittest.TestCase):
     
     def test_successful_theft(self):
         """Test successful object theft."""
-        # Enable theft attempt
-        self.behavior.last_theft_time = 0
-        
         # Create mock treasure object
         treasure_obj = Mock()
         treasure_obj.name = "valuable gem"
@@ -144,13 +169,9 @@ class TestThiefBehavior(unittest.TestCase):
             
         self.assertEqual(stolen, "GEM")
         self.assertIn("GEM", self.behavior.stolen_objects)
-        self.assertGreater(self.behavior.last_theft_time, 0)
     
     def test_failed_theft(self):
         """Test failed theft attempt."""
-        # Enable theft attempt
-        self.behavior.last_theft_time = 0
-        
         # Create mock object
         obj = Mock()
         obj.name = "test item"  # Add name property
@@ -253,7 +274,6 @@ class TestThiefGameIntegration(unittest.TestCase):
         """Test that Thief behaviors are integrated into game engine."""
         # Create a Thief with behavior
         thief = create_canonical_thief(Mock(), "TEST_ROOM")
-        thief.thief_behavior.last_theft_time = 0  # Enable theft
         
         # Mock object for theft
         mock_obj = Mock()
@@ -268,37 +288,29 @@ class TestThiefGameIntegration(unittest.TestCase):
         
         # Mock successful theft
         with patch('entities.thief.random.random', return_value=0.5):
-            with patch('builtins.print') as mock_print:
-                _handle_thief_behaviors(self.mock_game_engine, thief)
-                
-                # Verify theft occurred
-                self.mock_player.remove_from_inventory.assert_called_with("LAMP")
-                mock_print.assert_called()
-                
-                # Check that item was added to Thief's stolen goods
-                self.assertIn("LAMP", thief.thief_behavior.stolen_objects)
+            _handle_thief_behaviors(self.mock_game_engine, thief)
+            
+            # Verify theft occurred and was announced on the game's output channel
+            self.mock_player.remove_from_inventory.assert_called_with("LAMP")
+            self.mock_game_engine.output.write.assert_called()
+            
+            # Check that item was added to Thief's stolen goods
+            self.assertIn("LAMP", thief.thief_behavior.stolen_objects)
     
     def test_thief_movement_behavior(self):
         """Test Thief movement between rooms."""
-        # Create world with rooms
-        mock_world = Mock()
-        source_room = Mock()
-        source_room.exits = {"north": "DEST_ROOM", "east": "OTHER_ROOM"}
-        dest_room = Mock()
-        dest_room.has_flag = Mock(return_value=False)  # Not deadly
-        
-        mock_world.get_room = Mock(side_effect=lambda room_id: {
-            "SOURCE_ROOM": source_room,
-            "DEST_ROOM": dest_room,
-            "OTHER_ROOM": dest_room
-        }.get(room_id))
+        # Create world with rooms (roaming follows the compiled world graph)
+        world = World()
+        world.add_room(Room(id="SOURCE_ROOM", name="Source", description="",
+                            exits={"north": "DEST_ROOM", "east": "OTHER_ROOM"}))
+        world.add_room(Room(id="DEST_ROOM", name="Dest", description=""))  # Not deadly
+        world.add_room(Room(id="OTHER_ROOM", name="Other", description=""))
         
-        self.mock_game_engine.world = mock_world
+        self.mock_game_engine.world = world
         
 
         # Create Thief
         thief = create_canonical_thief(Mock(), "SOURCE_ROOM")
-        thief.thief_behavior.movement_timer = 0  # Enable movement
         self.mock_npc_manager.move_npc = Mock()
         
         # Test movement
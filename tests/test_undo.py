@@ -0,0 +1,115 @@
+"""Tests for the undo journal and the UNDO, AGAIN and OOPS commands."""
+
+from src.journal import UndoJournal
+
+
+def _state(game):
+    mailbox = game.object_manager.get_object("MAILBOX")
+    return (game.player.current_room, list(game.player.inventory),
+            {room_id: (list(room.items), room.visited) for room_id, room in game.world.rooms.items()},
+            mailbox.is_open(), list(mailbox.get_contents()), game.score_manager.moves,
+            dict(game.object_manager.containment.parents), game.scheduler.get_state())
+
+
+def test_undo_reverses_turns_one_at_a_time(game):
+    """Test that each UNDO takes back exactly one turn, back to the starting state."""
+    states = [_state(game)]
+    for command in ["open mailbox", "take leaflet", "take lamp", "n", "drop leaflet"]:
+        game._process_command(command)
+        states.append(_state(game))
+
+    game._process_command("inventory")  # Changes nothing, so it isn't an undoable turn
+    for expected in reversed(states[:-1]):
+        assert "undone" in game._process_command("undo")
+        assert _state(game) == expected
+    assert "nothing to undo" in game._process_command("undo")
+
+
+def test_journal_covers_npcs_score_puzzles_and_attributes(game):
+    """Test the inverse records of NPC moves, score, puzzle flags, attributes, flags and exits."""
+    thief = game.npc_manager.get_npc("THIEF")
+    lamp = game.object_manager.get_object("LAMP")
+    room = game.world.get_room("WHOUS")
+
+    game.journal.begin_turn("everything", game._turn_snapshot())
+    game.npc_manager.place_npc(thief, "NHOUS")
+    game.score_manager.add_achievement("lit_shaft", 5)
+    game.score_manager.find_treasure("COIN")
+    game.puzzle_manager.set_flag("grate_unlocked")
+    lamp.set_attribute("lit", True)
+    lamp.set_attribute("brand", "Acme")
+    room.set_flag("sacred")
+    room.exits["up"] = "NHOUS"
+    game.journal.end_turn()
+
+    game._process_command("undo")
+    assert thief.location == "WHOUS"
+    assert "lit_shaft" not in game.score_manager.achievement_scores
+    assert not game.score_manager.treasures["COIN"].found
+    assert "grate_unlocked" not in game.puzzle_manager.global_flags
+    assert not lamp.is_lit() and lamp.get_attribute("brand") is None
+    assert not room.has_flag("sacred") and "up" not in room.exits
+
+
+def test_failed_turns_are_not_undone_on_their_own(game):
+    """Test that turns that only moved the clock (unknown words, refusals) are skipped by UNDO."""
+    before = _state(game)
+    game._process_command("take lamp")
+    game._process_input("xyzzy")
+    game._process_input("take mailbox")
+    assert game.score_manager.moves == 3
+
+    assert "take lamp: undone" in game._process_command("undo")
+    assert _state(game) == before
+    assert "nothing to undo" in game._process_command("undo")
+
+
+def test_exit_changes_through_any_dict_method_are_undone(game):
+    """Test that update, pop, popitem, setdefault, |= and clear on exits are journaled."""
+    exits = game.world.get_room("WHOUS").exits
+    before = dict(exits)
+    changes = [lambda: exits.update(up="NHOUS", north="WHOUS"), lambda: exits.pop("north"),
+               lambda: exits.popitem(), lambda: exits.setdefault("down", "NHOUS"),
+               lambda: exits.__ior__({"east": "NHOUS"}), exits.clear]
+    for change in changes:
+        game.journal.begin_turn("exits")
+        change()
+        game.journal.end_turn()
+    for _ in changes:
+        game._process_command("undo")
+    assert dict(exits) == before
+
+
+def test_ring_buffer_and_loading_limit_undo(game):
+    """Test that only the newest turns are kept and loading a save forgets them."""
+    journal = UndoJournal(depth=2)
+    log = []
+    for n in range(3):
+        journal.begin_turn(f"turn {n}")
+        journal.record(log.append, n)
+        journal.end_turn()
+    assert len(journal) == 2
+    assert [journal.undo().user_input, journal.undo().user_input, journal.undo()] == ["turn 2", "turn 1", None]
+    assert log == [2, 1]
+
+    game._process_command("take lamp")
+    game._restore_game_state(game._collect_game_state())
+    assert len(game.journal) == 0
+
+
+def test_again_and_oops(game):
+    """Test that AGAIN repeats the last command (also after UNDO) and OOPS fixes its noun."""
+    assert "no command to repeat" in game._process_command("again")
+    assert "no word to replace" in game._process_command("oops lamp")
+
+    game._process_command("n")
+    game._process_command("undo")
+    game._process_command("g")
+    assert game.player.current_room == "NHOUS"
+
+    game._process_command("s")
+    game._process_command("take lmap")
+    assert "LAMP" not in game.player.inventory
+    game._process_command("oops lamp")
+    assert "LAMP" in game.player.inventory
+    assert "already" in game._process_command("again")
@@ -0,0 +1,99 @@
+"""Tests for the table-driven verb registry."""
+
+from src.game import GameEngine
+from src.world.room import Room
+from src.verbs import VerbRegistry, VerbDescriptor, verb_handler, DIRECTIONS, ARGS_NONE
+
+
+def test_engine_registers_core_and_plugin_verbs():
+    """Test that decorated handlers and combination plugin verbs are registered."""
+    game = GameEngine(use_mud_files=False)
+
+    for verb in list(DIRECTIONS) + ["go", "climb", "take", "drop", "q", "quit", "load", "restore", "say"]:
+        assert verb in game.verbs, verb
+    for verb in ["heat", "cool", "combine", "break", "pour", "use", "apply"]:
+        assert verb in game.verbs, verb
+
+    assert game.verbs.get("q") is game.verbs.get("quit")
+    assert game.verbs.get("use").handler is GameEngine._handle_use_tool
+
+
+def test_move_flag_controls_move_counter():
+    """Test that info verbs don't consume moves while actions and unknown verbs do."""
+    game = GameEngine(use_mud_files=False)
+
+    for command in ["inventory", "score", "help", "brief", "verbose"]:
+        game._process_command(command)
+    assert game.score_manager.moves == 0
+
+    game._process_command("look")
+    game._process_command("frobnicate")
+    assert game.score_manager.moves == 2
+
+
+def test_debug_verb_only_in_debug_mode(capsys):
+    """Test that debug-only verbs fall through to the unknown response."""
+    game = GameEngine(use_mud_files=False)
+    capsys.readouterr()
+    game._process_command("debug")
+    assert "Debug Commands" not in capsys.readouterr().out
+
+    game = GameEngine(use_mud_files=False, debug_mode=True)
+    capsys.readouterr()
+    game._process_command("debug")
+    assert "debug" in capsys.readouterr().out.lower()
+
+
+def test_go_direction(capsys):
+    """Test "go <direction>" moves the player and rejects unknown directions."""
+    game = GameEngine(use_mud_files=False)
+    game.world.add_room(Room(id="NHOUS", name="North of House", description="North of the house."))
+    game.world.get_room(game.player.current_room).exits["north"] = "NHOUS"
+
+    game._process_command("go north")
+    assert game.player.current_room == "NHOUS"
+
+    capsys.readouterr()
+    game._process_command("go sideways")
+    assert "I don't know how to go sideways." in capsys.readouterr().out
+
+
+def test_plugin_registration_and_help(capsys):
+    """Test that plugins can add verbs which are dispatched and listed in help."""
+    game = GameEngine(use_mud_files=False)
+    calls = []
+
+    game.verbs.register("dance", "boogie", handler=lambda engine: calls.append(engine),
+                        arguments=ARGS_NONE, consumes_move=False, usage="dance", category="Fun")
+    game._process_command("dance")
+    game._process_command("boogie")
+
+    assert calls == [game, game]
+    assert game.score_manager.moves == 0
+
+    capsys.readouterr()
+    game._process_command("help")
+    output = capsys.readouterr().out
+    assert "Movement:" in output
+    assert "take <object>" in output
+    assert "  Fun: dance" in output
+
+
+def test_registry_from_class_collects_subclass_overrides():
+    """Test that subclass handlers replace base handlers for the same verb."""
+    class Base:
+        @verb_handler("poke", usage="poke <object>")
+        def _handle_poke(self, command):
+            return "base"
+
+    class Child(Base):
+        @verb_handler("poke", category="Actions")
+        def _handle_poke_harder(self, command):
+            return "child"
+
+    registry = VerbRegistry.from_class(Child)
+    descriptor = registry.get("poke")
+
+    assert isinstance(descriptor, VerbDescriptor)
+    assert descriptor.handler is Child._handle_poke_harder
+    assert registry.help_lines() == ["  Actions: poke"]
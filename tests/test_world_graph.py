@@ -0,0 +1,157 @@
+"""Tests for the compiled world graph."""
+
+import random
+from collections import deque
+
+from src.game import GameEngine
+from src.world.room import Room
+from src.world.world import World
+from src.world.graph import REVERSE_DIRECTIONS, WorldGraph
+
+
+def _random_world(seed: int, room_count: int = 40) -> World:
+    """World with random exits, including some to rooms that don't exist."""
+    rng = random.Random(seed)
+    world = World()
+    room_ids = [f"R{i}" for i in range(room_count)]
+    for room_id in room_ids:
+        exits = {}
+        for direction in rng.sample(list(REVERSE_DIRECTIONS), rng.randint(0, 4)):
+            exits[direction] = rng.choice(room_ids + ["NOWHERE"])
+        world.add_room(Room(id=room_id, name=room_id, description="", exits=exits))
+    return world
+
+
+def _reference_distances(world: World, start: str) -> dict:
+    """Plain BFS over room.exits dictionaries."""
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        room_id = queue.popleft()
+        for target in world.rooms[room_id].exits.values():
+            if target in world.rooms and target not in distances:
+                distances[target] = distances[room_id] + 1
+                queue.append(target)
+    return distances
+
+
+def test_paths_match_reference_bfs():
+    """Test reachability and path lengths against a dictionary BFS."""
+    for seed in range(5):
+        world = _random_world(seed)
+        graph = world.get_graph()
+        for start in world.rooms:
+            expected = _reference_distances(world, start)
+            assert graph.distances_from(start) == expected
+            for target in world.rooms:
+                path = graph.shortest_path(start, target)
+                if target not in expected:
+                    assert path is None
+                    continue
+                assert len(path) == expected[target]
+                # Following the directions really leads to the target
+                room_id = start
+                for direction in path.directions:
+                    room_id = world.rooms[room_id].exits[direction]
+                assert room_id == target == path.rooms[-1]
+
+
+def test_strongly_connected_components():
+    """Test that rooms share a component exactly when they reach each other."""
+    world = _random_world(11)
+    graph = world.get_graph()
+    reach = {room_id: set(graph.reachable_from(room_id)) for room_id in world.rooms}
+    components = graph.strongly_connected_components()
+    assert sorted(r for component in components for r in component) == sorted(world.rooms)
+    component_of = {room_id: i for i, component in enumerate(components) for room_id in component}
+    for a in world.rooms:
+        for b in world.rooms:
+            mutual = b in reach[a] and a in reach[b]
+            assert (component_of[a] == component_of[b]) == mutual
+
+
+def test_one_way_edges_and_broken_exits():
+    """Test one-way detection with and without direction matching."""
+    world = World()
+    world.add_room(Room(id="A", name="A", description="", exits={"north": "B", "down": "C", "west": "GONE"}))
+    world.add_room(Room(id="B", name="B", description="", exits={"south": "A"}))
+    world.add_room(Room(id="C", name="C", description="", exits={"east": "A"}))
+    graph = world.get_graph()
+
+    assert graph.one_way_edges() == []
+    assert graph.one_way_edges(REVERSE_DIRECTIONS) == [("A", "down", "C"), ("C", "east", "A")]
+    assert graph.broken_exits == [("A", "west", "GONE")]
+
+
+def test_graph_invalidated_when_exits_change():
+    """Test that exit edits, room replacement and new rooms drop the cached graph."""
+    world = _random_world(3, room_count=5)
+    world.rooms["R0"].exits = {}
+    graph = world.get_graph()
+    assert world.get_graph() is graph
+    assert graph.shortest_path("R0", "R1") is None
+
+    world.rooms["R0"].exits["north"] = "R1"
+    assert world.get_graph() is not graph
+    assert world.get_graph().shortest_path("R0", "R1").directions == ("north",)
+
+    graph = world.get_graph()
+    del world.rooms["R0"].exits["north"]
+    assert world.get_graph().shortest_path("R0", "R1") is None
+
+    graph = world.get_graph()
+    world.add_room(Room(id="R9", name="R9", description=""))
+    assert "R9" in world.get_graph() and "R9" not in graph
+
+
+def test_path_cache_is_bounded_lru():
+    """Test path cache hits and eviction."""
+    world = _random_world(7)
+    graph = WorldGraph(world, cache_size=3)
+    graph.shortest_path("R0", "R1")
+    graph.shortest_path("R0", "R1")
+    for target in ("R2", "R3", "R4"):
+        graph.shortest_path("R0", target)
+    info = graph.cache_info()
+    assert info["hits"] == 1 and info["misses"] == 4 and info["size"] == 3
+    graph.shortest_path("R0", "R1")
+    assert graph.cache_info()["misses"] == 5
+
+
+def test_weighted_path_avoids_costly_rooms():
+    """Test Dijkstra routing around an expensive or forbidden room."""
+    world = World()
+    world.add_room(Room(id="A", name="A", description="", exits={"north": "B", "east": "C"}))
+    world.add_room(Room(id="B", name="B", description="", exits={"east": "D"}))
+    world.add_room(Room(id="C", name="C", description="", exits={"south": "E"}))
+    world.add_room(Room(id="E", name="E", description="", exits={"east": "D"}))
+    world.add_room(Room(id="D", name="D", description=""))
+    graph = world.get_graph()
+
+    assert graph.shortest_path("A", "D").rooms == ("A", "B", "D")
+    path = graph.weighted_path("A", "D", lambda src, direction, dst: 10.0 if dst == "B" else 1.0)
+    assert path.rooms == ("A", "C", "E", "D") and path.cost == 3.0
+    assert graph.weighted_path("A", "D", lambda src, direction, dst: None if dst == "E" else 1.0).rooms == ("A", "B", "D")
+
+
+def test_thief_roams_valid_exits_and_debug_path(capsys):
+    """Test NPC roaming and the debug path command use the graph."""
+    from src.entities.thief import ThiefBehavior, create_canonical_thief
+
+    game = GameEngine(use_mud_files=False, debug_mode=True)
+    game.world.add_room(Room(id="NHOUS", name="North of House", description=""))
+    game.world.add_room(Room(id="CELLA", name="Cellar", description="", flags={"deadly"}))
+    whous = game.world.get_room("WHOUS")
+    whous.exits["north"] = "NHOUS"
+    whous.exits["down"] = "CELLA"
+    whous.exits["west"] = "MISSING"
+
+    behavior = create_canonical_thief(game.npc_manager).thief_behavior
+    assert isinstance(behavior, ThiefBehavior)
+    assert behavior.get_movement_destinations("WHOUS", game.world) == ["NHOUS"]
+
+    capsys.readouterr()
+    game._process_command("debug path nhous")
+    assert "WHOUS: north NHOUS (1 move)" in capsys.readouterr().out
+    game._process_command("debug path nhous whous")
+    assert "No route from NHOUS to WHOUS" in capsys.readouterr().out
@@ -0,0 +1,142 @@
+"""Tests for the precompiled world image cache."""
+
+import io
+import os
+import pickle
+
+import pytest
+
+from src.game import GameEngine
+from src.parsers.mdl_parser import MDLParser
+from src.world.world_image import WorldImageCache, WORLD_IMAGE_FILENAME, _WorldImageUnpickler
+
+
+DUNGEON_SOURCE = '''
+<PSETG STFORE "This is a forest, with trees in all directions around you.">
+<ROOM "WHOUS"
+       "This is an open field west of a white house, with a boarded front door."
+       "West of House"
+       <EXIT "NORTH" "NHOUS" "SOUTH" "SHOUS" "WEST" "FORE1" "EAST" #NEXIT "The door is locked.">
+       (<GET-OBJ "FDOOR"> <GET-OBJ "MAILB">)
+       <>
+       <+ ,RLANDBIT ,RLIGHTBIT ,RNWALLBIT>>
+<ROOM "NHOUS"
+       "You are facing the north side of a white house."
+       "North of House"
+       <EXIT "WEST" "WHOUS" "SOUTH" #NEXIT "The windows are all barred.">
+       ()
+       <>
+       <+ ,RLANDBIT ,RLIGHTBIT>>
+<ROOM "SHOUS"
+       "You are facing the south side of a white house."
+       "South of House"
+       <EXIT "WEST" "WHOUS">
+       ()
+       <>
+       <+ ,RLANDBIT ,RLIGHTBIT>>
+<ROOM "FORE1"
+       ,STFORE
+       "Forest"
+       <EXIT "EAST" "WHOUS" "NORTH" "FORE1">
+       ()
+       <>
+       <+ ,RLANDBIT ,RLIGHTBIT>>
+'''
+
+
+@pytest.fixture
+def mud_dir(tmp_path):
+    """Create a small .mud source tree."""
+    (tmp_path / "dung.mud").write_text(DUNGEON_SOURCE)
+    return tmp_path
+
+
+def _snapshot(game):
+    """Comparable view of the loaded world."""
+    rooms = {room_id: (room.name, room.description, dict(room.exits), list(room.items), room.flags)
+             for room_id, room in game.world.rooms.items()}
+    objects = {obj_id: (obj.name, obj.description, obj.aliases, obj.attributes)
+               for obj_id, obj in game.object_manager.objects.items()}
+    npcs = {npc_id: (npc.name, npc.location) for npc_id, npc in game.npc_manager.npcs.items()}
+    return rooms, objects, npcs, game.player.current_room
+
+
+def test_cold_start_writes_image_and_warm_start_uses_it(mud_dir, monkeypatch):
+    """Test that a warm start restores the same world without parsing .mud files."""
+    cold = GameEngine(use_mud_files=True, mud_directory=mud_dir)
+    assert not cold.world_loaded_from_cache
+    assert (mud_dir / WORLD_IMAGE_FILENAME).exists()
+
+    def fail_parse(self, directory):
+        raise AssertionError("warm start should not parse .mud files")
+
+    monkeypatch.setattr(MDLParser, "parse_directory", fail_parse)
+    warm = GameEngine(use_mud_files=True, mud_directory=mud_dir)
+
+    assert warm.world_loaded_from_cache
+    assert _snapshot(warm) == _snapshot(cold)
+    assert warm.npc_manager.get_npc("THIEF").thief_behavior.thief is warm.npc_manager.get_npc("THIEF")
+    assert warm.puzzle_manager is not None
+    assert warm.combination_manager is not None
+
+
+def test_warm_engine_plays(mud_dir):
+    """Test that commands work against a world restored from the image."""
+    GameEngine(use_mud_files=True, mud_directory=mud_dir)
+    game = GameEngine(use_mud_files=True, mud_directory=mud_dir)
+
+    game._process_command("north")
+    assert game.player.current_room == "NHOUS"
+
+
+def test_image_invalidated_when_sources_change(mud_dir):
+    """Test that editing a .mud file changes the key and forces a rebuild."""
+    GameEngine(use_mud_files=True, mud_directory=mud_dir)
+    old_key = WorldImageCache(mud_dir).key
+
+    (mud_dir / "dung.mud").write_text(DUNGEON_SOURCE.replace("North of House", "North Side"))
+    assert WorldImageCache(mud_dir).key != old_key
+    assert WorldImageCache(mud_dir).load() is None
+
+    game = GameEngine(use_mud_files=True, mud_directory=mud_dir)
+    assert not game.world_loaded_from_cache
+    assert game.world.get_room("NHOUS").name == "North Side"
+    assert WorldImageCache(mud_dir).load() is not None
+
+
+def test_rebuild_ignores_existing_image(mud_dir):
+    """Test that rebuild_world_cache parses from scratch."""
+    GameEngine(use_mud_files=True, mud_directory=mud_dir)
+    game = GameEngine(use_mud_files=True, mud_directory=mud_dir, rebuild_world_cache=True)
+    assert not game.world_loaded_from_cache
+
+    game = GameEngine(use_mud_files=True, mud_directory=mud_dir, use_world_cache=False)
+    assert not game.world_loaded_from_cache
+
+
+def test_image_refuses_foreign_classes(mud_dir):
+    """Test that an image referencing arbitrary globals is rejected."""
+    cache = WorldImageCache(mud_dir)
+    with open(cache.image_path, "wb") as f:
+        f.write(cache._header())
+        pickle.dump(pickle.loads, f)
+
+    assert cache.load() is None
+
+
+def test_image_refuses_dotted_names_through_game_modules(mud_dir, monkeypatch):
+    """Test that a protocol-4 global reaching os.getcwd through a game module is rejected."""
+    def called():
+        raise AssertionError("os.getcwd ran while loading the image")
+
+    monkeypatch.setattr(os, "getcwd", called)
+    module, name = b"src.world.world_image", b"os.getcwd"
+    payload = (b"\x80\x04" + b"\x8c" + bytes([len(module)]) + module + b"\x8c" + bytes([len(name)]) + name
+               + b"\x93" + b")" + b"R" + b".")  # STACK_GLOBAL, EMPTY_TUPLE, REDUCE, STOP
+    with pytest.raises(pickle.UnpicklingError):
+        _WorldImageUnpickler(io.BytesIO(payload)).load()
+
+    cache = WorldImageCache(mud_dir)
+    with open(cache.image_path, "wb") as f:
+        f.write(cache._header() + payload)
+    assert cache.load() is None